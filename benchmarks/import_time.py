@@ -0,0 +1,60 @@
+"""
+Cold import time of pytextos, measured in fresh interpreters with
+`python -X importtime`. Also checks that importing the package doesn't load
+the word lists in pytextos.stopwords, nor the modules in DEFERRED, which are
+imported by the features that need them.
+
+Usage: python benchmarks/import_time.py [--runs N] [--max-ms MS]
+Exits with status 1 if the median import time is above MS milliseconds
+(40 by default; pass a larger budget on slow machines).
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+DEFERRED = (
+    "asyncio", "concurrent.futures", "hashlib", "json", "logging", "multiprocessing",
+    "pytextos.cache", "pytextos.query", "pytextos.scheduler", "pytextos.watch",
+    "secrets", "sqlite3", "statistics",
+)
+
+CHECK = (
+    "import pytextos, pytextos.stopwords as s, sys;"
+    "loaded = [m for m in %r if m in sys.modules];"
+    "sys.exit('word lists loaded at import' if 'ENGLISH_STOPS' in vars(s) else"
+    " f'loaded at import: {loaded}' if loaded else 0)"
+) % (DEFERRED,)
+
+
+def import_time_ms(module="pytextos"):
+    """Returns the cumulative import time of a module in a new process (float)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    for line in result.stderr.splitlines():
+        fields = [f.strip() for f in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--max-ms", type=float, default=40.0)
+    args = parser.parse_args()
+
+    subprocess.run([sys.executable, "-c", CHECK], cwd=ROOT, check=True)
+    import_time_ms()  # warm up .pyc files
+    times = sorted(import_time_ms() for _ in range(args.runs))
+    median = statistics.median(times)
+    print(f"import pytextos: median {median:.1f} ms, min {times[0]:.1f} ms, "
+          f"max {times[-1]:.1f} ms ({args.runs} runs)")
+    if median > args.max_ms:
+        sys.exit(f"import time above {args.max_ms} ms")
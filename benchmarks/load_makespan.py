@@ -0,0 +1,92 @@
+"""
+Makespan of analyzing a skewed corpus in worker processes (Collection with
+jobs=N): many short news items and a few novels, written to a temporary
+folder. Compares one task per file, the fixed chunks of Executor.map and
+the size-aware schedule of pytextos.scheduler. Speedups need as many free
+cores as jobs.
+
+Usage: python benchmarks/load_makespan.py [--small N] [--large N] [--large-mb N] [--jobs 2,4]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pytextos import Text, scheduler
+
+
+def write_text(path, n_words, rng, vocab):
+    """Writes a text of about `n_words` words in Text's file format"""
+    words = rng.choices(vocab, k=n_words)
+    paragraphs = [" ".join(words[i:i + 80]) + "." for i in range(0, n_words, 80)]
+    lines = [os.path.basename(path), "By Author Name", "2024-01-01", "*A subtitle*",
+             *paragraphs, "+article", "-news", "synthetic"]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n\n".join(lines) + "\n")
+
+
+def write_corpus(folder, n_small, n_large, large_mb, seed=0):
+    """Writes `n_small` texts of about 2 KB and `n_large` of about `large_mb` MB"""
+    rng = random.Random(seed)
+    vocab = [f"word{chr(97 + i % 26)}{chr(97 + i // 26 % 26)}{chr(97 + i // 676)}"
+             for i in range(20_000)] + ["the", "of", "it's", "end."]
+    for n in range(n_small):
+        write_text(os.path.join(folder, f"news{n:05}.txt"), 300, rng, vocab)
+    for n in range(n_large):
+        write_text(os.path.join(folder, f"novel{n:02}.txt"), large_mb * 140_000, rng, vocab)
+
+
+def record(path):
+    return Text(path).record()
+
+
+def per_file(paths, jobs):
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(record, paths))
+
+
+def mapped(paths, jobs):
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(record, paths, chunksize=max(1, len(paths) // (jobs * 8))))
+
+
+def scheduled(files, jobs):
+    return scheduler.analyze(files, jobs)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--small", type=int, default=2_000)
+    parser.add_argument("--large", type=int, default=2)
+    parser.add_argument("--large-mb", type=int, default=8)
+    parser.add_argument("--jobs", default="2,4")
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, {os.cpu_count()} CPUs")
+    with tempfile.TemporaryDirectory() as folder:
+        write_corpus(folder, args.small, args.large, args.large_mb)
+        paths = sorted(os.path.join(folder, name) for name in os.listdir(folder))
+        files = [(path, os.path.getsize(path)) for path in paths]
+        total = sum(size for _, size in files)
+        print(f"{args.small} small and {args.large} large files, {total / 2**20:.1f} MB")
+
+        print(f"  serial                 {timed(lambda: [record(p) for p in paths]):7.2f} s")
+        for jobs in [int(n) for n in args.jobs.split(",")]:
+            tasks = scheduler.schedule(files, jobs)
+            largest = tasks[0].size / total
+            print(f"  jobs={jobs:<3} one per file    {timed(per_file, paths, jobs):7.2f} s")
+            print(f"  jobs={jobs:<3} map chunksize   {timed(mapped, paths, jobs):7.2f} s")
+            print(f"  jobs={jobs:<3} scheduled       {timed(scheduled, files, jobs):7.2f} s"
+                  f"  ({len(tasks)} tasks, largest {largest:.0%} of the corpus)")
@@ -0,0 +1,78 @@
+"""
+Query latency of Collection.search() (BM25) on a synthetic corpus with a
+Zipf-like word distribution, reported as p50/p99 in milliseconds, first with
+the ranking caches empty (cold) and then for the same queries again (warm).
+
+Usage: python benchmarks/search_latency.py [--texts N] [--queries N]
+"""
+
+import argparse
+from itertools import accumulate
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pytextos import Collection, Text
+from pytextos.text import METRICS, TextRecord
+
+
+def word(rank):
+    """Synthetic word for a frequency rank, letters only as the tokenizer drops digits"""
+    letters = ""
+    while True:
+        rank, r = divmod(rank, 26)
+        letters += chr(ord("A") + r)
+        if not rank:
+            return "W" + letters
+
+
+def synthetic_texts(n_texts, vocabulary_size=50_000, words_per_text=300, seed=0):
+    """Yields record-backed Texts with Zipf-distributed word frequencies"""
+    rng = random.Random(seed)
+    vocabulary = [word(i) for i in range(vocabulary_size)]
+    cum_weights = list(accumulate(1 / (rank + 1) for rank in range(vocabulary_size)))
+    for n in range(n_texts):
+        freq = {}
+        for w in rng.choices(vocabulary, cum_weights=cum_weights, k=words_per_text):
+            freq[w] = freq.get(w, 0) + 1
+        metadata = [f"text{n}.txt", f"Text {n}", "By Nobody", "", None, None, None, ""]
+        metrics = [words_per_text] + [None] * (len(METRICS) - 1)
+        yield Text.from_record(TextRecord(*metadata, *metrics, freq))
+
+
+def percentile(times, p):
+    return times[min(len(times) - 1, int(len(times) * p / 100))]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--texts", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=1_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    collection = Collection(title="Synthetic")
+    collection.extend(synthetic_texts(args.texts))
+    print(f"indexed {len(collection):,} texts in {time.perf_counter() - start:.1f} s")
+
+    rng = random.Random(1)
+    # Query words drawn from the whole frequency range, 1 to 3 words each
+    queries = [
+        " ".join(word(int(rng.paretovariate(0.5)) % 50_000) for _ in range(rng.randint(1, 3)))
+        for _ in range(args.queries)
+    ]
+    # The first pass builds the cached impact-ordered postings of each word
+    for label in ("cold", "warm"):
+        times = []
+        for query in queries:
+            start = time.perf_counter()
+            collection.search(query, k=10)
+            times.append((time.perf_counter() - start) * 1000)
+        times.sort()
+        print(f"{label} search latency over {len(times):,} queries: "
+              f"p50 {percentile(times, 50):.2f} ms, p99 {percentile(times, 99):.2f} ms, "
+              f"mean {statistics.mean(times):.2f} ms")
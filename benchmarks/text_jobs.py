@@ -0,0 +1,57 @@
+"""
+Time to analyze a single long Text (word counts, metrics and sentences) in
+one process and with Text(jobs=N), on a synthetic concatenated corpus file
+written to a temporary folder. Speedups need as many free cores as jobs.
+
+Usage: python benchmarks/text_jobs.py [--mb N] [--jobs 2,4,8]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pytextos import Text
+
+
+def write_text(path, mb, seed=0):
+    """Writes a text of about `mb` MB in Text's file format, a paragraph at a time"""
+    rng = random.Random(seed)
+    vocab = [f"word{chr(97 + i % 26)}{chr(97 + i // 26 % 26)}{chr(97 + i // 676)}"
+             for i in range(20_000)] + ["the", "of", "it's", "e.g.", "Mr.", "end.", "why?"]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Concatenated corpus\n\nBy Many Authors\n\n2024-01-01\n\n*A subtitle*\n\n")
+        while f.tell() < mb * 2**20:
+            f.write(" ".join(rng.choices(vocab, k=rng.randint(20, 200))) + ".\n\n")
+        f.write("+corpus\n\n-mixed\n\nsynthetic\n")
+
+
+def analyze(path, jobs):
+    text = Text(path, jobs=jobs)
+    start = time.perf_counter()
+    text.record()
+    text.sent_tokenize()
+    return time.perf_counter() - start, text
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mb", type=int, default=50)
+    parser.add_argument("--jobs", default="2,4,8")
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, {os.cpu_count()} CPUs")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "corpus.txt")
+        write_text(path, args.mb)
+        print(f"{os.path.getsize(path) / 2**20:.0f} MB text")
+        base, serial = analyze(path, None)
+        print(f"  serial    {base:7.2f} s")
+        for jobs in [int(n) for n in args.jobs.split(",")]:
+            seconds, text = analyze(path, jobs)
+            assert text.record() == serial.record()
+            print(f"  jobs={jobs:<3} {seconds:7.2f} s  {base / seconds:5.2f}x")
@@ -0,0 +1,79 @@
+"""
+Thread scaling of Collection loading (threads=N) and of queries run from N
+threads at once, on a synthetic corpus written to a temporary folder.
+Speedups above 1x need a free-threaded (no-GIL) build of CPython 3.13+ and
+as many cores as threads; with the GIL the numbers show the locking overhead.
+
+Usage: python benchmarks/thread_scaling.py [--files N] [--words N] [--threads 1,2,4,8]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pytextos import Collection
+
+
+def write_corpus(folder, n_files, n_words, seed=0):
+    """Writes `n_files` texts of about `n_words` words each in Text's file format"""
+    rng = random.Random(seed)
+    vocab = [f"word{i}" for i in range(20_000)] + ["it's", "end.", "climate", "change"]
+    genres = ["news", "fiction", "essay"]
+    for n in range(n_files):
+        words = rng.choices(vocab, k=n_words)
+        paragraphs = [" ".join(words[i:i + 80]) + "." for i in range(0, n_words, 80)]
+        lines = [f"Text {n}", f"By Author{n % 50} Name", "2024-01-01", "*A subtitle*",
+                 *paragraphs, "+article", f"-{rng.choice(genres)}", "synthetic"]
+        with open(os.path.join(folder, f"text{n:05}.txt"), "w", encoding="utf-8") as f:
+            f.write("\n\n".join(lines) + "\n")
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=400)
+    parser.add_argument("--words", type=int, default=5_000)
+    parser.add_argument("--threads", default="1,2,4,8")
+    args = parser.parse_args()
+    counts = [int(n) for n in args.threads.split(",")]
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, "
+          f"{os.cpu_count()} CPUs")
+    with tempfile.TemporaryDirectory() as folder:
+        write_corpus(folder, args.files, args.words)
+        print(f"{args.files} files of {args.words:,} words")
+
+        Collection(folder)  # warms the page cache and the shared vocabulary
+        base = None
+        for n in counts:
+            seconds = timed(lambda: Collection(folder, threads=n))
+            base = base or seconds
+            print(f"  load    threads={n:<3} {seconds:7.2f} s  {base / seconds:5.2f}x")
+
+        collection = Collection(folder, positions=True)
+        queries = [
+            "genre:news AND words:..6000 SORT lexdiv DESC LIMIT 10",
+            'contains:"climate change" NOT genre:essay',
+            "word1 AND word2",
+        ] * 200
+        # Each query string is made unique so that results are not cached
+        queries = [f"{q} NOT title:q{i}" for i, q in enumerate(queries)]
+        collection.query(queries[0])  # builds the metadata indexes
+        base = None
+        for n in counts:
+            with ThreadPoolExecutor(max_workers=n) as pool:
+                seconds = timed(lambda: list(pool.map(collection.query, queries)))
+            base = base or seconds
+            print(f"  queries threads={n:<3} {len(queries) / seconds:7.0f}/s  {base / seconds:5.2f}x")
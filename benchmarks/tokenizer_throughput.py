@@ -0,0 +1,71 @@
+"""
+Tokenizer throughput in tokens/sec, compared with the original per-paragraph
+str.translate() implementation of Text.tokenize().
+
+Usage: python benchmarks/tokenizer_throughput.py [file.txt ...]
+Without arguments a synthetic multi-megabyte text is used.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pytextos.tokenizer import MAPPING, TOKENIZER
+
+
+def legacy_tokenize(paragraphs):
+    trans_table = str.maketrans(dict(MAPPING))
+    words = []
+    for sent in paragraphs:
+        clean_sent = sent.translate(trans_table)
+        words.extend([w.strip("' ").upper() for w in clean_sent.split()])
+    return words
+
+
+def synthetic_paragraphs(n_words=1_000_000, unicode=False):
+    random.seed(0)
+    vocab = ["word%d" % i for i in range(5000)] + [
+        "it's", "don't", "well-known", "(again)", "end.", "Mr.", "yes?", "1984,",
+    ]
+    if unicode:
+        vocab += ["“quoted”", "it’s", "café", "dash—here"]
+    words = [random.choice(vocab) for _ in range(n_words)]
+    return [" ".join(words[i:i + 120]) for i in range(0, n_words, 120)]
+
+
+def read_paragraphs(filename):
+    with open(filename, "r", encoding="utf-8", errors="ignore") as f:
+        return [line.strip() for line in f if not line.startswith("\n")]
+
+
+def best_of(func, arg, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokens = func(arg)
+        best = min(best, time.perf_counter() - start)
+    return tokens, best
+
+
+def run(label, paragraphs):
+    raw_body = " ".join(paragraphs)
+    expected, legacy_time = best_of(legacy_tokenize, paragraphs)
+    tokens, new_time = best_of(TOKENIZER.tokenize, raw_body)
+    assert tokens == expected, "tokenizer output differs from legacy tokenizer"
+    size = len(raw_body.encode("utf-8")) / 2**20
+    print(f"{label} ({size:.1f} MB, {len(tokens):,} tokens)")
+    print(f"  legacy:    {len(tokens) / legacy_time:>14,.0f} tokens/sec")
+    print(f"  tokenizer: {len(tokens) / new_time:>14,.0f} tokens/sec"
+          f"  ({legacy_time / new_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for filename in sys.argv[1:]:
+            run(filename, read_paragraphs(filename))
+    else:
+        run("synthetic ASCII", synthetic_paragraphs())
+        run("synthetic Unicode", synthetic_paragraphs(unicode=True))
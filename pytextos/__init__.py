@@ -1,8 +1,15 @@
 from .text import Text, Extract
-from .stopwords import ENGLISH_STOPS, KNOWN_VOCABULARY
 from .collection import Collection
 
 __version__ = (0, 1, 0)
 __author__="Rafael Luque"
 
-__all__=['Text', 'Extract', 'Collection', 'ENGLISH_STOPS', 'KNOWN_VOCABULARY']
\ No newline at end of file
+__all__=['Text', 'Extract', 'Collection', 'ENGLISH_STOPS', 'KNOWN_VOCABULARY']
+
+
+def __getattr__(name):
+    # Word lists are loaded on first access, see pytextos.stopwords
+    if name in ("ENGLISH_STOPS", "KNOWN_VOCABULARY"):
+        from . import stopwords
+        return getattr(stopwords, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,154 @@
+"""
+Analysis engine shared by the metric properties of Text objects: the body is
+tokenized once and token IDs, type counts and frequency distribution are built
+from that single pass.
+"""
+
+from array import array
+from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
+from .vocabulary import VOCABULARY
+
+
+class Analysis:
+    """
+    Result of analyzing a list of tokens. Tokens are kept as an array of IDs
+    in a shared Vocabulary, with the count of every type ID (stopwords
+    included) in first-occurrence order.
+
+    Once split into paragraphs (split_paragraphs), paragraphs can be inserted,
+    replaced or removed and counts are updated from that paragraph only. Types
+    first seen in an edited paragraph are then counted as the most recent ones,
+    which only matters for ties in most_common().
+    """
+
+    __slots__ = ("vocabulary", "_ids", "paragraphs", "counts", "token_count")
+
+    def __init__(self, tokens, vocabulary=VOCABULARY):
+        self.vocabulary = vocabulary
+        self._ids = vocabulary.encode(tokens)
+        self.paragraphs = None
+        # Counter keeps first-occurrence order, so most_common() ties are
+        # resolved the same way as counting the tokens one by one
+        self.counts = Counter(self._ids)
+        self.token_count = len(self._ids)
+
+    @classmethod
+    def from_chunks(cls, chunks, vocabulary=VOCABULARY):
+        """
+        Builds an Analysis from an iterable of token lists, encoding one list
+        at a time so that only the ID array grows with the text
+        """
+        ids = array("I")
+        for tokens in chunks:
+            ids.extend(vocabulary.encode(tokens))
+        self = cls.__new__(cls)
+        self.vocabulary = vocabulary
+        self._ids = ids
+        self.paragraphs = None
+        self.counts = Counter(ids)
+        self.token_count = len(ids)
+        return self
+
+    @classmethod
+    def from_counts(cls, counts, vocabulary=VOCABULARY, ids=None):
+        """
+        Builds an Analysis from a mapping of token -> count in order of first
+        occurrence, such as the merged counts of the chunks of a text, and
+        optionally the array of token IDs. Without `ids`, token IDs and
+        tokens() are not available.
+        """
+        self = cls.__new__(cls)
+        self.vocabulary = vocabulary
+        self._ids = ids
+        self.paragraphs = None
+        intern = vocabulary.intern
+        self.counts = Counter({intern(w): c for w, c in counts.items()})
+        self.token_count = sum(self.counts.values())
+        return self
+
+    @property
+    def ids(self):
+        """Array of the token IDs of the whole text"""
+        if self._ids is None:
+            ids = array("I")
+            for paragraph in self.paragraphs:
+                ids.extend(paragraph)
+            self._ids = ids
+        return self._ids
+
+    def tokens(self):
+        """Returns the list of tokens"""
+        return self.vocabulary.decode(self.ids)
+
+    def split_paragraphs(self, body, tokenizer):
+        """
+        Keeps the token IDs of each paragraph of `body` separately, so that
+        they can be edited. Counts are unchanged.
+        """
+        if self.paragraphs is None:
+            encode = self.vocabulary.encode
+            self.paragraphs = [encode(tokenizer.tokenize(p)) for p in body]
+
+    def insert(self, i, tokens):
+        """Inserts a paragraph of tokens at position i, updating counts"""
+        ids = self.vocabulary.encode(tokens)
+        self.paragraphs.insert(i, ids)
+        self.counts.update(ids)
+        self.token_count += len(ids)
+        self._ids = None
+
+    def remove(self, i):
+        """Removes paragraph i, updating counts"""
+        ids = self.paragraphs.pop(i)
+        counts = self.counts
+        counts.subtract(ids)
+        for k in set(ids):
+            if counts[k] <= 0:
+                del counts[k]
+        self.token_count -= len(ids)
+        self._ids = None
+
+    def replace(self, i, tokens):
+        """Replaces paragraph i with a paragraph of tokens, updating counts"""
+        self.remove(i)
+        self.insert(i, tokens)
+
+    def _content(self):
+        """(ID, count) pairs of non-stopword types"""
+        stops = self.vocabulary.stops
+        return ((i, c) for i, c in self.counts.items() if not stops[i])
+
+    def freq_dist(self):
+        """Returns a Counter of non-stopword tokens (Counter object)"""
+        types = self.vocabulary.types
+        return Counter({types[i]: c for i, c in self._content()})
+
+    def most_common(self, n):
+        """Returns the `n` most common non-stopword tokens with their counts (list)"""
+        types = self.vocabulary.types
+        return [(types[i], c) for i, c in nlargest(n, self._content(), key=itemgetter(1))]
+
+    def count(self, word):
+        """Returns the number of occurrences of a non-stopword token (int)"""
+        i = self.vocabulary.get(word)
+        if i is None or self.vocabulary.stops[i]:
+            return 0
+        return self.counts[i]
+
+    @property
+    def type_count(self):
+        """Number of distinct tokens (int)"""
+        return len(self.counts)
+
+    @property
+    def char_count(self):
+        """Sum of the lengths of all tokens (int)"""
+        types = self.vocabulary.types
+        return sum(len(types[i]) * c for i, c in self.counts.items())
+
+    @property
+    def hapax_count(self):
+        """Number of non-stopword types occurring only once (int)"""
+        return sum(1 for _, c in self._content() if c == 1)
@@ -0,0 +1,195 @@
+"""
+Persistent cache of analyzed texts. Each file's TextRecord (metadata and
+metrics) is stored in a SQLite database keyed by absolute path, with the
+file's modification time, size and a hash of its content, so unchanged files
+are not parsed again when a Collection is reloaded.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from . import stopwords
+from .text import METRICS, TextRecord
+from .tokenizer import TOKENIZER
+
+# Bump when the way texts are parsed or measured changes
+CACHE_VERSION = 1
+
+
+def default_path():
+    """Returns the default cache file, under $XDG_CACHE_HOME or ~/.cache (str)"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pytextos", "analysis.sqlite")
+
+
+def content_hash(data):
+    """Returns the hash of a file's content used by the cache (str)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_hash(path, block=1 << 20):
+    """Returns the content_hash() of a file, read `block` bytes at a time (str)"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for data in iter(lambda: f.read(block), b""):
+            h.update(data)
+    return h.hexdigest()
+
+
+def version_stamp():
+    """
+    Returns the version stamp of cached entries: changes with CACHE_VERSION,
+    the record fields, the tokenizer mapping and the stopword list (str)
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(repr((TextRecord._fields, METRICS, sorted(TOKENIZER.mapping.items()))).encode())
+    h.update("\n".join(sorted(stopwords.ENGLISH_STOPS)).encode())
+    return f"{CACHE_VERSION}-{h.hexdigest()}"
+
+
+class AnalysisCache:
+    """
+    SQLite store of TextRecords. An entry is valid while the file keeps its
+    size and modification time, or, if only the modification time changed,
+    while its content hash is the same. Entries written with another version
+    stamp are discarded when the cache is opened, and the least recently
+    used entries are evicted beyond `max_entries`. The connection is shared
+    by all threads, one statement at a time.
+    """
+
+    def __init__(self, path=None, max_entries=1_000_000):
+        self.path = path or default_path()
+        self.max_entries = max_entries
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.RLock()
+        with self._db:
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries (path TEXT PRIMARY KEY, mtime_ns INTEGER,"
+                " size INTEGER, hash TEXT, record TEXT, used REAL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            version = version_stamp()
+            if row is None or row[0] != version:
+                self._db.execute("DELETE FROM entries")
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,))
+            # Kept up to date by this object, so that writes don't count the
+            # table; entries written meanwhile by other processes are counted
+            # by evict()
+            self._count = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __repr__(self):
+        return f"<AnalysisCache: {len(self)} entries in {self.path}>"
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def get(self, path, stat=None):
+        """Returns the cached TextRecord of a file, or None"""
+        return self.get_many([path], None if stat is None else [stat]).get(path)
+
+    def get_many(self, paths, stats=None):
+        """
+        Returns a dict of the cached TextRecords of `paths`, leaving out files
+        that are not cached or have changed. `stats` are optional os.stat()
+        results for the paths, to avoid calling stat again.
+        """
+        found, used = {}, []
+        if stats is None:
+            stats = map(os.stat, paths)
+        for path, st in zip(paths, stats):
+            key = os.path.abspath(path)
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT mtime_ns, size, hash, record FROM entries WHERE path = ?", (key,)
+                ).fetchone()
+            if row is None or row[1] != st.st_size:
+                continue
+            if row[0] != st.st_mtime_ns:
+                # Touched but maybe not changed: compare content
+                with open(path, "rb") as f:
+                    if content_hash(f.read()) != row[2]:
+                        continue
+            found[path] = TextRecord(*json.loads(row[3]))._replace(filename=path)
+            used.append((st.st_mtime_ns, time.time(), key))
+        with self._lock, self._db:
+            self._db.executemany("UPDATE entries SET mtime_ns = ?, used = ? WHERE path = ?", used)
+        return found
+
+    def put(self, record, data, stat=None):
+        """Stores the TextRecord of a file, given the file's content as bytes"""
+        self.put_many([(record, content_hash(data), stat or os.stat(record.filename))])
+
+    def put_many(self, entries):
+        """Stores (record, content hash, os.stat result) tuples in one transaction"""
+        now = time.time()
+        rows = [
+            (os.path.abspath(r.filename), st.st_mtime_ns, st.st_size, h, json.dumps(r), now)
+            for r, h, st in entries
+        ]
+        with self._lock, self._db:
+            keys = {row[0] for row in rows}
+            cached = sum(
+                self._db.execute("SELECT 1 FROM entries WHERE path = ?", (key,)).fetchone() is not None
+                for key in keys
+            )
+            self._db.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._count += len(keys) - cached
+            if self.max_entries is not None:
+                self._evict(self.max_entries)
+
+    def evict(self, max_entries=None, missing=False):
+        """
+        Deletes the least recently used entries beyond `max_entries` (by
+        default the cache's own limit), and the entries of files that no
+        longer exist if `missing` is True. Returns the number of deleted
+        entries (int).
+        """
+        if max_entries is None:
+            max_entries = self.max_entries
+        deleted = 0
+        with self._lock, self._db:
+            self._count = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if max_entries is not None:
+                deleted = self._evict(max_entries)
+            if missing:
+                gone = [
+                    (p,) for (p,) in self._db.execute("SELECT path FROM entries")
+                    if not os.path.exists(p)
+                ]
+                self._db.executemany("DELETE FROM entries WHERE path = ?", gone)
+                self._count -= len(gone)
+                deleted += len(gone)
+        return deleted
+
+    def _evict(self, max_entries):
+        """
+        Deletes the least recently used entries beyond `max_entries` (with
+        the lock held), reading only those from the index on `used` (int)
+        """
+        excess = self._count - max_entries
+        if excess <= 0:
+            return 0
+        deleted = self._db.execute(
+            "DELETE FROM entries WHERE path IN (SELECT path FROM entries ORDER BY used LIMIT ?)",
+            (excess,),
+        ).rowcount
+        self._count -= deleted
+        return deleted
+
+    def clear(self):
+        """Deletes every entry"""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries")
+            self._count = 0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -1,43 +1,856 @@
 from pytextos.text import Text
+from pytextos.dialog import GetPath
+from pytextos.discovery import Discovery, FileInfo, discover
+from pytextos.index import InvertedIndex, PositionalIndex, MetadataIndex
+from pytextos.table import MetricsTable
+from pytextos.tokenizer import TOKENIZER
+from pytextos import stopwords
 import os, csv
-from secrets import choice
 import re
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from array import array
+from glob import glob
+from functools import partial
 
-from tkinter import Tk, filedialog
 
-# Helper function to select collection folder via dialog
-def GetPath():
-    root = Tk()
-    root.withdraw()
-    return filedialog.askdirectory()
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _analyze_bytes(path, data):
+    # Analysis of a file already read by the parent, in a worker process
+    return Text.from_bytes(path, data).record()
+
+
+def _analyze_hashed(path):
+    # Analysis and content hash of a file for the persistent cache
+    from pytextos.cache import content_hash
+    data = _read(path)
+    return _analyze_bytes(path, data), content_hash(data)
+
+
+def _open_cache(cache):
+    """Returns an AnalysisCache from True (default location), a path or a cache"""
+    from pytextos.cache import AnalysisCache
+    if isinstance(cache, AnalysisCache):
+        return cache
+    return AnalysisCache(None if cache is True else os.fspath(cache))
+
+
+def _stamp(path):
+    """Returns (mtime_ns, size) of a file, or None if it can't be read"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _filename(text):
+    """Returns the file a member was read from, "" for Extracts (str)"""
+    return getattr(text, "filename", "")
+
+
+def _parsed(text):
+    # Text() prints an error and returns a Text without metadata when the
+    # file is missing or isn't a .txt file
+    return hasattr(text, "title")
+
+
+def _reloadable(text):
+    # Members edited in memory or created there, e.g. Extracts, would lose
+    # their body if unloaded
+    return bool(_filename(text)) and not text.edited
+
+
+# Filenames affected by Collection.refresh()
+Changes = namedtuple("Changes", "added changed removed")
+
+
+def _unloaded(text):
+    # Stats-only members keep their metadata and metrics only
+    text.unload(keep_freq=False)
+    return text
+
+
+def _parse_file(path, lazy=False, unload=False, keep_freq=False):
+    # Runs in loading threads: parses and analyzes a file
+    text = Text(path, lazy=lazy)
+    if not lazy:
+        text.token_count
+    if unload:
+        text.unload(keep_freq=keep_freq)
+    return text
+
+
+def _executor(jobs=None, threads=None):
+    """Returns a pool of `jobs` processes or of `threads` threads, or None"""
+    # Imported here, concurrent.futures pulls in multiprocessing and logging
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    if jobs and jobs > 1:
+        return ProcessPoolExecutor(max_workers=jobs)
+    if threads and threads > 1:
+        return ThreadPoolExecutor(max_workers=threads)
+    return None
+
+
+class _Side:
+    # One side of a _ReadWriteLock, used as a context manager
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(self, acquire, release):
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self):
+        self._acquire()
+
+    def __exit__(self, *exc):
+        self._release()
+
+
+class _ReadWriteLock:
+    """
+    Lock held by any number of readers at once or by a single writer:
+    `with lock.reading:` / `with lock.writing:`. The writer can take either
+    side again, and so can a reader take the reading side, but a reader
+    can't start writing. New readers wait for a waiting writer.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = {}  # thread ID -> depth
+        self._writer = None
+        self._writes = 0
+        self._waiting = 0  # writers
+        self.reading = _Side(self._read, self._unread)
+        self.writing = _Side(self._write, self._unwrite)
+
+    def _read(self):
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writes += 1
+                return
+            if me not in self._readers:
+                while self._writer is not None or self._waiting:
+                    self._condition.wait()
+            self._readers[me] = self._readers.get(me, 0) + 1
+
+    def _unread(self):
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writes -= 1
+                return
+            depth = self._readers.pop(me) - 1
+            if depth:
+                self._readers[me] = depth
+            elif not self._readers:
+                self._condition.notify_all()
+
+    def _write(self):
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writes += 1
+                return
+            if me in self._readers:
+                raise RuntimeError("Can't change a collection while reading it in the same thread")
+            self._waiting += 1
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._waiting -= 1
+            self._writer = me
+            self._writes = 1
+
+    def _unwrite(self):
+        with self._condition:
+            self._writes -= 1
+            if not self._writes:
+                self._writer = None
+                self._condition.notify_all()
+
+
+def _parse_bytes(path, data):
+    text = Text.from_bytes(path, data)
+    text.token_count  # analyzed here rather than when sorting members
+    return text
 
 
 # Collection class definition
 class Collection:
     """Group of Text Objects to be collected, queried, listed, compared and
-       exported according to different criteria: if no folder is provided in
-       instance's parameters, it will be selected with a dialog.
+       exported according to different criteria. Collections can be used
+       from several threads at once, e.g. while one runs Collection.watch().
     """
 
-    def __init__(self, folder=None, title="Unnamed Collection"):
-        
+    def __init__(self, folder=None, title="Unnamed Collection", lazy=False, jobs=None, cache=None,
+                 positions=False, stats_only=False, resident=None, threads=None):
+        """
+        Reads members from `folder`: a folder path, a glob pattern such as
+        "texts/**/*.txt", a Discovery or an iterable of file paths, stored as
+        absolute paths; without it the collection starts empty (see
+        Collection.from_dialog()). `lazy`, `jobs`, `threads` and `cache`
+        decide how files are read (see Collection._load()), `positions`
+        builds the phrase index while loading, and `stats_only` and
+        `resident` bound the bodies kept in memory (see Collection._release()).
+        """
         self.title = title
-        if folder:
-            self.folder=folder
-        else:
-            self.folder = GetPath()
-        # Validating folder
+        self.folder = None
+        self.lazy = lazy
+        self.stats_only = stats_only
+        self.resident = resident
+        self._resident = OrderedDict()  # Text -> None, least recently used first
+        self._lock = _ReadWriteLock()  # members: read by queries, written by changes
+        self._build_lock = threading.Lock()  # lazily built indexes
+        self._resident_lock = threading.Lock()
+        self._queries_lock = threading.Lock()
+        self._members = []
+        self._texts = {}  # member ID -> Text
+        self._ids = {}  # Text -> member ID
+        self._next_id = 0
+        self._index = None if lazy or stats_only else InvertedIndex()
+        self._positions = PositionalIndex() if positions else None
+        self._metadata = MetadataIndex(release=self._release)
+        self._table = None
+        self._version = 0  # incremented when members are added or removed
+        self._queries = {}  # query string -> [version, Plan, IDs]
+        self._sources = []  # ("folder", path) / ("glob", pattern) / ("paths", paths)
+        self._files = {}  # filename -> member
+        self._stamps = {}  # filename -> (mtime_ns, size) when loaded
+        self._discovered = {}  # filename -> FileInfo, until the file is loaded
+        self._sourced = set()  # filenames found in the sources, which refresh() checks
+        self.cache = _open_cache(cache) if cache else None
+        paths = self._paths(folder)
+        self._sourced.update(paths)
+        if paths:
+            self._load(paths, lazy, jobs, threads)
+
+    def _paths(self, folder):
+        """
+        Returns the list of .txt files in a folder, glob pattern, Discovery or
+        iterable of paths, keeping the size and modification time of the
+        files found by walking folders
+        """
+        if folder is None:
+            return []
+        if isinstance(folder, Discovery):
+            self._sources.append(("discovery", folder))
+            found = list(folder)
+            self._discovered.update((f.path, f) for f in found)
+            return [f.path for f in found]
+        if isinstance(folder, (str, os.PathLike)):
+            folder = os.fspath(folder)
+            if any(c in folder for c in "*?["):
+                self._sources.append(("glob", os.path.abspath(folder)))
+                return [
+                    os.path.abspath(f) for f in glob(folder, recursive=True) if f.endswith(".txt")
+                ]
+            # Validating folder
+            root = os.path.abspath(folder)
+            try:
+                found = list(discover(root, max_depth=0))
+            except (FileNotFoundError, NotADirectoryError):
+                print("Not a valid path.")
+                return []
+            self.folder = folder
+            self._sources.append(("folder", root))
+            self._discovered.update((f.path, f) for f in found)
+            return [f.path for f in found]
+        paths = []
+        for f in folder:
+            if isinstance(f, FileInfo):
+                f = f._replace(path=os.path.abspath(f.path))
+                self._discovered[f.path] = f
+                paths.append(f.path)
+            else:
+                paths.append(os.path.abspath(f))
+        self._sources.append(("paths", paths))
+        return paths
+
+    @classmethod
+    def from_dialog(cls, title="Unnamed Collection", lazy=False, jobs=None, cache=None, threads=None):
+        """Creates a Collection from a folder selected with a dialog (requires Tk)"""
+        return cls(GetPath(), title=title, lazy=lazy, jobs=jobs, cache=cache, threads=threads)
+
+    @classmethod
+    async def aload(cls, folder, title="Unnamed Collection", concurrency=64, jobs=None):
+        """
+        Creates a Collection asynchronously, overlapping up to `concurrency`
+        file reads, e.g. `await Collection.aload(folder, concurrency=64)`.
+        See Collection.astream() for the details.
+        """
+        collection = cls(title=title)
+        async for _ in collection.astream(folder, concurrency, jobs):
+            pass
+        return collection
+
+    async def astream(self, folder, concurrency=64, jobs=None):
+        """
+        Adds the texts in `folder` (folder, glob pattern or iterable of paths)
+        to the collection and yields each Text as soon as it is ready.
+        Files are read in a thread pool, at most `concurrency` at a time, and
+        analyzed in `jobs` worker processes, or in the reading threads
+        without `jobs`. Each Text is a member when it is yielded; members
+        are sorted once every file is loaded or the loop is left.
+        """
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        threads = ThreadPoolExecutor(max_workers=concurrency)
+        processes = ProcessPoolExecutor(max_workers=jobs) if jobs and jobs > 1 else None
+
+        async def load(path):
+            async with semaphore:
+                data = await loop.run_in_executor(threads, _read, path)
+                if processes is None:
+                    return await loop.run_in_executor(threads, _parse_bytes, path, data)
+                record = await loop.run_in_executor(processes, _analyze_bytes, path, data)
+                return Text.from_record(record)
+
+        paths = self._paths(folder)
+        self._sourced.update(paths)
+        tasks = [asyncio.ensure_future(load(p)) for p in paths]
         try:
-            os.chdir(self.folder)
-            members= [Text(f) for f in os.listdir() if f.endswith(".txt")]
-            members.sort(key=lambda f:f.token_count, reverse=True)
-            self._members=members 
-        except FileNotFoundError:
-            print("Not a valid path.")
+            for task in asyncio.as_completed(tasks):
+                text = await task
+                if self.stats_only:
+                    text.unload(keep_freq=False)
+                # Registered before it is yielded, so that the collection
+                # stays usable if the loop is left early
+                with self._lock.writing:
+                    self._members.append(text)
+                    self._register([text])
+                yield text
+        finally:
+            for task in tasks:
+                task.cancel()
+            threads.shutdown(wait=False)
+            if processes is not None:
+                processes.shutdown(wait=False)
+            # Sorting by filename first keeps the order independent of timing
+            with self._lock.writing:
+                self._members = self._sorted(sorted(self._members, key=_filename))
+
+    def _load(self, paths, lazy=False, jobs=None, threads=None):
+        """
+        Creates members from a list of file paths and sorts them. With `lazy`
+        members only read their header and footer until their body is
+        needed, and are sorted by filename instead of word count. With
+        `jobs=N` files are analyzed in N worker processes as planned by
+        pytextos.scheduler, and members read their body from disk when it is
+        needed; with `threads=N` they are parsed in N threads, which scales
+        with free-threaded Python. With a cache, records of unchanged files
+        are read from it and only the other files are analyzed.
+        """
+        # Sorted input and a stable sort keep member order deterministic
+        paths = sorted(paths)
+        if self.cache is not None and not lazy:
+            members = self._load_cached(paths, jobs, threads)
+        elif self.cache is not None:
+            # Cached records where there are some, headers and footers otherwise
+            records = self.cache.get_many(paths)
+            members = [
+                Text.from_record(records[p]) if p in records else Text(p, lazy=True)
+                for p in paths
+            ]
+        elif jobs and jobs > 1 and not lazy:
+            # Sizes from discovery where known, to batch, order and split files
+            from pytextos import scheduler
+            sizes = [(self._discovered.get(p) or os.stat(p)).st_size for p in paths]
+            records = scheduler.analyze(list(zip(paths, sizes)), jobs)
+            members = [Text.from_record(records[p]) for p in paths]
+        elif threads and threads > 1 and len(paths) > 1:
+            # Members are unloaded in the threads when only a few are kept,
+            # keeping word counts until they are indexed
+            unload = (self.stats_only or self.resident is not None) and not lazy
+            keep_freq = not self.stats_only
+            with _executor(threads=threads) as pool:
+                parse = partial(_parse_file, lazy=lazy, unload=unload, keep_freq=keep_freq)
+                members = list(pool.map(parse, paths))
+        else:
+            members= (Text(f, lazy=lazy) for f in paths)
+        if self.stats_only and not lazy:
+            # Unloaded one by one, so that at most one body is in memory
+            members = map(_unloaded, members)
+        elif self.resident is not None and not lazy:
+            # Word counts are kept until they are indexed, so that evicted
+            # members are not read again
+            members = map(partial(self._touch, keep_freq=True), members)
+        members = self._sorted(members, lazy)
+        with self._lock.writing:
+            self._members = members
+            self._register(members, keep_freq=self.resident is not None)
+        if self.resident is not None and not lazy:
+            with self._resident_lock:
+                resident = set(self._resident)
+            for text in members:
+                if text not in resident:
+                    text.unload(keep_freq=False)
+
+    def _register(self, texts, keep_freq=False):
+        """
+        Gives member IDs to new members and indexes them (with the lock held).
+        With `keep_freq` members evicted meanwhile keep their word counts.
+        """
+        for text in texts:
+            if text not in self._ids:
+                text_id = self._ids[text] = self._next_id
+                self._texts[text_id] = text
+                self._next_id += 1
+                self._version += 1
+                self._metadata.add(text_id, text)
+                filename = _filename(text)
+                if filename:
+                    self._files[filename] = text
+                    info = self._discovered.pop(filename, None)
+                    if info is None:
+                        self._stamps[filename] = _stamp(filename)
+                    else:
+                        self._stamps[filename] = (info.mtime_ns, info.size)
+                if self._table is not None:
+                    self._table.add(text_id, text)
+                if self._index is not None:
+                    self._index.add(text_id, text.freq_dist())
+                if self._positions is not None:
+                    self._positions.add(text_id, text.tokenize())
+                self._release(text, keep_freq)
+
+    @property
+    def index(self):
+        """
+        InvertedIndex of the words of the members, by member ID, built while
+        loading or on first use for lazy and stats-only collections
+        """
+        if self._index is None:
+            with self._lock.reading, self._build_lock:
+                if self._index is None:
+                    index = InvertedIndex()
+                    for text_id, text in self._texts.items():
+                        index.add(text_id, text.freq_dist())
+                        self._release(text)
+                    self._index = index
+        return self._index
+
+    @property
+    def positions(self):
+        """
+        PositionalIndex of the tokens of the members, by member ID, built
+        while loading with `positions=True` or on first use
+        """
+        if self._positions is None:
+            with self._lock.reading, self._build_lock:
+                if self._positions is None:
+                    positions = PositionalIndex()
+                    for text_id, text in self._texts.items():
+                        positions.add(text_id, text.tokenize())
+                        self._release(text)
+                    self._positions = positions
+        return self._positions
+
+    def _release(self, text, keep_freq=False):
+        """
+        Called after using the body of a member: unloads it at once in
+        stats-only mode, or once it is no longer among the `resident` most
+        recently used members. Unloaded members keep their metadata and
+        metrics (see Text.unload) and read their body again when needed;
+        members edited in memory are kept.
+        """
+        if not _reloadable(text):
+            return
+        if self.stats_only and not self.lazy:
+            text.unload(keep_freq=False)
+        elif self.resident is not None:
+            self._touch(text, keep_freq)
+
+    def _touch(self, text, keep_freq=False):
+        """
+        Marks a member as the most recently used, unloading the least recently
+        used ones, with their word counts unless `keep_freq` is True
+        """
+        if self.resident is not None:
+            evicted = []
+            with self._resident_lock:
+                resident = self._resident
+                resident[text] = None
+                resident.move_to_end(text)
+                while len(resident) > self.resident:
+                    evicted.append(resident.popitem(last=False)[0])
+            for old in evicted:
+                if old.loaded and _reloadable(old):
+                    old.unload(keep_freq=keep_freq)
+        return text
+
+    @property
+    def table(self):
+        """
+        MetricsTable of the metrics of the members, by member ID, built on
+        first use for sorting, grouping and exporting
+        """
+        if self._table is None:
+            with self._lock.reading, self._build_lock:
+                if self._table is None:
+                    table = MetricsTable()
+                    for text_id, text in self._texts.items():
+                        table.add(text_id, text)
+                        self._release(text)
+                    self._table = table
+        return self._table
+
+    def extend(self, texts):
+        """
+        Adds several Texts or file paths, sorting members once. Members of
+        the same files are replaced.
+        """
+        texts = [
+            t if isinstance(t, Text) else Text(os.path.abspath(t), lazy=self.lazy) for t in texts
+        ]
+        with self._lock.writing:
+            # The last Text of each file, and every Text without one
+            new = {_filename(t) or id(t): t for t in texts if _parsed(t) and t not in self._ids}
+            new = list(new.values())
+            self._replace(new)
+            self._members = self._sorted(self._members + new, self.lazy)
+            self._register(new)
+
+    def add(self, text):
+        """
+        Adds a Text, or the Text in a file path, keeping members sorted. A
+        member of the same file is replaced.
+        """
+        if not isinstance(text, Text):
+            text = Text(os.path.abspath(text), lazy=self.lazy)
+        if not _parsed(text):
+            return
+        with self._lock.writing:
+            if text in self._ids:
+                return
+            self._replace([text])
+            members = self._members
+            lo, hi = 0, len(members)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self.lazy:
+                    after = _filename(members[mid]) <= _filename(text)
+                else:
+                    after = members[mid].token_count >= text.token_count
+                if after:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            members.insert(lo, text)
+            self._register([text])
+
+    def _replace(self, texts):
+        """Removes the members of the files of new members (with the lock held)"""
+        for text in texts:
+            filename = _filename(text)
+            old = self._files.get(filename)
+            if old is not None:
+                sourced = filename in self._sourced
+                self.remove(old)
+                if sourced:
+                    self._sourced.add(filename)
+
+    def remove(self, text):
+        """Removes a member from the collection"""
+        with self._lock.writing:
+            text_id = self._ids.pop(text)
+            del self._texts[text_id]
+            self._members.remove(text)
+            with self._resident_lock:
+                self._resident.pop(text, None)
+            filename = _filename(text)
+            if filename and self._files.get(filename) is text:
+                del self._files[filename]
+                del self._stamps[filename]
+                self._sourced.discard(filename)
+            self._metadata.remove(text_id)
+            self._version += 1
+            if self._table is not None:
+                self._table.remove(text_id)
+            if self._index is not None:
+                self._index.remove(text_id)
+            if self._positions is not None:
+                self._positions.remove(text_id)
+
+    def _scan(self, paths=None):
+        """
+        Returns a dict of filename -> (mtime_ns, size) of the files currently
+        in the collection's folders, patterns and path lists, or only of
+        those among `paths`
+        """
+        found = {}
+        for kind, source in self._sources:
+            if kind in ("folder", "discovery"):
+                if kind == "folder":
+                    source = Discovery(source, max_depth=0)
+                if paths is None:
+                    found.update((f.path, (f.mtime_ns, f.size)) for f in source)
+                    continue
+                stamps = ((p, _stamp(p)) for p in paths if source.matches(p))
+            elif kind == "glob":
+                names = glob(source, recursive=True)
+                if paths is not None:
+                    names = set(names).intersection(paths)
+                stamps = ((p, _stamp(p)) for p in names if p.endswith(".txt"))
+            else:
+                names = source if paths is None else set(source).intersection(paths)
+                stamps = ((p, _stamp(p)) for p in names)
+            found.update((p, stamp) for p, stamp in stamps if stamp is not None)
+        return found
+
+    def refresh(self, paths=None):
+        """
+        Brings the collection up to date with its folders: adds new files,
+        analyzes changed files again (detected by modification time and
+        size) and drops deleted ones, updating indexes and metric columns
+        for those members only. Members added with add() or extend() from
+        files outside the folders are left alone. With `paths` only those files are checked.
+        Files that can't be parsed yet, e.g. while they are being written,
+        are left out, and only reported once a later refresh can read them.
+        Returns the Changes as lists of filenames.
+        """
+        if paths is not None:
+            paths = [os.path.abspath(p) for p in paths]
+        found = self._scan(paths)
+        with self._lock.writing:
+            # Members added from elsewhere with add() or extend() are kept
+            self._sourced.update(found)
+            checked = self._files if paths is None else [p for p in paths if p in self._files]
+            removed = [p for p in checked if p in self._sourced and p not in found]
+            changed = [
+                p for p, stamp in found.items() if p in self._files and self._stamps[p] != stamp
+            ]
+            added = [p for p in found if p not in self._files]
+            for path in removed + changed:
+                self.remove(self._files[path])
+            new, skipped = [], set()
+            for path in changed + added:
+                try:
+                    new.append(self._open(path))
+                except (IndexError, UnicodeDecodeError, OSError):
+                    skipped.add(path)
+            # Members of changed files that can't be parsed are gone as well
+            removed += [p for p in changed if p in skipped]
+            changed = [p for p in changed if p not in skipped]
+            added = [p for p in added if p not in skipped]
+            if len(new) == 1:
+                self.add(new[0])
+            elif new:
+                self.extend(new)
+        return Changes(added, changed, removed)
+
+    def _open(self, path):
+        """Returns a new member for a file, from the cache if it has its record"""
+        if self.cache is None:
+            text = Text(path, lazy=self.lazy)
+            if not _parsed(text):
+                raise FileNotFoundError(path)
+            return text
+        record = self.cache.get(path)
+        if record is None:
+            record, content_hash = _analyze_hashed(path)
+            self.cache.put_many([(record, content_hash, os.stat(path))])
+        return Text.from_record(record)
+
+    def watch(self, interval=1.0, timeout=None):
+        """
+        Yields the Changes of the collection as files are added, changed or
+        deleted, e.g. `for changes in collection.watch(): ...`. Folders and
+        path lists are watched with inotify where available, so a change is
+        picked up as soon as the file is closed; otherwise, and for glob
+        patterns and Discovery walks, the files are checked every `interval`
+        seconds. Stops
+        after `timeout` seconds without changes, or runs until the loop is
+        left.
+        """
+        from pytextos.watch import Watcher
+
+        directories = {}
+        for kind, source in self._sources:
+            if kind == "folder":
+                directories[source] = source
+            elif kind == "paths":
+                for path in source:
+                    directory = os.path.dirname(path)
+                    directories[directory] = directory
+            else:
+                directories = None  # glob patterns and recursive discovery are polled
+                break
+        with Watcher(directories, interval) as watcher:
+            idle = 0.0
+            while timeout is None or idle < timeout:
+                start = time.monotonic()
+                paths = watcher.wait(None if timeout is None else timeout - idle)
+                changes = self.refresh(paths) if paths != set() else Changes([], [], [])
+                if any(changes):
+                    idle = 0.0
+                    yield changes
+                else:
+                    idle += time.monotonic() - start
+
+    def containing(self, *words, exclude=(), match="all"):
+        """
+        Returns the members containing all the `words` (or any of them with
+        match="any") and none of the words in `exclude`, in loading order.
+        Stopwords are not indexed.
+        """
+        with self._lock.reading:
+            ids = self.index.lookup(words, exclude, match)
+            return [self._texts[i] for i in sorted(ids)]
+
+    def where(self, **conditions):
+        """
+        Returns a CollectionView of the members matching every condition, in
+        loading order. Metadata fields take a value or a set of values, e.g.
+        where(genre="news", by={"Jane Austen", "Mary Shelley"}); metrics take a
+        (low, high) range with both ends included and None for no bound, e.g.
+        where(token_count=(500, 800), reading_time=(None, 5)). Metadata and
+        metrics are indexed on first use.
+        """
+        with self._lock.reading:
+            return CollectionView(self, self._metadata.where(**conditions))
+
+    def sort_by(self, metric, descending=False):
+        """
+        Returns a CollectionView of the members sorted by a metric, e.g.
+        sort_by("lex_div_maas", descending=True). Ties keep loading order and
+        members for which the metric is not defined come last.
+        """
+        with self._lock.reading:
+            return CollectionView(self, self.table.sort(metric, descending))
+
+    def group_by(self, field, metric="token_count", aggregate="mean"):
+        """
+        Returns a dict of each value of a metadata field (e.g. "genre") to an
+        aggregate of a metric over the members with that value: count, sum,
+        mean, median, min or max
+        """
+        with self._lock.reading:
+            keys = self._metadata.values(field)
+            return self.table.group_by(keys, metric, aggregate)
+
+    def query(self, query):
+        """
+        Returns a CollectionView of the members matching a query string, e.g.
+        'genre:news AND words:500..900 AND contains:"climate change" SORT
+        lexdiv DESC LIMIT 20' (see pytextos.query for the syntax). Results
+        are cached until members are added or removed.
+        """
+        with self._lock.reading:
+            entry = self._compiled(query)
+            if entry[2] is None:
+                entry[2] = entry[1].run()
+            return CollectionView(self, entry[2])
+
+    def plan(self, query):
+        """Returns the execution Plan of a query string, printable to see the chosen indexes"""
+        with self._lock.reading:
+            return self._compiled(query)[1]
+
+    def _compiled(self, query, max_queries=128):
+        """Returns the cached [version, Plan, IDs or None] of a query string"""
+        from pytextos.query import Plan, parse
+        with self._queries_lock:
+            entry = self._queries.pop(query, None)
+            if entry is not None and entry[0] == self._version:
+                self._queries[query] = entry  # most recently used last
+                return entry
+        # Planned without the queries lock, while members can't change
+        entry = [self._version, None, None]
+        entry[1] = Plan(parse(query), self)
+        with self._queries_lock:
+            self._queries[query] = entry
+            while len(self._queries) > max_queries:
+                del self._queries[next(iter(self._queries))]
+        return entry
+
+    def search(self, query, k=10):
+        """
+        Returns the `k` members most relevant to `query` as (Text, score)
+        pairs, ranked by BM25 over the tokens of the query, stopwords excluded
+        """
+        words = [w for w in TOKENIZER.tokenize(query) if w.lower() not in stopwords.ENGLISH_STOPS]
+        with self._lock.reading:
+            return [(self._texts[i], score) for i, score in self.index.bm25(words, k)]
+
+    def find_phrase(self, phrase):
+        """
+        Returns (Text, positions) pairs for the members containing the exact
+        sequence of tokens in `phrase`, with the token positions where it starts
+        """
+        words = [w for w in TOKENIZER.tokenize(phrase) if w]
+        with self._lock.reading:
+            found = self.positions.phrase(words)
+            return [(self._texts[i], found[i]) for i in sorted(found)]
+
+    def concordance(self, phrase, width=5):
+        """
+        Returns keyword-in-context lines for `phrase` as (Text, left, match,
+        right) tuples, with up to `width` words of context on each side taken
+        from the original text
+        """
+        length = len([w for w in TOKENIZER.tokenize(phrase) if w])
+        lines = []
+        for text, starts in self.find_phrase(phrase):
+            spans = text.spans
+            for start in starts:
+                lines.append((text, *spans.context(start, width, length)))
+            self._release(text)
+        return lines
+
+    def print_concordance(self, phrase, width=5):
+        for text, left, match, right in self.concordance(phrase, width):
+            print(left.rjust(40)[-40:], match, right.ljust(40)[:40], f"({text.title})")
+
+    def word_counts(self, word):
+        """Returns (Text, count) pairs for the members using a word, most frequent first"""
+        with self._lock.reading:
+            postings = self.index.postings(word)
+            return [
+                (self._texts[i], c)
+                for i, c in sorted(postings.items(), key=lambda p: (-p[1], p[0]))
+            ]
+
+    def _load_cached(self, paths, jobs=None, threads=None):
+        """Returns members from cached records, analyzing and caching the other files"""
+        stats = [self._discovered.get(p) or os.stat(p) for p in paths]
+        records = self.cache.get_many(paths, stats)
+        missing = [(p, st) for p, st in zip(paths, stats) if p not in records]
+        if jobs and jobs > 1 and len(missing) > 1:
+            # Batched, ordered and split by size like uncached loads
+            from pytextos import scheduler
+            analyzed = scheduler.analyze([(p, st.st_size) for p, st in missing], jobs, hashes=True)
+            analyzed = [analyzed[p] for p, _ in missing]
+        elif threads and threads > 1 and len(missing) > 1:
+            with _executor(threads=threads) as pool:
+                chunksize = max(1, len(missing) // (threads * 8))
+                analyzed = list(pool.map(_analyze_hashed, [p for p, _ in missing], chunksize=chunksize))
+        else:
+            analyzed = [_analyze_hashed(p) for p, _ in missing]
+        self.cache.put_many([(r, h, st) for (r, h), (_, st) in zip(analyzed, missing)])
+        records.update((r.filename, r) for r, _ in analyzed)
+        return [Text.from_record(records[p]) for p in paths]
+
+    @staticmethod
+    def _sorted(members, lazy=False):
+        if lazy:
+            return sorted(members, key=_filename)
+        return sorted(members, key=lambda f:f.token_count, reverse=True)
     
-    def print_members(self):
-        for text in self._members:
-            print(f"{self._members.index(text)})".rjust(3), f"{text.title} - {text.by.split()[-1]}".ljust(76, "."), f"{text.token_count:,}".rjust(7), "words")
+    def print_members(self, word_counts=True):
+        for i, text in enumerate(self):
+            if word_counts:
+                print(f"{i})".rjust(3), f"{text.title} - {text.by.split()[-1]}".ljust(76, "."), f"{text.token_count:,}".rjust(7), "words")
+            else:
+                print(f"{i})".rjust(3), f"{text.title} - {text.by.split()[-1]}")
 
     def __repr__(self):
         return f"<Collection: {self.title}>"
@@ -46,7 +859,17 @@ class Collection:
         return len(self._members)
 
     def __getitem__(self, i):
-        return self._members[i]
+        members = self._members[i]
+        if self.resident is not None:
+            for text in members if isinstance(i, slice) else [members]:
+                self._touch(text)
+        return members
+
+    def __iter__(self):
+        with self._lock.reading:
+            members = list(self._members)
+        for text in members:
+            yield self._touch(text)
 
     def to_csv(self, filename):
         with open(filename, "w", encoding="utf-8") as csvfile:
@@ -68,27 +891,40 @@ class Collection:
                 "Keywords",
             ]
             collection_writer.writerow(headers)
-            for t in self._members:
+            with self._lock.reading:
+                table = self.table
+                rows = [(t, table.row(self._ids[t])) for t in self._members]
+            # Files in the collection's folders are listed by name, as before
+            # members stored absolute paths
+            folders = {source for kind, source in self._sources if kind == "folder"}
+            for t, metrics in rows:
+                name = _filename(t) or t.title
+                if os.path.dirname(name) in folders:
+                    name = os.path.basename(name)
                 collection_writer.writerow(
                     [
-                        t.filename,
+                        name,
                         t.by,
                         t.date,
                         t.text_type,
                         t.genre,
-                        t.token_count,
-                        t.lex_div_maas,
-                        t.hapax_richness,
-                        t.avg_word_len,
-                        t.avg_sentence_len,
-                        t.reading_time,
+                        metrics["token_count"],
+                        metrics["lex_div_maas"],
+                        metrics["hapax_richness"],
+                        metrics["avg_word_len"],
+                        metrics["avg_sentence_len"],
+                        metrics["reading_time"],
                         t.keywords,
                     ]
                 )
+                self._release(t)
 
 
     def random(self):
-        random_text=choice(self._members)
+        from secrets import choice  # imported here, it pulls in hashlib
+        with self._lock.reading:
+            random_text = choice(self._members)
+        random_text=self._touch(random_text)
         random_line=random_text.random_sent()
         if len(random_line)>8:
             return (f"{random_text.random_sent()}\n\t--{random_text.by}, {random_text.title}.\n")
@@ -96,4 +932,42 @@ class Collection:
             print("Try again.")
 
     def print_random(self):
-        print(self.random())    
\ No newline at end of file
+        print(self.random())    
+
+
+class CollectionView:
+    """
+    Read-only selection of the members of a Collection, as returned by
+    Collection.where() and Collection.query(). Only member IDs are kept;
+    Texts are looked up in the collection when accessed. Views don't follow
+    later changes to the collection: removed members are skipped.
+    """
+
+    def __init__(self, collection, ids):
+        self.collection = collection
+        self.ids = ids if isinstance(ids, array) else array("I", sorted(ids))
+
+    def __repr__(self):
+        return f"<CollectionView: {len(self)} of {self.collection.title}>"
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        texts = self.collection._texts
+        return (t for t in map(texts.get, self.ids) if t is not None)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return CollectionView(self.collection, self.ids[i])
+        return self.collection._texts[self.ids[i]]
+
+    def __contains__(self, text):
+        text_id = self.collection._ids.get(text)
+        return text_id is not None and text_id in self.ids
+
+    def where(self, **conditions):
+        """Returns a CollectionView of the members of this view matching the conditions"""
+        with self.collection._lock.reading:
+            found = self.collection._metadata.where(**conditions)
+        return CollectionView(self.collection, [i for i in self.ids if i in found])
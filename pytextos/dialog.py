@@ -0,0 +1,14 @@
+"""
+Optional Tk front-end used to pick a collection folder with a dialog.
+tkinter is only imported when a dialog is opened, so the rest of the package
+works on systems without Tk.
+"""
+
+
+# Helper function to select collection folder via dialog
+def GetPath():
+    from tkinter import Tk, filedialog
+
+    root = Tk()
+    root.withdraw()
+    return filedialog.askdirectory()
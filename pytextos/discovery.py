@@ -0,0 +1,151 @@
+"""
+Discovery of the text files of a corpus: a recursive os.scandir walk with
+include/exclude patterns, a depth limit and a symlink policy. Each file is
+returned with its size and modification time from the same walk, so that
+the persistent cache and the loading scheduler don't stat it again.
+"""
+
+import os
+import re
+from collections import namedtuple
+from fnmatch import translate
+from operator import itemgetter
+
+SYMLINKS = ("skip", "files", "follow")
+
+
+class FileInfo(namedtuple("FileInfo", "path size mtime_ns")):
+    """
+    A discovered file. Also has the st_size and st_mtime_ns attributes of
+    an os.stat() result, so it can be given wherever one is expected.
+    """
+
+    __slots__ = ()
+    st_size = property(itemgetter(1))
+    st_mtime_ns = property(itemgetter(2))
+
+
+def _compile(patterns):
+    """
+    Returns (name regex, path regex) matching any of the glob patterns:
+    patterns without a slash are matched against file names, the others
+    against paths relative to the root. Either is None if there are no
+    patterns of that kind.
+    """
+    names = [translate(p) for p in patterns if "/" not in p]
+    paths = [translate(p.strip("/")) for p in patterns if "/" in p]
+    return (
+        re.compile("|".join(names)) if names else None,
+        re.compile("|".join(paths)) if paths else None,
+    )
+
+
+def _matches(compiled, name, relpath):
+    names, paths = compiled
+    return bool(
+        (names is not None and names.match(name))
+        or (paths is not None and paths.match(relpath))
+    )
+
+
+def discover(root, include=("*.txt",), exclude=(), max_depth=None, symlinks="files"):
+    """
+    Yields a FileInfo for every file under `root` whose name or relative path
+    matches one of the `include` glob patterns and none of `exclude`.
+    Patterns without a slash match names ("*.txt"), the others paths
+    relative to `root` ("news/*.txt", where * also matches slashes).
+    Directories matching `exclude` are not entered. `max_depth` limits how
+    many levels of subfolders are walked: 0 for `root` only, None for no
+    limit. `symlinks` is "skip" to ignore symbolic links, "files" to include
+    linked files but not enter linked folders, or "follow" to enter them
+    too (each folder at most once). Unreadable folders and broken links are
+    skipped. Files are yielded as folders are read, in no particular order.
+    """
+    if symlinks not in SYMLINKS:
+        raise ValueError(f"symlinks must be one of {SYMLINKS}")
+    included, excluded = _compile(include), _compile(exclude)
+    follow = symlinks == "follow"
+    seen = set()
+    if follow:
+        st = os.stat(root)
+        seen.add((st.st_dev, st.st_ino))
+    # Missing or unreadable roots raise, unlike folders found on the way
+    stack = [(os.scandir(root), "", 0)]
+    while stack:
+        entries, prefix, depth = stack.pop()
+        folders = []
+        with entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    if entry.is_symlink() and symlinks == "skip":
+                        continue
+                    if entry.is_dir(follow_symlinks=follow):
+                        if max_depth is not None and depth >= max_depth:
+                            continue
+                        if _matches(excluded, name, prefix + name):
+                            continue
+                        if follow:
+                            st = entry.stat()
+                            if (st.st_dev, st.st_ino) in seen:
+                                continue
+                            seen.add((st.st_dev, st.st_ino))
+                        folders.append((entry.path, prefix + name + "/"))
+                    elif (
+                        _matches(included, name, prefix + name)
+                        and not _matches(excluded, name, prefix + name)
+                        and entry.is_file()
+                    ):
+                        st = entry.stat()
+                        yield FileInfo(entry.path, st.st_size, st.st_mtime_ns)
+                except OSError:
+                    continue
+        for path, relpath in reversed(folders):
+            try:
+                stack.append((os.scandir(path), relpath, depth + 1))
+            except OSError:
+                continue
+
+
+class Discovery:
+    """
+    Reusable discover() settings for a corpus root: iterating a Discovery
+    walks the tree again, so a Collection created from one can be refreshed.
+    The root is made absolute, and so are the paths found.
+    """
+
+    def __init__(self, root, include=("*.txt",), exclude=(), max_depth=None, symlinks="files"):
+        if symlinks not in SYMLINKS:
+            raise ValueError(f"symlinks must be one of {SYMLINKS}")
+        self.root = os.path.abspath(root)
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self.max_depth = max_depth
+        self.symlinks = symlinks
+        self._included = _compile(self.include)
+        self._excluded = _compile(self.exclude)
+
+    def __repr__(self):
+        return f"<Discovery: {self.root} {' '.join(self.include)}>"
+
+    def __iter__(self):
+        return discover(self.root, self.include, self.exclude, self.max_depth, self.symlinks)
+
+    def matches(self, path):
+        """
+        Returns True if a path would be discovered by its name and place in
+        the tree, without checking that it exists or following links (bool)
+        """
+        relpath = os.path.relpath(os.path.abspath(path), self.root)
+        parts = relpath.split(os.sep)
+        if parts[0] in (os.pardir, os.curdir):
+            return False
+        if self.max_depth is not None and len(parts) - 1 > self.max_depth:
+            return False
+        for i, part in enumerate(parts[:-1]):
+            if _matches(self._excluded, part, "/".join(parts[:i + 1])):
+                return False
+        name, relpath = parts[-1], "/".join(parts)
+        return _matches(self._included, name, relpath) and not _matches(
+            self._excluded, name, relpath
+        )
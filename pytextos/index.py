@@ -0,0 +1,464 @@
+"""
+Indexes kept by Collection objects to answer queries without going through
+every Text.
+"""
+
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import heappush, heapreplace
+from math import log
+from .text import METADATA, METRICS
+
+
+class InvertedIndex:
+    """
+    Maps each word (upper case, stopwords excluded, as in Text.freq_dist()) to
+    the IDs of the texts containing it and the number of occurrences in each.
+    The length of each text (number of non-stopword tokens) is kept for
+    BM25 ranking.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._words = {}
+        self._lengths = {}
+        self._total_length = 0
+        self._cache = {}  # ranking data, cleared when texts are added or removed
+
+    def __repr__(self):
+        return f"<InvertedIndex: {len(self._postings)} words, {len(self._words)} texts>"
+
+    def __len__(self):
+        return len(self._postings)
+
+    def __contains__(self, word):
+        return word.upper() in self._postings
+
+    def add(self, text_id, freq):
+        """Indexes a text from its frequency distribution (word -> count)"""
+        if text_id in self._words:
+            self.remove(text_id)
+        self._cache.clear()
+        postings = self._postings
+        for word, count in freq.items():
+            try:
+                postings[word][text_id] = count
+            except KeyError:
+                postings[word] = {text_id: count}
+        self._words[text_id] = tuple(freq)
+        self._lengths[text_id] = length = sum(freq.values())
+        self._total_length += length
+
+    def remove(self, text_id):
+        """Removes a text from the index"""
+        self._cache.clear()
+        self._total_length -= self._lengths.pop(text_id, 0)
+        postings = self._postings
+        for word in self._words.pop(text_id, ()):
+            posting = postings[word]
+            del posting[text_id]
+            if not posting:
+                del postings[word]
+
+    def postings(self, word):
+        """Returns a dict of text ID -> count for a word (empty if not found)"""
+        return self._postings.get(word.upper(), {})
+
+    def lookup(self, words, exclude=(), match="all"):
+        """
+        Returns the set of IDs of texts containing all the `words` (or any of
+        them with match="any") and none of the words in `exclude`
+        """
+        postings = sorted((self.postings(w) for w in words), key=len)
+        if not postings:
+            ids = set(self._words)
+        elif match == "any":
+            ids = set().union(*postings)
+        else:
+            # Start from the rarest word and keep intersecting
+            ids = set(postings[0])
+            for posting in postings[1:]:
+                if not ids:
+                    break
+                ids = {i for i in ids if i in posting}
+        for word in exclude:
+            ids.difference_update(self.postings(word))
+        return ids
+
+    def bm25(self, words, k=10, k1=1.2, b=0.75):
+        """
+        Returns the `k` best (text ID, score) pairs for a list of words,
+        ranked by Okapi BM25, highest score first (ties go to the lowest ID).
+
+        Uses the threshold algorithm over impact-ordered postings: each word's
+        postings sorted by score contribution, cached until the index changes.
+        Lists are read in parallel and each text seen is scored in full; the
+        scan stops once the k-th best score beats the best score any unseen
+        text could still reach.
+        """
+        words = [w for w in dict.fromkeys(words) if w in self._postings]
+        if not words or k <= 0:
+            return []
+        impacts = [self._impacts(w, k1, b) for w in words]
+        top = []  # min-heap of the best (score, -text ID)
+        seen = set()
+        for depth in range(max(map(len, impacts))):
+            threshold = 0.0
+            for impact in impacts:
+                if depth < len(impact):
+                    score, text_id = impact[depth]
+                    threshold -= score
+                    if text_id not in seen:
+                        seen.add(text_id)
+                        item = (self._score(words, text_id, k1, b), -text_id)
+                        if len(top) < k:
+                            heappush(top, item)
+                        elif item > top[0]:
+                            heapreplace(top, item)
+            if len(top) == k and top[0][0] > threshold:
+                break
+        return [(-i, score) for score, i in sorted(top, reverse=True)]
+
+    def _weights(self, k1, b):
+        """Per-text BM25 length normalization, cached until the index changes"""
+        key = ("norms", k1, b)
+        norms = self._cache.get(key)
+        if norms is None:
+            avg_length = self._total_length / len(self._lengths) or 1
+            norms = self._cache[key] = {
+                i: k1 * (1 - b + b * length / avg_length) for i, length in self._lengths.items()
+            }
+        return norms
+
+    def _idf(self, word):
+        n_texts, n = len(self._lengths), len(self._postings[word])
+        return log((n_texts - n + 0.5) / (n + 0.5) + 1)
+
+    def _impacts(self, word, k1, b):
+        """(-contribution, text ID) pairs of a word, best first"""
+        key = (word, k1, b)
+        impacts = self._cache.get(key)
+        if impacts is None:
+            norms = self._weights(k1, b)
+            idf = self._idf(word) * (k1 + 1)
+            impacts = self._cache[key] = sorted(
+                (-(idf * tf / (tf + norms[i])), i) for i, tf in self._postings[word].items()
+            )
+        return impacts
+
+    def _score(self, words, text_id, k1, b):
+        norm = self._weights(k1, b)[text_id]
+        score = 0.0
+        for word in words:
+            tf = self._postings[word].get(text_id)
+            if tf:
+                score += self._idf(word) * (k1 + 1) * tf / (tf + norm)
+        return score
+
+
+# Fields of MetadataIndex: metadata matched by value, metrics by range
+CATEGORICAL = METADATA
+NUMERIC = tuple(f for f in METRICS if f != "keywords")
+
+
+def _value(text, field):
+    # Metrics that are not defined for a text (e.g. an empty body) are None
+    try:
+        return getattr(text, field, None)
+    except (ZeroDivisionError, ValueError):
+        return None
+
+
+class MetadataIndex:
+    """
+    Secondary indexes on the metadata and metrics of texts, by text ID: a
+    hash index (value -> IDs) for each categorical field and a sorted index
+    of values searched with bisect for each numeric field. A field is
+    indexed the first time it is queried, then kept up to date as texts are
+    added and removed. Values are read when a text is indexed; texts whose
+    metadata or body change afterwards must be added again. `release` is an
+    optional function called with each text after reading one of its metrics.
+    """
+
+    def __init__(self, release=None):
+        self.release = release
+        self._lock = threading.Lock()  # fields are built by the first thread querying them
+        self._texts = {}
+        self._values = {}  # field -> {text ID: value}
+        self._hashed = {}  # field -> {value: set of IDs}
+        self._sorted = {}  # field -> (sorted values, IDs in the same order)
+
+    def __repr__(self):
+        return f"<MetadataIndex: {len(self._values)} fields, {len(self._texts)} texts>"
+
+    def __len__(self):
+        return len(self._texts)
+
+    def add(self, text_id, text):
+        """Indexes a text in every field already indexed"""
+        if text_id in self._texts:
+            self.remove(text_id)
+        self._texts[text_id] = text
+        for field in self._values:
+            self._insert(field, text_id, _value(text, field))
+
+    def remove(self, text_id):
+        """Removes a text from the index"""
+        if self._texts.pop(text_id, None) is None:
+            return
+        for field, values in self._values.items():
+            value = values.pop(text_id)
+            if field in self._hashed:
+                ids = self._hashed[field][value]
+                ids.discard(text_id)
+                if not ids:
+                    del self._hashed[field][value]
+            elif value is not None:
+                keys, ids = self._sorted[field]
+                i = bisect_left(keys, value)
+                while ids[i] != text_id:
+                    i += 1
+                del keys[i], ids[i]
+
+    def _insert(self, field, text_id, value):
+        self._values[field][text_id] = value
+        if field in self._hashed:
+            try:
+                self._hashed[field][value].add(text_id)
+            except KeyError:
+                self._hashed[field][value] = {text_id}
+        elif value is not None:
+            keys, ids = self._sorted[field]
+            i = bisect_right(keys, value)
+            keys.insert(i, value)
+            ids.insert(i, text_id)
+
+    def _field(self, field):
+        """Builds the index of a field on first use"""
+        if field in self._values:
+            return
+        if field not in CATEGORICAL and field not in NUMERIC:
+            raise ValueError(f"{field!r} is not an indexed field")
+        with self._lock:
+            if field in self._values:
+                return
+            values = {}
+            for text_id, text in self._texts.items():
+                values[text_id] = _value(text, field)
+                if self.release is not None and field in NUMERIC:
+                    self.release(text)
+            if field in CATEGORICAL:
+                hashed = self._hashed[field] = {}
+                for text_id, value in values.items():
+                    try:
+                        hashed[value].add(text_id)
+                    except KeyError:
+                        hashed[value] = {text_id}
+            else:
+                pairs = sorted((v, i) for i, v in values.items() if v is not None)
+                self._sorted[field] = ([v for v, _ in pairs], array("I", [i for _, i in pairs]))
+            # Published last: other threads use the field once it is in _values
+            self._values[field] = values
+
+    def values(self, field):
+        """Returns a dict of text ID -> value of a field"""
+        self._field(field)
+        return self._values[field]
+
+    def equal(self, field, value):
+        """Returns the set of IDs of texts whose `field` is `value`"""
+        self._field(field)
+        if field in self._hashed:
+            return set(self._hashed[field].get(value, ()))
+        return self.between(field, value, value)
+
+    def between(self, field, low=None, high=None):
+        """
+        Returns the set of IDs of texts whose numeric `field` is between `low`
+        and `high`, both included (None for no bound). Texts for which the
+        metric is undefined never match.
+        """
+        self._field(field)
+        if field not in self._sorted:
+            raise ValueError(f"{field!r} is not a numeric field")
+        keys, ids = self._sorted[field]
+        start = 0 if low is None else bisect_left(keys, low)
+        end = len(keys) if high is None else bisect_right(keys, high)
+        return set(ids[start:end])
+
+    def select(self, field, condition):
+        """
+        Returns the set of IDs of texts matching a condition on `field`: a
+        value for equality, a set, list or frozenset of values for any of
+        them, or a (low, high) tuple for a range of a numeric field
+        """
+        if isinstance(condition, tuple):
+            return self.between(field, *condition)
+        if isinstance(condition, (set, frozenset, list)):
+            return set().union(*(self.equal(field, v) for v in condition))
+        return self.equal(field, condition)
+
+    def count(self, field, condition):
+        """
+        Returns the number of texts matching a condition, as select() would,
+        without building the set of IDs (int)
+        """
+        self._field(field)
+        if isinstance(condition, (set, frozenset, list)):
+            return sum(self.count(field, v) for v in set(condition))
+        if field in self._hashed and not isinstance(condition, tuple):
+            return len(self._hashed[field].get(condition, ()))
+        if field not in self._sorted:
+            raise ValueError(f"{field!r} is not a numeric field")
+        low, high = condition if isinstance(condition, tuple) else (condition, condition)
+        keys = self._sorted[field][0]
+        start = 0 if low is None else bisect_left(keys, low)
+        end = len(keys) if high is None else bisect_right(keys, high)
+        return max(end - start, 0)
+
+    def test(self, field, condition, text_id):
+        """Returns True if the text matches a condition, as select() would"""
+        self._field(field)
+        value = self._values[field][text_id]
+        if isinstance(condition, tuple):
+            low, high = condition
+            return (
+                value is not None
+                and (low is None or value >= low)
+                and (high is None or value <= high)
+            )
+        if isinstance(condition, (set, frozenset, list)):
+            return value in condition
+        return value == condition
+
+    def where(self, **conditions):
+        """
+        Returns the set of IDs of texts matching every condition, see select()
+        (None for no bound in a range)
+        """
+        found = [self.select(field, condition) for field, condition in conditions.items()]
+        if not found:
+            return set(self._texts)
+        # Start from the most selective condition
+        found.sort(key=len)
+        ids = found[0]
+        for other in found[1:]:
+            if not ids:
+                break
+            ids.intersection_update(other)
+        return ids
+
+
+def encode_positions(positions):
+    """Encodes increasing token positions as varint-compressed deltas (bytes)"""
+    out = bytearray()
+    previous = 0
+    for p in positions:
+        delta = p - previous
+        previous = p
+        while delta >= 0x80:
+            out.append(delta & 0x7F | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out)
+
+
+def decode_positions(data):
+    """Decodes token positions encoded by encode_positions() (list)"""
+    positions = []
+    position = value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            position += value
+            positions.append(position)
+            value = shift = 0
+    return positions
+
+
+class PositionalIndex:
+    """
+    Maps each token (upper case, stopwords included) to the positions where
+    it occurs in each text, as indexes in Text.tokenize(). Positions are
+    stored as varint-compressed deltas.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._words = {}
+
+    def __repr__(self):
+        return f"<PositionalIndex: {len(self._postings)} words, {len(self._words)} texts>"
+
+    def __len__(self):
+        return len(self._postings)
+
+    @property
+    def nbytes(self):
+        """Size of the encoded positions in bytes (int)"""
+        return sum(len(p) for posting in self._postings.values() for p in posting.values())
+
+    def add(self, text_id, tokens):
+        """Indexes a text from its list of tokens"""
+        if text_id in self._words:
+            self.remove(text_id)
+        positions = {}
+        for i, token in enumerate(tokens):
+            if token:
+                try:
+                    positions[token].append(i)
+                except KeyError:
+                    positions[token] = [i]
+        postings = self._postings
+        for word, found in positions.items():
+            encoded = encode_positions(found)
+            try:
+                postings[word][text_id] = encoded
+            except KeyError:
+                postings[word] = {text_id: encoded}
+        self._words[text_id] = tuple(positions)
+
+    def remove(self, text_id):
+        """Removes a text from the index"""
+        postings = self._postings
+        for word in self._words.pop(text_id, ()):
+            posting = postings[word]
+            del posting[text_id]
+            if not posting:
+                del postings[word]
+
+    def positions(self, word, text_id):
+        """Returns the positions of a token in a text (list)"""
+        return decode_positions(self._postings.get(word, {}).get(text_id, b""))
+
+    def text_count(self, word):
+        """Returns the number of texts containing a token (int)"""
+        return len(self._postings.get(word, ()))
+
+    def phrase(self, words, ids=None):
+        """
+        Returns a dict of text ID -> start positions of the consecutive
+        tokens `words`, for the texts containing the phrase. With `ids` only
+        those texts are checked.
+        """
+        if not words:
+            return {}
+        postings = [self._postings.get(w, {}) for w in words]
+        rarest = min(postings, key=len)
+        if ids is not None and len(ids) < len(rarest):
+            rarest = ids
+        found = {}
+        for text_id in rarest:
+            if not all(text_id in p for p in postings):
+                continue
+            starts = set(decode_positions(postings[0][text_id]))
+            for offset, posting in enumerate(postings[1:], 1):
+                starts.intersection_update(p - offset for p in decode_positions(posting[text_id]))
+                if not starts:
+                    break
+            if starts:
+                found[text_id] = sorted(starts)
+        return found
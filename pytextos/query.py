@@ -0,0 +1,238 @@
+"""
+Query language of Collection.query(). A query is a list of clauses joined by
+AND (optional), each of them negated with NOT, then optional SORT and LIMIT:
+
+    genre:news AND words:500..900 AND contains:"climate change" SORT lexdiv DESC LIMIT 20
+
+Clauses are `field:value`. Metadata fields match a value, or any of several
+separated by commas (genre:news,essay); quote values with spaces
+(by:"Jane Austen"). Metrics match a number or an inclusive range, open on
+either side (words:500..900, readtime:..5). `contains:` matches a word, or a
+phrase if quoted, and a bare word or quoted phrase is short for contains.
+
+A query is parsed once into a Query, then planned for a Collection: the
+clause expected to match the fewest members is answered from its index and
+the other clauses only check those candidates.
+"""
+
+import re
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+from heapq import nlargest, nsmallest
+from . import stopwords
+from .index import CATEGORICAL, NUMERIC
+from .tokenizer import TOKENIZER
+
+# Short names of fields, besides their attribute names
+FIELDS = {
+    "author": "by",
+    "type": "text_type",
+    "words": "token_count",
+    "types": "type_count",
+    "lexdiv": "lex_div_maas",
+    "hapax": "hapax_richness",
+    "wordlen": "avg_word_len",
+    "sentlen": "avg_sentence_len",
+    "readtime": "reading_time",
+}
+FIELDS.update((f, f) for f in CATEGORICAL + NUMERIC)
+
+Clause = namedtuple("Clause", "field condition negated")
+Query = namedtuple("Query", "clauses sort descending limit")
+
+_TOKEN = re.compile(r'(\w+):(?:"([^"]*)"|([^\s"]+))|"([^"]*)"|([^\s"]+)')
+_SPACE = re.compile(r"\s*")
+
+
+def _number(value):
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(f"Not a number: {value!r}") from None
+
+
+def _field(name):
+    try:
+        return FIELDS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown field: {name!r}") from None
+
+
+def _clause(name, value, quoted, negated):
+    """Returns the Clause of a `name:value` term"""
+    if name.lower() == "contains":
+        words = tuple(w for w in TOKENIZER.tokenize(value) if w)
+        if not words:
+            raise ValueError(f"No words to look for in {value!r}")
+        return Clause("contains", words, negated)
+    field = _field(name)
+    if field in NUMERIC:
+        if ".." in value:
+            low, high = value.split("..", 1)
+            condition = (_number(low) if low else None, _number(high) if high else None)
+        else:
+            condition = (_number(value),) * 2
+    elif not quoted and "," in value:
+        condition = frozenset(value.split(","))
+    else:
+        condition = value
+    return Clause(field, condition, negated)
+
+
+@lru_cache(maxsize=256)
+def parse(query):
+    """Parses a query string into a Query, raising ValueError if it is not valid"""
+    clauses = []
+    sort, descending, limit = None, False, None
+    negated = False
+    tokens = []
+    position = _SPACE.match(query).end()
+    while position < len(query):
+        m = _TOKEN.match(query, position)
+        if m is None:
+            raise ValueError(f"Not a valid query at {query[position:]!r}")
+        tokens.append(m.groups(""))
+        position = _SPACE.match(query, m.end()).end()
+    i = 0
+    while i < len(tokens):
+        name, quoted, value, phrase, word = tokens[i]
+        keyword = word.upper()
+        i += 1
+        if name:
+            clauses.append(_clause(name, quoted or value, bool(quoted), negated))
+            negated = False
+        elif phrase or (word and keyword not in ("AND", "NOT", "SORT", "LIMIT", "OR")):
+            clauses.append(_clause("contains", phrase or word, True, negated))
+            negated = False
+        elif keyword == "NOT":
+            negated = not negated
+        elif keyword == "SORT":
+            if i == len(tokens) or not tokens[i][4]:
+                raise ValueError("SORT needs a field")
+            sort = _field(tokens[i][4])
+            i += 1
+            if i < len(tokens) and tokens[i][4].upper() in ("ASC", "DESC"):
+                descending = tokens[i][4].upper() == "DESC"
+                i += 1
+        elif keyword == "LIMIT":
+            if i == len(tokens) or not tokens[i][4].isdigit():
+                raise ValueError("LIMIT needs a number")
+            limit = int(tokens[i][4])
+            i += 1
+        elif keyword == "OR":
+            raise ValueError("OR is not supported, use field:a,b for alternative values")
+    if negated:
+        raise ValueError("NOT at the end of the query")
+    return Query(tuple(clauses), sort, descending, limit)
+
+
+class Plan:
+    """
+    Execution plan of a Query for a Collection: positive clauses ordered by
+    the estimated number of members they match, the first one answered from
+    its index (metadata, metric, inverted or positional) and the others,
+    then the negated ones, checked against the remaining candidates.
+    Phrases are checked last, as they are the most expensive clauses.
+    """
+
+    def __init__(self, query, collection):
+        self.query = query
+        self.collection = collection
+        steps = [(c, self._estimate(c)) for c in query.clauses]
+        positive = sorted((s for s in steps if not s[0].negated), key=lambda s: s[1])
+        negative = [s for s in steps if s[0].negated]
+        rest = sorted(positive[1:], key=lambda s: self._kind(s[0]) == "phrase")
+        self.steps = positive[:1] + rest + negative
+
+    def __repr__(self):
+        lines = [f"<Plan: {len(self.steps)} clauses>"]
+        for n, (clause, estimate) in enumerate(self.steps):
+            action = "scan" if n == 0 and not clause.negated else "check"
+            negated = "NOT " if clause.negated else ""
+            lines.append(
+                f"  {action} {negated}{self._kind(clause)} {clause.field}={clause.condition!r}"
+                f" (~{estimate})"
+            )
+        if self.query.sort:
+            order = "DESC" if self.query.descending else "ASC"
+            lines.append(f"  sort {self.query.sort} {order}")
+        if self.query.limit is not None:
+            lines.append(f"  limit {self.query.limit}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _kind(clause):
+        if clause.field != "contains":
+            return "metadata" if clause.field in CATEGORICAL else "range"
+        words = clause.condition
+        if len(words) == 1 and words[0].lower() not in stopwords.ENGLISH_STOPS:
+            return "word"
+        return "phrase"
+
+    def _estimate(self, clause):
+        """Number of members matching a clause, or an upper bound for phrases (int)"""
+        kind = self._kind(clause)
+        if kind == "word":
+            return len(self.collection.index.postings(clause.condition[0]))
+        if kind == "phrase":
+            positions = self.collection.positions
+            return min(positions.text_count(w) for w in clause.condition)
+        return self.collection._metadata.count(clause.field, clause.condition)
+
+    def _select(self, clause):
+        """Set of IDs of the members matching a clause"""
+        kind = self._kind(clause)
+        if kind == "word":
+            return set(self.collection.index.postings(clause.condition[0]))
+        if kind == "phrase":
+            return set(self.collection.positions.phrase(clause.condition))
+        return self.collection._metadata.select(clause.field, clause.condition)
+
+    def _check(self, clause, ids):
+        """Subset of `ids` matching a clause (or not, if negated)"""
+        kind = self._kind(clause)
+        if kind == "word":
+            postings = self.collection.index.postings(clause.condition[0])
+            matches = lambda i: i in postings
+        elif kind == "phrase":
+            found = self.collection.positions.phrase(clause.condition, ids)
+            matches = found.__contains__
+        else:
+            metadata = self.collection._metadata
+            matches = lambda i: metadata.test(clause.field, clause.condition, i)
+        if clause.negated:
+            return {i for i in ids if not matches(i)}
+        return {i for i in ids if matches(i)}
+
+    def run(self):
+        """Returns the IDs of the matching members, sorted and limited (array)"""
+        steps = [clause for clause, _ in self.steps]
+        if steps and not steps[0].negated:
+            ids = self._select(steps.pop(0))
+        else:
+            ids = set(self.collection._texts)
+        for clause in steps:
+            if not ids:
+                break
+            ids = self._check(clause, ids)
+        ids = sorted(ids)
+        query = self.query
+        if query.sort:
+            values = self.collection._metadata.values(query.sort)
+            if query.descending:
+                key = lambda i: (values[i] is not None, values[i])
+                select = nlargest
+            else:
+                key = lambda i: (values[i] is None, values[i])
+                select = nsmallest
+            if query.limit is not None:
+                ids = select(query.limit, ids, key=key)
+            else:
+                ids.sort(key=key, reverse=query.descending)
+        elif query.limit is not None:
+            ids = ids[:query.limit]
+        return array("I", ids)
@@ -0,0 +1,164 @@
+"""
+Functions reading the lines of Text files. Lines are stripped and lines that
+are only a newline are skipped, as expected by Text: the first lines hold the
+header (title, author, date, subtitle) and the last three the footer
+(text type, genre, source).
+"""
+
+import io
+import mmap
+import os
+import re
+from array import array
+
+
+def _kept(lines):
+    return [line.strip() for line in lines if not line.startswith("\n")]
+
+
+def read_lines(filename):
+    """Returns all the non-blank lines of a file, stripped (list)"""
+    with open(filename, "r", encoding="utf-8", errors="ignore") as f:
+        return _kept(f.readlines())
+
+
+def decode_lines(data):
+    """
+    Returns the non-blank lines of UTF-8 encoded bytes, stripped, exactly as
+    read_lines() returns them for a file with that content (list)
+    """
+    return _kept(_readlines(data))
+
+
+def _readlines(data):
+    # Same decoding and newline handling as open() in text mode
+    return io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", errors="ignore").readlines()
+
+
+def read_header(filename, n=4):
+    """Returns the first `n` non-blank lines of a file, reading nothing else (list)"""
+    header = []
+    with open(filename, "r", encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            if not line.startswith("\n"):
+                header.append(line.strip())
+                if len(header) == n:
+                    break
+    return header
+
+
+def read_footer(filename, n=3, block_size=4096):
+    """
+    Returns the last `n` non-blank lines of a file, reading blocks backwards
+    from the end of the file (list)
+    """
+    with open(filename, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        start = size
+        while True:
+            start = max(size - block_size, 0)
+            f.seek(start)
+            lines = _readlines(f.read(size - start))
+            if start > 0:
+                # The first line may have started before the block
+                lines = lines[1:]
+            footer = _kept(lines)
+            if len(footer) >= n or start == 0:
+                return footer[-n:]
+            block_size *= 2
+
+
+_NEWLINE = re.compile(rb"\r\n|\r|\n")
+
+
+class MappedBody:
+    """
+    Read-only sequence of paragraphs decoded on demand from a memory-mapped
+    file. Only the start and end offsets of each paragraph are kept in memory.
+    """
+
+    def __init__(self, buffer, starts, ends):
+        self._buffer = buffer
+        self._starts = starts
+        self._ends = ends
+
+    def __repr__(self):
+        return f"<MappedBody: {len(self)} paragraphs>"
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return _decode_line(self._buffer, self._starts[i], self._ends[i])
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def chunks(self, size=2**20):
+        """
+        Yields raw bytes of consecutive paragraphs, about `size` bytes at a
+        time and split only at line boundaries. Blank lines between paragraphs
+        are included, which makes no difference to tokenizing.
+        """
+        starts, ends = self._starts, self._ends
+        first = 0
+        for i in range(len(starts)):
+            if ends[i] - starts[first] >= size or i == len(starts) - 1:
+                yield self._buffer[starts[first]:ends[i]]
+                first = i + 1
+
+
+    def ranges(self, parts):
+        """
+        Returns the byte offsets (start, end) in the file of up to `parts`
+        runs of consecutive paragraphs of about the same size (list)
+        """
+        starts, ends = self._starts, self._ends
+        if not starts:
+            return []
+        target = (ends[-1] - starts[0]) / parts
+        ranges, first = [], 0
+        for i in range(len(starts)):
+            if ends[i] - starts[0] >= target * (len(ranges) + 1) or i == len(starts) - 1:
+                ranges.append((starts[first], ends[i]))
+                first = i + 1
+        return ranges
+
+
+def map_lines(filename):
+    """
+    Maps a file into memory and returns its header (first 4 non-blank lines),
+    footer (last 3) and body (the rest, from the 4th line) as a MappedBody
+    """
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return [], [], []
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    starts, ends = array("Q"), array("Q")
+    start = 0
+    for m in _NEWLINE.finditer(buffer):
+        _index_line(buffer, start, m.start(), starts, ends)
+        start = m.end()
+    _index_line(buffer, start, len(buffer), starts, ends)
+    body = MappedBody(buffer, starts[3:-3], ends[3:-3])
+    header = [_decode_line(buffer, s, e) for s, e in zip(starts[:4], ends[:4])]
+    footer = [_decode_line(buffer, s, e) for s, e in zip(starts[-3:], ends[-3:])]
+    return header, footer, body
+
+
+def _index_line(buffer, start, end, starts, ends):
+    # Same rule as read_lines(): lines left empty after decoding are skipped
+    if end > start:
+        line = buffer[start:end]
+        if line.isascii() or line.decode("utf-8", errors="ignore"):
+            starts.append(start)
+            ends.append(end)
+
+
+def _decode_line(buffer, start, end):
+    return buffer[start:end].decode("utf-8", errors="ignore").strip()
@@ -0,0 +1,288 @@
+"""
+Size-aware scheduling of the analysis of many files in worker processes.
+Small files are batched into tasks of a few hundred KB, so that they don't
+cost one round trip each; files larger than a task are split at line ends
+into chunks analyzed separately, whose Partial results are merged exactly;
+and tasks run largest first (longest-processing-time order), so that no
+large file is left to run alone at the end. A single long Text is analyzed
+the same way by analyze_text(), a slice of its paragraphs per task.
+"""
+
+from array import array
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from .analysis import Analysis
+from .readers import MappedBody, decode_lines
+from .text import Text
+from .tokenizer import TOKENIZER, SENTENCE_END
+from .vocabulary import VOCABULARY
+
+# Smallest task in bytes: below that, the round trip to a worker costs more
+# than the analysis saves
+MIN_TASK = 1 << 18
+
+# Tasks per worker when the corpus is large enough, so that the last tasks
+# to finish are small compared to the time spent on the rest
+TASKS_PER_WORKER = 4
+
+# Files analyzed whole (start is None) or a chunk of paths[0] between two
+# byte offsets, end None for the end of the file; size in bytes
+Task = namedtuple("Task", "size paths start end")
+
+
+class Partial(namedtuple("Partial", "counts paragraphs pieces first sentences chars last tail")):
+    """
+    Analysis of consecutive paragraphs of a body, which can be merged with
+    that of the following ones: `counts` of every token in order of first
+    occurrence, number of `paragraphs`, and the pieces of their text split
+    at sentence ends: number of `pieces`, length of the `first` and the
+    `last` ones, which may continue in the neighbouring chunks, and number
+    of `sentences` and `chars` of those in between longer than 3 characters
+    (as in Text.sent_tokenize). `tail` holds the last 4 characters, which
+    decide whether the space joining the next paragraph ends a sentence.
+    """
+
+    __slots__ = ()
+
+    def sentence_stats(self):
+        """Returns the number of sentences and their total length (tuple)"""
+        ends = [self.first] if self.pieces == 1 else [self.first, self.last]
+        ends = [n for n in ends if n > 3]
+        return self.sentences + len(ends), self.chars + sum(ends)
+
+
+def _analyze(paragraphs):
+    # Partial of a list of paragraphs, with their tokens and sentence pieces
+    raw = " ".join(paragraphs)
+    tokens = TOKENIZER.tokenize(raw)
+    pieces = SENTENCE_END.split(raw)
+    lengths = [len(s) for s in pieces]
+    inner = [n for n in lengths[1:-1] if n > 3]
+    partial = Partial(
+        Counter(tokens), len(paragraphs), len(lengths),
+        lengths[0], len(inner), sum(inner), lengths[-1], raw[-4:],
+    )
+    return partial, tokens, pieces
+
+
+def analyze_body(paragraphs):
+    """Returns the Partial of a list of paragraphs"""
+    return _analyze(paragraphs)[0]
+
+
+def _ends_sentence(tail):
+    # True if a space after `tail` (last 4 characters) ends a sentence
+    return SENTENCE_END.search(tail + " ", len(tail)) is not None
+
+
+def merge(partials):
+    """
+    Merges the Partials of consecutive chunks of a body, in order, into the
+    Partial of the whole body, as analyze_body() would return it
+    """
+    counts = Counter()
+    merged = None
+    for p in partials:
+        if not p.paragraphs:
+            continue  # adds no text, not even a joining space
+        counts.update(p.counts)
+        if merged is None:
+            merged = p._replace(counts=counts)
+            continue
+        # The paragraphs are joined by a space, which may end a sentence
+        tail = merged.tail
+        if _ends_sentence(tail):
+            joint = [merged.last, p.first]
+        else:
+            joint = [merged.last + 1 + p.first]
+        pieces = merged.pieces + p.pieces - 2 + len(joint)
+        # First and last pieces of the merged chunks, and those in between
+        # that became complete sentences
+        ends = ([merged.first] if merged.pieces > 1 else []) + joint
+        ends += [p.last] if p.pieces > 1 else []
+        closed = [n for n in ends[1:-1] if n > 3]
+        merged = Partial(
+            counts,
+            merged.paragraphs + p.paragraphs,
+            pieces,
+            ends[0],
+            merged.sentences + p.sentences + len(closed),
+            merged.chars + p.chars + sum(closed),
+            ends[-1],
+            (tail + " " + p.tail)[-4:],
+        )
+    return merged or analyze_body([])
+
+
+def _offsets(path, size, parts):
+    """Returns the offsets of up to `parts` chunks of a file, each starting a line (list)"""
+    offsets = [0]
+    with open(path, "rb") as f:
+        for k in range(1, parts):
+            f.seek(max(size * k // parts, offsets[-1]))
+            f.readline()
+            offset = f.tell()
+            if offset >= size:
+                break
+            if offset > offsets[-1]:
+                offsets.append(offset)
+    return offsets
+
+
+def schedule(files, workers):
+    """
+    Returns the Tasks analyzing `files`, a list of (path, size) pairs, in
+    `workers` processes, largest first (list). Files larger than the task
+    size are split into chunks and the other ones batched up to that size.
+    """
+    files = sorted(files, key=itemgetter(1), reverse=True)
+    total = sum(size for _, size in files)
+    target = max(MIN_TASK, total // (workers * TASKS_PER_WORKER))
+    tasks = []
+    batch, batched = [], 0
+    for path, size in files:
+        if size > target:
+            offsets = _offsets(path, size, -(-size // target))
+            if len(offsets) > 1:
+                ends = offsets[1:] + [None]
+                tasks.extend(
+                    Task((end or size) - start, (path,), start, end)
+                    for start, end in zip(offsets, ends)
+                )
+                continue
+        batch.append(path)
+        batched += size
+        if batched >= target:
+            tasks.append(Task(batched, tuple(batch), None, None))
+            batch, batched = [], 0
+    if batch:
+        tasks.append(Task(batched, tuple(batch), None, None))
+    tasks.sort(key=itemgetter(0), reverse=True)
+    return tasks
+
+
+def _analyze_chunk(path, start, end):
+    # Header and footer lines of the file where the chunk has them, and the
+    # Partial of the body lines
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read() if end is None else f.read(end - start)
+    lines = decode_lines(data)
+    header = lines[:4] if start == 0 else None
+    footer = lines[-3:] if end is None else None
+    body = lines[3 if start == 0 else 0:-3 if end is None else None]
+    return header, footer, analyze_body(body)
+
+
+def _hashed(path):
+    # Record and content hash of a whole file, read once
+    from .cache import content_hash
+    with open(path, "rb") as f:
+        data = f.read()
+    return Text.from_bytes(path, data).record(), content_hash(data)
+
+
+def _run(task, hashes=False):
+    # Runs in worker processes
+    if task.start is None:
+        if hashes:
+            return [_hashed(path) for path in task.paths]
+        return [Text(path).record() for path in task.paths]
+    return _analyze_chunk(task.paths[0], task.start, task.end)
+
+
+def analyze(files, jobs, hashes=False):
+    """
+    Analyzes files in `jobs` worker processes as planned by schedule().
+    `files` is a list of (path, size) pairs. Returns a dict of path ->
+    TextRecord, the same as Text(path).record() for each file, or with
+    `hashes` of path -> (TextRecord, content hash) for the cache.
+    """
+    chunks = {}  # path -> [(start, header, footer, Partial)]
+    records = {}
+    digests = {}  # path -> future content hash of a file split into chunks
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # Submitted largest first, workers take them in that order
+        tasks = [(task, pool.submit(_run, task, hashes)) for task in schedule(files, jobs)]
+        if hashes:
+            # Hashing is quick next to analysis, so whole files are hashed
+            # in a task of their own after their chunks
+            from .cache import file_hash
+            for task, _ in tasks:
+                if task.start == 0:
+                    digests[task.paths[0]] = pool.submit(file_hash, task.paths[0])
+        for task, future in tasks:
+            if task.start is None:
+                records.update(zip(task.paths, future.result()))
+            else:
+                chunks.setdefault(task.paths[0], []).append((task.start, *future.result()))
+    for path, results in chunks.items():
+        results.sort(key=itemgetter(0))
+        header, footer = results[0][1], results[-1][2]
+        if len(header) < 4 or len(footer) < 3:
+            # A chunk is too short to hold the header or the footer
+            records[path] = Text(path).record()
+        else:
+            partial = merge(r[3] for r in results)
+            records[path] = Text.from_partial(path, header, footer, partial).record()
+        if hashes:
+            records[path] = records[path], digests[path].result()
+    return records
+
+
+def split_body(paragraphs, parts):
+    """
+    Splits a sequence of paragraphs into up to `parts` lists of consecutive
+    paragraphs with about the same number of characters (list)
+    """
+    sizes = [len(p) + 1 for p in paragraphs]
+    target = sum(sizes) / parts
+    slices, start, size = [], 0, 0
+    for i, n in enumerate(sizes):
+        size += n
+        if size >= target * (len(slices) + 1) or i == len(sizes) - 1:
+            slices.append(list(paragraphs[start:i + 1]))
+            start = i + 1
+    return slices
+
+
+def _analyze_slice(paragraphs):
+    # Runs in worker processes: the Partial of a slice of a body and its
+    # tokens as indexes into the Partial's counts
+    partial, tokens, _ = _analyze(paragraphs)
+    index = {word: i for i, word in enumerate(partial.counts)}
+    return partial, array("I", map(index.__getitem__, tokens))
+
+
+def _analyze_range(path, start, end):
+    # Runs in worker processes: _analyze_slice() of the paragraphs between
+    # two byte offsets of a file
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return _analyze_slice(decode_lines(data))
+
+
+def analyze_text(paragraphs, jobs, filename=None, vocabulary=VOCABULARY):
+    """
+    Analyzes a body in `jobs` worker processes, split into slices of
+    paragraphs, and returns its Analysis and the number of its sentences
+    and their total length (as in Text.sent_tokenize), the same as
+    analyzing the whole body at once. The slices of a MappedBody are read
+    by the workers from `filename`, so the body isn't decoded here.
+    """
+    parts = jobs * TASKS_PER_WORKER
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        if isinstance(paragraphs, MappedBody):
+            ranges = paragraphs.ranges(parts)
+            results = list(pool.map(_analyze_range, [filename] * len(ranges), *zip(*ranges)))
+        else:
+            results = list(pool.map(_analyze_slice, split_body(paragraphs, parts)))
+    ids = array("I")
+    for partial, local in results:
+        types = [vocabulary.intern(word) for word in partial.counts]
+        ids.extend(map(types.__getitem__, local))
+    partial = merge(r[0] for r in results)
+    analysis = Analysis.from_counts(partial.counts, vocabulary, ids)
+    return analysis, partial.sentence_stats()
@@ -0,0 +1,80 @@
+"""
+Span index of a Text: start and end offsets of every token and sentence in
+raw_body, stored in compact arrays, so the original text can be sliced without
+tokenizing again or keeping a copy of each token.
+"""
+
+from bisect import bisect_right
+from .tokenizer import TOKENIZER, sentence_spans
+
+
+class SpanIndex:
+    """
+    Offsets of tokens and sentences in a string. Token i of tokenize() is
+    found at text[token_starts[i]:token_ends[i]], as it was written in the
+    original text (case, punctuation and curly quotes included).
+    """
+
+    __slots__ = ("text", "token_starts", "token_ends", "sentence_starts", "sentence_ends")
+
+    def __init__(self, text, tokenizer=TOKENIZER):
+        self.text = text
+        self.token_starts, self.token_ends = tokenizer.spans(text)
+        self.sentence_starts, self.sentence_ends = sentence_spans(text)
+
+    def __repr__(self):
+        return f"<SpanIndex: {len(self)} tokens, {self.sentence_count} sentences>"
+
+    def __len__(self):
+        return len(self.token_starts)
+
+    @property
+    def sentence_count(self):
+        """Number of sentences (int)"""
+        return len(self.sentence_starts)
+
+    @property
+    def nbytes(self):
+        """Memory used by the offset arrays in bytes (int)"""
+        return sum(
+            a.itemsize * len(a)
+            for a in (self.token_starts, self.token_ends, self.sentence_starts, self.sentence_ends)
+        )
+
+    def token(self, i):
+        """Returns token i as written in the text (str)"""
+        return self.text[self.token_starts[i]:self.token_ends[i]]
+
+    def sentence(self, i):
+        """Returns sentence i (str)"""
+        return self.text[self.sentence_starts[i]:self.sentence_ends[i]]
+
+    def slice(self, first, last):
+        """Returns the text from the start of token `first` to the end of token `last` (str)"""
+        return self.text[self.token_starts[first]:self.token_ends[last]]
+
+    def context(self, i, width=5, length=1):
+        """
+        Returns a (left, match, right) tuple of strings for `length` tokens
+        starting at token i, with up to `width` tokens of context on each side.
+        The right context runs up to the next token, so it keeps trailing
+        punctuation.
+        """
+        last = min(i + length, len(self)) - 1
+        left = max(i - width, 0)
+        right = last + width + 1
+        starts, ends = self.token_starts, self.token_ends
+        end = starts[right] if right < len(self) else len(self.text)
+        return (
+            self.text[starts[left]:starts[i]],
+            self.text[starts[i]:ends[last]],
+            self.text[ends[last]:end].rstrip(),
+        )
+
+    def sentence_of(self, i):
+        """Returns the index of the sentence containing token i, or None (int)"""
+        start = self.token_starts[i]
+        s = bisect_right(self.sentence_starts, start) - 1
+        if s >= 0 and start < self.sentence_ends[s]:
+            return s
+        return None
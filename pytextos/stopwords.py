@@ -1,11927 +1,31 @@
-ENGLISH_STOPS = set([
-    "",
-    "'ll",
-    "'ve",
-    "a",
-    "a's",
-    "able",
-    "about",
-    "above",
-    "abst",
-    "accordance",
-    "according",
-    "accordingly",
-    "across",
-    "act",
-    "actually",
-    "added",
-    "adj",
-    "affected",
-    "affecting",
-    "affects",
-    "after",
-    "afterwards",
-    "afterward",
-    "again",
-    "against",
-    "ah",
-    "ain",
-    "ain't",
-    "all",
-    "allow",
-    "allows",
-    "almost",
-    "alone",
-    "along",
-    "already",
-    "also",
-    "although",
-    "always",
-    "am",
-    "among",
-    "amongst",
-    "an",
-    "and",
-    "announce",
-    "another",
-    "any",
-    "anybody",
-    "anyhow",
-    "anymore",
-    "anyone",
-    "anything",
-    "anyway",
-    "anyways",
-    "anywhere",
-    "apart",
-    "apparently",
-    "appear",
-    "appreciate",
-    "appropriate",
-    "approximately",
-    "are",
-    "aren",
-    "aren't",
-    "arent",
-    "arise",
-    "around",
-    "as",
-    "aside",
-    "ask",
-    "asking",
-    "associated",
-    "at",
-    "auth",
-    "available",
-    "away",
-    "awfully",
-    "b",
-    "back",
-    "be",
-    "became",
-    "because",
-    "become",
-    "becomes",
-    "becoming",
-    "been",
-    "before",
-    "beforehand",
-    "begin",
-    "beginning",
-    "beginnings",
-    "begins",
-    "behind",
-    "being",
-    "believe",
-    "below",
-    "beside",
-    "besides",
-    "best",
-    "better",
-    "between",
-    "beyond",
-    "biol",
-    "both",
-    "brief",
-    "briefly",
-    "but",
-    "by",
-    "c",
-    "c'mon",
-    "c's",
-    "ca",
-    "came",
-    "can",
-    "can't",
-    "cannot",
-    "cant",
-    "cause",
-    "causes",
-    "certain",
-    "certainly",
-    "changes",
-    "clearly",
-    "co",
-    "com",
-    "come",
-    "comes",
-    "concerning",
-    "consequently",
-    "consider",
-    "considering",
-    "contain",
-    "containing",
-    "contains",
-    "corresponding",
-    "could",
-    "couldn",
-    "couldn't",
-    "couldnt",
-    "course",
-    "currently",
-    "d",
-    "date",
-    "definitely",
-    "described",
-    "despite",
-    "did",
-    "didn",
-    "didn't",
-    "different",
-    "do",
-    "does",
-    "doesn",
-    "doesn't",
-    "doing",
-    "don",
-    "don't",
-    "done",
-    "down",
-    "downwards",
-    "due",
-    "during",
-    "e",
-    "each",
-    "ed",
-    "edu",
-    "effect",
-    "eg",
-    "eight",
-    "eighty",
-    "either",
-    "else",
-    "elsewhere",
-    "end",
-    "ending",
-    "enough",
-    "entirely",
-    "especially",
-    "et",
-    "et-al",
-    "etc",
-    "even",
-    "ever",
-    "every",
-    "everybody",
-    "everyone",
-    "everything",
-    "everywhere",
-    "ex",
-    "exactly",
-    "example",
-    "except",
-    "f",
-    "far",
-    "few",
-    "ff",
-    "fifth",
-    "first",
-    "five",
-    "fix",
-    "followed",
-    "following",
-    "follows",
-    "for",
-    "former",
-    "formerly",
-    "forth",
-    "found",
-    "four",
-    "from",
-    "further",
-    "furthermore",
-    "g",
-    "gave",
-    "get",
-    "gets",
-    "getting",
-    "give",
-    "given",
-    "gives",
-    "giving",
-    "go",
-    "goes",
-    "going",
-    "gone",
-    "got",
-    "gotten",
-    "greetings",
-    "h",
-    "had",
-    "hadn",
-    "hadn't",
-    "happens",
-    "hardly",
-    "has",
-    "hasn",
-    "hasn't",
-    "have",
-    "haven",
-    "haven't",
-    "having",
-    "he",
-    "he'd",
-    "he'll",
-    "he's",
-    "hed",
-    "hello",
-    "help",
-    "hence",
-    "her",
-    "here",
-    "here's",
-    "hereafter",
-    "hereby",
-    "herein",
-    "heres",
-    "hereupon",
-    "hers",
-    "herself",
-    "hes",
-    "hi",
-    "hid",
-    "him",
-    "himself",
-    "his",
-    "hither",
-    "home",
-    "hopefully",
-    "how",
-    "how's",
-    "howbeit",
-    "however",
-    "hundred",
-    "i",
-    "i'd",
-    "i'll",
-    "i'm",
-    "i've",
-    "id",
-    "ie",
-    "if",
-    "ignored",
-    "im",
-    "immediate",
-    "immediately",
-    "importance",
-    "important",
-    "in",
-    "inasmuch",
-    "inc",
-    "indeed",
-    "index",
-    "indicate",
-    "indicated",
-    "indicates",
-    "information",
-    "inner",
-    "insofar",
-    "instead",
-    "into",
-    "invention",
-    "inward",
-    "is",
-    "isn",
-    "isn't",
-    "it",
-    "it'd",
-    "it'll",
-    "it's",
-    "itd",
-    "its",
-    "itself",
-    "j",
-    "just",
-    "k",
-    "keep",
-    "keeps",
-    "kept",
-    "kg",
-    "km",
-    "know",
-    "known",
-    "knows",
-    "l",
-    "largely",
-    "last",
-    "lately",
-    "later",
-    "latter",
-    "latterly",
-    "least",
-    "less",
-    "lest",
-    "let",
-    "let's",
-    "lets",
-    "like",
-    "liked",
-    "likely",
-    "line",
-    "little",
-    "ll",
-    "look",
-    "looking",
-    "looks",
-    "ltd",
-    "m",
-    "ma",
-    "made",
-    "mainly",
-    "make",
-    "makes",
-    "many",
-    "may",
-    "maybe",
-    "me",
-    "mean",
-    "means",
-    "meantime",
-    "meanwhile",
-    "merely",
-    "mg",
-    "might",
-    "mightn",
-    "mightn't",
-    "million",
-    "miss",
-    "ml",
-    "more",
-    "moreover",
-    "most",
-    "mostly",
-    "mr",
-    "mrs",
-    "much",
-    "mug",
-    "must",
-    "mustn",
-    "mustn't",
-    "my",
-    "myself",
-    "n",
-    "na",
-    "name",
-    "namely",
-    "nay",
-    "nd",
-    "near",
-    "nearly",
-    "necessarily",
-    "necessary",
-    "need",
-    "needn",
-    "needn't",
-    "needs",
-    "neither",
-    "never",
-    "nevertheless",
-    "new",
-    "next",
-    "nine",
-    "ninety",
-    "no",
-    "nobody",
-    "non",
-    "none",
-    "nonetheless",
-    "noone",
-    "nor",
-    "normally",
-    "nos",
-    "not",
-    "noted",
-    "nothing",
-    "novel",
-    "now",
-    "nowhere",
-    "o",
-    "obtain",
-    "obtained",
-    "obviously",
-    "of",
-    "off",
-    "often",
-    "oh",
-    "ok",
-    "okay",
-    "old",
-    "omitted",
-    "on",
-    "once",
-    "one",
-    "ones",
-    "only",
-    "onto",
-    "or",
-    "ord",
-    "other",
-    "others",
-    "otherwise",
-    "ought",
-    "our",
-    "ours",
-    "ourselves",
-    "out",
-    "outside",
-    "over",
-    "overall",
-    "owing",
-    "own",
-    "p",
-    "page",
-    "pages",
-    "part",
-    "particular",
-    "particularly",
-    "past",
-    "per",
-    "perhaps",
-    "placed",
-    "please",
-    "plus",
-    "poorly",
-    "possible",
-    "possibly",
-    "potentially",
-    "pp",
-    "predominantly",
-    "present",
-    "presumably",
-    "previously",
-    "primarily",
-    "probably",
-    "promptly",
-    "proud",
-    "provides",
-    "put",
-    "q",
-    "que",
-    "quickly",
-    "quite",
-    "qv",
-    "r",
-    "ran",
-    "rather",
-    "rd",
-    "re",
-    "readily",
-    "really",
-    "reasonably",
-    "recent",
-    "recently",
-    "ref",
-    "refs",
-    "regarding",
-    "regardless",
-    "regards",
-    "related",
-    "relatively",
-    "research",
-    "respectively",
-    "resulted",
-    "resulting",
-    "results",
-    "right",
-    "run",
-    "s",
-    "said",
-    "same",
-    "saw",
-    "say",
-    "saying",
-    "says",
-    "sec",
-    "second",
-    "secondly",
-    "section",
-    "see",
-    "seeing",
-    "seem",
-    "seemed",
-    "seeming",
-    "seems",
-    "seen",
-    "self",
-    "selves",
-    "sensible",
-    "sent",
-    "serious",
-    "seriously",
-    "seven",
-    "several",
-    "shall",
-    "shan",
-    "shan't",
-    "she",
-    "she'd",
-    "she'll",
-    "she's",
-    "shed",
-    "shes",
-    "should",
-    "should've",
-    "shouldn",
-    "shouldn't",
-    "show",
-    "showed",
-    "shown",
-    "showns",
-    "shows",
-    "significant",
-    "significantly",
-    "similar",
-    "similarly",
-    "since",
-    "six",
-    "slightly",
-    "so",
-    "some",
-    "somebody",
-    "somehow",
-    "someone",
-    "somethan",
-    "something",
-    "sometime",
-    "sometimes",
-    "somewhat",
-    "somewhere",
-    "soon",
-    "sorry",
-    "specifically",
-    "specified",
-    "specify",
-    "specifying",
-    "still",
-    "stop",
-    "strongly",
-    "sub",
-    "substantially",
-    "successfully",
-    "such",
-    "sufficiently",
-    "suggest",
-    "sup",
-    "sure",
-    "t",
-    "t's",
-    "take",
-    "taken",
-    "taking",
-    "tell",
-    "tends",
-    "th",
-    "than",
-    "thank",
-    "thanks",
-    "thanx",
-    "that",
-    "that'll",
-    "that's",
-    "that've",
-    "thats",
-    "the",
-    "their",
-    "theirs",
-    "them",
-    "themselves",
-    "then",
-    "thence",
-    "there",
-    "there'll",
-    "there's",
-    "there've",
-    "thereafter",
-    "thereby",
-    "thered",
-    "therefore",
-    "therein",
-    "thereof",
-    "therere",
-    "theres",
-    "thereto",
-    "thereupon",
-    "these",
-    "they",
-    "they'd",
-    "they'll",
-    "they're",
-    "they've",
-    "theyd",
-    "theyre",
-    "think",
-    "third",
-    "this",
-    "thorough",
-    "thoroughly",
-    "those",
-    "thou",
-    "though",
-    "thoughh",
-    "thousand",
-    "three",
-    "throug",
-    "through",
-    "throughout",
-    "thru",
-    "thus",
-    "til",
-    "tip",
-    "to",
-    "together",
-    "too",
-    "took",
-    "toward",
-    "towards",
-    "tried",
-    "tries",
-    "truly",
-    "try",
-    "trying",
-    "ts",
-    "twice",
-    "two",
-    "u",
-    "un",
-    "under",
-    "unfortunately",
-    "unless",
-    "unlike",
-    "unlikely",
-    "until",
-    "unto",
-    "up",
-    "upon",
-    "ups",
-    "us",
-    "use",
-    "used",
-    "useful",
-    "usefully",
-    "usefulness",
-    "uses",
-    "using",
-    "usually",
-    "v",
-    "value",
-    "various",
-    "ve",
-    "very",
-    "via",
-    "viz",
-    "vol",
-    "vols",
-    "vs",
-    "w",
-    "want",
-    "wants",
-    "was",
-    "wasn",
-    "wasn't",
-    "wasnt",
-    "way",
-    "we",
-    "we'd",
-    "we'll",
-    "we're",
-    "we've",
-    "wed",
-    "welcome",
-    "well",
-    "went",
-    "were",
-    "weren",
-    "weren't",
-    "werent",
-    "what",
-    "what'll",
-    "what's",
-    "whatever",
-    "whats",
-    "when",
-    "when's",
-    "whence",
-    "whenever",
-    "where",
-    "where's",
-    "whereafter",
-    "whereas",
-    "whereby",
-    "wherein",
-    "wheres",
-    "whereupon",
-    "wherever",
-    "whether",
-    "which",
-    "while",
-    "whim",
-    "whither",
-    "who",
-    "who'll",
-    "who's",
-    "whod",
-    "whoever",
-    "whole",
-    "whom",
-    "whomever",
-    "whos",
-    "whose",
-    "why",
-    "why's",
-    "widely",
-    "will",
-    "willing",
-    "wish",
-    "with",
-    "within",
-    "without",
-    "won",
-    "won't",
-    "wonder",
-    "wont",
-    "words",
-    "world",
-    "would",
-    "wouldn",
-    "wouldn't",
-    "wouldnt",
-    "www",
-    "x",
-    "y",
-    "yes",
-    "yet",
-    "you",
-    "you'd",
-    "you'll",
-    "you're",
-    "you've",
-    "youd",
-    "your",
-    "youre",
-    "yours",
-    "yourself",
-    "yourselves",
-    "z",
-    "zero",
-    "thy",
-    "thou",
-    "thee",
-    "dost",
-    "didst",
-    "long",
-    "short",
-    "good",
-    "bad",
-    "nice",
-    "morning",
-    "afternoon",
-    "evening",
-    "till",
-    "thir",
-    "hath",
-    "hee",
-    "mee",
-    "ye",
-    "hast",
-    "ere",
-    "thing",
-    "things",
-    "look",
-    "looked",
-    "looks",
-    "say",
-    "said",
-    "saying",
-    "tell",
-    "tells",
-    "told",
-    "left",
-    "right"
-])
+"""
+Word lists used to analyze texts, stored as sorted newline-separated files in
+pytextos/data and loaded as sets on first access:
 
+- ENGLISH_STOPS: lower-case English stopwords, left out of frequency counts.
+- KNOWN_VOCABULARY: upper-case words considered known vocabulary.
+"""
+
+import os
 
 # VOCABULARY STOPS: COULD HAVE DIFFERENT VARIABLES FOR DIFFERENT LEVELS
+_FILES = {
+    "ENGLISH_STOPS": "english_stops.txt",
+    "KNOWN_VOCABULARY": "known_vocabulary.txt",
+}
+
+_DATA = os.path.join(os.path.dirname(__file__), "data")
+
+
+def load(name):
+    """Returns the set of words in a word list, reading it from its data file"""
+    with open(os.path.join(_DATA, _FILES[name]), "r", encoding="utf-8") as f:
+        return set(f.read().split("\n"))
 
 
-KNOWN_VOCABULARY = set([
-    "AA",
-    "AAA",
-    "AAAA",
-    "AARON",
-    "ABANDON",
-    "ABDOMEN",
-    "ABDOMINAL",
-    "ABNORMAL",
-    "ABUNDANT",
-    "ABUNDANCE",
-    "ACCUMULATED",
-    "ACCUMULATION",
-    "ABILITIES",
-    "ABILITY",
-    "ABLY",
-    "ABROAD",
-    "ABSENCE",
-    "ABSENCES",
-    "ABSENT",
-    "ABSOLUTE",
-    "ABSOLUTELY",
-    "ABSTRACT",
-    "ABUSE",
-    "ABUSING",
-    "AC",
-    "ACADEMIC",
-    "ACADEMY",
-    "ACCEPT",
-    "ACCEPTABILITY",
-    "ACCEPTABLE",
-    "ACCEPTANCE",
-    "ACCEPTED",
-    "ACCEPTING",
-    "ACCEPTS",
-    "ACCESS",
-    "ACCESSIBILITY",
-    "ACCESSIBLE",
-    "ACCESSORIES",
-    "ACCESSORY",
-    "ACCIDENT",
-    "ACCIDENTAL",
-    "ACCIDENTALLY",
-    "ACCIDENTS",
-    "ACCOMMODATION",
-    "ACCOMODATE",
-    "ACCOMPLISH",
-    "ACCOMPLISHMENT",
-    "ACCOMPLISHMENTS",
-    "ACCOMPLISHED",
-    "ACCOMPLISHES",
-    "ACCOMPLISHING",
-    "ACCORD",
-    "ACCORDED",
-    "ACCORDS",
-    "ACCOUNT",
-    "ACCOUNTABILITY",
-    "ACCOUNTABLE",
-    "ACCOUNTANCY",
-    "ACCOUNTANT",
-    "ACCOUNTANTS",
-    "ACCOUNTED",
-    "ACCOUNTING",
-    "ACCOUNTS",
-    "ACCURACY",
-    "ACCURATE",
-    "ACCUSE",
-    "ACCUSED",
-    "ACCUSES",
-    "ACCUSING",
-    "ACCUSTOM",
-    "ACCUSTOMED",
-    "ACCUSTOMING",
-    "ACCUSTOMS",
-    "ACHE",
-    "ACHED",
-    "ACHES",
-    "ACHIEVE",
-    "ACHIEVED",
-    "ACHIEVEMENT",
-    "ACHING",
-    "ACID",
-    "ACQUIRED",
-    "ACQUISITION",
-    "ACRES",
-    "ACROBAT",
-    "ACTED",
-    "ACTING",
-    "ACTION",
-    "ACTIONS",
-    "ACTIVE",
-    "ACTIVELY",
-    "ACTIVITIES",
-    "ACTIVITY",
-    "ACTOR",
-    "ACTORS",
-    "ACTRESS",
-    "ACTRESSES",
-    "ACTS",
-    "ACTUAL",
-    "AD",
-    "ADAM",
-    "ADAMS",
-    "ADAPTER",
-    "ADD",
-    "ADDING",
-    "ADDITION",
-    "ADDITIONAL",
-    "ADDITIONS",
-    "ADDITIVE",
-    "ADDRESS",
-    "ADDRESSED",
-    "ADDRESSES",
-    "ADDRESSING",
-    "ADDS",
-    "ADEQUATE",
-    "ADJUSTABLE",
-    "ADJUSTMENT",
-    "ADMIN",
-    "ADMINISTRATION",
-    "ADMINISTRATIVE",
-    "ADMINISTRATOR",
-    "ADMIRABLE",
-    "ADMIRATION",
-    "ADMIRE",
-    "ADMIRED",
-    "ADMIRES",
-    "ADMIRING",
-    "ADMISSION",
-    "ADMISSIONS",
-    "ADMIT",
-    "ADMITS",
-    "ADMITTED",
-    "ADMITTING",
-    "ADOBE",
-    "ADOPT",
-    "ADOPTED",
-    "ADOPTING",
-    "ADOPTION",
-    "ADOPTIONS",
-    "ADOPTS",
-    "ADS",
-    "ADULT",
-    "ADULTS",
-    "ADVANCE",
-    "ADVANCED",
-    "ADVANCEMENT",
-    "ADVANCES",
-    "ADVANCING",
-    "ADVANTAGE",
-    "ADVANTAGED",
-    "ADVANTAGES",
-    "ADVANTAGING",
-    "ADVENTURE",
-    "ADVENTURER",
-    "ADVENTURERS",
-    "ADVENTURES",
-    "ADVENTUROUS",
-    "ADVERTISE",
-    "ADVERTISED",
-    "ADVERTISEMENT",
-    "ADVERTISEMENTS",
-    "ADVERTISER",
-    "ADVERTISERS",
-    "ADVERTISES",
-    "ADVERTISING",
-    "ADVICE",
-    "ADVISE",
-    "ADVISED",
-    "ADVISER",
-    "ADVISERS",
-    "ADVISES",
-    "ADVISING",
-    "ADVISOR",
-    "ADVISORS",
-    "ADVISORY",
-    "AE",
-    "AEROPLANE",
-    "AEROPLANES",
-    "AFFAIR",
-    "AFFAIRS",
-    "AFFECT",
-    "AFFILIATE",
-    "AFFORD",
-    "AFFORDABLE",
-    "AFFORDED",
-    "AFFORDING",
-    "AFFORDS",
-    "AFGHAN",
-    "AFGHANISTAN",
-    "AFRAID",
-    "AFRICA",
-    "AFRICAN",
-    "AFTERNOONS",
-    "AG",
-    "AGE",
-    "AGED",
-    "AGENCIES",
-    "AGENCY",
-    "AGENDA",
-    "AGENT",
-    "AGENTS",
-    "AGES",
-    "AGING",
-    "AGO",
-    "AGREE",
-    "AGREEABLE",
-    "AGREED",
-    "AGREEING",
-    "AGREEMENT",
-    "AGREEMENTS",
-    "AGREES",
-    "AGRICULTURAL",
-    "AGRICULTURE",
-    "AHEAD",
-    "AI",
-    "AID",
-    "AIDS",
-    "AIM",
-    "AIMED",
-    "AIMING",
-    "AIMLESS",
-    "AIMLESSNESS",
-    "AIMS",
-    "AIR",
-    "AIRCRAFT",
-    "AIRLINE",
-    "AIRLINES",
-    "AIRPLANE",
-    "AIRPLANES",
-    "AIRPORT",
-    "AK",
-    "AKA",
-    "AL",
-    "ALABAMA",
-    "ALAN",
-    "ALARM",
-    "ALASKA",
-    "ALBERT",
-    "ALBERTA",
-    "ALBUM",
-    "ALBUMS",
-    "ALCOHOL",
-    "ALERT",
-    "ALERTS",
-    "ALEX",
-    "ALEXANDER",
-    "ALGORITHM",
-    "ALICE",
-    "ALIKE",
-    "ALIVE",
-    "ALLEN",
-    "ALLIANCE",
-    "ALLOCATED",
-    "ALLOCATION",
-    "ALLOWANCE",
-    "ALLOWANCES",
-    "ALLOWED",
-    "ALLOWING",
-    "ALOUD",
-    "ALPHA",
-    "ALPHABETICAL",
-    "ALTERNATE",
-    "ALTERNATIVE",
-    "ALTERNATIVES",
-    "ALTOGETHER",
-    "ALUMINUM",
-    "ALUMNI",
-    "AMATEUR",
-    "AMAZING",
-    "AMAZON",
-    "AMBITION",
-    "AMBITIONS",
-    "AMBITIOUS",
-    "AMBITIOUSLY",
-    "AMD",
-    "AMENDED",
-    "AMENDMENT",
-    "AMENDMENTS",
-    "AMERICA",
-    "AMERICAN",
-    "AMERICANS",
-    "AMOUNT",
-    "AMOUNTED",
-    "AMOUNTING",
-    "AMOUNTS",
-    "AMP",
-    "AMSTERDAM",
-    "AMUSE",
-    "AMUSED",
-    "AMUSEMENT",
-    "AMUSEMENTS",
-    "AMUSES",
-    "AMUSING",
-    "AMY",
-    "ANAL",
-    "ANALOG",
-    "ANALYSIS",
-    "ANALYST",
-    "ANCIENT",
-    "ANDERSON",
-    "ANDREW",
-    "ANDY",
-    "ANGEL",
-    "ANGELES",
-    "ANGELS",
-    "ANGER",
-    "ANGERED",
-    "ANGERING",
-    "ANGERS",
-    "ANGLE",
-    "ANGLED",
-    "ANGLES",
-    "ANGLING",
-    "ANGRIER",
-    "ANGRIEST",
-    "ANGRILY",
-    "ANGRY",
-    "ANIMAL",
-    "ANIMALS",
-    "ANIMATED",
-    "ANIMATION",
-    "ANIME",
-    "ANN",
-    "ANNA",
-    "ANNE",
-    "ANNIVERSARY",
-    "ANNOTATION",
-    "ANNOUNCED",
-    "ANNOUNCEMENT",
-    "ANNOUNCEMENTS",
-    "ANNOY",
-    "ANNOYANCE",
-    "ANNOYED",
-    "ANNOYING",
-    "ANNOYS",
-    "ANNUAL",
-    "ANONYMOUS",
-    "ANSWER",
-    "ANSWERED",
-    "ANSWERING",
-    "ANSWERS",
-    "ANTENNA",
-    "ANTHONY",
-    "ANTI",
-    "ANTIQUE",
-    "ANTIQUES",
-    "ANTONIO",
-    "ANXIETIES",
-    "ANXIETY",
-    "ANXIOUS",
-    "ANXIOUSLY",
-    "ANYTIME",
-    "AOL",
-    "AP",
-    "APACHE",
-    "APARTMENT",
-    "APARTMENTS",
-    "API",
-    "APOLOGETIC",
-    "APOLOGIES",
-    "APOLOGISE",
-    "APOLOGISED",
-    "APOLOGISES",
-    "APOLOGISING",
-    "APOLOGIZE",
-    "APOLOGIZED",
-    "APOLOGIZES",
-    "APOLOGY",
-    "APP",
-    "APPAREL",
-    "APPEAL",
-    "APPEALS",
-    "APPEARANCE",
-    "APPEARANCES",
-    "APPEARED",
-    "APPEARING",
-    "APPEARS",
-    "APPENDIX",
-    "APPLAUD",
-    "APPLAUDED",
-    "APPLAUDING",
-    "APPLAUDS",
-    "APPLAUSE",
-    "APPLE",
-    "APPLES",
-    "APPLIANCES",
-    "APPLICABILITY",
-    "APPLICABLE",
-    "APPLICANT",
-    "APPLICANTS",
-    "APPLICATION",
-    "APPLICATIONS",
-    "APPLIED",
-    "APPLIES",
-    "APPLY",
-    "APPLYING",
-    "APPOINT",
-    "APPOINTED",
-    "APPOINTING",
-    "APPOINTMENT",
-    "APPOINTMENTS",
-    "APPOINTS",
-    "APPROACH",
-    "APPROACHES",
-    "APPROVAL",
-    "APPROVE",
-    "APPROVED",
-    "APPROVES",
-    "APPROVING",
-    "APR",
-    "APRIL",
-    "AR",
-    "ARAB",
-    "ARC",
-    "ARCADE",
-    "ARCH",
-    "ARCHED",
-    "ARCHES",
-    "ARCHING",
-    "ARCHITECTURE",
-    "ARCHIVE",
-    "ARCHIVES",
-    "AREA",
-    "AREAS",
-    "ARENA",
-    "ARGENTINA",
-    "ARGUABLE",
-    "ARGUE",
-    "ARGUED",
-    "ARGUES",
-    "ARGUING",
-    "ARGUMENT",
-    "ARGUMENTS",
-    "ARISEN",
-    "ARISES",
-    "ARISING",
-    "ARIZONA",
-    "ARKANSAS",
-    "ARM",
-    "ARMED",
-    "ARMIES",
-    "ARMS",
-    "ARMY",
-    "AROSE",
-    "ARRANGE",
-    "ARRANGED",
-    "ARRANGEMENT",
-    "ARRANGEMENTS",
-    "ARRANGES",
-    "ARRANGING",
-    "ARRAY",
-    "ARREST",
-    "ARRESTED",
-    "ARRESTING",
-    "ARRESTS",
-    "ARRIVAL",
-    "ARRIVALS",
-    "ARRIVE",
-    "ARRIVED",
-    "ARRIVES",
-    "ARRIVING",
-    "ARROW",
-    "ARROWS",
-    "ART",
-    "ARTHUR",
-    "ARTICLE",
-    "ARTICLES",
-    "ARTIFICIAL",
-    "ARTIFICIALLY",
-    "ARTIST",
-    "ARTISTIC",
-    "ARTISTICALLY",
-    "ARTISTS",
-    "ARTS",
-    "ASH",
-    "ASHAMED",
-    "ASHAMEDLY",
-    "ASHES",
-    "ASIA",
-    "ASIAN",
-    "ASKED",
-    "ASKS",
-    "ASLEEP",
-    "ASP",
-    "ASPECT",
-    "ASPECTS",
-    "ASS",
-    "ASSEMBLY",
-    "ASSESS",
-    "ASSESSMENT",
-    "ASSET",
-    "ASSETS",
-    "ASSIGNED",
-    "ASSIGNMENT",
-    "ASSIST",
-    "ASSISTANCE",
-    "ASSISTANT",
-    "ASSOCIATE",
-    "ASSOCIATES",
-    "ASSOCIATING",
-    "ASSOCIATION",
-    "ASSOCIATIONS",
-    "ASSUME",
-    "ASSUMED",
-    "ASSUMES",
-    "ASSUMING",
-    "ASSUMPTION",
-    "ASSURANCE",
-    "ASTONISH",
-    "ASTONISHED",
-    "ASTONISHES",
-    "ASTONISHING",
-    "ASTONISHMENT",
-    "ATE",
-    "ATHLETIC",
-    "ATHLETICS",
-    "ATLANTA",
-    "ATLANTIC",
-    "ATLAS",
-    "ATMOSPHERE",
-    "ATOM",
-    "ATTACHED",
-    "ATTACHMENT",
-    "ATTACK",
-    "ATTACKED",
-    "ATTACKING",
-    "ATTACKS",
-    "ATTEMPT",
-    "ATTEMPTED",
-    "ATTEMPTING",
-    "ATTEMPTS",
-    "ATTEND",
-    "ATTENDANCE",
-    "ATTENDANCES",
-    "ATTENDANT",
-    "ATTENDED",
-    "ATTENDING",
-    "ATTENDS",
-    "ATTENTION",
-    "ATTITUDE",
-    "ATTORNEY",
-    "ATTORNEYS",
-    "ATTRACT",
-    "ATTRACTED",
-    "ATTRACTING",
-    "ATTRACTION",
-    "ATTRACTIONS",
-    "ATTRACTIVE",
-    "ATTRACTIVELY",
-    "ATTRACTIVENESS",
-    "ATTRACTS",
-    "ATTRIBUTE",
-    "ATTRIBUTES",
-    "AU",
-    "AUCTION",
-    "AUCTIONS",
-    "AUD",
-    "AUDIENCE",
-    "AUDIENCES",
-    "AUDIO",
-    "AUDIT",
-    "AUG",
-    "AUGUST",
-    "AUNT",
-    "AUNTS",
-    "AUNTY",
-    "AUSTIN",
-    "AUSTRALIA",
-    "AUSTRALIAN",
-    "AUSTRIA",
-    "AUTHENTICATION",
-    "AUTHOR",
-    "AUTHORITIES",
-    "AUTHORITY",
-    "AUTHORIZED",
-    "AUTHORS",
-    "AUTO",
-    "AUTOMATED",
-    "AUTOMATIC",
-    "AUTOMATICALLY",
-    "AUTOMATION",
-    "AUTOMOTIVE",
-    "AUTUMN",
-    "AV",
-    "AVAILABILITY",
-    "AVATAR",
-    "AVE",
-    "AVENUE",
-    "AVENUES",
-    "AVERAGE",
-    "AVERAGED",
-    "AVERAGES",
-    "AVERAGING",
-    "AVG",
-    "AVIATION",
-    "AVOID",
-    "AVOIDABLE",
-    "AVOIDANCE",
-    "AVOIDED",
-    "AVOIDING",
-    "AVOIDS",
-    "AWAKE",
-    "AWAKEN",
-    "AWARD",
-    "AWARDED",
-    "AWARDS",
-    "AWARE",
-    "AWARENESS",
-    "AWESOME",
-    "AWKWARD",
-    "AWKWARDLY",
-    "AWOKEN",
-    "AX",
-    "AXE",
-    "AXED",
-    "AXES",
-    "AXING",
-    "AXIS",
-    "AZ",
-    "BA",
-    "BABE",
-    "BABES",
-    "BABIES",
-    "BABY",
-    "BACHELOR",
-    "BACKBONE",
-    "BACKED",
-    "BACKGROUND",
-    "BACKGROUNDS",
-    "BACKING",
-    "BACKS",
-    "BACKUP",
-    "BACKWARD",
-    "BACKWARDS",
-    "BADLY",
-    "BADNESS",
-    "BAG",
-    "BAGGAGE",
-    "BAGGED",
-    "BAGGING",
-    "BAGS",
-    "BAKE",
-    "BAKED",
-    "BAKER",
-    "BAKERS",
-    "BAKES",
-    "BAKING",
-    "BALANCE",
-    "BALANCED",
-    "BALANCES",
-    "BALANCING",
-    "BALL",
-    "BALLS",
-    "BALTIMORE",
-    "BAN",
-    "BAND",
-    "BANDED",
-    "BANDING",
-    "BANDS",
-    "BANDWIDTH",
-    "BANG",
-    "BANK",
-    "BANKED",
-    "BANKER",
-    "BANKERS",
-    "BANKING",
-    "BANKRUPTCY",
-    "BANKS",
-    "BANNER",
-    "BAR",
-    "BARBARA",
-    "BARBER",
-    "BARBERS",
-    "BARE",
-    "BARED",
-    "BARELY",
-    "BARES",
-    "BARGAIN",
-    "BARGAINED",
-    "BARGAINING",
-    "BARGAINS",
-    "BARING",
-    "BARRED",
-    "BARREL",
-    "BARRELS",
-    "BARRING",
-    "BARRY",
-    "BARS",
-    "BASE",
-    "BASEBALL",
-    "BASED",
-    "BASES",
-    "BASIC",
-    "BASICALLY",
-    "BASICS",
-    "BASIN",
-    "BASING",
-    "BASINS",
-    "BASIS",
-    "BASKET",
-    "BASKETBALL",
-    "BASKETS",
-    "BASS",
-    "BATH",
-    "BATHE",
-    "BATHED",
-    "BATHES",
-    "BATHING",
-    "BATHROOM",
-    "BATHS",
-    "BATTERIES",
-    "BATTERY",
-    "BATTLE",
-    "BATTLED",
-    "BATTLES",
-    "BATTLING",
-    "BAY",
-    "BAYS",
-    "BB",
-    "BBC",
-    "BC",
-    "BEACH",
-    "BEAK",
-    "BEAKED",
-    "BEAKS",
-    "BEAM",
-    "BEAMED",
-    "BEAMING",
-    "BEAMS",
-    "BEAN",
-    "BEANS",
-    "BEAR",
-    "BEARD",
-    "BEARDED",
-    "BEARDS",
-    "BEARING",
-    "BEARINGS",
-    "BEARS",
-    "BEAST",
-    "BEASTIALITY",
-    "BEASTS",
-    "BEAT",
-    "BEATEN",
-    "BEATING",
-    "BEATS",
-    "BEAUTIFUL",
-    "BEAUTIFULLY",
-    "BEAUTY",
-    "BED",
-    "BEDDING",
-    "BEDROOM",
-    "BEDROOMS",
-    "BEDS",
-    "BEER",
-    "BEG",
-    "BEGAN",
-    "BEGGAR",
-    "BEGGARS",
-    "BEGGED",
-    "BEGGING",
-    "BEGINNER",
-    "BEGINNERS",
-    "BEGS",
-    "BEGUN",
-    "BEHALF",
-    "BEHAVE",
-    "BEHAVED",
-    "BEHAVES",
-    "BEHAVING",
-    "BEHAVIOR",
-    "BEHAVIORAL",
-    "BEHAVIORS",
-    "BEHAVIOUR",
-    "BEHAVIOURAL",
-    "BEHAVIOURS",
-    "BEINGS",
-    "BELGIUM",
-    "BELIEF",
-    "BELIEFS",
-    "BELIEVED",
-    "BELIEVES",
-    "BELIEVING",
-    "BELL",
-    "BELLS",
-    "BELONG",
-    "BELONGED",
-    "BELONGING",
-    "BELONGINGS",
-    "BELONGS",
-    "BELT",
-    "BELTED",
-    "BELTING",
-    "BELTS",
-    "BEN",
-    "BEND",
-    "BENDING",
-    "BENDS",
-    "BENEATH",
-    "BENEFIT",
-    "BENEFITS",
-    "BENT",
-    "BERLIN",
-    "BERRIES",
-    "BERRY",
-    "BESTIALITY",
-    "BESTSELLERS",
-    "BET",
-    "BETA",
-    "BETTING",
-    "BI",
-    "BIBLE",
-    "BICYCLE",
-    "BICYCLED",
-    "BICYCLES",
-    "BICYCLING",
-    "BID",
-    "BIDDER",
-    "BIDDING",
-    "BIDS",
-    "BIG",
-    "BIGGER",
-    "BIGGEST",
-    "BIGGISH",
-    "BIKE",
-    "BIKINI",
-    "BILL",
-    "BILLED",
-    "BILLING",
-    "BILLION",
-    "BILLIONS",
-    "BILLS",
-    "BILLY",
-    "BIN",
-    "BINARY",
-    "BIND",
-    "BIO",
-    "BIOGRAPHY",
-    "BIOLOGICAL",
-    "BIOLOGY",
-    "BIRD",
-    "BIRDS",
-    "BIRMINGHAM",
-    "BIRTH",
-    "BIRTHDAY",
-    "BIRTHDAYS",
-    "BIRTHS",
-    "BIT",
-    "BITE",
-    "BITES",
-    "BITING",
-    "BITS",
-    "BITTEN",
-    "BITTER",
-    "BITTERER",
-    "BITTEREST",
-    "BITTERLY",
-    "BITTERNESS",
-    "BIZ",
-    "BLACK",
-    "BLACKEN",
-    "BLACKER",
-    "BLACKEST",
-    "BLACKISH",
-    "BLACKJACK",
-    "BLACKLY",
-    "BLACKNESS",
-    "BLACKS",
-    "BLADE",
-    "BLADES",
-    "BLAME",
-    "BLAMED",
-    "BLAMELESS",
-    "BLAMES",
-    "BLAMING",
-    "BLANK",
-    "BLED",
-    "BLEED",
-    "BLEEDING",
-    "BLEEDS",
-    "BLESS",
-    "BLESSED",
-    "BLESSES",
-    "BLESSING",
-    "BLESSINGS",
-    "BLEW",
-    "BLIND",
-    "BLINDED",
-    "BLINDING",
-    "BLINDLY",
-    "BLINDNESS",
-    "BLINDS",
-    "BLOCK",
-    "BLOCKED",
-    "BLOCKING",
-    "BLOCKS",
-    "BLOG",
-    "BLOGGER",
-    "BLOGGING",
-    "BLOGS",
-    "BLONDE",
-    "BLOOD",
-    "BLOODY",
-    "BLOW",
-    "BLOWING",
-    "BLOWJOB",
-    "BLOWJOBS",
-    "BLOWN",
-    "BLOWS",
-    "BLUE",
-    "BLUENESS",
-    "BLUER",
-    "BLUES",
-    "BLUEST",
-    "BLUETOOTH",
-    "BLVD",
-    "BMW",
-    "BOARD",
-    "BOARDED",
-    "BOARDING",
-    "BOARDS",
-    "BOAT",
-    "BOATS",
-    "BOB",
-    "BODIES",
-    "BODILY",
-    "BODY",
-    "BOIL",
-    "BOILED",
-    "BOILER",
-    "BOILERS",
-    "BOILING",
-    "BOILS",
-    "BOLD",
-    "BOLDER",
-    "BOLDEST",
-    "BOLDLY",
-    "BOLDNESS",
-    "BOND",
-    "BONDAGE",
-    "BONDS",
-    "BONE",
-    "BONED",
-    "BONES",
-    "BONING",
-    "BONUS",
-    "BOOBS",
-    "BOOK",
-    "BOOKING",
-    "BOOKMARK",
-    "BOOKS",
-    "BOOST",
-    "BOOT",
-    "BOOTS",
-    "BOOTY",
-    "BORDER",
-    "BORDERED",
-    "BORDERING",
-    "BORDERS",
-    "BORE",
-    "BORN",
-    "BORNE",
-    "BORROW",
-    "BORROWED",
-    "BORROWING",
-    "BORROWS",
-    "BOSS",
-    "BOSTON",
-    "BOTTLE",
-    "BOTTLED",
-    "BOTTLES",
-    "BOTTLING",
-    "BOTTOM",
-    "BOTTOMS",
-    "BOUGHT",
-    "BOUND",
-    "BOUNDARIES",
-    "BOUNDARY",
-    "BOUNDED",
-    "BOUNDING",
-    "BOUNDLESS",
-    "BOUNDS",
-    "BOW",
-    "BOWED",
-    "BOWING",
-    "BOWL",
-    "BOWLED",
-    "BOWLING",
-    "BOWLS",
-    "BOWS",
-    "BOX",
-    "BOXES",
-    "BOY",
-    "BOYHOOD",
-    "BOYS",
-    "BR",
-    "BRAIN",
-    "BRAINS",
-    "BRANCH",
-    "BRANCHED",
-    "BRANCHES",
-    "BRANCHING",
-    "BRAND",
-    "BRANDS",
-    "BRASS",
-    "BRAVE",
-    "BRAVED",
-    "BRAVELY",
-    "BRAVERY",
-    "BRAVES",
-    "BRAVING",
-    "BRAZIL",
-    "BREAD",
-    "BREADTH",
-    "BREAK",
-    "BREAKAGE",
-    "BREAKFAST",
-    "BREAKFASTED",
-    "BREAKFASTING",
-    "BREAKFASTS",
-    "BREAKING",
-    "BREAKS",
-    "BREAST",
-    "BREASTS",
-    "BREATH",
-    "BREATHE",
-    "BREATHED",
-    "BREATHES",
-    "BREATHING",
-    "BREATHLESS",
-    "BREATHLESSLY",
-    "BREATHS",
-    "BRIAN",
-    "BRIBE",
-    "BRIBED",
-    "BRIBERY",
-    "BRIBES",
-    "BRIBING",
-    "BRICK",
-    "BRICKS",
-    "BRIDGE",
-    "BRIDGES",
-    "BRIGHT",
-    "BRIGHTEN",
-    "BRIGHTENED",
-    "BRIGHTENING",
-    "BRIGHTENS",
-    "BRIGHTER",
-    "BRIGHTEST",
-    "BRIGHTLY",
-    "BRIGHTNESS",
-    "BRING",
-    "BRINGING",
-    "BRINGS",
-    "BRISTOL",
-    "BRITAIN",
-    "BRITISH",
-    "BROAD",
-    "BROADBAND",
-    "BROADCAST",
-    "BROADCASTED",
-    "BROADCASTING",
-    "BROADCASTS",
-    "BROADER",
-    "BROADEST",
-    "BROADLY",
-    "BROADWAY",
-    "BROCHURE",
-    "BROKE",
-    "BROKEN",
-    "BROKER",
-    "BROKERS",
-    "BROTHER",
-    "BROTHERLY",
-    "BROTHERS",
-    "BROUGHT",
-    "BROWN",
-    "BROWNED",
-    "BROWNING",
-    "BROWNS",
-    "BROWSE",
-    "BROWSER",
-    "BRUCE",
-    "BRUSH",
-    "BRUSHED",
-    "BRUSHES",
-    "BRUSHING",
-    "BS",
-    "BUCKET",
-    "BUCKETS",
-    "BUDDY",
-    "BUDGET",
-    "BUFFALO",
-    "BUFFER",
-    "BUG",
-    "BUGS",
-    "BUILD",
-    "BUILD-UP",
-    "BUILDER",
-    "BUILDERS",
-    "BUILDING",
-    "BUILDINGS",
-    "BUILDS",
-    "BUILT",
-    "BUKKAKE",
-    "BULGARIA",
-    "BULK",
-    "BULLETIN",
-    "BUNCH",
-    "BUNCHES",
-    "BUREAU",
-    "BURIAL",
-    "BURIALS",
-    "BURIED",
-    "BURIES",
-    "BURN",
-    "BURNED",
-    "BURNING",
-    "BURNS",
-    "BURNT",
-    "BURST",
-    "BURSTING",
-    "BURSTS",
-    "BURY",
-    "BURYING",
-    "BUS",
-    "BUSES",
-    "BUSH",
-    "BUSHES",
-    "BUSHY",
-    "BUSIER",
-    "BUSIEST",
-    "BUSILY",
-    "BUSINESS",
-    "BUSINESSES",
-    "BUSINESSLIKE",
-    "BUSINESSMAN",
-    "BUSINESSMEN",
-    "BUSINESSWOMAN",
-    "BUSINESSWOMEN",
-    "BUSSED",
-    "BUSSING",
-    "BUSTY",
-    "BUSY",
-    "BUTT",
-    "BUTTER",
-    "BUTTERED",
-    "BUTTERING",
-    "BUTTERS",
-    "BUTTON",
-    "BUTTONED",
-    "BUTTONING",
-    "BUTTONS",
-    "BUY",
-    "BUYER",
-    "BUYERS",
-    "BUYING",
-    "BUYS",
-    "BYTES",
-    "CABINET",
-    "CABLE",
-    "CABLES",
-    "CACHE",
-    "CACHED",
-    "CAFE",
-    "CAGE",
-    "CAGED",
-    "CAGES",
-    "CAGING",
-    "CAKE",
-    "CAKES",
-    "CAL",
-    "CALCULATE",
-    "CALCULATED",
-    "CALCULATES",
-    "CALCULATING",
-    "CALCULATION",
-    "CALCULATIONS",
-    "CALCULATOR",
-    "CALENDAR",
-    "CALIFORNIA",
-    "CALL",
-    "CALLED",
-    "CALLING",
-    "CALLS",
-    "CALM",
-    "CALMED",
-    "CALMING",
-    "CALMLY",
-    "CALMNESS",
-    "CALMS",
-    "CAM",
-    "CAMBRIDGE",
-    "CAMCORDER",
-    "CAMCORDERS",
-    "CAMERA",
-    "CAMERAS",
-    "CAMP",
-    "CAMPAIGN",
-    "CAMPBELL",
-    "CAMPED",
-    "CAMPING",
-    "CAMPS",
-    "CAMPUS",
-    "CANADA",
-    "CANADIAN",
-    "CANAL",
-    "CANALS",
-    "CANCEL",
-    "CANCER",
-    "CANDIDATE",
-    "CANDIDATES",
-    "CANDY",
-    "CANNED",
-    "CANNING",
-    "CANON",
-    "CANS",
-    "CAP",
-    "CAPABILITIES",
-    "CAPABILITY",
-    "CAPABLE",
-    "CAPACITY",
-    "CAPE",
-    "CAPED",
-    "CAPES",
-    "CAPITAL",
-    "CAPITALS",
-    "CAPPED",
-    "CAPPING",
-    "CAPPINGS",
-    "CAPS",
-    "CAPTAIN",
-    "CAPTAINS",
-    "CAPTURE",
-    "CAR",
-    "CARBON",
-    "CARD",
-    "CARDS",
-    "CARE",
-    "CARED",
-    "CAREER",
-    "CAREERS",
-    "CAREFUL",
-    "CAREFULLY",
-    "CARELESS",
-    "CARELESSLY",
-    "CARES",
-    "CARIBBEAN",
-    "CARING",
-    "CARL",
-    "CAROLINA",
-    "CARPET",
-    "CARRIAGE",
-    "CARRIAGES",
-    "CARRIED",
-    "CARRIER",
-    "CARRIES",
-    "CARRY",
-    "CARRYING",
-    "CARS",
-    "CART",
-    "CARTED",
-    "CARTER",
-    "CARTING",
-    "CARTOON",
-    "CARTOONS",
-    "CARTRIDGE",
-    "CARTRIDGES",
-    "CARTS",
-    "CASE",
-    "CASES",
-    "CASH",
-    "CASINO",
-    "CASINOS",
-    "CAST",
-    "CASTLE",
-    "CASTLES",
-    "CASUAL",
-    "CAT",
-    "CATALOG",
-    "CATALOGUE",
-    "CATCH",
-    "CATCHES",
-    "CATCHING",
-    "CATEGORIES",
-    "CATEGORY",
-    "CATERING",
-    "CATHOLIC",
-    "CATS",
-    "CATTLE",
-    "CAUGHT",
-    "CAUSED",
-    "CAUSING",
-    "CAUTION",
-    "CAUTIONED",
-    "CAUTIONING",
-    "CAUTIONS",
-    "CAUTIOUS",
-    "CAUTIOUSLY",
-    "CAVE",
-    "CAVED",
-    "CAVES",
-    "CAVING",
-    "CC",
-    "CD",
-    "CDS",
-    "CE",
-    "CELEBRITY",
-    "CELL",
-    "CELLS",
-    "CELLULAR",
-    "CENSUS",
-    "CENT",
-    "CENTER",
-    "CENTERED",
-    "CENTERIST",
-    "CENTERISTS",
-    "CENTERS",
-    "CENTIMETRE",
-    "CENTIMETRES",
-    "CENTRAL",
-    "CENTRALIZATION",
-    "CENTRE",
-    "CENTRED",
-    "CENTRES",
-    "CENTRIST",
-    "CENTRISTS",
-    "CENTS",
-    "CENTURIES",
-    "CENTURY",
-    "CEO",
-    "CEREMONIAL",
-    "CEREMONIES",
-    "CEREMONY",
-    "CERTAINTY",
-    "CERTIFICATE",
-    "CERTIFICATES",
-    "CERTIFICATION",
-    "CERTIFIED",
-    "CF",
-    "CH",
-    "CHAIN",
-    "CHAINED",
-    "CHAINING",
-    "CHAINS",
-    "CHAIR",
-    "CHAIRMAN",
-    "CHAIRS",
-    "CHALK",
-    "CHALKS",
-    "CHALLENGE",
-    "CHALLENGES",
-    "CHAMBER",
-    "CHAMPION",
-    "CHAMPIONSHIP",
-    "CHANCE",
-    "CHANCED",
-    "CHANCES",
-    "CHANCING",
-    "CHANGE",
-    "CHANGED",
-    "CHANGING",
-    "CHANNEL",
-    "CHANNELS",
-    "CHAPTER",
-    "CHAPTERS",
-    "CHAR",
-    "CHARACTER",
-    "CHARACTERISE",
-    "CHARACTERISED",
-    "CHARACTERISES",
-    "CHARACTERISTIC",
-    "CHARACTERISTICALLY",
-    "CHARACTERISTICS",
-    "CHARACTERIZATION",
-    "CHARACTERIZE",
-    "CHARACTERIZED",
-    "CHARACTERIZES",
-    "CHARACTERS",
-    "CHARGE",
-    "CHARGED",
-    "CHARGER",
-    "CHARGES",
-    "CHARGING",
-    "CHARITY",
-    "CHARLES",
-    "CHARLIE",
-    "CHARLOTTE",
-    "CHARM",
-    "CHARMED",
-    "CHARMING",
-    "CHARMS",
-    "CHART",
-    "CHARTER",
-    "CHARTS",
-    "CHAT",
-    "CHEAP",
-    "CHEAPER",
-    "CHEAPEST",
-    "CHEAPLY",
-    "CHEAPNESS",
-    "CHEAT",
-    "CHEATED",
-    "CHEATING",
-    "CHEATS",
-    "CHECK",
-    "CHECKED",
-    "CHECKING",
-    "CHECKOUT",
-    "CHECKS",
-    "CHEER",
-    "CHEERED",
-    "CHEERFUL",
-    "CHEERING",
-    "CHEERS",
-    "CHEERY",
-    "CHEESE",
-    "CHEESES",
-    "CHEMICAL",
-    "CHEMICALS",
-    "CHEMISTRY",
-    "CHEQUE",
-    "CHEQUES",
-    "CHERRY",
-    "CHEST",
-    "CHESTS",
-    "CHEVROLET",
-    "CHICAGO",
-    "CHICKEN",
-    "CHICKENS",
-    "CHIEF",
-    "CHIEFLY",
-    "CHIEFS",
-    "CHILD",
-    "CHILDHOOD",
-    "CHILDISH",
-    "CHILDLIKE",
-    "CHILDREN",
-    "CHILE",
-    "CHIMNEY",
-    "CHIMNEYS",
-    "CHINA",
-    "CHINESE",
-    "CHIP",
-    "CHIPS",
-    "CHOCOLATE",
-    "CHOICE",
-    "CHOICES",
-    "CHOOSE",
-    "CHOOSES",
-    "CHOOSING",
-    "CHOSE",
-    "CHOSEN",
-    "CHRIS",
-    "CHRIST",
-    "CHRISTIAN",
-    "CHRISTMAS",
-    "CHRISTMASES",
-    "CHRISTOPHER",
-    "CHRONIC",
-    "CHURCH",
-    "CHURCHES",
-    "CIALIS",
-    "CINCINNATI",
-    "CINEMA",
-    "CIRCLE",
-    "CIRCLED",
-    "CIRCLES",
-    "CIRCLING",
-    "CIRCUIT",
-    "CIRCULAR",
-    "CIRCUMSTANCES",
-    "CISCO",
-    "CITIES",
-    "CITIZEN",
-    "CITIZENS",
-    "CITY",
-    "CITYSEARCH",
-    "CIVIL",
-    "CIVILISATION",
-    "CIVILISATIONS",
-    "CIVILISE",
-    "CIVILISED",
-    "CIVILISES",
-    "CIVILISING",
-    "CIVILIZE",
-    "CIVILIZED",
-    "CIVILIZES",
-    "CIVILIZING",
-    "CL",
-    "CLAIM",
-    "CLAIMED",
-    "CLAIMING",
-    "CLAIMS",
-    "CLARK",
-    "CLASS",
-    "CLASSED",
-    "CLASSES",
-    "CLASSIC",
-    "CLASSICAL",
-    "CLASSICS",
-    "CLASSIFICATION",
-    "CLASSIFICATIONS",
-    "CLASSIFIED",
-    "CLASSIFIEDS",
-    "CLASSIFIES",
-    "CLASSIFY",
-    "CLASSIFYING",
-    "CLASSING",
-    "CLASSROOM",
-    "CLAUSE",
-    "CLAY",
-    "CLAYS",
-    "CLEAN",
-    "CLEANED",
-    "CLEANER",
-    "CLEANERS",
-    "CLEANEST",
-    "CLEANING",
-    "CLEANLY",
-    "CLEANNESS",
-    "CLEANS",
-    "CLEAR",
-    "CLEARANCE",
-    "CLEARED",
-    "CLEARER",
-    "CLEAREST",
-    "CLEARING",
-    "CLEARINGS",
-    "CLEARNESS",
-    "CLEARS",
-    "CLERK",
-    "CLERKS",
-    "CLEVELAND",
-    "CLEVER",
-    "CLEVERER",
-    "CLEVEREST",
-    "CLEVERLY",
-    "CLEVERNESS",
-    "CLICK",
-    "CLICKING",
-    "CLIENT",
-    "CLIENTS",
-    "CLIFF",
-    "CLIFFS",
-    "CLIMATE",
-    "CLIMB",
-    "CLIMBED",
-    "CLIMBER",
-    "CLIMBERS",
-    "CLIMBING",
-    "CLIMBS",
-    "CLINIC",
-    "CLINICAL",
-    "CLINTON",
-    "CLIP",
-    "CLIPS",
-    "CLOCK",
-    "CLOCKS",
-    "CLOSE",
-    "CLOSED",
-    "CLOSELY",
-    "CLOSENESS",
-    "CLOSER",
-    "CLOSES",
-    "CLOSEST",
-    "CLOSING",
-    "CLOSURE",
-    "CLOTH",
-    "CLOTHES",
-    "CLOTHING",
-    "CLOTHS",
-    "CLOUD",
-    "CLOUDED",
-    "CLOUDS",
-    "CLOUDY",
-    "CLUB",
-    "CLUBBED",
-    "CLUBBING",
-    "CLUBS",
-    "CLUSTER",
-    "CM",
-    "CNET",
-    "COACH",
-    "COAL",
-    "COALITION",
-    "COARSE",
-    "COARSELY",
-    "COARSENESS",
-    "COARSER",
-    "COARSEST",
-    "COAST",
-    "COASTAL",
-    "COASTS",
-    "COAT",
-    "COATS",
-    "COCK",
-    "COCKS",
-    "CODE",
-    "CODES",
-    "COFFEE",
-    "COFFEES",
-    "COIN",
-    "COINS",
-    "COLD",
-    "COLDER",
-    "COLDEST",
-    "COLDLY",
-    "COLDNESS",
-    "COLDS",
-    "COLLABORATION",
-    "COLLAR",
-    "COLLARS",
-    "COLLECT",
-    "COLLECTABLES",
-    "COLLECTED",
-    "COLLECTIBLES",
-    "COLLECTING",
-    "COLLECTION",
-    "COLLECTIONS",
-    "COLLECTIVE",
-    "COLLECTIVELY",
-    "COLLECTOR",
-    "COLLECTORS",
-    "COLLECTS",
-    "COLLEGE",
-    "COLLEGES",
-    "COLLINS",
-    "COLONIAL",
-    "COLONIALS",
-    "COLONIES",
-    "COLONISING",
-    "COLONIST",
-    "COLONISTS",
-    "COLONIZATION",
-    "COLONIZE",
-    "COLONIZED",
-    "COLONY",
-    "COLOR",
-    "COLORADO",
-    "COLORED",
-    "COLORFUL",
-    "COLORING",
-    "COLORLESS",
-    "COLORS",
-    "COLOUR",
-    "COLOURED",
-    "COLOURFUL",
-    "COLOURING",
-    "COLOURLESS",
-    "COLOURS",
-    "COLUMBIA",
-    "COLUMBUS",
-    "COLUMN",
-    "COLUMNS",
-    "COMB",
-    "COMBAT",
-    "COMBED",
-    "COMBINATION",
-    "COMBINATIONS",
-    "COMBINE",
-    "COMBINED",
-    "COMBINES",
-    "COMBING",
-    "COMBINING",
-    "COMBS",
-    "COMEDY",
-    "COMFORT",
-    "COMFORTABLE",
-    "COMFORTABLY",
-    "COMFORTED",
-    "COMFORTING",
-    "COMFORTS",
-    "COMIC",
-    "COMICS",
-    "COMING",
-    "COMMAND",
-    "COMMANDED",
-    "COMMANDER",
-    "COMMANDERS",
-    "COMMANDING",
-    "COMMANDS",
-    "COMMENT",
-    "COMMENTARY",
-    "COMMENTS",
-    "COMMERCE",
-    "COMMERCIAL",
-    "COMMERCIALLY",
-    "COMMISSION",
-    "COMMISSIONER",
-    "COMMIT",
-    "COMMITMENT",
-    "COMMITTED",
-    "COMMITTEE",
-    "COMMITTEES",
-    "COMMON",
-    "COMMONER",
-    "COMMONEST",
-    "COMMONLY",
-    "COMMONNESS",
-    "COMMONS",
-    "COMMUNICATE",
-    "COMMUNICATION",
-    "COMMUNICATIONS",
-    "COMMUNITIES",
-    "COMMUNITY",
-    "COMPACT",
-    "COMPANIES",
-    "COMPANION",
-    "COMPANIONS",
-    "COMPANIONSHIP",
-    "COMPANY",
-    "COMPAQ",
-    "COMPARABLE",
-    "COMPARATIVE",
-    "COMPARATIVELY",
-    "COMPARE",
-    "COMPARED",
-    "COMPARES",
-    "COMPARING",
-    "COMPARISON",
-    "COMPARISONS",
-    "COMPATIBLE",
-    "COMPENSATION",
-    "COMPETE",
-    "COMPETED",
-    "COMPETES",
-    "COMPETING",
-    "COMPETITION",
-    "COMPETITIONS",
-    "COMPETITIVE",
-    "COMPILATION",
-    "COMPILED",
-    "COMPLAIN",
-    "COMPLAINED",
-    "COMPLAINING",
-    "COMPLAINS",
-    "COMPLAINT",
-    "COMPLAINTS",
-    "COMPLETE",
-    "COMPLETED",
-    "COMPLETELY",
-    "COMPLETENESS",
-    "COMPLETES",
-    "COMPLETING",
-    "COMPLETION",
-    "COMPLETIONS",
-    "COMPLEX",
-    "COMPLIANCE",
-    "COMPLICATE",
-    "COMPLICATED",
-    "COMPLICATES",
-    "COMPLICATING",
-    "COMPLICATION",
-    "COMPLICATIONS",
-    "COMPLY",
-    "COMPONENT",
-    "COMPONENTS",
-    "COMPOSE",
-    "COMPOSED",
-    "COMPOSER",
-    "COMPOSES",
-    "COMPOSING",
-    "COMPOSITE",
-    "COMPOSITION",
-    "COMPREHENSIVE",
-    "COMPUTER",
-    "COMPUTERS",
-    "COMPUTING",
-    "CON",
-    "CONCENTRATION",
-    "CONCEPT",
-    "CONCEPTS",
-    "CONCERN",
-    "CONCERNED",
-    "CONCERNS",
-    "CONCERT",
-    "CONCLUSION",
-    "CONCRETE",
-    "CONDITION",
-    "CONDITIONAL",
-    "CONDITIONING",
-    "CONDITIONS",
-    "CONDUCT",
-    "CONDUCTED",
-    "CONFERENCE",
-    "CONFERENCES",
-    "CONFESS",
-    "CONFESSED",
-    "CONFESSES",
-    "CONFESSING",
-    "CONFESSION",
-    "CONFESSIONS",
-    "CONFIDENCE",
-    "CONFIDENCES",
-    "CONFIDENT",
-    "CONFIDENTLY",
-    "CONFIG",
-    "CONFIGURATION",
-    "CONFIGURE",
-    "CONFIRM",
-    "CONFIRMATION",
-    "CONFIRMED",
-    "CONFLICT",
-    "CONFUSE",
-    "CONFUSED",
-    "CONFUSES",
-    "CONFUSING",
-    "CONFUSION",
-    "CONGRATULATE",
-    "CONGRATULATED",
-    "CONGRATULATES",
-    "CONGRATULATING",
-    "CONGRATULATIONS",
-    "CONGRESS",
-    "CONNECT",
-    "CONNECTED",
-    "CONNECTICUT",
-    "CONNECTING",
-    "CONNECTION",
-    "CONNECTIONS",
-    "CONNECTS",
-    "CONQUER",
-    "CONQUERED",
-    "CONQUERING",
-    "CONQUEROR",
-    "CONQUERORS",
-    "CONQUERS",
-    "CONQUEST",
-    "CONQUESTS",
-    "CONSCIENCE",
-    "CONSCIENCES",
-    "CONSCIOUS",
-    "CONSCIOUSLY",
-    "CONSCIOUSNESS",
-    "CONSENT",
-    "CONSEQUENCES",
-    "CONSERVATION",
-    "CONSERVATIVE",
-    "CONSIDERATION",
-    "CONSIDERATIONS",
-    "CONSIDERED",
-    "CONSIDERS",
-    "CONSISTENT",
-    "CONSISTS",
-    "CONSOLE",
-    "CONSOLIDATION",
-    "CONST",
-    "CONSTANT",
-    "CONSTITUTES",
-    "CONSTITUTION",
-    "CONSTRUCTED",
-    "CONSTRUCTION",
-    "CONSULT",
-    "CONSULTANT",
-    "CONSULTANTS",
-    "CONSULTATION",
-    "CONSULTING",
-    "CONSUMER",
-    "CONSUMERS",
-    "CONSUMPTION",
-    "CONTACT",
-    "CONTACTS",
-    "CONTAINED",
-    "CONTAINER",
-    "CONTAINERS",
-    "CONTEMPORARY",
-    "CONTENT",
-    "CONTENTED",
-    "CONTENTING",
-    "CONTENTMENT",
-    "CONTENTS",
-    "CONTEST",
-    "CONTEXT",
-    "CONTINENTAL",
-    "CONTINUANCE",
-    "CONTINUE",
-    "CONTINUED",
-    "CONTINUES",
-    "CONTINUING",
-    "CONTINUITY",
-    "CONTINUOUS",
-    "CONTINUOUSLY",
-    "CONTRACT",
-    "CONTRACTOR",
-    "CONTRACTORS",
-    "CONTRACTS",
-    "CONTRAST",
-    "CONTRIBUTE",
-    "CONTRIBUTED",
-    "CONTRIBUTION",
-    "CONTRIBUTIONS",
-    "CONTROL",
-    "CONTROLLED",
-    "CONTROLLER",
-    "CONTROLLING",
-    "CONTROLS",
-    "CONVENIENCE",
-    "CONVENIENCES",
-    "CONVENIENT",
-    "CONVENIENTLY",
-    "CONVENTION",
-    "CONVENTIONAL",
-    "CONVERSATION",
-    "CONVERSATIONS",
-    "CONVERSION",
-    "CONVERT",
-    "CONVERTED",
-    "CONVERTER",
-    "COOK",
-    "COOKED",
-    "COOKER",
-    "COOKERS",
-    "COOKIES",
-    "COOKING",
-    "COOKS",
-    "COOL",
-    "COOLED",
-    "COOLER",
-    "COOLEST",
-    "COOLING",
-    "COOLLY",
-    "COOLNESS",
-    "COOLS",
-    "COOPER",
-    "COOPERATION",
-    "COORDINATOR",
-    "COPIED",
-    "COPIES",
-    "COPPER",
-    "COPY",
-    "COPYING",
-    "COPYRIGHT",
-    "CORE",
-    "CORK",
-    "CORKED",
-    "CORKING",
-    "CORKS",
-    "CORN",
-    "CORNER",
-    "CORNERED",
-    "CORNERING",
-    "CORNERS",
-    "CORP",
-    "CORPORATE",
-    "CORPORATION",
-    "CORPS",
-    "CORRECT",
-    "CORRECTED",
-    "CORRECTING",
-    "CORRECTION",
-    "CORRECTIONS",
-    "CORRECTLY",
-    "CORRECTNESS",
-    "CORRECTS",
-    "COST",
-    "COSTA",
-    "COSTING",
-    "COSTLY",
-    "COSTS",
-    "COTTAGE",
-    "COTTAGES",
-    "COTTON",
-    "COUGH",
-    "COUGHED",
-    "COUGHING",
-    "COUGHS",
-    "COUNCIL",
-    "COUNCILLOR",
-    "COUNCILLORS",
-    "COUNCILOR",
-    "COUNCILS",
-    "COUNSEL",
-    "COUNSELING",
-    "COUNT",
-    "COUNTABLE",
-    "COUNTED",
-    "COUNTER",
-    "COUNTIES",
-    "COUNTING",
-    "COUNTLESS",
-    "COUNTRIES",
-    "COUNTRY",
-    "COUNTS",
-    "COUNTY",
-    "COUPLE",
-    "COUPLES",
-    "COUPONS",
-    "COURAGE",
-    "COURAGEOUS",
-    "COURSES",
-    "COURT",
-    "COURTS",
-    "COUSIN",
-    "COUSINS",
-    "COVER",
-    "COVERAGE",
-    "COVERED",
-    "COVERING",
-    "COVERS",
-    "COW",
-    "COWARD",
-    "COWARDICE",
-    "COWARDLY",
-    "COWARDS",
-    "COWS",
-    "CP",
-    "CPU",
-    "CR",
-    "CRACK",
-    "CRACKED",
-    "CRACKING",
-    "CRACKS",
-    "CRAFT",
-    "CRAFTS",
-    "CRAIG",
-    "CRASH",
-    "CRASHED",
-    "CRASHES",
-    "CRASHING",
-    "CRAZY",
-    "CREAM",
-    "CREAMED",
-    "CREAMING",
-    "CREAMS",
-    "CREATE",
-    "CREATED",
-    "CREATES",
-    "CREATING",
-    "CREATION",
-    "CREATIVE",
-    "CREATURE",
-    "CREATURES",
-    "CREDIT",
-    "CREDITS",
-    "CREEK",
-    "CREEP",
-    "CREEPING",
-    "CREEPS",
-    "CREPT",
-    "CREW",
-    "CRIED",
-    "CRIES",
-    "CRIME",
-    "CRIMES",
-    "CRIMINAL",
-    "CRIMINALLY",
-    "CRISIS",
-    "CRITERIA",
-    "CRITIC",
-    "CRITICAL",
-    "CRITICALLY",
-    "CRITICS",
-    "CRM",
-    "CROP",
-    "CROPPED",
-    "CROPPING",
-    "CROPS",
-    "CROSS",
-    "CROSSED",
-    "CROSSES",
-    "CROSSING",
-    "CROWD",
-    "CROWDED",
-    "CROWDING",
-    "CROWDS",
-    "CROWN",
-    "CROWNED",
-    "CROWNING",
-    "CROWNS",
-    "CRUEL",
-    "CRUELLER",
-    "CRUELLEST",
-    "CRUELLY",
-    "CRUELNESS",
-    "CRUELTIES",
-    "CRUELTY",
-    "CRUISE",
-    "CRUISES",
-    "CRUSH",
-    "CRUSHED",
-    "CRUSHES",
-    "CRUSHING",
-    "CRY",
-    "CRYING",
-    "CRYSTAL",
-    "CS",
-    "CSS",
-    "CST",
-    "CT",
-    "CUBA",
-    "CULTIVATE",
-    "CULTIVATED",
-    "CULTIVATES",
-    "CULTIVATING",
-    "CULTIVATION",
-    "CULTURAL",
-    "CULTURE",
-    "CUM",
-    "CUMSHOT",
-    "CUMSHOTS",
-    "CUP",
-    "CUPBOARD",
-    "CUPBOARDS",
-    "CUPS",
-    "CURABLE",
-    "CURE",
-    "CURED",
-    "CURES",
-    "CURING",
-    "CURIOSITY",
-    "CURIOUS",
-    "CURIOUSLY",
-    "CURL",
-    "CURLED",
-    "CURLING",
-    "CURLS",
-    "CURLY",
-    "CURRENCY",
-    "CURRENT",
-    "CURRICULUM",
-    "CURSE",
-    "CURSED",
-    "CURSES",
-    "CURSING",
-    "CURTAIN",
-    "CURTAINS",
-    "CURVE",
-    "CURVED",
-    "CURVES",
-    "CURVING",
-    "CUSHION",
-    "CUSHIONED",
-    "CUSHIONING",
-    "CUSHIONS",
-    "CUSTOM",
-    "CUSTOMARY",
-    "CUSTOMER",
-    "CUSTOMERS",
-    "CUSTOMIZE",
-    "CUSTOMIZED",
-    "CUSTOMS",
-    "CUT",
-    "CUTE",
-    "CUTS",
-    "CUTTING",
-    "CVS",
-    "CYCLE",
-    "CYCLING",
-    "CYPRUS",
-    "CZECH",
-    "DA",
-    "DAD",
-    "DADS",
-    "DAILY",
-    "DAKOTA",
-    "DALLAS",
-    "DAMAGE",
-    "DAMAGED",
-    "DAMAGES",
-    "DAMAGING",
-    "DAMP",
-    "DAMPER",
-    "DAMPEST",
-    "DAMPNESS",
-    "DAN",
-    "DANCE",
-    "DANCED",
-    "DANCER",
-    "DANCERS",
-    "DANCES",
-    "DANCING",
-    "DANGER",
-    "DANGEROUS",
-    "DANGEROUSLY",
-    "DANGERS",
-    "DANIEL",
-    "DARE",
-    "DARED",
-    "DARES",
-    "DARING",
-    "DARK",
-    "DARKER",
-    "DARKEST",
-    "DARKNESS",
-    "DATA",
-    "DATABASE",
-    "DATABASES",
-    "DATED",
-    "DATES",
-    "DATING",
-    "DAUGHTER",
-    "DAUGHTERS",
-    "DAVE",
-    "DAVID",
-    "DAVIS",
-    "DAWN",
-    "DAY",
-    "DAYLIGHT",
-    "DAYS",
-    "DB",
-    "DC",
-    "DD",
-    "DE",
-    "DEAD",
-    "DEADLINE",
-    "DEAF",
-    "DEAFER",
-    "DEAFEST",
-    "DEAFNESS",
-    "DEAL",
-    "DEALER",
-    "DEALERS",
-    "DEALING",
-    "DEALINGS",
-    "DEALS",
-    "DEALT",
-    "DEALTIME",
-    "DEAN",
-    "DEAR",
-    "DEARS",
-    "DEATH",
-    "DEATHS",
-    "DEBATE",
-    "DEBIAN",
-    "DEBT",
-    "DEBTS",
-    "DEC",
-    "DECAY",
-    "DECAYED",
-    "DECAYING",
-    "DECAYS",
-    "DECEIVE",
-    "DECEIVED",
-    "DECEIVES",
-    "DECEIVING",
-    "DECEMBER",
-    "DECEPTION",
-    "DECIDE",
-    "DECIDED",
-    "DECIDEDLY",
-    "DECIDES",
-    "DECIDING",
-    "DECISION",
-    "DECISIONS",
-    "DECISIVE",
-    "DECK",
-    "DECLARATION",
-    "DECLARATIONS",
-    "DECLARE",
-    "DECLARED",
-    "DECLARES",
-    "DECLARING",
-    "DECOR",
-    "DECREASE",
-    "DECREASED",
-    "DECREASES",
-    "DECREASING",
-    "DEDICATED",
-    "DEED",
-    "DEEDS",
-    "DEEP",
-    "DEEPEN",
-    "DEEPENED",
-    "DEEPENING",
-    "DEEPER",
-    "DEEPEST",
-    "DEEPLY",
-    "DEER",
-    "DEF",
-    "DEFAULT",
-    "DEFEAT",
-    "DEFEATED",
-    "DEFEATING",
-    "DEFEATS",
-    "DEFENCE",
-    "DEFEND",
-    "DEFENDANT",
-    "DEFENDED",
-    "DEFENDER",
-    "DEFENDERS",
-    "DEFENDING",
-    "DEFENDS",
-    "DEFENSE",
-    "DEFINE",
-    "DEFINED",
-    "DEFINITION",
-    "DEFINITIONS",
-    "DEGREE",
-    "DEGREES",
-    "DEL",
-    "DELAWARE",
-    "DELAY",
-    "DELAYED",
-    "DELAYING",
-    "DELAYS",
-    "DELETE",
-    "DELETED",
-    "DELICACIES",
-    "DELICACY",
-    "DELICATE",
-    "DELICATELY",
-    "DELIGHT",
-    "DELIGHTED",
-    "DELIGHTFUL",
-    "DELIGHTFULLY",
-    "DELIGHTING",
-    "DELIGHTS",
-    "DELIVER",
-    "DELIVERED",
-    "DELIVERIES",
-    "DELIVERING",
-    "DELIVERS",
-    "DELIVERY",
-    "DELL",
-    "DELTA",
-    "DELUXE",
-    "DEMAND",
-    "DEMANDED",
-    "DEMANDING",
-    "DEMANDS",
-    "DEMO",
-    "DEMOCRACY",
-    "DEMOCRATIC",
-    "DEMONSTRATE",
-    "DEMONSTRATED",
-    "DEN",
-    "DENMARK",
-    "DENNIS",
-    "DENSITY",
-    "DENTAL",
-    "DENVER",
-    "DEPARTMENT",
-    "DEPARTMENTAL",
-    "DEPARTMENTS",
-    "DEPARTURE",
-    "DEPEND",
-    "DEPENDANT",
-    "DEPENDANTS",
-    "DEPENDED",
-    "DEPENDENT",
-    "DEPENDING",
-    "DEPENDS",
-    "DEPOSIT",
-    "DEPRESSION",
-    "DEPTH",
-    "DEPTHS",
-    "DEPUTY",
-    "DER",
-    "DERIVED",
-    "DES",
-    "DESCEND",
-    "DESCENDED",
-    "DESCENDING",
-    "DESCENDS",
-    "DESCRIBE",
-    "DESCRIBES",
-    "DESCRIBING",
-    "DESCRIPTION",
-    "DESCRIPTIONS",
-    "DESCRIPTIVE",
-    "DESERT",
-    "DESERTED",
-    "DESERTING",
-    "DESERTS",
-    "DESERVE",
-    "DESERVED",
-    "DESERVEDLY",
-    "DESERVES",
-    "DESERVING",
-    "DESIGN",
-    "DESIGNATED",
-    "DESIGNED",
-    "DESIGNER",
-    "DESIGNERS",
-    "DESIGNS",
-    "DESIRABILITY",
-    "DESIRABLE",
-    "DESIRE",
-    "DESIRED",
-    "DESIRES",
-    "DESIRING",
-    "DESK",
-    "DESKS",
-    "DESKTOP",
-    "DESKTOPS",
-    "DESPAIR",
-    "DESPAIRED",
-    "DESPAIRING",
-    "DESPAIRINGLY",
-    "DESPAIRS",
-    "DESTINATION",
-    "DESTINATIONS",
-    "DESTROY",
-    "DESTROYED",
-    "DESTROYING",
-    "DESTROYS",
-    "DESTRUCTION",
-    "DESTRUCTIVE",
-    "DETAIL",
-    "DETAILED",
-    "DETAILING",
-    "DETAILS",
-    "DETECTION",
-    "DETERMINATE",
-    "DETERMINATION",
-    "DETERMINE",
-    "DETERMINED",
-    "DETERMINES",
-    "DETERMINING",
-    "DETROIT",
-    "DEUTSCH",
-    "DEV",
-    "DEVEL",
-    "DEVELOP",
-    "DEVELOPED",
-    "DEVELOPER",
-    "DEVELOPERS",
-    "DEVELOPING",
-    "DEVELOPMENT",
-    "DEVELOPMENTS",
-    "DEVELOPS",
-    "DEVICE",
-    "DEVICES",
-    "DEVIL",
-    "DEVILS",
-    "DI",
-    "DIABETES",
-    "DIAGNOSIS",
-    "DIAL",
-    "DIALOGUE",
-    "DIAMETER",
-    "DIAMOND",
-    "DIAMONDS",
-    "DIARY",
-    "DICK",
-    "DICKE",
-    "DICTIONARIES",
-    "DICTIONARY",
-    "DIE",
-    "DIED",
-    "DIEGO",
-    "DIES",
-    "DIESEL",
-    "DIET",
-    "DIFF",
-    "DIFFER",
-    "DIFFERENCE",
-    "DIFFERENCES",
-    "DIFFERENTLY",
-    "DIFFERING",
-    "DIFFERS",
-    "DIFFICULT",
-    "DIFFICULTIES",
-    "DIFFICULTY",
-    "DIG",
-    "DIGEST",
-    "DIGGING",
-    "DIGITAL",
-    "DIGS",
-    "DILDO",
-    "DIMENSION",
-    "DIMENSIONS",
-    "DINE",
-    "DINED",
-    "DINES",
-    "DINING",
-    "DINNER",
-    "DINNERS",
-    "DIP",
-    "DIPPED",
-    "DIPPING",
-    "DIPS",
-    "DIRECT",
-    "DIRECTED",
-    "DIRECTING",
-    "DIRECTION",
-    "DIRECTIONS",
-    "DIRECTLY",
-    "DIRECTOR",
-    "DIRECTORIES",
-    "DIRECTORS",
-    "DIRECTORY",
-    "DIRECTS",
-    "DIRT",
-    "DIRTY",
-    "DISABILITIES",
-    "DISABILITY",
-    "DISABLED",
-    "DISADVANTAGE",
-    "DISADVANTAGED",
-    "DISADVANTAGES",
-    "DISAGREE",
-    "DISAGREEABLE",
-    "DISAGREED",
-    "DISAGREEING",
-    "DISAGREEMENT",
-    "DISAGREEMENTS",
-    "DISAGREES",
-    "DISAPPEAR",
-    "DISAPPEARANCE",
-    "DISAPPEARANCES",
-    "DISAPPEARED",
-    "DISAPPEARING",
-    "DISAPPEARS",
-    "DISAPPOINT",
-    "DISAPPOINTED",
-    "DISAPPOINTING",
-    "DISAPPOINTMENT",
-    "DISAPPOINTMENTS",
-    "DISAPPOINTS",
-    "DISAPPROVAL",
-    "DISAPPROVE",
-    "DISAPPROVED",
-    "DISAPPROVES",
-    "DISAPPROVING",
-    "DISASSOCIATE",
-    "DISASSOCIATED",
-    "DISASTER",
-    "DISBELIEF",
-    "DISC",
-    "DISCIPLINARY",
-    "DISCIPLINE",
-    "DISCIPLINED",
-    "DISCIPLINES",
-    "DISCIPLINING",
-    "DISCLAIMER",
-    "DISCLOSURE",
-    "DISCOMFORT",
-    "DISCONTENT",
-    "DISCONTENTMENT",
-    "DISCOUNT",
-    "DISCOUNTS",
-    "DISCOVER",
-    "DISCOVERED",
-    "DISCOVERIES",
-    "DISCOVERING",
-    "DISCOVERS",
-    "DISCOVERY",
-    "DISCRIMINATION",
-    "DISCUSS",
-    "DISCUSSED",
-    "DISCUSSES",
-    "DISCUSSING",
-    "DISCUSSION",
-    "DISCUSSIONS",
-    "DISEASE",
-    "DISEASED",
-    "DISEASES",
-    "DISGUST",
-    "DISGUSTED",
-    "DISGUSTING",
-    "DISGUSTS",
-    "DISH",
-    "DISHES",
-    "DISHONEST",
-    "DISHONOUR",
-    "DISHONOURABLE",
-    "DISJOINTED",
-    "DISK",
-    "DISLIKE",
-    "DISLIKED",
-    "DISLIKES",
-    "DISLIKING",
-    "DISMISS",
-    "DISMISSED",
-    "DISMISSES",
-    "DISMISSING",
-    "DISMISSIVE",
-    "DISMISSIVELY",
-    "DISNEY",
-    "DISOBEY",
-    "DISOBEYED",
-    "DISOBEYING",
-    "DISORDER",
-    "DISORDERS",
-    "DISPATCHED",
-    "DISPLAY",
-    "DISPLAYED",
-    "DISPLAYING",
-    "DISPLAYS",
-    "DISPLEASE",
-    "DISPLEASED",
-    "DISPLEASING",
-    "DISPLEASURE",
-    "DISPOSAL",
-    "DISREGARD",
-    "DISREGARDED",
-    "DISREGARDING",
-    "DISREGARDS",
-    "DISRESPECT",
-    "DISRESPECTFUL",
-    "DISSATISFACTION",
-    "DISSATISFIED",
-    "DISSATISFIES",
-    "DISSATISFY",
-    "DISSATISFYING",
-    "DISTANCE",
-    "DISTANCED",
-    "DISTANCES",
-    "DISTANCING",
-    "DISTANT",
-    "DISTINGUISH",
-    "DISTINGUISHABLE",
-    "DISTINGUISHED",
-    "DISTINGUISHES",
-    "DISTINGUISHING",
-    "DISTRIBUTED",
-    "DISTRIBUTION",
-    "DISTRICT",
-    "DISTRICTS",
-    "DISTURB",
-    "DISTURBANCE",
-    "DISTURBANCES",
-    "DISTURBED",
-    "DISTURBING",
-    "DISTURBS",
-    "DITCH",
-    "DITCHED",
-    "DITCHES",
-    "DITCHING",
-    "DIVE",
-    "DIVED",
-    "DIVER",
-    "DIVERS",
-    "DIVERSE",
-    "DIVERSITY",
-    "DIVES",
-    "DIVIDE",
-    "DIVIDED",
-    "DIVIDES",
-    "DIVIDING",
-    "DIVING",
-    "DIVISION",
-    "DIVISIONS",
-    "DIVORCE",
-    "DJ",
-    "DNA",
-    "DOC",
-    "DOCTOR",
-    "DOCTORS",
-    "DOCUMENT",
-    "DOCUMENTATION",
-    "DOCUMENTS",
-    "DODGE",
-    "DOG",
-    "DOGGED",
-    "DOGS",
-    "DOLL",
-    "DOLLAR",
-    "DOLLARS",
-    "DOLLS",
-    "DOMAIN",
-    "DOMAINS",
-    "DOMESTIC",
-    "DONALD",
-    "DONATE",
-    "DONATIONS",
-    "DONKEY",
-    "DONKEYS",
-    "DONT",
-    "DOOR",
-    "DOORS",
-    "DOSE",
-    "DOT",
-    "DOTS",
-    "DOUBLE",
-    "DOUBLED",
-    "DOUBLES",
-    "DOUBLING",
-    "DOUBT",
-    "DOUBTED",
-    "DOUBTFUL",
-    "DOUBTING",
-    "DOUBTLESS",
-    "DOUBTS",
-    "DOUGLAS",
-    "DOVE",
-    "DOWNLOAD",
-    "DOWNLOADS",
-    "DOWNSTAIRS",
-    "DOWNTOWN",
-    "DOZEN",
-    "DOZENS",
-    "DR",
-    "DRAFT",
-    "DRAG",
-    "DRAGGED",
-    "DRAGGING",
-    "DRAGON",
-    "DRAGS",
-    "DRAMA",
-    "DRANK",
-    "DRAW",
-    "DRAWER",
-    "DRAWERS",
-    "DRAWING",
-    "DRAWN",
-    "DRAWS",
-    "DREAM",
-    "DREAMED",
-    "DREAMING",
-    "DREAMS",
-    "DREAMT",
-    "DREAMY",
-    "DRESS",
-    "DRESSED",
-    "DRESSES",
-    "DRESSING",
-    "DREW",
-    "DRIED",
-    "DRIES",
-    "DRIEST",
-    "DRINK",
-    "DRINKER",
-    "DRINKERS",
-    "DRINKING",
-    "DRINKS",
-    "DRIVE",
-    "DRIVEN",
-    "DRIVER",
-    "DRIVERS",
-    "DRIVES",
-    "DRIVEWAY",
-    "DRIVING",
-    "DROP",
-    "DROPPED",
-    "DROPPING",
-    "DROPS",
-    "DROVE",
-    "DROWN",
-    "DROWNED",
-    "DROWNING",
-    "DROWNS",
-    "DRUG",
-    "DRUGS",
-    "DRUM",
-    "DRUMMED",
-    "DRUMMING",
-    "DRUMS",
-    "DRUNK",
-    "DRY",
-    "DRYER",
-    "DRYING",
-    "DRYLY",
-    "DRYNESS",
-    "DS",
-    "DSL",
-    "DU",
-    "DUAL",
-    "DUBLIN",
-    "DUCK",
-    "DUCKED",
-    "DUCKING",
-    "DUCKS",
-    "DUG",
-    "DUKE",
-    "DULL",
-    "DULLER",
-    "DULLEST",
-    "DULLNESS",
-    "DURATION",
-    "DUST",
-    "DUSTED",
-    "DUSTER",
-    "DUSTERS",
-    "DUSTING",
-    "DUSTS",
-    "DUTCH",
-    "DUTIES",
-    "DUTY",
-    "DVD",
-    "DVDS",
-    "DYING",
-    "DYNAMIC",
-    "DYNAMICS",
-    "EA",
-    "EAGER",
-    "EAGERLY",
-    "EAGERNESS",
-    "EAGLE",
-    "EAR",
-    "EARLIER",
-    "EARLIEST",
-    "EARLINESS",
-    "EARLY",
-    "EARN",
-    "EARNED",
-    "EARNEST",
-    "EARNESTLY",
-    "EARNING",
-    "EARNINGS",
-    "EARNS",
-    "EARRINGS",
-    "EARS",
-    "EARTH",
-    "EARTHQUAKE",
-    "EARTHQUAKES",
-    "EARTHY",
-    "EASE",
-    "EASED",
-    "EASES",
-    "EASIER",
-    "EASIEST",
-    "EASILY",
-    "EASINESS",
-    "EASING",
-    "EAST",
-    "EASTERN",
-    "EASY",
-    "EAT",
-    "EATEN",
-    "EATING",
-    "EATS",
-    "EBAY",
-    "EBONY",
-    "EC",
-    "ECHO",
-    "ECONOMIC",
-    "ECONOMICS",
-    "ECONOMY",
-    "EDGE",
-    "EDGED",
-    "EDGES",
-    "EDGING",
-    "EDINBURGH",
-    "EDIT",
-    "EDITED",
-    "EDITING",
-    "EDITION",
-    "EDITIONS",
-    "EDITOR",
-    "EDITORIAL",
-    "EDITORS",
-    "EDT",
-    "EDUCATE",
-    "EDUCATED",
-    "EDUCATES",
-    "EDUCATING",
-    "EDUCATION",
-    "EDUCATIONAL",
-    "EDUCATOR",
-    "EDUCATORS",
-    "EDWARD",
-    "EE",
-    "EFFECTED",
-    "EFFECTING",
-    "EFFECTIVE",
-    "EFFECTIVELY",
-    "EFFECTIVENESS",
-    "EFFECTS",
-    "EFFICIENCY",
-    "EFFICIENT",
-    "EFFORT",
-    "EFFORTS",
-    "EGG",
-    "EGGS",
-    "EGYPT",
-    "EIGHTEEN",
-    "EIGHTEENTH",
-    "EIGHTH",
-    "EIGHTIES",
-    "EIGHTIETH",
-    "EIGHTS",
-    "EL",
-    "ELASTIC",
-    "ELASTICITY",
-    "ELASTICS",
-    "ELDER",
-    "ELDERLY",
-    "ELECT",
-    "ELECTED",
-    "ELECTING",
-    "ELECTION",
-    "ELECTIONS",
-    "ELECTORAL",
-    "ELECTORS",
-    "ELECTRIC",
-    "ELECTRICAL",
-    "ELECTRICALLY",
-    "ELECTRICIAN",
-    "ELECTRICIANS",
-    "ELECTRICITY",
-    "ELECTRONIC",
-    "ELECTRONICS",
-    "ELECTS",
-    "ELEMENT",
-    "ELEMENTARY",
-    "ELEMENTS",
-    "ELEPHANT",
-    "ELEPHANTS",
-    "ELEVEN",
-    "ELEVENS",
-    "ELEVENTH",
-    "ELIGIBILITY",
-    "ELIGIBLE",
-    "ELITE",
-    "ELIZABETH",
-    "EM",
-    "EMAIL",
-    "EMAILS",
-    "EMBEDDED",
-    "EMERGENCY",
-    "EMERGING",
-    "EMINEM",
-    "EMISSIONS",
-    "EMOTIONAL",
-    "EMPHASIS",
-    "EMPIRE",
-    "EMPIRES",
-    "EMPLOY",
-    "EMPLOYED",
-    "EMPLOYEE",
-    "EMPLOYEES",
-    "EMPLOYER",
-    "EMPLOYERS",
-    "EMPLOYING",
-    "EMPLOYMENT",
-    "EMPLOYS",
-    "EMPTIED",
-    "EMPTIES",
-    "EMPTY",
-    "EMPTYING",
-    "EN",
-    "ENABLE",
-    "ENABLED",
-    "ENABLES",
-    "ENCLOSE",
-    "ENCLOSED",
-    "ENCLOSES",
-    "ENCLOSING",
-    "ENCLOSURE",
-    "ENCOURAGE",
-    "ENCOURAGED",
-    "ENCOURAGEMENT",
-    "ENCOURAGES",
-    "ENCOURAGING",
-    "ENCOURAGINGLY",
-    "ENCYCLOPEDIA",
-    "ENDED",
-    "ENDLESS",
-    "ENDLESSLY",
-    "ENDS",
-    "ENEMIES",
-    "ENEMY",
-    "ENERGY",
-    "ENFORCEMENT",
-    "ENGAGED",
-    "ENGAGEMENT",
-    "ENGINE",
-    "ENGINEER",
-    "ENGINEERING",
-    "ENGINEERS",
-    "ENGINES",
-    "ENGLAND",
-    "ENGLISH",
-    "ENHANCE",
-    "ENHANCED",
-    "ENJOY",
-    "ENJOYABLE",
-    "ENJOYED",
-    "ENJOYING",
-    "ENJOYMENT",
-    "ENJOYS",
-    "ENLARGE",
-    "ENQUIRE",
-    "ENQUIRING",
-    "ENQUIRY",
-    "ENROLLMENT",
-    "ENSURE",
-    "ENT",
-    "ENTER",
-    "ENTERED",
-    "ENTERING",
-    "ENTERPRISE",
-    "ENTERPRISES",
-    "ENTERS",
-    "ENTERTAIN",
-    "ENTERTAINED",
-    "ENTERTAINING",
-    "ENTERTAINMENT",
-    "ENTERTAINS",
-    "ENTIRE",
-    "ENTITLED",
-    "ENTITY",
-    "ENTRANCE",
-    "ENTRANCES",
-    "ENTRIES",
-    "ENTRUST",
-    "ENTRY",
-    "ENVELOPE",
-    "ENVELOPES",
-    "ENVIED",
-    "ENVIES",
-    "ENVIOUS",
-    "ENVIRONMENT",
-    "ENVIRONMENTAL",
-    "ENVIRONMENTS",
-    "ENVY",
-    "ENVYING",
-    "EPA",
-    "EPINIONS",
-    "EPISODE",
-    "EPSON",
-    "EQUAL",
-    "EQUALED",
-    "EQUALING",
-    "EQUALITY",
-    "EQUALLED",
-    "EQUALLING",
-    "EQUALLY",
-    "EQUALS",
-    "EQUATION",
-    "EQUIPMENT",
-    "EQUIPPED",
-    "EQUITY",
-    "EQUIVALENT",
-    "ER",
-    "ERA",
-    "ERIC",
-    "ERICSSON",
-    "EROTIC",
-    "ERROR",
-    "ERRORS",
-    "ES",
-    "ESCAPE",
-    "ESCAPED",
-    "ESCAPES",
-    "ESCAPING",
-    "ESPECIAL",
-    "ESSAY",
-    "ESSAYS",
-    "ESSENCE",
-    "ESSENCES",
-    "ESSENTIAL",
-    "ESSENTIALLY",
-    "ESSENTIALS",
-    "EST",
-    "ESTABLISH",
-    "ESTABLISHED",
-    "ESTABLISHMENT",
-    "ESTATE",
-    "ESTIMATE",
-    "ESTIMATED",
-    "ESTIMATES",
-    "ETHERNET",
-    "ETHICS",
-    "ETHNIC",
-    "EU",
-    "EUR",
-    "EURO",
-    "EUROPE",
-    "EUROPEAN",
-    "EVALUATE",
-    "EVALUATION",
-    "EVANS",
-    "EVE",
-    "EVENINGS",
-    "EVENLY",
-    "EVENT",
-    "EVENTS",
-    "EVENTUALLY",
-    "EVERYDAY",
-    "EVIDENCE",
-    "EVIL",
-    "EVILER",
-    "EVILEST",
-    "EVILLY",
-    "EVILNESS",
-    "EVILS",
-    "EVOLUTION",
-    "EXACT",
-    "EXAM",
-    "EXAMINATION",
-    "EXAMINATIONS",
-    "EXAMINE",
-    "EXAMINED",
-    "EXAMINER",
-    "EXAMINERS",
-    "EXAMINES",
-    "EXAMINING",
-    "EXAMPLES",
-    "EXCEED",
-    "EXCEL",
-    "EXCELLENCE",
-    "EXCELLENT",
-    "EXCEPTION",
-    "EXCEPTIONAL",
-    "EXCEPTIONS",
-    "EXCESS",
-    "EXCESSIVE",
-    "EXCESSIVELY",
-    "EXCHANGE",
-    "EXCHANGED",
-    "EXCHANGES",
-    "EXCHANGING",
-    "EXCITE",
-    "EXCITED",
-    "EXCITEDLY",
-    "EXCITEMENT",
-    "EXCITES",
-    "EXCITING",
-    "EXCLUSIVE",
-    "EXCUSE",
-    "EXCUSED",
-    "EXCUSES",
-    "EXCUSING",
-    "EXECUTION",
-    "EXECUTIVE",
-    "EXERCISE",
-    "EXERCISED",
-    "EXERCISES",
-    "EXERCISING",
-    "EXHIBIT",
-    "EXHIBITION",
-    "EXIST",
-    "EXISTED",
-    "EXISTENCE",
-    "EXISTING",
-    "EXISTS",
-    "EXIT",
-    "EXP",
-    "EXPAND",
-    "EXPANDED",
-    "EXPANSION",
-    "EXPECT",
-    "EXPECTANCY",
-    "EXPECTATION",
-    "EXPECTATIONS",
-    "EXPECTED",
-    "EXPECTING",
-    "EXPECTS",
-    "EXPENSE",
-    "EXPENSES",
-    "EXPENSIVE",
-    "EXPERIENCE",
-    "EXPERIENCED",
-    "EXPERIENCES",
-    "EXPERIENCING",
-    "EXPERIMENT",
-    "EXPERIMENTAL",
-    "EXPERIMENTATION",
-    "EXPERIMENTED",
-    "EXPERIMENTING",
-    "EXPERIMENTS",
-    "EXPERT",
-    "EXPERTISE",
-    "EXPERTS",
-    "EXPLAIN",
-    "EXPLAINED",
-    "EXPLAINING",
-    "EXPLAINS",
-    "EXPLANATION",
-    "EXPLANATIONS",
-    "EXPLANATORY",
-    "EXPLODE",
-    "EXPLODED",
-    "EXPLODES",
-    "EXPLODING",
-    "EXPLORATION",
-    "EXPLORATIONS",
-    "EXPLORATORY",
-    "EXPLORE",
-    "EXPLORED",
-    "EXPLORER",
-    "EXPLORERS",
-    "EXPLORES",
-    "EXPLORING",
-    "EXPLOSION",
-    "EXPLOSIONS",
-    "EXPLOSIVE",
-    "EXPORT",
-    "EXPOSED",
-    "EXPOSURE",
-    "EXPRESS",
-    "EXPRESSED",
-    "EXPRESSES",
-    "EXPRESSING",
-    "EXPRESSION",
-    "EXPRESSIONS",
-    "EXPRESSIVE",
-    "EXT",
-    "EXTEND",
-    "EXTENDED",
-    "EXTENDING",
-    "EXTENDS",
-    "EXTENSION",
-    "EXTENSIONS",
-    "EXTENSIVE",
-    "EXTENSIVELY",
-    "EXTENT",
-    "EXTERNAL",
-    "EXTRA",
-    "EXTRAORDINARILY",
-    "EXTRAORDINARY",
-    "EXTRAS",
-    "EXTREME",
-    "EXTREMELY",
-    "EYE",
-    "EYES",
-    "FABRIC",
-    "FACE",
-    "FACED",
-    "FACES",
-    "FACIAL",
-    "FACILITIES",
-    "FACILITY",
-    "FACING",
-    "FACT",
-    "FACTOR",
-    "FACTORIES",
-    "FACTORS",
-    "FACTORY",
-    "FACTS",
-    "FACTUAL",
-    "FACULTY",
-    "FADE",
-    "FADED",
-    "FADES",
-    "FADING",
-    "FAIL",
-    "FAILED",
-    "FAILING",
-    "FAILS",
-    "FAILURE",
-    "FAILURES",
-    "FAINT",
-    "FAINTED",
-    "FAINTER",
-    "FAINTING",
-    "FAINTLY",
-    "FAINTNESS",
-    "FAINTS",
-    "FAIR",
-    "FAIRER",
-    "FAIREST",
-    "FAIRLY",
-    "FAIRNESS",
-    "FAITH",
-    "FAITHFUL",
-    "FAITHFULLY",
-    "FAITHS",
-    "FALL",
-    "FALLEN",
-    "FALLING",
-    "FALLS",
-    "FALSE",
-    "FALSEHOOD",
-    "FALSELY",
-    "FAMILIAR",
-    "FAMILIARITY",
-    "FAMILIARLY",
-    "FAMILIES",
-    "FAMILY",
-    "FAMOUS",
-    "FAN",
-    "FANCIED",
-    "FANCIER",
-    "FANCIES",
-    "FANCIEST",
-    "FANCILY",
-    "FANCINESS",
-    "FANCY",
-    "FANCYING",
-    "FANNED",
-    "FANNING",
-    "FANS",
-    "FANTASTIC",
-    "FANTASY",
-    "FAQ",
-    "FAQS",
-    "FARM",
-    "FARMER",
-    "FARMERS",
-    "FARMING",
-    "FARMS",
-    "FARTHER",
-    "FARTHEST",
-    "FASHION",
-    "FASHIONABLE",
-    "FASHIONED",
-    "FASHIONING",
-    "FASHIONS",
-    "FAST",
-    "FASTEN",
-    "FASTENED",
-    "FASTENER",
-    "FASTENERS",
-    "FASTENING",
-    "FASTENS",
-    "FASTER",
-    "FASTEST",
-    "FASTNESS",
-    "FAT",
-    "FATE",
-    "FATES",
-    "FATHER",
-    "FATHER-IN-LAW",
-    "FATHERS",
-    "FATS",
-    "FATTEN",
-    "FATTY",
-    "FAULT",
-    "FAULTS",
-    "FAULTY",
-    "FAVOR",
-    "FAVORITE",
-    "FAVORITES",
-    "FAVOUR",
-    "FAVOURABLE",
-    "FAVOURABLY",
-    "FAVOURED",
-    "FAVOURING",
-    "FAVOURITE",
-    "FAVOURITES",
-    "FAVOURS",
-    "FAX",
-    "FE",
-    "FEAR",
-    "FEARED",
-    "FEARFUL",
-    "FEARING",
-    "FEARS",
-    "FEAST",
-    "FEASTED",
-    "FEASTING",
-    "FEASTS",
-    "FEATHER",
-    "FEATHERED",
-    "FEATHERING",
-    "FEATHERS",
-    "FEATURE",
-    "FEATURED",
-    "FEATURES",
-    "FEATURING",
-    "FEB",
-    "FEBRUARY",
-    "FED",
-    "FEDERAL",
-    "FEDERATION",
-    "FEE",
-    "FEED",
-    "FEEDBACK",
-    "FEEDS",
-    "FEEL",
-    "FEELING",
-    "FEELINGS",
-    "FEELS",
-    "FEES",
-    "FEET",
-    "FELL",
-    "FELLOW",
-    "FELLOWS",
-    "FELT",
-    "FEMALE",
-    "FEMALES",
-    "FENCE",
-    "FENCED",
-    "FENCES",
-    "FENCING",
-    "FESTIVAL",
-    "FETISH",
-    "FEVER",
-    "FEVERISH",
-    "FEVERS",
-    "FEWER",
-    "FEWEST",
-    "FI",
-    "FIBER",
-    "FICTION",
-    "FIELD",
-    "FIELDS",
-    "FIERCE",
-    "FIERCELY",
-    "FIERCENESS",
-    "FIERCER",
-    "FIERCEST",
-    "FIFTEEN",
-    "FIFTEENTH",
-    "FIFTHLY",
-    "FIFTIES",
-    "FIFTIETH",
-    "FIFTY",
-    "FIG",
-    "FIGHT",
-    "FIGHTER",
-    "FIGHTERS",
-    "FIGHTING",
-    "FIGHTS",
-    "FIGURE",
-    "FIGURES",
-    "FILE",
-    "FILED",
-    "FILES",
-    "FILING",
-    "FILL",
-    "FILLED",
-    "FILLING",
-    "FILLS",
-    "FILM",
-    "FILMED",
-    "FILMING",
-    "FILMS",
-    "FILTER",
-    "FILTERS",
-    "FINAL",
-    "FINALLY",
-    "FINANCE",
-    "FINANCIAL",
-    "FINANCING",
-    "FIND",
-    "FINDER",
-    "FINDING",
-    "FINDINGS",
-    "FINDS",
-    "FINE",
-    "FINELY",
-    "FINENESS",
-    "FINER",
-    "FINEST",
-    "FINGER",
-    "FINGERS",
-    "FINISH",
-    "FINISHED",
-    "FINISHES",
-    "FINISHING",
-    "FINLAND",
-    "FIRE",
-    "FIRED",
-    "FIREFOX",
-    "FIRES",
-    "FIREWALL",
-    "FIRING",
-    "FIRM",
-    "FIRMEST",
-    "FIRMLY",
-    "FIRMNESS",
-    "FIRMS",
-    "FIRSTLY",
-    "FISCAL",
-    "FISH",
-    "FISHED",
-    "FISHERMAN",
-    "FISHES",
-    "FISHING",
-    "FISTING",
-    "FIT",
-    "FITNESS",
-    "FITS",
-    "FITTED",
-    "FITTER",
-    "FITTEST",
-    "FITTING",
-    "FIVES",
-    "FIXABLE",
-    "FIXED",
-    "FIXES",
-    "FIXING",
-    "FL",
-    "FLAG",
-    "FLAGS",
-    "FLAME",
-    "FLAMES",
-    "FLAMING",
-    "FLASH",
-    "FLASHED",
-    "FLASHES",
-    "FLASHING",
-    "FLAT",
-    "FLATS",
-    "FLATTEN",
-    "FLATTENING",
-    "FLAVOR",
-    "FLAVORED",
-    "FLAVORING",
-    "FLAVORS",
-    "FLAVOUR",
-    "FLAVOURED",
-    "FLAVOURING",
-    "FLAVOURS",
-    "FLESH",
-    "FLEW",
-    "FLEXIBILITY",
-    "FLEXIBLE",
-    "FLIES",
-    "FLIGHT",
-    "FLIGHTS",
-    "FLOAT",
-    "FLOATED",
-    "FLOATING",
-    "FLOATS",
-    "FLOOD",
-    "FLOODED",
-    "FLOODING",
-    "FLOODS",
-    "FLOOR",
-    "FLOORS",
-    "FLORIDA",
-    "FLORIST",
-    "FLORISTS",
-    "FLOUR",
-    "FLOW",
-    "FLOWED",
-    "FLOWER",
-    "FLOWERS",
-    "FLOWING",
-    "FLOWN",
-    "FLOWS",
-    "FLUID",
-    "FLY",
-    "FLYING",
-    "FM",
-    "FOCUS",
-    "FOCUSED",
-    "FOLD",
-    "FOLDED",
-    "FOLDER",
-    "FOLDING",
-    "FOLDS",
-    "FOLK",
-    "FOLKS",
-    "FOLLOW",
-    "FOLLOWER",
-    "FOLLOWERS",
-    "FOND",
-    "FONDER",
-    "FONDEST",
-    "FONDLY",
-    "FONDNESS",
-    "FONT",
-    "FONTS",
-    "FOOD",
-    "FOODS",
-    "FOOL",
-    "FOOLED",
-    "FOOLING",
-    "FOOLISH",
-    "FOOLISHLY",
-    "FOOLISHNESS",
-    "FOOLS",
-    "FOOT",
-    "FOOTBALL",
-    "FOOTBALLS",
-    "FORBID",
-    "FORBIDDEN",
-    "FORBIDDING",
-    "FORBIDS",
-    "FORCE",
-    "FORCED",
-    "FORCEFUL",
-    "FORCEFULLY",
-    "FORCES",
-    "FORCING",
-    "FORD",
-    "FORECAST",
-    "FOREIGN",
-    "FOREIGNER",
-    "FOREIGNERS",
-    "FOREST",
-    "FORESTED",
-    "FORESTING",
-    "FORESTS",
-    "FOREVER",
-    "FORGAVE",
-    "FORGET",
-    "FORGETS",
-    "FORGETTING",
-    "FORGIVE",
-    "FORGIVEN",
-    "FORGIVES",
-    "FORGIVING",
-    "FORGOT",
-    "FORGOTTEN",
-    "FORK",
-    "FORKS",
-    "FORM",
-    "FORMAL",
-    "FORMALITY",
-    "FORMALLY",
-    "FORMAT",
-    "FORMATION",
-    "FORMATS",
-    "FORMED",
-    "FORMING",
-    "FORMS",
-    "FORMULA",
-    "FORT",
-    "FORTIES",
-    "FORTIETH",
-    "FORTUNATE",
-    "FORTUNATELY",
-    "FORTUNE",
-    "FORTUNES",
-    "FORTY",
-    "FORUM",
-    "FORUMS",
-    "FORWARD",
-    "FORWARDS",
-    "FOSTER",
-    "FOTO",
-    "FOUGHT",
-    "FOUNDATION",
-    "FOUNDED",
-    "FOURS",
-    "FOURTEEN",
-    "FOURTEENTH",
-    "FOURTH",
-    "FOURTHLY",
-    "FOX",
-    "FR",
-    "FRAME",
-    "FRAMED",
-    "FRAMES",
-    "FRAMEWORK",
-    "FRAMING",
-    "FRANCE",
-    "FRANCHISE",
-    "FRANCIS",
-    "FRANCISCO",
-    "FRANK",
-    "FRANKLIN",
-    "FRAUD",
-    "FRED",
-    "FREE",
-    "FREED",
-    "FREEDOM",
-    "FREEDOMS",
-    "FREEING",
-    "FREELY",
-    "FREER",
-    "FREEST",
-    "FREEZE",
-    "FREEZES",
-    "FREEZING",
-    "FRENCH",
-    "FREQUENCY",
-    "FREQUENT",
-    "FREQUENTED",
-    "FREQUENTING",
-    "FREQUENTLY",
-    "FREQUENTS",
-    "FRESH",
-    "FRESHER",
-    "FRESHEST",
-    "FRESHLY",
-    "FRESHNESS",
-    "FRI",
-    "FRIDAY",
-    "FRIDAYS",
-    "FRIED",
-    "FRIEND",
-    "FRIENDLY",
-    "FRIENDS",
-    "FRIENDSHIP",
-    "FRIENDSHIPS",
-    "FRIES",
-    "FRIGHT",
-    "FRIGHTEN",
-    "FRIGHTENED",
-    "FRIGHTENING",
-    "FRIGHTENS",
-    "FRIGHTFUL",
-    "FRIGHTS",
-    "FRONT",
-    "FROZEN",
-    "FRUIT",
-    "FRUITS",
-    "FRY",
-    "FRYING",
-    "FT",
-    "FTP",
-    "FUCK",
-    "FUCKING",
-    "FUEL",
-    "FULL",
-    "FULLER",
-    "FULLEST",
-    "FULLNESS",
-    "FULLY",
-    "FUN",
-    "FUNCTION",
-    "FUNCTIONAL",
-    "FUNCTIONALITY",
-    "FUNCTIONS",
-    "FUND",
-    "FUNDAMENTAL",
-    "FUNDED",
-    "FUNDING",
-    "FUNDS",
-    "FUNERAL",
-    "FUNERALS",
-    "FUNNIER",
-    "FUNNIEST",
-    "FUNNY",
-    "FUR",
-    "FURNISH",
-    "FURNISHED",
-    "FURNISHES",
-    "FURNISHING",
-    "FURNITURE",
-    "FURS",
-    "FURTHEST",
-    "FUTURE",
-    "FUTURES",
-    "GA",
-    "GADGETS",
-    "GAIETY",
-    "GAILY",
-    "GAIN",
-    "GAINED",
-    "GAINING",
-    "GAINS",
-    "GALLERIES",
-    "GALLERY",
-    "GALLON",
-    "GALLONS",
-    "GAMBLING",
-    "GAME",
-    "GAMES",
-    "GAMING",
-    "GAMMA",
-    "GANG",
-    "GAP",
-    "GAPS",
-    "GARAGE",
-    "GARAGES",
-    "GARDEN",
-    "GARDENER",
-    "GARDENERS",
-    "GARDENING",
-    "GARDENS",
-    "GARY",
-    "GAS",
-    "GASES",
-    "GATE",
-    "GATES",
-    "GATEWAY",
-    "GATHER",
-    "GATHERED",
-    "GATHERING",
-    "GATHERINGS",
-    "GATHERS",
-    "GAY",
-    "GAYER",
-    "GAYEST",
-    "GAYNESS",
-    "GB",
-    "GCC",
-    "GE",
-    "GEAR",
-    "GENDER",
-    "GENE",
-    "GENERAL",
-    "GENERALISABLE",
-    "GENERALISATION",
-    "GENERALISATIONS",
-    "GENERALISE",
-    "GENERALISED",
-    "GENERALITY",
-    "GENERALIZATIONS",
-    "GENERALLY",
-    "GENERALS",
-    "GENERATE",
-    "GENERATED",
-    "GENERATION",
-    "GENERATOR",
-    "GENERIC",
-    "GENEROSITY",
-    "GENEROUS",
-    "GENEROUSLY",
-    "GENES",
-    "GENETIC",
-    "GENETICS",
-    "GENRE",
-    "GENTLE",
-    "GENTLEMAN",
-    "GENTLEMEN",
-    "GENTLY",
-    "GENUINE",
-    "GEOGRAPHIC",
-    "GEOGRAPHY",
-    "GEORGE",
-    "GEORGIA",
-    "GERMAN",
-    "GERMANY",
-    "GHOST",
-    "GI",
-    "GIANT",
-    "GIFT",
-    "GIFTED",
-    "GIFTS",
-    "GIRL",
-    "GIRLS",
-    "GLAD",
-    "GLADDER",
-    "GLADDEST",
-    "GLADLY",
-    "GLADNESS",
-    "GLANCE",
-    "GLASGOW",
-    "GLASS",
-    "GLASSES",
-    "GLOBAL",
-    "GLOBE",
-    "GLORIES",
-    "GLORIOUS",
-    "GLORY",
-    "GLOSSARY",
-    "GM",
-    "GMT",
-    "GNOME",
-    "GNU",
-    "GOAL",
-    "GOALS",
-    "GOAT",
-    "GOATS",
-    "GOD",
-    "GODDESS",
-    "GODS",
-    "GOLD",
-    "GOLDEN",
-    "GOLF",
-    "GONNA",
-    "GOODBYE",
-    "GOODBYES",
-    "GOODNESS",
-    "GOODS",
-    "GOOGLE",
-    "GORDON",
-    "GOSPEL",
-    "GOURMET",
-    "GOVERN",
-    "GOVERNANCE",
-    "GOVERNED",
-    "GOVERNING",
-    "GOVERNMENT",
-    "GOVERNMENTAL",
-    "GOVERNMENTS",
-    "GOVERNOR",
-    "GOVERNS",
-    "GOVT",
-    "GPS",
-    "GR",
-    "GRACE",
-    "GRACED",
-    "GRACEFUL",
-    "GRACEFULLY",
-    "GRACES",
-    "GRACING",
-    "GRADE",
-    "GRADES",
-    "GRADUAL",
-    "GRADUALLY",
-    "GRADUATE",
-    "GRAHAM",
-    "GRAIN",
-    "GRAINS",
-    "GRAM",
-    "GRAMMAR",
-    "GRAMMARS",
-    "GRAMS",
-    "GRAND",
-    "GRANDCHILD",
-    "GRANDCHILDREN",
-    "GRANDDAUGHTER",
-    "GRANDDAUGHTERS",
-    "GRANDFATHER",
-    "GRANDMA",
-    "GRANDMOTHER",
-    "GRANDPA",
-    "GRANDPARENT",
-    "GRANDPARENTS",
-    "GRANDSON",
-    "GRANDSONS",
-    "GRANT",
-    "GRANTED",
-    "GRANTS",
-    "GRAPH",
-    "GRAPHIC",
-    "GRAPHICS",
-    "GRASS",
-    "GRASSES",
-    "GRASSY",
-    "GRATEFUL",
-    "GRATEFULLY",
-    "GRATIS",
-    "GRAVE",
-    "GRAVES",
-    "GRAY",
-    "GREASE",
-    "GREASED",
-    "GREASES",
-    "GREASING",
-    "GREASY",
-    "GREAT",
-    "GREATER",
-    "GREATEST",
-    "GREATLY",
-    "GREATNESS",
-    "GREECE",
-    "GREED",
-    "GREEDILY",
-    "GREEDY",
-    "GREEK",
-    "GREEN",
-    "GREENER",
-    "GREENEST",
-    "GREENISH",
-    "GREENNESS",
-    "GREET",
-    "GREETED",
-    "GREETING",
-    "GREETS",
-    "GREG",
-    "GREW",
-    "GREY",
-    "GRID",
-    "GRIND",
-    "GRINDING",
-    "GRINDS",
-    "GROSS",
-    "GROUND",
-    "GROUNDED",
-    "GROUNDING",
-    "GROUNDS",
-    "GROUP",
-    "GROUPED",
-    "GROUPING",
-    "GROUPINGS",
-    "GROUPS",
-    "GROVE",
-    "GROW",
-    "GROWING",
-    "GROWN",
-    "GROWS",
-    "GROWTH",
-    "GT",
-    "GUARANTEE",
-    "GUARANTEED",
-    "GUARD",
-    "GUARDED",
-    "GUARDIAN",
-    "GUARDING",
-    "GUARDS",
-    "GUESS",
-    "GUESSED",
-    "GUESSES",
-    "GUESSING",
-    "GUEST",
-    "GUESTBOOK",
-    "GUESTS",
-    "GUIDANCE",
-    "GUIDE",
-    "GUIDED",
-    "GUIDELINES",
-    "GUIDES",
-    "GUIDING",
-    "GUILT",
-    "GUILTILY",
-    "GUILTLESS",
-    "GUILTY",
-    "GUINEA",
-    "GUITAR",
-    "GULF",
-    "GUN",
-    "GUNNER",
-    "GUNS",
-    "GUY",
-    "GUYS",
-    "HA",
-    "HABIT",
-    "HABITAT",
-    "HABITS",
-    "HABITUAL",
-    "HABITUALLY",
-    "HAIR",
-    "HAIRS",
-    "HAIRY",
-    "HALF",
-    "HALL",
-    "HALLS",
-    "HALVES",
-    "HAMILTON",
-    "HAMMER",
-    "HAMMERED",
-    "HAMMERING",
-    "HAMMERS",
-    "HAMPSHIRE",
-    "HAND",
-    "HANDBOOK",
-    "HANDED",
-    "HANDFUL",
-    "HANDFULS",
-    "HANDHELD",
-    "HANDING",
-    "HANDKERCHIEF",
-    "HANDKERCHIEFS",
-    "HANDLE",
-    "HANDLED",
-    "HANDLES",
-    "HANDLING",
-    "HANDS",
-    "HANDWRITING",
-    "HANG",
-    "HANGED",
-    "HANGING",
-    "HANGS",
-    "HAPPEN",
-    "HAPPENED",
-    "HAPPENING",
-    "HAPPIER",
-    "HAPPIEST",
-    "HAPPILY",
-    "HAPPINESS",
-    "HAPPY",
-    "HARBOR",
-    "HARBORS",
-    "HARBOUR",
-    "HARBOURS",
-    "HARD",
-    "HARDCORE",
-    "HARDCOVER",
-    "HARDEN",
-    "HARDENED",
-    "HARDENING",
-    "HARDENS",
-    "HARDER",
-    "HARDEST",
-    "HARDNESS",
-    "HARDSHIP",
-    "HARDSHIPS",
-    "HARDWARE",
-    "HARM",
-    "HARMED",
-    "HARMFUL",
-    "HARMING",
-    "HARMLESS",
-    "HARMS",
-    "HARRIS",
-    "HARRY",
-    "HARVARD",
-    "HARVEST",
-    "HARVESTED",
-    "HARVESTER",
-    "HARVESTING",
-    "HARVESTS",
-    "HASTE",
-    "HASTEN",
-    "HASTENED",
-    "HASTENING",
-    "HASTENS",
-    "HASTILY",
-    "HAT",
-    "HATE",
-    "HATED",
-    "HATES",
-    "HATING",
-    "HATRED",
-    "HATS",
-    "HAVES",
-    "HAWAII",
-    "HAY",
-    "HD",
-    "HEAD",
-    "HEADED",
-    "HEADER",
-    "HEADING",
-    "HEADLINES",
-    "HEADS",
-    "HEAL",
-    "HEALED",
-    "HEALING",
-    "HEALS",
-    "HEALTH",
-    "HEALTHCARE",
-    "HEALTHIER",
-    "HEALTHIEST",
-    "HEALTHILY",
-    "HEALTHY",
-    "HEAP",
-    "HEAPED",
-    "HEAPING",
-    "HEAPS",
-    "HEAR",
-    "HEARD",
-    "HEARER",
-    "HEARING",
-    "HEARS",
-    "HEART",
-    "HEARTS",
-    "HEAT",
-    "HEATED",
-    "HEATING",
-    "HEATS",
-    "HEAVEN",
-    "HEAVENLY",
-    "HEAVENS",
-    "HEAVIER",
-    "HEAVIEST",
-    "HEAVILY",
-    "HEAVY",
-    "HEIGHT",
-    "HEIGHTS",
-    "HELD",
-    "HELL",
-    "HELPED",
-    "HELPER",
-    "HELPERS",
-    "HELPFUL",
-    "HELPING",
-    "HELPLESS",
-    "HELPLESSLY",
-    "HELPS",
-    "HENRY",
-    "HENTAI",
-    "HERALD",
-    "HERITAGE",
-    "HERO",
-    "HESITATE",
-    "HESITATED",
-    "HESITATES",
-    "HESITATING",
-    "HESITATION",
-    "HESITATIONS",
-    "HEY",
-    "HIDDEN",
-    "HIDE",
-    "HIDES",
-    "HIDING",
-    "HIGH",
-    "HIGHER",
-    "HIGHEST",
-    "HIGHLIGHTS",
-    "HIGHLY",
-    "HIGHNESS",
-    "HIGHWAY",
-    "HIGHWAYS",
-    "HILL",
-    "HILLS",
-    "HILLSIDE",
-    "HILLY",
-    "HILTON",
-    "HINDER",
-    "HINDERED",
-    "HINDERING",
-    "HINDERS",
-    "HIP",
-    "HIRE",
-    "HIRED",
-    "HIRES",
-    "HIRING",
-    "HIST",
-    "HISTORIAN",
-    "HISTORIC",
-    "HISTORICAL",
-    "HISTORIES",
-    "HISTORY",
-    "HIT",
-    "HITS",
-    "HITTER",
-    "HITTING",
-    "HIV",
-    "HO",
-    "HOBBIES",
-    "HOCKEY",
-    "HOLD",
-    "HOLDEM",
-    "HOLDER",
-    "HOLDERS",
-    "HOLDING",
-    "HOLDS",
-    "HOLE",
-    "HOLES",
-    "HOLIDAY",
-    "HOLIDAYS",
-    "HOLIER",
-    "HOLIEST",
-    "HOLINESS",
-    "HOLLAND",
-    "HOLLOW",
-    "HOLLOWED",
-    "HOLLOWING",
-    "HOLLOWS",
-    "HOLLYWOOD",
-    "HOLY",
-    "HOMELESS",
-    "HOMEPAGE",
-    "HOMES",
-    "HONDA",
-    "HONEST",
-    "HONESTLY",
-    "HONESTY",
-    "HONG",
-    "HONOR",
-    "HONORABLE",
-    "HONORABLY",
-    "HONORARY",
-    "HONORED",
-    "HONORING",
-    "HONORS",
-    "HONOUR",
-    "HONOURABLE",
-    "HONOURABLY",
-    "HOOK",
-    "HOOKED",
-    "HOOKING",
-    "HOOKS",
-    "HOP",
-    "HOPE",
-    "HOPED",
-    "HOPEFUL",
-    "HOPELESS",
-    "HOPELESSNESS",
-    "HOPES",
-    "HOPING",
-    "HORIZON",
-    "HORIZONS",
-    "HORNY",
-    "HORROR",
-    "HORSE",
-    "HORSES",
-    "HOSPITAL",
-    "HOSPITALS",
-    "HOST",
-    "HOSTED",
-    "HOSTING",
-    "HOSTS",
-    "HOT",
-    "HOTEL",
-    "HOTELS",
-    "HOTLY",
-    "HOTNESS",
-    "HOTTER",
-    "HOTTEST",
-    "HOUR",
-    "HOURLY",
-    "HOURS",
-    "HOUSE",
-    "HOUSED",
-    "HOUSEHOLD",
-    "HOUSES",
-    "HOUSING",
-    "HOUSTON",
-    "HOWARD",
-    "HP",
-    "HR",
-    "HRS",
-    "HS",
-    "HTML",
-    "HTTP",
-    "HUGE",
-    "HULLO",
-    "HUMAN",
-    "HUMANS",
-    "HUMBLE",
-    "HUMBLED",
-    "HUMBLES",
-    "HUMBLING",
-    "HUMBLY",
-    "HUMOR",
-    "HUNDREDS",
-    "HUNDREDTH",
-    "HUNG",
-    "HUNGARY",
-    "HUNGER",
-    "HUNGERING",
-    "HUNGERS",
-    "HUNGRILY",
-    "HUNGRY",
-    "HUNT",
-    "HUNTED",
-    "HUNTER",
-    "HUNTERS",
-    "HUNTING",
-    "HUNTS",
-    "HURRAH",
-    "HURRICANE",
-    "HURRIED",
-    "HURRIEDLY",
-    "HURRIES",
-    "HURRY",
-    "HURRYING",
-    "HURT",
-    "HURTFUL",
-    "HURTING",
-    "HURTS",
-    "HUSBAND",
-    "HUSBANDS",
-    "HUT",
-    "HUTS",
-    "HYBRID",
-    "IA",
-    "IAN",
-    "IBM",
-    "IC",
-    "ICE",
-    "ICED",
-    "ICON",
-    "ICONS",
-    "ICY",
-    "IDAHO",
-    "IDEA",
-    "IDEAL",
-    "IDEALLY",
-    "IDEALS",
-    "IDEAS",
-    "IDENTIFICATION",
-    "IDENTIFIED",
-    "IDENTIFY",
-    "IDENTIFYING",
-    "IDENTITY",
-    "IDLE",
-    "IDLED",
-    "IDLES",
-    "IDLING",
-    "IDLY",
-    "IEEE",
-    "IGNORE",
-    "II",
-    "III",
-    "IL",
-    "ILL",
-    "ILLEGAL",
-    "ILLINOIS",
-    "ILLNESS",
-    "ILLNESSES",
-    "ILLUSTRATED",
-    "IMAGE",
-    "IMAGES",
-    "IMAGINARY",
-    "IMAGINATION",
-    "IMAGINATIONS",
-    "IMAGINATIVE",
-    "IMAGINE",
-    "IMAGINED",
-    "IMAGINES",
-    "IMAGING",
-    "IMAGINING",
-    "IMG",
-    "IMITATE",
-    "IMITATED",
-    "IMITATES",
-    "IMITATING",
-    "IMITATION",
-    "IMITATIONS",
-    "IMMEDIACY",
-    "IMMENSE",
-    "IMMENSELY",
-    "IMMIGRATION",
-    "IMPACT",
-    "IMPACTS",
-    "IMPLEMENT",
-    "IMPLEMENTATION",
-    "IMPLEMENTED",
-    "IMPLEMENTING",
-    "IMPLICATIONS",
-    "IMPORT",
-    "IMPORTANTLY",
-    "IMPOSSIBILITY",
-    "IMPOSSIBLE",
-    "IMPOSSIBLY",
-    "IMPRISON",
-    "IMPROBABLE",
-    "IMPROPER",
-    "IMPROPERLY",
-    "IMPROVE",
-    "IMPROVED",
-    "IMPROVEMENT",
-    "IMPROVEMENTS",
-    "IMPROVES",
-    "IMPROVING",
-    "IMPURE",
-    "IMPURITY",
-    "INABILITY",
-    "INCEST",
-    "INCH",
-    "INCHES",
-    "INCIDENT",
-    "INCLUDE",
-    "INCLUDED",
-    "INCLUDES",
-    "INCLUDING",
-    "INCLUSION",
-    "INCLUSIVE",
-    "INCOME",
-    "INCOMPLETE",
-    "INCOMPLETELY",
-    "INCORPORATED",
-    "INCORRECT",
-    "INCORRECTLY",
-    "INCREASE",
-    "INCREASED",
-    "INCREASES",
-    "INCREASING",
-    "INCREASINGLY",
-    "INCURABLE",
-    "INDEPENDENCE",
-    "INDEPENDENT",
-    "INDEPENDENTLY",
-    "INDETERMINATE",
-    "INDEXED",
-    "INDIA",
-    "INDIAN",
-    "INDIANA",
-    "INDICATORS",
-    "INDIRECT",
-    "INDIRECTLY",
-    "INDIVIDUAL",
-    "INDIVIDUALS",
-    "INDONESIA",
-    "INDOOR",
-    "INDOORS",
-    "INDUCED",
-    "INDUSTRIAL",
-    "INDUSTRIALLY",
-    "INDUSTRIES",
-    "INDUSTRY",
-    "INEFFECTIVE",
-    "INEFFECTIVELY",
-    "INEFFICIENT",
-    "INEQUALITY",
-    "INFANT",
-    "INFECTION",
-    "INFLUENCE",
-    "INFLUENCED",
-    "INFLUENCES",
-    "INFLUENCING",
-    "INFLUENTIAL",
-    "INFO",
-    "INFORM",
-    "INFORMAL",
-    "INFORMALLY",
-    "INFORMED",
-    "INFORMING",
-    "INFORMS",
-    "INFRASTRUCTURE",
-    "INFREQUENT",
-    "INFREQUENTLY",
-    "ING",
-    "INGREDIENTS",
-    "INITIAL",
-    "INITIATIVE",
-    "INITIATIVES",
-    "INJURIES",
-    "INJURY",
-    "INK",
-    "INKJET",
-    "INKS",
-    "INKY",
-    "INN",
-    "INNOVATION",
-    "INNOVATIVE",
-    "INNS",
-    "INOFFENSIVE",
-    "INOFFENSIVELY",
-    "INPUT",
-    "INQUIRE",
-    "INQUIRED",
-    "INQUIRES",
-    "INQUIRIES",
-    "INQUIRING",
-    "INQUIRY",
-    "INSECT",
-    "INSECTS",
-    "INSERT",
-    "INSIDE",
-    "INSIDER",
-    "INSIDERS",
-    "INSIGHT",
-    "INSPECTION",
-    "INSPIRED",
-    "INSTALL",
-    "INSTALLATION",
-    "INSTALLED",
-    "INSTALLING",
-    "INSTANCE",
-    "INSTANT",
-    "INSTANTLY",
-    "INSTITUTE",
-    "INSTITUTION",
-    "INSTITUTIONAL",
-    "INSTITUTIONS",
-    "INSTRUCTION",
-    "INSTRUCTIONS",
-    "INSTRUCTOR",
-    "INSTRUMENT",
-    "INSTRUMENTAL",
-    "INSTRUMENTS",
-    "INSULT",
-    "INSULTED",
-    "INSULTING",
-    "INSULTS",
-    "INSURANCE",
-    "INSURE",
-    "INSURED",
-    "INSURES",
-    "INSURING",
-    "INT",
-    "INTEGER",
-    "INTEGRATED",
-    "INTEGRATION",
-    "INTEGRITY",
-    "INTEL",
-    "INTELLECTUAL",
-    "INTELLIGENCE",
-    "INTELLIGENT",
-    "INTEND",
-    "INTENDED",
-    "INTENDING",
-    "INTENDS",
-    "INTENT",
-    "INTENTION",
-    "INTENTIONAL",
-    "INTENTIONALLY",
-    "INTENTIONS",
-    "INTENTLY",
-    "INTER",
-    "INTERACTION",
-    "INTERACTIONS",
-    "INTERACTIVE",
-    "INTEREST",
-    "INTERESTED",
-    "INTERESTING",
-    "INTERESTS",
-    "INTERFACE",
-    "INTERFACES",
-    "INTERFERE",
-    "INTERFERED",
-    "INTERFERENCE",
-    "INTERFERES",
-    "INTERFERING",
-    "INTERIOR",
-    "INTERMEDIATE",
-    "INTERNAL",
-    "INTERNATIONAL",
-    "INTERNATIONALLY",
-    "INTERNET",
-    "INTERPRETATION",
-    "INTERRACIAL",
-    "INTERRUPT",
-    "INTERRUPTED",
-    "INTERRUPTING",
-    "INTERRUPTS",
-    "INTERVENTION",
-    "INTERVIEW",
-    "INTERVIEWS",
-    "INTRO",
-    "INTRODUCE",
-    "INTRODUCED",
-    "INTRODUCES",
-    "INTRODUCING",
-    "INTRODUCTION",
-    "INTRODUCTIONS",
-    "INTRODUCTORY",
-    "INVALUABLE",
-    "INVALUABLY",
-    "INVENT",
-    "INVENTED",
-    "INVENTING",
-    "INVENTIONS",
-    "INVENTOR",
-    "INVENTORS",
-    "INVENTORY",
-    "INVENTS",
-    "INVESTIGATION",
-    "INVESTING",
-    "INVESTMENT",
-    "INVESTMENTS",
-    "INVESTOR",
-    "INVESTORS",
-    "INVITATION",
-    "INVITATIONS",
-    "INVITE",
-    "INVITED",
-    "INVITES",
-    "INVITING",
-    "INVOLVE",
-    "INVOLVED",
-    "INVOLVEMENT",
-    "INVOLVES",
-    "INVOLVING",
-    "INWARDLY",
-    "ION",
-    "IOWA",
-    "IP",
-    "IPOD",
-    "IRAN",
-    "IRAQ",
-    "IRAQI",
-    "IRELAND",
-    "IRISH",
-    "IRON",
-    "IRREGULAR",
-    "IRREGULARLY",
-    "IRREPLACEABLE",
-    "IRRESPECTIVE",
-    "IRRESPECTIVELY",
-    "IRRESPONSIBLE",
-    "ISBN",
-    "ISLAMIC",
-    "ISLAND",
-    "ISLANDS",
-    "ISO",
-    "ISRAEL",
-    "ISSUE",
-    "ISSUED",
-    "ISSUES",
-    "ITALIAN",
-    "ITALY",
-    "ITEM",
-    "ITEMS",
-    "IV",
-    "JA",
-    "JACK",
-    "JACKET",
-    "JACKSON",
-    "JAM",
-    "JAMES",
-    "JAN",
-    "JANE",
-    "JANUARY",
-    "JAPAN",
-    "JAPANESE",
-    "JASON",
-    "JAVA",
-    "JAVASCRIPT",
-    "JAW",
-    "JAWS",
-    "JAY",
-    "JAZZ",
-    "JEALOUS",
-    "JEALOUSLY",
-    "JEALOUSY",
-    "JEAN",
-    "JEANS",
-    "JEFF",
-    "JEFFERSON",
-    "JENNIFER",
-    "JERRY",
-    "JERSEY",
-    "JESSICA",
-    "JESUS",
-    "JET",
-    "JEWEL",
-    "JEWELLER",
-    "JEWELLERS",
-    "JEWELLERY",
-    "JEWELRY",
-    "JEWELS",
-    "JEWISH",
-    "JIM",
-    "JIMMY",
-    "JOB",
-    "JOBS",
-    "JOE",
-    "JOHN",
-    "JOHNNY",
-    "JOHNSON",
-    "JOIN",
-    "JOINED",
-    "JOINING",
-    "JOINS",
-    "JOINT",
-    "JOINTED",
-    "JOINTLY",
-    "JOINTS",
-    "JOKE",
-    "JOKED",
-    "JOKES",
-    "JOKING",
-    "JON",
-    "JONATHAN",
-    "JONES",
-    "JORDAN",
-    "JOSE",
-    "JOSEPH",
-    "JOURNAL",
-    "JOURNALS",
-    "JOURNEY",
-    "JOURNEYED",
-    "JOURNEYING",
-    "JOURNEYS",
-    "JOY",
-    "JOYFUL",
-    "JOYFULLY",
-    "JOYS",
-    "JR",
-    "JUDGE",
-    "JUDGED",
-    "JUDGEMENT",
-    "JUDGEMENTAL",
-    "JUDGEMENTS",
-    "JUDGES",
-    "JUDGING",
-    "JUDGMENT",
-    "JUDGMENTS",
-    "JUDICIAL",
-    "JUICE",
-    "JUICES",
-    "JUICY",
-    "JUL",
-    "JULY",
-    "JUMP",
-    "JUMPED",
-    "JUMPING",
-    "JUMPS",
-    "JUN",
-    "JUNE",
-    "JUNIOR",
-    "JURISDICTION",
-    "JUSTICE",
-    "JUSTLY",
-    "KANSAS",
-    "KAREN",
-    "KATE",
-    "KB",
-    "KEEPERS",
-    "KEEPING",
-    "KEITH",
-    "KELLY",
-    "KEN",
-    "KENNEDY",
-    "KENT",
-    "KENTUCKY",
-    "KENYA",
-    "KERNEL",
-    "KERRY",
-    "KEVIN",
-    "KEY",
-    "KEYBOARD",
-    "KEYS",
-    "KEYWORD",
-    "KEYWORDS",
-    "KICK",
-    "KICKED",
-    "KICKING",
-    "KICKS",
-    "KID",
-    "KIDS",
-    "KILL",
-    "KILLED",
-    "KILLER",
-    "KILLERS",
-    "KILLING",
-    "KILLS",
-    "KILOGRAM",
-    "KILOGRAMS",
-    "KILOMETRE",
-    "KILOMETRES",
-    "KIM",
-    "KIND",
-    "KINDLY",
-    "KINDNESS",
-    "KINDS",
-    "KING",
-    "KINGDOM",
-    "KINGDOMS",
-    "KINGS",
-    "KISS",
-    "KISSED",
-    "KISSES",
-    "KISSING",
-    "KIT",
-    "KITCHEN",
-    "KITCHENS",
-    "KITS",
-    "KNEE",
-    "KNEEL",
-    "KNEELED",
-    "KNEELING",
-    "KNEELS",
-    "KNEES",
-    "KNEW",
-    "KNIFE",
-    "KNIGHT",
-    "KNIVES",
-    "KNOCK",
-    "KNOCKED",
-    "KNOCKING",
-    "KNOCKS",
-    "KNOT",
-    "KNOTS",
-    "KNOTTED",
-    "KNOTTING",
-    "KNOWING",
-    "KNOWLEDGE",
-    "KNOWLEDGEABLE",
-    "KONG",
-    "KOREA",
-    "KOREAN",
-    "KS",
-    "KY",
-    "LA",
-    "LAB",
-    "LABEL",
-    "LABELS",
-    "LABOR",
-    "LABORATORY",
-    "LABOUR",
-    "LABS",
-    "LACK",
-    "LACKED",
-    "LACKING",
-    "LACKS",
-    "LADDER",
-    "LADDERS",
-    "LADIES",
-    "LADY",
-    "LAID",
-    "LAKE",
-    "LAKES",
-    "LAMP",
-    "LAMPS",
-    "LAN",
-    "LAND",
-    "LANDED",
-    "LANDING",
-    "LANDLORDS",
-    "LANDS",
-    "LANDSCAPE",
-    "LANE",
-    "LANGUAGE",
-    "LANGUAGES",
-    "LAPTOP",
-    "LAPTOPS",
-    "LARGE",
-    "LARGER",
-    "LARGEST",
-    "LARRY",
-    "LAS",
-    "LASER",
-    "LASTED",
-    "LASTING",
-    "LASTLY",
-    "LASTS",
-    "LAT",
-    "LATE",
-    "LATENESS",
-    "LATEST",
-    "LATIN",
-    "LATINA",
-    "LATINAS",
-    "LAUGH",
-    "LAUGHABLE",
-    "LAUGHED",
-    "LAUGHING",
-    "LAUGHS",
-    "LAUGHTER",
-    "LAUNCH",
-    "LAUNCHED",
-    "LAURA",
-    "LAW",
-    "LAWFUL",
-    "LAWFULLY",
-    "LAWLESS",
-    "LAWRENCE",
-    "LAWS",
-    "LAWYER",
-    "LAWYERS",
-    "LAY",
-    "LAYER",
-    "LAYING",
-    "LAYOUT",
-    "LAYS",
-    "LAZIER",
-    "LAZIEST",
-    "LAZILY",
-    "LAZINESS",
-    "LAZY",
-    "LBS",
-    "LCD",
-    "LE",
-    "LEAD",
-    "LEADED",
-    "LEADER",
-    "LEADERS",
-    "LEADERSHIP",
-    "LEADING",
-    "LEADS",
-    "LEAF",
-    "LEAFY",
-    "LEAGUE",
-    "LEAN",
-    "LEANED",
-    "LEANING",
-    "LEANS",
-    "LEARN",
-    "LEARNED",
-    "LEARNER",
-    "LEARNERS",
-    "LEARNING",
-    "LEARNS",
-    "LEARNT",
-    "LEASE",
-    "LEATHER",
-    "LEATHERS",
-    "LEAVE",
-    "LEAVES",
-    "LEAVING",
-    "LEBANON",
-    "LECTURE",
-    "LED",
-    "LEE",
-    "LEFT",
-    "LEFTIST",
-    "LEFTISTS",
-    "LEG",
-    "LEGACY",
-    "LEGAL",
-    "LEGEND",
-    "LEGISLATION",
-    "LEGISLATIVE",
-    "LEGS",
-    "LEISURE",
-    "LEND",
-    "LENDING",
-    "LENDS",
-    "LENGTH",
-    "LENGTHEN",
-    "LENGTHENING",
-    "LENGTHS",
-    "LENGTHY",
-    "LENS",
-    "LENSES",
-    "LENT",
-    "LES",
-    "LESBIAN",
-    "LESBIANS",
-    "LESSEN",
-    "LESSENED",
-    "LESSENING",
-    "LESSER",
-    "LESSON",
-    "LESSONS",
-    "LETTER",
-    "LETTERS",
-    "LETTING",
-    "LEVEL",
-    "LEVELLED",
-    "LEVELLER",
-    "LEVELLING",
-    "LEVELS",
-    "LEWIS",
-    "LG",
-    "LI",
-    "LIABILITY",
-    "LIABLE",
-    "LIAR",
-    "LIARS",
-    "LIB",
-    "LIBERAL",
-    "LIBERTIES",
-    "LIBERTY",
-    "LIBRARIAN",
-    "LIBRARIANS",
-    "LIBRARIES",
-    "LIBRARY",
-    "LICENCE",
-    "LICENSE",
-    "LICENSED",
-    "LICENSING",
-    "LID",
-    "LIDS",
-    "LIE",
-    "LIED",
-    "LIES",
-    "LIFE",
-    "LIFELIKE",
-    "LIFELONG",
-    "LIFESIZE",
-    "LIFESTYLE",
-    "LIFETIME",
-    "LIFETIMES",
-    "LIFT",
-    "LIFTED",
-    "LIFTING",
-    "LIFTS",
-    "LIGHT",
-    "LIGHTED",
-    "LIGHTEN",
-    "LIGHTER",
-    "LIGHTEST",
-    "LIGHTING",
-    "LIGHTLY",
-    "LIGHTNESS",
-    "LIGHTS",
-    "LIGHTWEIGHT",
-    "LIKELIER",
-    "LIKELIEST",
-    "LIKELIHOOD",
-    "LIKES",
-    "LIKING",
-    "LIMB",
-    "LIMBS",
-    "LIMIT",
-    "LIMITATION",
-    "LIMITATIONS",
-    "LIMITED",
-    "LIMITING",
-    "LIMITS",
-    "LIMOUSINES",
-    "LINCOLN",
-    "LINDA",
-    "LINEAR",
-    "LINED",
-    "LINES",
-    "LINGERIE",
-    "LINING",
-    "LINK",
-    "LINKED",
-    "LINKING",
-    "LINKS",
-    "LINUX",
-    "LION",
-    "LIP",
-    "LIPS",
-    "LIQUID",
-    "LIQUIDS",
-    "LISA",
-    "LIST",
-    "LISTED",
-    "LISTEN",
-    "LISTENED",
-    "LISTENER",
-    "LISTENERS",
-    "LISTENING",
-    "LISTENS",
-    "LISTING",
-    "LISTINGS",
-    "LISTS",
-    "LIT",
-    "LITERACY",
-    "LITERARY",
-    "LITERATURE",
-    "LITRE",
-    "LITRES",
-    "LITTLER",
-    "LITTLEST",
-    "LIVE",
-    "LIVECAM",
-    "LIVED",
-    "LIVELIEST",
-    "LIVELY",
-    "LIVER",
-    "LIVES",
-    "LIVING",
-    "LLC",
-    "LO",
-    "LOAD",
-    "LOADED",
-    "LOADING",
-    "LOADS",
-    "LOAF",
-    "LOAN",
-    "LOANS",
-    "LOAVES",
-    "LOCAL",
-    "LOCALLY",
-    "LOCALS",
-    "LOCATE",
-    "LOCATED",
-    "LOCATION",
-    "LOCATIONS",
-    "LOCK",
-    "LOCKED",
-    "LOCKING",
-    "LOCKS",
-    "LODGE",
-    "LODGING",
-    "LODGINGS",
-    "LOG",
-    "LOGGED",
-    "LOGIC",
-    "LOGIN",
-    "LOGO",
-    "LOGOS",
-    "LOGS",
-    "LOL",
-    "LONDON",
-    "LONE",
-    "LONELINESS",
-    "LONELY",
-    "LONGER",
-    "LONGEST",
-    "LOOKED",
-    "LOOKUP",
-    "LOOP",
-    "LOOSE",
-    "LOOSELY",
-    "LOOSEN",
-    "LORD",
-    "LORDS",
-    "LORDSHIP",
-    "LORDSHIPS",
-    "LOS",
-    "LOSE",
-    "LOSERS",
-    "LOSES",
-    "LOSING",
-    "LOSS",
-    "LOSSES",
-    "LOST",
-    "LOT",
-    "LOTS",
-    "LOTTERY",
-    "LOUD",
-    "LOUDER",
-    "LOUDEST",
-    "LOUDLY",
-    "LOUDNESS",
-    "LOUIS",
-    "LOUISIANA",
-    "LOUNGE",
-    "LOVABLE",
-    "LOVE",
-    "LOVED",
-    "LOVELY",
-    "LOVER",
-    "LOVES",
-    "LOVING",
-    "LOW",
-    "LOWER",
-    "LOWERED",
-    "LOWERING",
-    "LOWEST",
-    "LOYAL",
-    "LOYALLY",
-    "LOYALTY",
-    "LP",
-    "LUCK",
-    "LUCKIER",
-    "LUCKIEST",
-    "LUCKILY",
-    "LUCKY",
-    "LUMP",
-    "LUMPS",
-    "LUNCH",
-    "LUNCHES",
-    "LUNG",
-    "LUNGS",
-    "LUXURY",
-    "LYING",
-    "LYRICS",
-    "MAC",
-    "MACHINE",
-    "MACHINERY",
-    "MACHINES",
-    "MAD",
-    "MADDER",
-    "MADDEST",
-    "MADISON",
-    "MADLY",
-    "MADMAN",
-    "MADNESS",
-    "MAGAZINE",
-    "MAGAZINES",
-    "MAGIC",
-    "MAGNETIC",
-    "MAIL",
-    "MAILED",
-    "MAILING",
-    "MAILS",
-    "MAIN",
-    "MAINE",
-    "MAINTAIN",
-    "MAINTAINED",
-    "MAINTAINING",
-    "MAINTENANCE",
-    "MAJOR",
-    "MAJORITY",
-    "MAKER",
-    "MAKERS",
-    "MAKING",
-    "MALAYSIA",
-    "MALE",
-    "MALES",
-    "MALL",
-    "MAN",
-    "MANAGE",
-    "MANAGED",
-    "MANAGEMENT",
-    "MANAGER",
-    "MANAGERS",
-    "MANAGES",
-    "MANAGING",
-    "MANCHESTER",
-    "MANGA",
-    "MANHOOD",
-    "MANKIND",
-    "MANLINESS",
-    "MANLY",
-    "MANNER",
-    "MANNERS",
-    "MANUAL",
-    "MANUFACTURE",
-    "MANUFACTURED",
-    "MANUFACTURER",
-    "MANUFACTURERS",
-    "MANUFACTURES",
-    "MANUFACTURING",
-    "MAP",
-    "MAPPING",
-    "MAPS",
-    "MAR",
-    "MARC",
-    "MARCH",
-    "MARCHED",
-    "MARCHERS",
-    "MARCHES",
-    "MARCHING",
-    "MARGARET",
-    "MARIA",
-    "MARIE",
-    "MARINE",
-    "MARK",
-    "MARKED",
-    "MARKER",
-    "MARKERS",
-    "MARKET",
-    "MARKETED",
-    "MARKETING",
-    "MARKETPLACE",
-    "MARKETS",
-    "MARKING",
-    "MARKS",
-    "MARRIAGE",
-    "MARRIAGES",
-    "MARRIED",
-    "MARRIES",
-    "MARRY",
-    "MARRYING",
-    "MARS",
-    "MARSHALL",
-    "MARTIN",
-    "MARY",
-    "MARYLAND",
-    "MASK",
-    "MASS",
-    "MASSACHUSETTS",
-    "MASSAGE",
-    "MASSES",
-    "MASSIVE",
-    "MASTER",
-    "MASTERED",
-    "MASTERFUL",
-    "MASTERING",
-    "MASTERS",
-    "MASTERY",
-    "MAT",
-    "MATCH",
-    "MATCHED",
-    "MATCHES",
-    "MATCHING",
-    "MATERIAL",
-    "MATERIALISTIC",
-    "MATERIALISTICALLY",
-    "MATERIALLY",
-    "MATERIALS",
-    "MATH",
-    "MATHEMATICS",
-    "MATRIX",
-    "MATS",
-    "MATT",
-    "MATTER",
-    "MATTERED",
-    "MATTERING",
-    "MATTERS",
-    "MATTHEW",
-    "MATURE",
-    "MAX",
-    "MAXIMUM",
-    "MAYOR",
-    "MB",
-    "MC",
-    "MD",
-    "MEAL",
-    "MEALS",
-    "MEANER",
-    "MEANEST",
-    "MEANING",
-    "MEANINGFUL",
-    "MEANINGLESS",
-    "MEANINGS",
-    "MEANLY",
-    "MEANNESS",
-    "MEANT",
-    "MEASURABLE",
-    "MEASURABLY",
-    "MEASURE",
-    "MEASURED",
-    "MEASUREMENT",
-    "MEASUREMENTS",
-    "MEASURES",
-    "MEASURING",
-    "MEAT",
-    "MEATS",
-    "MECHANIC",
-    "MECHANICAL",
-    "MECHANICALLY",
-    "MECHANICS",
-    "MECHANISM",
-    "MECHANISMS",
-    "MED",
-    "MEDIA",
-    "MEDIAN",
-    "MEDIC",
-    "MEDICAL",
-    "MEDICATION",
-    "MEDICINE",
-    "MEDICINES",
-    "MEDIUM",
-    "MEDLINE",
-    "MEET",
-    "MEETING",
-    "MEETINGS",
-    "MEETS",
-    "MELBOURNE",
-    "MELT",
-    "MELTED",
-    "MELTING",
-    "MELTS",
-    "MEMBER",
-    "MEMBERS",
-    "MEMBERSHIP",
-    "MEMBERSHIPS",
-    "MEMORABILIA",
-    "MEMORIAL",
-    "MEMORIALS",
-    "MEMORIES",
-    "MEMORISE",
-    "MEMORISED",
-    "MEMORISES",
-    "MEMORISING",
-    "MEMORIZE",
-    "MEMORIZED",
-    "MEMORIZES",
-    "MEMORIZING",
-    "MEMORY",
-    "MEMPHIS",
-    "MEN",
-    "MEND",
-    "MENDED",
-    "MENDING",
-    "MENDS",
-    "MENS",
-    "MENTAL",
-    "MENTION",
-    "MENTIONED",
-    "MENTIONING",
-    "MENTIONS",
-    "MENU",
-    "MERCEDES",
-    "MERCHANDISE",
-    "MERCHANT",
-    "MERCHANTS",
-    "MERCIES",
-    "MERCIFUL",
-    "MERCURY",
-    "MERCY",
-    "MERE",
-    "MEREST",
-    "MERRIER",
-    "MERRIEST",
-    "MERRILY",
-    "MERRINESS",
-    "MERRY",
-    "MESH",
-    "MESSAGE",
-    "MESSAGES",
-    "MESSAGING",
-    "MESSENGER",
-    "MESSENGERS",
-    "MET",
-    "META",
-    "METABOLISM",
-    "METAL",
-    "METALS",
-    "METER",
-    "METHOD",
-    "METHODS",
-    "METRE",
-    "METRES",
-    "METRO",
-    "METROPOLITAN",
-    "MEXICAN",
-    "MEXICO",
-    "MHZ",
-    "MI",
-    "MIAMI",
-    "MICE",
-    "MICHAEL",
-    "MICHELLE",
-    "MICHIGAN",
-    "MICRO",
-    "MICROSOFT",
-    "MID",
-    "MIDDLE",
-    "MIDNIGHT",
-    "MIDST",
-    "MIGRATION",
-    "MIKE",
-    "MILD",
-    "MILDER",
-    "MILDEST",
-    "MILDLY",
-    "MILDNESS",
-    "MILE",
-    "MILES",
-    "MILF",
-    "MILFHUNTER",
-    "MILFS",
-    "MILITARY",
-    "MILK",
-    "MILKED",
-    "MILKING",
-    "MILKS",
-    "MILKY",
-    "MILL",
-    "MILLED",
-    "MILLER",
-    "MILLIGRAM",
-    "MILLIGRAMS",
-    "MILLILITRE",
-    "MILLILITRES",
-    "MILLIMETRE",
-    "MILLIMETRES",
-    "MILLING",
-    "MILLIONS",
-    "MILLIONTH",
-    "MILLS",
-    "MILWAUKEE",
-    "MIN",
-    "MIND",
-    "MINDED",
-    "MINDING",
-    "MINDS",
-    "MINE",
-    "MINED",
-    "MINER",
-    "MINERAL",
-    "MINERALS",
-    "MINERS",
-    "MINES",
-    "MINI",
-    "MINIMAL",
-    "MINIMUM",
-    "MINING",
-    "MINISTER",
-    "MINISTERS",
-    "MINISTRY",
-    "MINNEAPOLIS",
-    "MINNESOTA",
-    "MINOR",
-    "MINORITY",
-    "MINT",
-    "MINUTE",
-    "MINUTES",
-    "MIRROR",
-    "MISC",
-    "MISCELLANEOUS",
-    "MISERABLE",
-    "MISERABLY",
-    "MISLEAD",
-    "MISLEADING",
-    "MISLED",
-    "MISSED",
-    "MISSES",
-    "MISSING",
-    "MISSION",
-    "MISSISSIPPI",
-    "MISSOURI",
-    "MISSPELT",
-    "MISTAKE",
-    "MISTAKEN",
-    "MISTAKENLY",
-    "MISTAKES",
-    "MISTAKING",
-    "MISTER",
-    "MISUSED",
-    "MIT",
-    "MITCHELL",
-    "MIX",
-    "MIXED",
-    "MIXES",
-    "MIXING",
-    "MIXTURE",
-    "MIXTURES",
-    "MM",
-    "MN",
-    "MO",
-    "MOBILE",
-    "MOD",
-    "MODE",
-    "MODEL",
-    "MODELED",
-    "MODELING",
-    "MODELLED",
-    "MODELLING",
-    "MODELS",
-    "MODEM",
-    "MODERATE",
-    "MODERATELY",
-    "MODERATION",
-    "MODERATOR",
-    "MODERN",
-    "MODERNISATION",
-    "MODERNISE",
-    "MODES",
-    "MODEST",
-    "MODESTLY",
-    "MODESTY",
-    "MODIFICATION",
-    "MODIFIED",
-    "MODIFY",
-    "MODULE",
-    "MODULES",
-    "MOLECULAR",
-    "MOM",
-    "MOMENT",
-    "MOMENTARY",
-    "MOMENTS",
-    "MON",
-    "MONDAY",
-    "MONDAYS",
-    "MONEY",
-    "MONITOR",
-    "MONITORING",
-    "MONITORS",
-    "MONKEY",
-    "MONKEYS",
-    "MONSTER",
-    "MONTANA",
-    "MONTH",
-    "MONTHLY",
-    "MONTHS",
-    "MONTREAL",
-    "MOOD",
-    "MOON",
-    "MOONLIGHT",
-    "MOONS",
-    "MOORE",
-    "MORAL",
-    "MORALITY",
-    "MORALLY",
-    "MORALS",
-    "MORGAN",
-    "MORNINGS",
-    "MORRIS",
-    "MORTGAGE",
-    "MORTGAGES",
-    "MOTHER",
-    "MOTHER-IN-LAW",
-    "MOTHERHOOD",
-    "MOTHERS",
-    "MOTION",
-    "MOTIONED",
-    "MOTIONING",
-    "MOTIONLESS",
-    "MOTIONS",
-    "MOTOR",
-    "MOTORCYCLE",
-    "MOTORIST",
-    "MOTORISTS",
-    "MOTOROLA",
-    "MOTORS",
-    "MOUNT",
-    "MOUNTAIN",
-    "MOUNTAINS",
-    "MOUNTAINSIDE",
-    "MOUNTED",
-    "MOUSE",
-    "MOUTH",
-    "MOUTHFUL",
-    "MOUTHS",
-    "MOVE",
-    "MOVED",
-    "MOVEMENT",
-    "MOVEMENTS",
-    "MOVES",
-    "MOVIE",
-    "MOVIES",
-    "MOVING",
-    "MP",
-    "MPEG",
-    "MPH",
-    "MS",
-    "MSN",
-    "MT",
-    "MUD",
-    "MUDDY",
-    "MULTI",
-    "MULTIMEDIA",
-    "MULTIPLE",
-    "MULTIPLICATION",
-    "MULTIPLIED",
-    "MULTIPLIES",
-    "MULTIPLY",
-    "MULTIPLYING",
-    "MUM",
-    "MUNICIPAL",
-    "MURDER",
-    "MURDERED",
-    "MURDERER",
-    "MURDERERS",
-    "MURDERING",
-    "MURDERS",
-    "MURRAY",
-    "MUSCLE",
-    "MUSEUM",
-    "MUSIC",
-    "MUSICAL",
-    "MUSICALLY",
-    "MUSICIAN",
-    "MUSICIANS",
-    "MUTUAL",
-    "MX",
-    "MYSQL",
-    "MYSTERIES",
-    "MYSTERIOUS",
-    "MYSTERIOUSLY",
-    "MYSTERY",
-    "NAIL",
-    "NAILED",
-    "NAILING",
-    "NAILS",
-    "NAKED",
-    "NAMED",
-    "NAMELESS",
-    "NAMES",
-    "NAMING",
-    "NANCY",
-    "NARROW",
-    "NARROWED",
-    "NARROWER",
-    "NARROWEST",
-    "NARROWING",
-    "NARROWLY",
-    "NARROWNESS",
-    "NARROWS",
-    "NASA",
-    "NASHVILLE",
-    "NATION",
-    "NATIONAL",
-    "NATIONALLY",
-    "NATIONS",
-    "NATIONWIDE",
-    "NATIVE",
-    "NATIVES",
-    "NATURAL",
-    "NATURALLY",
-    "NATURE",
-    "NATURES",
-    "NAVIGATE",
-    "NAVIGATION",
-    "NAVY",
-    "NBA",
-    "NC",
-    "NCAA",
-    "NE",
-    "NEARBY",
-    "NEARER",
-    "NEAREST",
-    "NEARNESS",
-    "NEAT",
-    "NEATER",
-    "NEATEST",
-    "NEATLY",
-    "NEATNESS",
-    "NEBRASKA",
-    "NEC",
-    "NECESSITIES",
-    "NECESSITY",
-    "NECK",
-    "NECKS",
-    "NEEDED",
-    "NEEDING",
-    "NEEDLE",
-    "NEEDLED",
-    "NEEDLES",
-    "NEEDLESS",
-    "NEEDLING",
-    "NEGATIVE",
-    "NEGLECT",
-    "NEGLECTED",
-    "NEGLECTING",
-    "NEGLECTS",
-    "NEIGHBOR",
-    "NEIGHBORHOOD",
-    "NEIGHBORHOODS",
-    "NEIGHBORS",
-    "NEIGHBOUR",
-    "NEIGHBOURHOOD",
-    "NEIGHBOURHOODS",
-    "NEIGHBOURS",
-    "NELSON",
-    "NEPHEW",
-    "NEPHEWS",
-    "NEST",
-    "NESTED",
-    "NESTING",
-    "NESTS",
-    "NET",
-    "NETHERLANDS",
-    "NETS",
-    "NETWORK",
-    "NETWORKING",
-    "NETWORKS",
-    "NEVADA",
-    "NEWER",
-    "NEWEST",
-    "NEWLY",
-    "NEWNESS",
-    "NEWS",
-    "NEWSLETTER",
-    "NEWSLETTERS",
-    "NEWSPAPER",
-    "NEWSPAPERS",
-    "NFL",
-    "NG",
-    "NH",
-    "NICELY",
-    "NICENESS",
-    "NICER",
-    "NICEST",
-    "NICK",
-    "NIECE",
-    "NIECES",
-    "NIGHT",
-    "NIGHTLY",
-    "NIGHTS",
-    "NIKE",
-    "NIKON",
-    "NINES",
-    "NINETEEN",
-    "NINETEENTH",
-    "NINETIES",
-    "NINETIETH",
-    "NINTENDO",
-    "NINTH",
-    "NIPPLES",
-    "NJ",
-    "NL",
-    "NM",
-    "NOBILITY",
-    "NOBLE",
-    "NOBLER",
-    "NOBLES",
-    "NOBLEST",
-    "NOBLY",
-    "NODE",
-    "NOISE",
-    "NOISES",
-    "NOISILY",
-    "NOISY",
-    "NOKIA",
-    "NONEXISTENT",
-    "NONSENSE",
-    "NONSENSICAL",
-    "NONVIOLENT",
-    "NOON",
-    "NORMAL",
-    "NORTH",
-    "NORTH-EAST",
-    "NORTH-WEST",
-    "NORTHEAST",
-    "NORTHERN",
-    "NORTHWARDS",
-    "NORTHWEST",
-    "NORWAY",
-    "NOSE",
-    "NOSES",
-    "NOTABLE",
-    "NOTABLY",
-    "NOTE",
-    "NOTEBOOK",
-    "NOTEBOOKS",
-    "NOTES",
-    "NOTICE",
-    "NOTICEABLE",
-    "NOTICEABLY",
-    "NOTICED",
-    "NOTICES",
-    "NOTICING",
-    "NOTIFICATION",
-    "NOTIFY",
-    "NOTING",
-    "NOUN",
-    "NOUNS",
-    "NOV",
-    "NOVA",
-    "NOVEMBER",
-    "NOWADAYS",
-    "NR",
-    "NS",
-    "NSW",
-    "NT",
-    "NUCLEAR",
-    "NUDE",
-    "NUISANCE",
-    "NUISANCES",
-    "NULL",
-    "NUMBER",
-    "NUMBERED",
-    "NUMBERING",
-    "NUMBERS",
-    "NUMERICAL",
-    "NUMERICALLY",
-    "NUMEROUS",
-    "NURSE",
-    "NURSED",
-    "NURSES",
-    "NURSING",
-    "NUT",
-    "NUTRITION",
-    "NUTS",
-    "NUTTEN",
-    "NV",
-    "NW",
-    "NY",
-    "NYC",
-    "NZ",
-    "OAK",
-    "OAR",
-    "OARS",
-    "OBEDIENCE",
-    "OBEDIENT",
-    "OBEDIENTLY",
-    "OBEY",
-    "OBEYED",
-    "OBEYING",
-    "OBEYS",
-    "OBJECT",
-    "OBJECTED",
-    "OBJECTING",
-    "OBJECTION",
-    "OBJECTIONABLE",
-    "OBJECTIONS",
-    "OBJECTIVE",
-    "OBJECTIVES",
-    "OBJECTS",
-    "OBLIGATION",
-    "OBLIGATIONS",
-    "OBSERVABLE",
-    "OBSERVATION",
-    "OBSERVATIONS",
-    "OBSERVATORY",
-    "OBSERVE",
-    "OBSERVED",
-    "OBSERVER",
-    "OBSERVERS",
-    "OBSERVES",
-    "OBSERVING",
-    "OBVIOUS",
-    "OCCASION",
-    "OCCASIONAL",
-    "OCCASIONALLY",
-    "OCCASIONS",
-    "OCCUPATION",
-    "OCCUPATIONAL",
-    "OCCUR",
-    "OCCURRED",
-    "OCCURS",
-    "OCEAN",
-    "OCEANS",
-    "OCT",
-    "OCTOBER",
-    "ODD",
-    "ODDS",
-    "OFFEND",
-    "OFFENDED",
-    "OFFENDING",
-    "OFFENDS",
-    "OFFENSE",
-    "OFFENSES",
-    "OFFENSIVE",
-    "OFFENSIVELY",
-    "OFFER",
-    "OFFERED",
-    "OFFERING",
-    "OFFERINGS",
-    "OFFERS",
-    "OFFICE",
-    "OFFICER",
-    "OFFICERS",
-    "OFFICES",
-    "OFFICIAL",
-    "OFFICIALDOM",
-    "OFFICIALLY",
-    "OFFICIALS",
-    "OFFLINE",
-    "OFFSET",
-    "OHIO",
-    "OIL",
-    "OILED",
-    "OILINESS",
-    "OILS",
-    "OILY",
-    "OKLAHOMA",
-    "OLDER",
-    "OLDEST",
-    "OMISSION",
-    "OMISSIONS",
-    "OMIT",
-    "OMITS",
-    "OMITTING",
-    "ONGOING",
-    "ONLINE",
-    "ONTARIO",
-    "ONWARD",
-    "ONWARDS",
-    "OP",
-    "OPEN",
-    "OPENED",
-    "OPENING",
-    "OPENLY",
-    "OPENNESS",
-    "OPENS",
-    "OPERA",
-    "OPERATE",
-    "OPERATED",
-    "OPERATES",
-    "OPERATING",
-    "OPERATION",
-    "OPERATIONAL",
-    "OPERATIONS",
-    "OPERATOR",
-    "OPERATORS",
-    "OPINION",
-    "OPINIONATED",
-    "OPINIONS",
-    "OPPORTUNITIES",
-    "OPPORTUNITY",
-    "OPPOSE",
-    "OPPOSED",
-    "OPPOSES",
-    "OPPOSING",
-    "OPPOSITE",
-    "OPPOSITES",
-    "OPPOSITION",
-    "OPTICAL",
-    "OPTIMIZATION",
-    "OPTION",
-    "OPTIONAL",
-    "OPTIONS",
-    "ORACLE",
-    "ORAL",
-    "ORANGE",
-    "ORANGES",
-    "ORANGISH",
-    "ORCHESTRA",
-    "ORDER",
-    "ORDERED",
-    "ORDERING",
-    "ORDERLY",
-    "ORDERS",
-    "ORDINARILY",
-    "ORDINARY",
-    "OREGON",
-    "ORG",
-    "ORGAN",
-    "ORGANIC",
-    "ORGANISATION",
-    "ORGANISATIONAL",
-    "ORGANISATIONS",
-    "ORGANISE",
-    "ORGANISED",
-    "ORGANISES",
-    "ORGANISING",
-    "ORGANIZATION",
-    "ORGANIZATIONS",
-    "ORGANIZE",
-    "ORGANIZED",
-    "ORGANIZES",
-    "ORGANIZING",
-    "ORGANS",
-    "ORGY",
-    "ORIENTATION",
-    "ORIENTED",
-    "ORIGIN",
-    "ORIGINAL",
-    "ORIGINALITY",
-    "ORIGINALLY",
-    "ORIGINATED",
-    "ORIGINATES",
-    "ORIGINS",
-    "ORLANDO",
-    "ORLEANS",
-    "ORNAMENT",
-    "ORNAMENTAL",
-    "ORNAMENTS",
-    "OS",
-    "OT",
-    "OTTAWA",
-    "OUGHTN",
-    "OUTBREAK",
-    "OUTBREAKS",
-    "OUTCOME",
-    "OUTCOMES",
-    "OUTDOOR",
-    "OUTDOORS",
-    "OUTER",
-    "OUTLET",
-    "OUTLINE",
-    "OUTLINED",
-    "OUTLINES",
-    "OUTLINING",
-    "OUTLOOK",
-    "OUTPUT",
-    "OUTSIDER",
-    "OUTSIDERS",
-    "OUTSOURCING",
-    "OUTSTANDING",
-    "OUTWARD",
-    "OUTWARDS",
-    "OVERCAME",
-    "OVERCOME",
-    "OVERCOMES",
-    "OVERCOMING",
-    "OVERNIGHT",
-    "OVERSEAS",
-    "OVERVIEW",
-    "OWE",
-    "OWED",
-    "OWES",
-    "OWNED",
-    "OWNER",
-    "OWNERS",
-    "OWNERSHIP",
-    "OWNING",
-    "OWNS",
-    "OXFORD",
-    "OZ",
-    "PA",
-    "PACE",
-    "PACIFIC",
-    "PACK",
-    "PACKAGE",
-    "PACKAGES",
-    "PACKAGING",
-    "PACKARD",
-    "PACKED",
-    "PACKET",
-    "PACKING",
-    "PACKS",
-    "PAD",
-    "PADDED",
-    "PADDING",
-    "PADS",
-    "PAID",
-    "PAIN",
-    "PAINFUL",
-    "PAINFULLY",
-    "PAINS",
-    "PAINT",
-    "PAINTED",
-    "PAINTER",
-    "PAINTERS",
-    "PAINTING",
-    "PAINTINGS",
-    "PAINTS",
-    "PAIR",
-    "PAIRED",
-    "PAIRING",
-    "PAIRS",
-    "PAKISTAN",
-    "PALACE",
-    "PALE",
-    "PALED",
-    "PALENESS",
-    "PALES",
-    "PALING",
-    "PALM",
-    "PAN",
-    "PANASONIC",
-    "PANEL",
-    "PANS",
-    "PANTS",
-    "PAPER",
-    "PAPERBACK",
-    "PAPERED",
-    "PAPERING",
-    "PAPERS",
-    "PAR",
-    "PARA",
-    "PARADISE",
-    "PARAGRAPH",
-    "PARALLEL",
-    "PARAMETER",
-    "PARAMETERS",
-    "PARCEL",
-    "PARCELLED",
-    "PARCELS",
-    "PARDON",
-    "PARDONED",
-    "PARDONING",
-    "PARDONS",
-    "PARENT",
-    "PARENTAGE",
-    "PARENTAL",
-    "PARENTS",
-    "PARIS",
-    "PARK",
-    "PARKED",
-    "PARKER",
-    "PARKING",
-    "PARKS",
-    "PARLIAMENT",
-    "PARTED",
-    "PARTIAL",
-    "PARTIALLY",
-    "PARTICIPANTS",
-    "PARTICIPATE",
-    "PARTICIPATING",
-    "PARTICIPATION",
-    "PARTICLE",
-    "PARTICLES",
-    "PARTIES",
-    "PARTING",
-    "PARTLY",
-    "PARTNER",
-    "PARTNERS",
-    "PARTNERSHIP",
-    "PARTNERSHIPS",
-    "PARTS",
-    "PARTY",
-    "PASS",
-    "PASSAGE",
-    "PASSAGES",
-    "PASSED",
-    "PASSENGER",
-    "PASSENGERS",
-    "PASSES",
-    "PASSING",
-    "PASSION",
-    "PASSWORD",
-    "PASTE",
-    "PASTED",
-    "PASTES",
-    "PASTING",
-    "PAT",
-    "PATCH",
-    "PATCHES",
-    "PATENT",
-    "PATH",
-    "PATHS",
-    "PATIENCE",
-    "PATIENT",
-    "PATIENTLY",
-    "PATIENTS",
-    "PATRICK",
-    "PATRIOTIC",
-    "PATTERN",
-    "PATTERNED",
-    "PATTERNS",
-    "PAUL",
-    "PAUSE",
-    "PAUSED",
-    "PAUSES",
-    "PAUSING",
-    "PAW",
-    "PAWS",
-    "PAY",
-    "PAYDAY",
-    "PAYING",
-    "PAYMENT",
-    "PAYMENTS",
-    "PAYPAL",
-    "PAYS",
-    "PC",
-    "PCI",
-    "PCS",
-    "PDA",
-    "PDAS",
-    "PDF",
-    "PDT",
-    "PE",
-    "PEACE",
-    "PEACEFUL",
-    "PEACEFULLY",
-    "PEAK",
-    "PEARL",
-    "PEARLS",
-    "PECULIAR",
-    "PECULIARITIES",
-    "PECULIARITY",
-    "PECULIARLY",
-    "PEE",
-    "PEER",
-    "PEN",
-    "PENALTY",
-    "PENCIL",
-    "PENCILS",
-    "PENDING",
-    "PENIS",
-    "PENNIES",
-    "PENNSYLVANIA",
-    "PENNY",
-    "PENS",
-    "PENSION",
-    "PENTIUM",
-    "PEOPLE",
-    "PEOPLES",
-    "PERCENT",
-    "PERCENTAGE",
-    "PERFECT",
-    "PERFECTED",
-    "PERFECTING",
-    "PERFECTION",
-    "PERFECTLY",
-    "PERFECTS",
-    "PERFORM",
-    "PERFORMANCE",
-    "PERFORMANCES",
-    "PERFORMED",
-    "PERFORMERS",
-    "PERFORMING",
-    "PERFORMS",
-    "PERIOD",
-    "PERIODS",
-    "PERIPHERALS",
-    "PERL",
-    "PERMALINK",
-    "PERMANENT",
-    "PERMANENTLY",
-    "PERMISSION",
-    "PERMIT",
-    "PERMITS",
-    "PERMITTED",
-    "PERMITTING",
-    "PERSON",
-    "PERSONAL",
-    "PERSONALITIES",
-    "PERSONALIZED",
-    "PERSONALLY",
-    "PERSONALS",
-    "PERSONNEL",
-    "PERSONS",
-    "PERSPECTIVE",
-    "PERSUADE",
-    "PERSUADED",
-    "PERSUADES",
-    "PERSUADING",
-    "PERSUASION",
-    "PERSUASIVE",
-    "PERSUASIVELY",
-    "PERU",
-    "PET",
-    "PETER",
-    "PETITION",
-    "PETS",
-    "PG",
-    "PH",
-    "PHARMACY",
-    "PHASE",
-    "PHD",
-    "PHENTERMINE",
-    "PHIL",
-    "PHILADELPHIA",
-    "PHILIP",
-    "PHILIPPINES",
-    "PHILIPS",
-    "PHILOSOPHY",
-    "PHOENIX",
-    "PHONE",
-    "PHONED",
-    "PHONES",
-    "PHONING",
-    "PHOTO",
-    "PHOTOGRAPH",
-    "PHOTOGRAPHED",
-    "PHOTOGRAPHER",
-    "PHOTOGRAPHERS",
-    "PHOTOGRAPHING",
-    "PHOTOGRAPHS",
-    "PHOTOGRAPHY",
-    "PHOTOS",
-    "PHP",
-    "PHRASE",
-    "PHYSICAL",
-    "PHYSICIAN",
-    "PHYSICIANS",
-    "PHYSICS",
-    "PI",
-    "PIANO",
-    "PIC",
-    "PICK",
-    "PICKED",
-    "PICKER",
-    "PICKERS",
-    "PICKING",
-    "PICKS",
-    "PICS",
-    "PICTURE",
-    "PICTURED",
-    "PICTURES",
-    "PICTURING",
-    "PIECE",
-    "PIECES",
-    "PIG",
-    "PIGEON",
-    "PIGEONS",
-    "PIGS",
-    "PILE",
-    "PILED",
-    "PILES",
-    "PILING",
-    "PILL",
-    "PILLS",
-    "PILOT",
-    "PIN",
-    "PINCH",
-    "PINCHED",
-    "PINCHES",
-    "PINCHING",
-    "PINE",
-    "PINK",
-    "PINKER",
-    "PINKEST",
-    "PINKNESS",
-    "PINNED",
-    "PINNING",
-    "PINS",
-    "PINT",
-    "PINTS",
-    "PIONEER",
-    "PIPE",
-    "PIPELINE",
-    "PIPES",
-    "PISSING",
-    "PITIED",
-    "PITIES",
-    "PITTSBURGH",
-    "PITY",
-    "PITYING",
-    "PIZZA",
-    "PL",
-    "PLACE",
-    "PLACEMENT",
-    "PLACES",
-    "PLACING",
-    "PLAIN",
-    "PLAINLY",
-    "PLAINS",
-    "PLAN",
-    "PLANE",
-    "PLANES",
-    "PLANET",
-    "PLANNED",
-    "PLANNER",
-    "PLANNERS",
-    "PLANNING",
-    "PLANS",
-    "PLANT",
-    "PLANTED",
-    "PLANTING",
-    "PLANTS",
-    "PLASMA",
-    "PLASTER",
-    "PLASTERED",
-    "PLASTERING",
-    "PLASTERS",
-    "PLASTIC",
-    "PLATE",
-    "PLATES",
-    "PLATFORM",
-    "PLATFORMS",
-    "PLATINUM",
-    "PLAY",
-    "PLAYED",
-    "PLAYER",
-    "PLAYERS",
-    "PLAYING",
-    "PLAYS",
-    "PLAYSTATION",
-    "PLAZA",
-    "PLEASANT",
-    "PLEASANTLY",
-    "PLEASANTNESS",
-    "PLEASED",
-    "PLEASES",
-    "PLEASING",
-    "PLEASURE",
-    "PLENTIFUL",
-    "PLENTY",
-    "PLOT",
-    "PLOUGH",
-    "PLOUGHED",
-    "PLOUGHING",
-    "PLOUGHS",
-    "PLUG",
-    "PLUGIN",
-    "PLURAL",
-    "PLURALS",
-    "PM",
-    "PMID",
-    "PO",
-    "POCKET",
-    "POCKETS",
-    "PODCAST",
-    "POEM",
-    "POEMS",
-    "POET",
-    "POETIC",
-    "POETRY",
-    "POINT",
-    "POINTED",
-    "POINTER",
-    "POINTERS",
-    "POINTING",
-    "POINTS",
-    "POISON",
-    "POISONED",
-    "POISONING",
-    "POISONOUS",
-    "POISONS",
-    "POKER",
-    "POLAND",
-    "POLICE",
-    "POLICED",
-    "POLICEMAN",
-    "POLICEMEN",
-    "POLICES",
-    "POLICEWOMEN",
-    "POLICIES",
-    "POLICING",
-    "POLICY",
-    "POLISH",
-    "POLISHED",
-    "POLISHES",
-    "POLISHING",
-    "POLITE",
-    "POLITENESS",
-    "POLITER",
-    "POLITEST",
-    "POLITICAL",
-    "POLITICALLY",
-    "POLITICIAN",
-    "POLITICIANS",
-    "POLITICS",
-    "POLL",
-    "POLLS",
-    "POLLUTION",
-    "POLYPHONIC",
-    "POOL",
-    "POOLING",
-    "POOLS",
-    "POOR",
-    "POORER",
-    "POOREST",
-    "POP",
-    "POPULAR",
-    "POPULARITY",
-    "POPULARLY",
-    "POPULATE",
-    "POPULATED",
-    "POPULATES",
-    "POPULATING",
-    "POPULATION",
-    "POPULATIONS",
-    "PORN",
-    "PORNO",
-    "PORT",
-    "PORTABLE",
-    "PORTAL",
-    "PORTFOLIO",
-    "PORTION",
-    "PORTIONS",
-    "PORTLAND",
-    "PORTS",
-    "PORTUGAL",
-    "POSITION",
-    "POSITIONED",
-    "POSITIONING",
-    "POSITIONS",
-    "POSITIVE",
-    "POSSESS",
-    "POSSESSED",
-    "POSSESSES",
-    "POSSESSING",
-    "POSSESSION",
-    "POSSESSIONS",
-    "POSSIBILITIES",
-    "POSSIBILITY",
-    "POST",
-    "POSTAGE",
-    "POSTAL",
-    "POSTED",
-    "POSTER",
-    "POSTERS",
-    "POSTING",
-    "POSTPONE",
-    "POSTPONED",
-    "POSTPONES",
-    "POSTPONING",
-    "POSTPOSTED",
-    "POSTS",
-    "POT",
-    "POTENTIAL",
-    "POTS",
-    "POTTED",
-    "POTTER",
-    "POTTERY",
-    "POTTING",
-    "POUND",
-    "POUNDS",
-    "POUR",
-    "POURED",
-    "POURING",
-    "POURS",
-    "POVERTY",
-    "POWDER",
-    "POWDERS",
-    "POWDERY",
-    "POWER",
-    "POWERED",
-    "POWERFUL",
-    "POWERS",
-    "PR",
-    "PRACTICAL",
-    "PRACTICALLY",
-    "PRACTICE",
-    "PRACTICES",
-    "PRACTISE",
-    "PRACTISED",
-    "PRACTISES",
-    "PRACTISING",
-    "PRAISE",
-    "PRAISED",
-    "PRAISES",
-    "PRAISING",
-    "PRAY",
-    "PRAYED",
-    "PRAYER",
-    "PRAYERS",
-    "PRAYING",
-    "PRAYS",
-    "PRE",
-    "PREACH",
-    "PREACHED",
-    "PREACHER",
-    "PREACHERS",
-    "PREACHES",
-    "PREACHING",
-    "PRECIOUS",
-    "PRECISION",
-    "PREFER",
-    "PREFERABLE",
-    "PREFERENCE",
-    "PREFERENCES",
-    "PREFERENTIAL",
-    "PREFERRED",
-    "PREFERRING",
-    "PREFERS",
-    "PREGNANCY",
-    "PREGNANT",
-    "PREJUDICE",
-    "PREJUDICED",
-    "PREJUDICES",
-    "PRELIMINARY",
-    "PREMIER",
-    "PREMIUM",
-    "PREPARATION",
-    "PREPARATIONS",
-    "PREPARE",
-    "PREPARED",
-    "PREPARES",
-    "PREPARING",
-    "PRESCRIPTION",
-    "PRESENCE",
-    "PRESENTATION",
-    "PRESENTATIONS",
-    "PRESENTED",
-    "PRESENTING",
-    "PRESENTLY",
-    "PRESENTS",
-    "PRESERVATION",
-    "PRESERVE",
-    "PRESERVED",
-    "PRESERVES",
-    "PRESERVING",
-    "PRESIDENT",
-    "PRESIDENTIAL",
-    "PRESIDENTS",
-    "PRESS",
-    "PRESSED",
-    "PRESSES",
-    "PRESSING",
-    "PRESSURE",
-    "PRESSURED",
-    "PRESSURES",
-    "PRESSURING",
-    "PRETENCE",
-    "PRETEND",
-    "PRETENDED",
-    "PRETENDING",
-    "PRETENDS",
-    "PRETTIER",
-    "PRETTIEST",
-    "PRETTILY",
-    "PRETTINESS",
-    "PRETTY",
-    "PREV",
-    "PREVENT",
-    "PREVENTABLE",
-    "PREVENTATIVE",
-    "PREVENTED",
-    "PREVENTING",
-    "PREVENTION",
-    "PREVENTS",
-    "PREVIEW",
-    "PREVIOUS",
-    "PRICE",
-    "PRICED",
-    "PRICES",
-    "PRICING",
-    "PRIDE",
-    "PRIDES",
-    "PRIEST",
-    "PRIESTS",
-    "PRIMARY",
-    "PRIME",
-    "PRINCE",
-    "PRINCESS",
-    "PRINCIPAL",
-    "PRINCIPLE",
-    "PRINCIPLES",
-    "PRINT",
-    "PRINTABLE",
-    "PRINTED",
-    "PRINTER",
-    "PRINTERS",
-    "PRINTING",
-    "PRINTS",
-    "PRIOR",
-    "PRIORITY",
-    "PRISON",
-    "PRISONER",
-    "PRISONERS",
-    "PRISONS",
-    "PRIVACY",
-    "PRIVATE",
-    "PRIVATELY",
-    "PRIZE",
-    "PRIZED",
-    "PRIZES",
-    "PRO",
-    "PROBABILITIES",
-    "PROBABILITY",
-    "PROBABLE",
-    "PROBLEM",
-    "PROBLEMATIC",
-    "PROBLEMS",
-    "PROCEDURE",
-    "PROCEDURES",
-    "PROCEEDINGS",
-    "PROCESS",
-    "PROCESSED",
-    "PROCESSES",
-    "PROCESSING",
-    "PROCESSION",
-    "PROCESSIONS",
-    "PROCESSOR",
-    "PRODUCE",
-    "PRODUCED",
-    "PRODUCER",
-    "PRODUCERS",
-    "PRODUCES",
-    "PRODUCING",
-    "PRODUCT",
-    "PRODUCTION",
-    "PRODUCTIONS",
-    "PRODUCTIVE",
-    "PRODUCTIVITY",
-    "PRODUCTS",
-    "PROFESSION",
-    "PROFESSIONAL",
-    "PROFESSIONALS",
-    "PROFESSIONS",
-    "PROFESSOR",
-    "PROFILE",
-    "PROFILES",
-    "PROFIT",
-    "PROFITABLE",
-    "PROFITED",
-    "PROFITING",
-    "PROFITS",
-    "PROGRAM",
-    "PROGRAMED",
-    "PROGRAMING",
-    "PROGRAMME",
-    "PROGRAMMED",
-    "PROGRAMMES",
-    "PROGRAMMING",
-    "PROGRAMS",
-    "PROGRESS",
-    "PROGRESSED",
-    "PROGRESSES",
-    "PROGRESSING",
-    "PROGRESSIVE",
-    "PROGRESSIVELY",
-    "PROHIBITED",
-    "PROJECT",
-    "PROJECTS",
-    "PROMISE",
-    "PROMISED",
-    "PROMISES",
-    "PROMISING",
-    "PROMOTE",
-    "PROMOTING",
-    "PROMOTION",
-    "PROMOTIONAL",
-    "PROMOTIONS",
-    "PROMPT",
-    "PROMPTED",
-    "PROMPTING",
-    "PROMPTS",
-    "PRONOUNCE",
-    "PRONOUNCED",
-    "PRONOUNCES",
-    "PRONOUNCING",
-    "PROOF",
-    "PROOFS",
-    "PROPER",
-    "PROPERLY",
-    "PROPERTIES",
-    "PROPERTY",
-    "PROPOSAL",
-    "PROPOSALS",
-    "PROPOSE",
-    "PROPOSED",
-    "PROPOSES",
-    "PROPOSING",
-    "PROTECT",
-    "PROTECTED",
-    "PROTECTING",
-    "PROTECTION",
-    "PROTECTIONS",
-    "PROTECTIVE",
-    "PROTECTS",
-    "PROTEIN",
-    "PROTEINS",
-    "PROTOCOL",
-    "PROUDER",
-    "PROUDEST",
-    "PROUDLY",
-    "PROVE",
-    "PROVED",
-    "PROVEN",
-    "PROVES",
-    "PROVIDE",
-    "PROVIDED",
-    "PROVIDER",
-    "PROVIDERS",
-    "PROVIDING",
-    "PROVINCE",
-    "PROVING",
-    "PROVISION",
-    "PROVISIONS",
-    "PS",
-    "PSP",
-    "PST",
-    "PSYCHOLOGY",
-    "PT",
-    "PUB",
-    "PUBLIC",
-    "PUBLICATION",
-    "PUBLICATIONS",
-    "PUBLICITY",
-    "PUBLICLY",
-    "PUBLISH",
-    "PUBLISHED",
-    "PUBLISHER",
-    "PUBLISHERS",
-    "PUBLISHING",
-    "PUBMED",
-    "PUERTO",
-    "PULL",
-    "PULLED",
-    "PULLING",
-    "PULLS",
-    "PULSE",
-    "PUMP",
-    "PUMPED",
-    "PUMPING",
-    "PUMPS",
-    "PUNCTUAL",
-    "PUNCTUALITY",
-    "PUNCTUALLY",
-    "PUNISH",
-    "PUNISHED",
-    "PUNISHES",
-    "PUNISHING",
-    "PUNISHMENT",
-    "PUNISHMENTS",
-    "PUNK",
-    "PUPIL",
-    "PUPILS",
-    "PURCHASE",
-    "PURCHASED",
-    "PURCHASES",
-    "PURCHASING",
-    "PURE",
-    "PURELY",
-    "PURENESS",
-    "PURER",
-    "PUREST",
-    "PURPLE",
-    "PURPLISH",
-    "PURPOSE",
-    "PURPOSES",
-    "PURSUANT",
-    "PUSH",
-    "PUSHED",
-    "PUSHES",
-    "PUSHING",
-    "PUSSY",
-    "PUTS",
-    "PUTTING",
-    "PUZZLE",
-    "PUZZLED",
-    "PUZZLES",
-    "PUZZLING",
-    "PYTHON",
-    "QTY",
-    "QUALIFICATION",
-    "QUALIFICATIONS",
-    "QUALIFIED",
-    "QUALIFIES",
-    "QUALIFY",
-    "QUALIFYING",
-    "QUALITIES",
-    "QUALITY",
-    "QUANTITIES",
-    "QUANTITY",
-    "QUANTUM",
-    "QUARREL",
-    "QUARRELED",
-    "QUARRELING",
-    "QUARRELLED",
-    "QUARRELLING",
-    "QUARRELS",
-    "QUART",
-    "QUARTER",
-    "QUARTERLY",
-    "QUARTERS",
-    "QUARTS",
-    "QUEBEC",
-    "QUEEN",
-    "QUEENS",
-    "QUERIES",
-    "QUERY",
-    "QUEST",
-    "QUESTION",
-    "QUESTIONABLE",
-    "QUESTIONED",
-    "QUESTIONING",
-    "QUESTIONS",
-    "QUICK",
-    "QUICKER",
-    "QUICKEST",
-    "QUICKNESS",
-    "QUIET",
-    "QUIETER",
-    "QUIETEST",
-    "QUIETLY",
-    "QUIETNESS",
-    "QUIZ",
-    "QUOTE",
-    "QUOTES",
-    "RA",
-    "RABBIT",
-    "RABBITS",
-    "RACE",
-    "RACECOURSE",
-    "RACED",
-    "RACES",
-    "RACING",
-    "RACK",
-    "RADAR",
-    "RADIATION",
-    "RADIO",
-    "RADIOED",
-    "RADIOS",
-    "RAIL",
-    "RAILROAD",
-    "RAILROADS",
-    "RAILS",
-    "RAILWAY",
-    "RAILWAYS",
-    "RAIN",
-    "RAINDROP",
-    "RAINDROPS",
-    "RAINED",
-    "RAINING",
-    "RAINS",
-    "RAISE",
-    "RAISED",
-    "RAISES",
-    "RAISING",
-    "RAKE",
-    "RAKED",
-    "RAKES",
-    "RAKING",
-    "RALPH",
-    "RAM",
-    "RANDOM",
-    "RANG",
-    "RANGE",
-    "RANK",
-    "RANKED",
-    "RANKING",
-    "RANKS",
-    "RAPE",
-    "RAPID",
-    "RAPIDITY",
-    "RAPIDLY",
-    "RARE",
-    "RARELY",
-    "RARENESS",
-    "RARER",
-    "RAREST",
-    "RAT",
-    "RATE",
-    "RATED",
-    "RATES",
-    "RATING",
-    "RATINGS",
-    "RATIO",
-    "RATS",
-    "RAW",
-    "RAWER",
-    "RAWEST",
-    "RAWNESS",
-    "RAY",
-    "RAYS",
-    "RAZOR",
-    "RAZORS",
-    "RC",
-    "REACH",
-    "REACHED",
-    "REACHES",
-    "REACHING",
-    "REACTION",
-    "READ",
-    "READER",
-    "READERS",
-    "READING",
-    "READINGS",
-    "READS",
-    "READY",
-    "REAL",
-    "REALISATION",
-    "REALISATIONS",
-    "REALISE",
-    "REALISED",
-    "REALISES",
-    "REALISING",
-    "REALISTIC",
-    "REALITY",
-    "REALIZATION",
-    "REALIZE",
-    "REALIZED",
-    "REALIZES",
-    "REALIZING",
-    "REAR",
-    "REASON",
-    "REASONABLE",
-    "REASONED",
-    "REASONING",
-    "REASONS",
-    "RECALL",
-    "RECEIPT",
-    "RECEIPTS",
-    "RECEIVE",
-    "RECEIVED",
-    "RECEIVER",
-    "RECEIVES",
-    "RECEIVING",
-    "RECEPTION",
-    "RECIPE",
-    "RECIPES",
-    "RECIPIENT",
-    "RECOGNISE",
-    "RECOGNISED",
-    "RECOGNISES",
-    "RECOGNISING",
-    "RECOGNITION",
-    "RECOGNIZE",
-    "RECOGNIZED",
-    "RECOGNIZES",
-    "RECOGNIZING",
-    "RECOMMEND",
-    "RECOMMENDATION",
-    "RECOMMENDATIONS",
-    "RECOMMENDED",
-    "RECOMMENDING",
-    "RECOMMENDS",
-    "RECONSIDER",
-    "RECONSIDERATION",
-    "RECONSIDERING",
-    "RECORD",
-    "RECORDED",
-    "RECORDER",
-    "RECORDING",
-    "RECORDINGS",
-    "RECORDS",
-    "RECOVERY",
-    "RECREATION",
-    "RECRUITMENT",
-    "RED",
-    "REDDEN",
-    "REDDER",
-    "REDDEST",
-    "REDDISH",
-    "REDNESS",
-    "REDUCE",
-    "REDUCED",
-    "REDUCES",
-    "REDUCING",
-    "REDUCTION",
-    "REDUCTIONS",
-    "REED",
-    "REFER",
-    "REFERENCE",
-    "REFERENCES",
-    "REFERRED",
-    "REFERRING",
-    "REFERS",
-    "REFINANCE",
-    "REFINE",
-    "REFLECT",
-    "REFLECTED",
-    "REFLECTING",
-    "REFLECTION",
-    "REFLECTIONS",
-    "REFLECTIVE",
-    "REFLECTS",
-    "REFORM",
-    "REFRESH",
-    "REFRESHED",
-    "REFRESHES",
-    "REFRESHING",
-    "REFRESHMENT",
-    "REFUND",
-    "REFUSAL",
-    "REFUSALS",
-    "REFUSE",
-    "REFUSED",
-    "REFUSES",
-    "REFUSING",
-    "REG",
-    "REGARD",
-    "REGARDED",
-    "REGION",
-    "REGIONAL",
-    "REGIONS",
-    "REGISTER",
-    "REGISTERED",
-    "REGISTRATION",
-    "REGISTRY",
-    "REGRET",
-    "REGRETFUL",
-    "REGRETS",
-    "REGRETTED",
-    "REGRETTING",
-    "REGULAR",
-    "REGULARLY",
-    "REGULATION",
-    "REGULATIONS",
-    "REGULATORY",
-    "REHABILITATION",
-    "REJOICE",
-    "REJOICED",
-    "REJOICES",
-    "REJOICING",
-    "RELATE",
-    "RELATES",
-    "RELATING",
-    "RELATION",
-    "RELATIONS",
-    "RELATIONSHIP",
-    "RELATIONSHIPS",
-    "RELATIVE",
-    "RELATIVES",
-    "RELEASE",
-    "RELEASED",
-    "RELEASES",
-    "RELEVANT",
-    "RELIABILITY",
-    "RELIABLE",
-    "RELIEF",
-    "RELIEVE",
-    "RELIEVED",
-    "RELIEVES",
-    "RELIEVING",
-    "RELIGION",
-    "RELIGIONS",
-    "RELIGIOUS",
-    "REMAIN",
-    "REMAINDER",
-    "REMAINDERS",
-    "REMAINED",
-    "REMAINING",
-    "REMAINS",
-    "REMARK",
-    "REMARKABLE",
-    "REMARKABLY",
-    "REMARKED",
-    "REMARKING",
-    "REMARKS",
-    "REMEDIED",
-    "REMEDIES",
-    "REMEDY",
-    "REMEDYING",
-    "REMEMBER",
-    "REMEMBERED",
-    "REMEMBERING",
-    "REMEMBERS",
-    "REMIND",
-    "REMINDED",
-    "REMINDER",
-    "REMINDING",
-    "REMINDS",
-    "REMOTE",
-    "REMOVAL",
-    "REMOVE",
-    "REMOVED",
-    "RENEW",
-    "RENEWED",
-    "RENEWING",
-    "RENEWS",
-    "RENT",
-    "RENTAL",
-    "RENTALS",
-    "RENTED",
-    "RENTING",
-    "RENTS",
-    "REP",
-    "REPAID",
-    "REPAIR",
-    "REPAIRED",
-    "REPAIRING",
-    "REPAIRS",
-    "REPEAT",
-    "REPEATED",
-    "REPEATEDLY",
-    "REPEATING",
-    "REPEATS",
-    "REPLACE",
-    "REPLACEABLE",
-    "REPLACED",
-    "REPLACEMENT",
-    "REPLACEMENTS",
-    "REPLACES",
-    "REPLACING",
-    "REPLAY",
-    "REPLAYED",
-    "REPLAYING",
-    "REPLAYS",
-    "REPLIED",
-    "REPLIES",
-    "REPLY",
-    "REPLYING",
-    "REPORT",
-    "REPORTED",
-    "REPORTER",
-    "REPORTERS",
-    "REPORTING",
-    "REPORTS",
-    "REPRESENT",
-    "REPRESENTATION",
-    "REPRESENTATIONS",
-    "REPRESENTATIVE",
-    "REPRESENTATIVES",
-    "REPRESENTED",
-    "REPRESENTING",
-    "REPRESENTS",
-    "REPRINT",
-    "REPRINTED",
-    "REPRINTING",
-    "REPRINTS",
-    "REPRODUCE",
-    "REPRODUCED",
-    "REPRODUCES",
-    "REPRODUCING",
-    "REPRODUCTION",
-    "REPRODUCTIONS",
-    "REPUBLIC",
-    "REPUBLICAN",
-    "REPUBLICANISM",
-    "REPUBLICANS",
-    "REPUBLICS",
-    "REPUTATION",
-    "REPUTATIONS",
-    "REQUEST",
-    "REQUESTED",
-    "REQUESTING",
-    "REQUESTS",
-    "REQUIRE",
-    "REQUIRED",
-    "REQUIREMENT",
-    "REQUIREMENTS",
-    "REQUIRES",
-    "REQUIRING",
-    "RES",
-    "RESCUE",
-    "RESCUED",
-    "RESCUES",
-    "RESCUING",
-    "RESEARCHERS",
-    "RESELL",
-    "RESELLING",
-    "RESERVATION",
-    "RESERVATIONS",
-    "RESERVE",
-    "RESERVED",
-    "RESERVES",
-    "RESERVING",
-    "RESIDENCE",
-    "RESIDENT",
-    "RESIDENTIAL",
-    "RESIDENTS",
-    "RESIGN",
-    "RESIGNATION",
-    "RESIGNATIONS",
-    "RESIGNED",
-    "RESIGNING",
-    "RESIGNS",
-    "RESIST",
-    "RESISTANCE",
-    "RESISTED",
-    "RESISTIBLE",
-    "RESISTING",
-    "RESISTS",
-    "RESOLD",
-    "RESOLUTION",
-    "RESORT",
-    "RESORTS",
-    "RESOURCE",
-    "RESOURCES",
-    "RESPECT",
-    "RESPECTABLE",
-    "RESPECTED",
-    "RESPECTFUL",
-    "RESPECTFULLY",
-    "RESPECTING",
-    "RESPECTIVE",
-    "RESPECTS",
-    "RESPOND",
-    "RESPONSE",
-    "RESPONSES",
-    "RESPONSIBILITIES",
-    "RESPONSIBILITY",
-    "RESPONSIBLE",
-    "REST",
-    "RESTAURANT",
-    "RESTAURANTS",
-    "RESTED",
-    "RESTING",
-    "RESTLESS",
-    "RESTLESSNESS",
-    "RESTORATION",
-    "RESTRICTED",
-    "RESTRICTIONS",
-    "RESTS",
-    "RESULT",
-    "RESUME",
-    "RETAIL",
-    "RETELL",
-    "RETELLING",
-    "RETIRE",
-    "RETIRED",
-    "RETIREMENT",
-    "RETIRES",
-    "RETIRING",
-    "RETURN",
-    "RETURNED",
-    "RETURNING",
-    "RETURNS",
-    "REV",
-    "REVEALED",
-    "REVENGE",
-    "REVENGES",
-    "REVENUE",
-    "REVENUES",
-    "REVERSE",
-    "REVIEW",
-    "REVIEWED",
-    "REVIEWER",
-    "REVIEWING",
-    "REVIEWS",
-    "REVISED",
-    "REVISION",
-    "REVOLUTION",
-    "REWARD",
-    "REWARDED",
-    "REWARDING",
-    "REWARDS",
-    "RF",
-    "RHODE",
-    "RI",
-    "RIBBON",
-    "RIBBONS",
-    "RICA",
-    "RICE",
-    "RICH",
-    "RICHARD",
-    "RICHER",
-    "RICHES",
-    "RICHEST",
-    "RICHLY",
-    "RICHMOND",
-    "RICHNESS",
-    "RICK",
-    "RICO",
-    "RID",
-    "RIDDED",
-    "RIDDEN",
-    "RIDDING",
-    "RIDE",
-    "RIDER",
-    "RIDERS",
-    "RIDES",
-    "RIDGE",
-    "RIDING",
-    "RIDS",
-    "RIGHTFUL",
-    "RIGHTFULLY",
-    "RIGHTIST",
-    "RIGHTISTS",
-    "RIGHTLY",
-    "RIGHTS",
-    "RING",
-    "RINGED",
-    "RINGING",
-    "RINGS",
-    "RINGTONE",
-    "RINGTONES",
-    "RIO",
-    "RIPE",
-    "RIPENESS",
-    "RIPER",
-    "RIPEST",
-    "RISE",
-    "RISES",
-    "RISING",
-    "RISK",
-    "RISKED",
-    "RISKING",
-    "RISKS",
-    "RISKY",
-    "RIVAL",
-    "RIVALLED",
-    "RIVALLING",
-    "RIVALRIES",
-    "RIVALRY",
-    "RIVALS",
-    "RIVER",
-    "RIVERS",
-    "RIVERSIDE",
-    "RM",
-    "ROAD",
-    "ROADS",
-    "ROADSIDE",
-    "ROAR",
-    "ROARED",
-    "ROARING",
-    "ROARS",
-    "ROAST",
-    "ROASTED",
-    "ROASTING",
-    "ROASTS",
-    "ROB",
-    "ROBBED",
-    "ROBBER",
-    "ROBBERS",
-    "ROBBING",
-    "ROBERT",
-    "ROBERTS",
-    "ROBOT",
-    "ROBS",
-    "ROCK",
-    "ROCKED",
-    "ROCKING",
-    "ROCKS",
-    "ROCKY",
-    "ROD",
-    "RODE",
-    "RODS",
-    "ROGER",
-    "ROLE",
-    "ROLES",
-    "ROLL",
-    "ROLLED",
-    "ROLLER",
-    "ROLLERS",
-    "ROLLING",
-    "ROLLS",
-    "ROM",
-    "ROMAN",
-    "ROMANCE",
-    "ROMANIA",
-    "ROMANTIC",
-    "ROME",
-    "RON",
-    "ROOF",
-    "ROOFS",
-    "ROOM",
-    "ROOMS",
-    "ROOT",
-    "ROOTED",
-    "ROOTS",
-    "ROPE",
-    "ROPES",
-    "ROSE",
-    "ROSES",
-    "ROSS",
-    "ROT",
-    "ROTS",
-    "ROTTED",
-    "ROTTEN",
-    "ROTTING",
-    "ROUGH",
-    "ROUGHLY",
-    "ROUGHNESS",
-    "ROUND",
-    "ROUNDABOUT",
-    "ROUNDED",
-    "ROUNDER",
-    "ROUNDEST",
-    "ROUNDLY",
-    "ROUNDNESS",
-    "ROUNDS",
-    "ROUTE",
-    "ROUTER",
-    "ROUTINE",
-    "ROW",
-    "ROWED",
-    "ROWING",
-    "ROWS",
-    "ROY",
-    "ROYAL",
-    "ROYALLY",
-    "ROYALTY",
-    "RPM",
-    "RS",
-    "RSS",
-    "RT",
-    "RUB",
-    "RUBBED",
-    "RUBBER",
-    "RUBBERS",
-    "RUBBING",
-    "RUBBISH",
-    "RUBS",
-    "RUDE",
-    "RUDELY",
-    "RUDENESS",
-    "RUDER",
-    "RUDEST",
-    "RUG",
-    "RUGBY",
-    "RUGS",
-    "RUIN",
-    "RUINED",
-    "RUINING",
-    "RUINS",
-    "RULE",
-    "RULED",
-    "RULER",
-    "RULERS",
-    "RULES",
-    "RULING",
-    "RUNG",
-    "RUNNER",
-    "RUNNERS",
-    "RUNNING",
-    "RUNS",
-    "RURAL",
-    "RUSH",
-    "RUSHED",
-    "RUSHES",
-    "RUSHING",
-    "RUSSELL",
-    "RUSSIA",
-    "RUSSIAN",
-    "RUST",
-    "RUSTED",
-    "RUSTING",
-    "RUSTS",
-    "RUSTY",
-    "RV",
-    "RW",
-    "RYAN",
-    "SA",
-    "SACRAMENTO",
-    "SACRED",
-    "SACREDNESS",
-    "SACRIFICE",
-    "SACRIFICED",
-    "SACRIFICES",
-    "SACRIFICIAL",
-    "SACRIFICING",
-    "SAD",
-    "SADDEN",
-    "SADDER",
-    "SADDEST",
-    "SADDLE",
-    "SADDLED",
-    "SADDLES",
-    "SADDLING",
-    "SADLY",
-    "SADNESS",
-    "SAFARI",
-    "SAFE",
-    "SAFELY",
-    "SAFENESS",
-    "SAFER",
-    "SAFEST",
-    "SAFETY",
-    "SAIL",
-    "SAILED",
-    "SAILING",
-    "SAILINGS",
-    "SAILOR",
-    "SAILORS",
-    "SAILS",
-    "SAINT",
-    "SAKE",
-    "SAKES",
-    "SALARIES",
-    "SALARY",
-    "SALE",
-    "SALES",
-    "SALT",
-    "SALTY",
-    "SAM",
-    "SAMENESS",
-    "SAMPLE",
-    "SAMPLED",
-    "SAMPLES",
-    "SAMPLING",
-    "SAMSUNG",
-    "SAMUEL",
-    "SAN",
-    "SAND",
-    "SANDS",
-    "SANDY",
-    "SANG",
-    "SANK",
-    "SANTA",
-    "SARAH",
-    "SAT",
-    "SATELLITE",
-    "SATISFACTION",
-    "SATISFACTORY",
-    "SATISFIED",
-    "SATISFIES",
-    "SATISFY",
-    "SATISFYING",
-    "SATURDAY",
-    "SATURDAYS",
-    "SAUCE",
-    "SAUCER",
-    "SAUCERS",
-    "SAUCES",
-    "SAUDI",
-    "SAVE",
-    "SAVED",
-    "SAVES",
-    "SAVING",
-    "SAVINGS",
-    "SAWED",
-    "SAWING",
-    "SAWS",
-    "SB",
-    "SC",
-    "SCALE",
-    "SCALES",
-    "SCAN",
-    "SCANNER",
-    "SCARCE",
-    "SCARCELY",
-    "SCARCER",
-    "SCARCEST",
-    "SCARCITY",
-    "SCATTER",
-    "SCATTERED",
-    "SCATTERING",
-    "SCATTERS",
-    "SCENE",
-    "SCENERY",
-    "SCENES",
-    "SCENT",
-    "SCENTED",
-    "SCENTING",
-    "SCENTS",
-    "SCHEDULE",
-    "SCHEDULED",
-    "SCHEDULES",
-    "SCHEME",
-    "SCHOLARSHIP",
-    "SCHOOL",
-    "SCHOOLING",
-    "SCHOOLS",
-    "SCI",
-    "SCIENCE",
-    "SCIENCES",
-    "SCIENTIFIC",
-    "SCIENTIFICALLY",
-    "SCIENTIST",
-    "SCIENTISTS",
-    "SCISSORS",
-    "SCOLD",
-    "SCOLDED",
-    "SCOLDING",
-    "SCOLDS",
-    "SCOPE",
-    "SCORE",
-    "SCORES",
-    "SCORN",
-    "SCORNED",
-    "SCORNFUL",
-    "SCORNFULLY",
-    "SCORNING",
-    "SCORNS",
-    "SCOTLAND",
-    "SCOTT",
-    "SCOTTISH",
-    "SCRAPE",
-    "SCRAPED",
-    "SCRAPES",
-    "SCRAPING",
-    "SCRATCH",
-    "SCRATCHED",
-    "SCRATCHES",
-    "SCRATCHING",
-    "SCREEN",
-    "SCREENED",
-    "SCREENING",
-    "SCREENS",
-    "SCREW",
-    "SCREWED",
-    "SCREWING",
-    "SCREWS",
-    "SCRIPT",
-    "SCRIPTS",
-    "SD",
-    "SE",
-    "SEA",
-    "SEAL",
-    "SEALED",
-    "SEAMAN",
-    "SEAMEN",
-    "SEAN",
-    "SEARCH",
-    "SEARCHED",
-    "SEARCHES",
-    "SEARCHING",
-    "SEAS",
-    "SEASIDE",
-    "SEASON",
-    "SEASONS",
-    "SEAT",
-    "SEATED",
-    "SEATING",
-    "SEATS",
-    "SEATTLE",
-    "SECONDARY",
-    "SECONDS",
-    "SECRECY",
-    "SECRET",
-    "SECRETARIES",
-    "SECRETARY",
-    "SECRETLY",
-    "SECRETS",
-    "SECTIONS",
-    "SECTOR",
-    "SECTORS",
-    "SECURE",
-    "SECURED",
-    "SECURITIES",
-    "SECURITY",
-    "SEED",
-    "SEEDED",
-    "SEEDING",
-    "SEEDLING",
-    "SEEDS",
-    "SEEK",
-    "SEEKER",
-    "SEEKING",
-    "SEES",
-    "SEGMENT",
-    "SEIZE",
-    "SEIZED",
-    "SEIZES",
-    "SEIZING",
-    "SELDOM",
-    "SELECT",
-    "SELECTED",
-    "SELECTION",
-    "SELFISH",
-    "SELFISHLY",
-    "SELFISHNESS",
-    "SELL",
-    "SELLER",
-    "SELLERS",
-    "SELLING",
-    "SELLS",
-    "SEMESTER",
-    "SEMI",
-    "SEMINAR",
-    "SEMINARS",
-    "SENATE",
-    "SENATOR",
-    "SEND",
-    "SENDER",
-    "SENDERS",
-    "SENDING",
-    "SENDS",
-    "SENIOR",
-    "SENSE",
-    "SENSELESS",
-    "SENSELESSNESS",
-    "SENSES",
-    "SENSITIVE",
-    "SENSITIVITY",
-    "SENSOR",
-    "SENTENCE",
-    "SENTENCES",
-    "SEP",
-    "SEPARATE",
-    "SEPARATED",
-    "SEPARATELY",
-    "SEPARATES",
-    "SEPARATING",
-    "SEPARATION",
-    "SEPARATIONS",
-    "SEPARATIST",
-    "SEPARATISTS",
-    "SEPT",
-    "SEPTEMBER",
-    "SEQUENCE",
-    "SERIAL",
-    "SERIES",
-    "SERIOUSNESS",
-    "SERVANT",
-    "SERVANTS",
-    "SERVE",
-    "SERVED",
-    "SERVER",
-    "SERVERS",
-    "SERVES",
-    "SERVICE",
-    "SERVICED",
-    "SERVICES",
-    "SERVICING",
-    "SERVING",
-    "SERVINGS",
-    "SESSION",
-    "SESSIONS",
-    "SET",
-    "SETS",
-    "SETTING",
-    "SETTINGS",
-    "SETTLE",
-    "SETTLED",
-    "SETTLEMENT",
-    "SETTLEMENTS",
-    "SETTLER",
-    "SETTLERS",
-    "SETTLES",
-    "SETTLING",
-    "SETUP",
-    "SEVENTEEN",
-    "SEVENTEENTH",
-    "SEVENTH",
-    "SEVENTIES",
-    "SEVENTIETH",
-    "SEVENTY",
-    "SEVERE",
-    "SEVERELY",
-    "SEVERENESS",
-    "SEVERER",
-    "SEVEREST",
-    "SEVERITY",
-    "SEW",
-    "SEWED",
-    "SEWING",
-    "SEWN",
-    "SEWS",
-    "SEX",
-    "SEXCAM",
-    "SEXO",
-    "SEXUAL",
-    "SEXY",
-    "SF",
-    "SH",
-    "SHADE",
-    "SHADED",
-    "SHADES",
-    "SHADING",
-    "SHADINGS",
-    "SHADOW",
-    "SHADOWED",
-    "SHADOWING",
-    "SHADOWS",
-    "SHADOWY",
-    "SHAKE",
-    "SHAKEN",
-    "SHAKES",
-    "SHAKILY",
-    "SHAKING",
-    "SHAKY",
-    "SHALLOW",
-    "SHALLOWER",
-    "SHALLOWEST",
-    "SHALLOWNESS",
-    "SHAME",
-    "SHAMED",
-    "SHAMEFUL",
-    "SHAMEFULLY",
-    "SHAMES",
-    "SHAMING",
-    "SHAPE",
-    "SHAPED",
-    "SHAPELESS",
-    "SHAPES",
-    "SHAPING",
-    "SHARE",
-    "SHARED",
-    "SHARES",
-    "SHAREWARE",
-    "SHARING",
-    "SHARP",
-    "SHARPEN",
-    "SHARPENED",
-    "SHARPENING",
-    "SHARPENS",
-    "SHARPER",
-    "SHARPEST",
-    "SHARPLY",
-    "SHARPNESS",
-    "SHAVE",
-    "SHAVED",
-    "SHAVES",
-    "SHAVING",
-    "SHEEP",
-    "SHEET",
-    "SHEETS",
-    "SHELF",
-    "SHELL",
-    "SHELLED",
-    "SHELLING",
-    "SHELLS",
-    "SHELTER",
-    "SHELTERED",
-    "SHELTERING",
-    "SHELTERS",
-    "SHELVES",
-    "SHEMALE",
-    "SHIELD",
-    "SHIELDED",
-    "SHIELDING",
-    "SHIELDS",
-    "SHIFT",
-    "SHILLING",
-    "SHILLINGS",
-    "SHINE",
-    "SHINED",
-    "SHINES",
-    "SHINING",
-    "SHINY",
-    "SHIP",
-    "SHIPMENT",
-    "SHIPMENTS",
-    "SHIPPED",
-    "SHIPPING",
-    "SHIPS",
-    "SHIRT",
-    "SHIRTS",
-    "SHIT",
-    "SHOCK",
-    "SHOCKED",
-    "SHOCKING",
-    "SHOCKS",
-    "SHOE",
-    "SHOED",
-    "SHOEING",
-    "SHOES",
-    "SHONE",
-    "SHOOK",
-    "SHOOT",
-    "SHOOTING",
-    "SHOOTINGS",
-    "SHOOTS",
-    "SHOP",
-    "SHOPPED",
-    "SHOPPER",
-    "SHOPPERS",
-    "SHOPPING",
-    "SHOPS",
-    "SHORE",
-    "SHORES",
-    "SHORTAGE",
-    "SHORTEN",
-    "SHORTENED",
-    "SHORTENING",
-    "SHORTENS",
-    "SHORTER",
-    "SHORTEST",
-    "SHORTLY",
-    "SHORTNESS",
-    "SHORTS",
-    "SHOT",
-    "SHOTS",
-    "SHOULDER",
-    "SHOULDERS",
-    "SHOUT",
-    "SHOUTED",
-    "SHOUTING",
-    "SHOUTS",
-    "SHOWER",
-    "SHOWERED",
-    "SHOWERING",
-    "SHOWERS",
-    "SHOWING",
-    "SHOWTIMES",
-    "SHUT",
-    "SHUTS",
-    "SHUTTING",
-    "SI",
-    "SICK",
-    "SICKER",
-    "SICKEST",
-    "SICKLY",
-    "SICKNESS",
-    "SIDE",
-    "SIDES",
-    "SIEMENS",
-    "SIERRA",
-    "SIGHT",
-    "SIGHTS",
-    "SIGMA",
-    "SIGN",
-    "SIGNAL",
-    "SIGNALLED",
-    "SIGNALLING",
-    "SIGNALS",
-    "SIGNATURE",
-    "SIGNATURES",
-    "SIGNED",
-    "SIGNING",
-    "SIGNS",
-    "SILENCE",
-    "SILENCED",
-    "SILENCES",
-    "SILENCING",
-    "SILENT",
-    "SILENTLY",
-    "SILK",
-    "SILKS",
-    "SILVER",
-    "SIMON",
-    "SIMPLE",
-    "SIMPLENESS",
-    "SIMPLER",
-    "SIMPLEST",
-    "SIMPLICITY",
-    "SIMPLIFICATION",
-    "SIMPLIFIED",
-    "SIMPLIFY",
-    "SIMPLY",
-    "SIMPSON",
-    "SIMULATION",
-    "SIN",
-    "SINCERE",
-    "SINCERELY",
-    "SINCERITY",
-    "SING",
-    "SINGAPORE",
-    "SINGER",
-    "SINGERS",
-    "SINGING",
-    "SINGLE",
-    "SINGLED",
-    "SINGLES",
-    "SINGS",
-    "SINK",
-    "SINKING",
-    "SINKS",
-    "SIR",
-    "SISTER",
-    "SISTERLY",
-    "SISTERS",
-    "SIT",
-    "SITE",
-    "SITEMAP",
-    "SITES",
-    "SITS",
-    "SITTING",
-    "SITUATE",
-    "SITUATED",
-    "SITUATION",
-    "SITUATIONS",
-    "SIXES",
-    "SIXTEEN",
-    "SIXTEENTH",
-    "SIXTEENTHS",
-    "SIXTH",
-    "SIXTHLY",
-    "SIXTHS",
-    "SIXTIES",
-    "SIXTIETH",
-    "SIXTIETHS",
-    "SIXTY",
-    "SIZE",
-    "SIZED",
-    "SIZES",
-    "SIZING",
-    "SKI",
-    "SKIES",
-    "SKILFUL",
-    "SKILFULLY",
-    "SKILL",
-    "SKILLED",
-    "SKILLS",
-    "SKIN",
-    "SKINNED",
-    "SKINNING",
-    "SKINS",
-    "SKIP",
-    "SKIRT",
-    "SKIRTS",
-    "SKY",
-    "SLAVE",
-    "SLAVERY",
-    "SLAVES",
-    "SLEEP",
-    "SLEEPING",
-    "SLEEPLESS",
-    "SLEEPS",
-    "SLEEPY",
-    "SLEPT",
-    "SLID",
-    "SLIDE",
-    "SLIDES",
-    "SLIDING",
-    "SLIGHT",
-    "SLIGHTED",
-    "SLIGHTER",
-    "SLIGHTEST",
-    "SLIGHTING",
-    "SLIGHTS",
-    "SLIP",
-    "SLIPPED",
-    "SLIPPING",
-    "SLIPS",
-    "SLOPE",
-    "SLOPED",
-    "SLOPES",
-    "SLOPING",
-    "SLOT",
-    "SLOTS",
-    "SLOW",
-    "SLOWED",
-    "SLOWER",
-    "SLOWEST",
-    "SLOWING",
-    "SLOWLY",
-    "SLOWS",
-    "SM",
-    "SMALL",
-    "SMALLER",
-    "SMALLEST",
-    "SMALLNESS",
-    "SMART",
-    "SMELL",
-    "SMELLED",
-    "SMELLING",
-    "SMELLS",
-    "SMELT",
-    "SMILE",
-    "SMILED",
-    "SMILES",
-    "SMILING",
-    "SMITH",
-    "SMOKE",
-    "SMOKED",
-    "SMOKELESS",
-    "SMOKERS",
-    "SMOKES",
-    "SMOKING",
-    "SMOOTH",
-    "SMOOTHED",
-    "SMOOTHING",
-    "SMOOTHLY",
-    "SMOOTHS",
-    "SMS",
-    "SNAKE",
-    "SNAKES",
-    "SNOW",
-    "SNOWED",
-    "SNOWING",
-    "SNOWS",
-    "SOAP",
-    "SOAPS",
-    "SOCCER",
-    "SOCIAL",
-    "SOCIALLY",
-    "SOCIETIES",
-    "SOCIETY",
-    "SOCK",
-    "SOCKET",
-    "SOCKS",
-    "SOFT",
-    "SOFTEN",
-    "SOFTENED",
-    "SOFTENING",
-    "SOFTENS",
-    "SOFTER",
-    "SOFTEST",
-    "SOFTLY",
-    "SOFTNESS",
-    "SOFTWARE",
-    "SOIL",
-    "SOILED",
-    "SOILING",
-    "SOILS",
-    "SOLAR",
-    "SOLD",
-    "SOLDIER",
-    "SOLDIERS",
-    "SOLE",
-    "SOLEMN",
-    "SOLEMNLY",
-    "SOLID",
-    "SOLIDIFY",
-    "SOLIDLY",
-    "SOLIDS",
-    "SOLO",
-    "SOLUTION",
-    "SOLUTIONS",
-    "SOLVE",
-    "SOLVED",
-    "SOLVES",
-    "SOLVING",
-    "SON",
-    "SONG",
-    "SONGS",
-    "SONS",
-    "SONY",
-    "SOONER",
-    "SOONEST",
-    "SORE",
-    "SORES",
-    "SORRIER",
-    "SORRIEST",
-    "SORRINESS",
-    "SORT",
-    "SORTED",
-    "SORTING",
-    "SORTS",
-    "SOUGHT",
-    "SOUL",
-    "SOULS",
-    "SOUND",
-    "SOUNDED",
-    "SOUNDING",
-    "SOUNDS",
-    "SOUP",
-    "SOUPS",
-    "SOUR",
-    "SOURCE",
-    "SOURCES",
-    "SOURED",
-    "SOURING",
-    "SOURLY",
-    "SOURS",
-    "SOUTH",
-    "SOUTHEAST",
-    "SOUTHERN",
-    "SOUTHERNERS",
-    "SOUTHWARD",
-    "SOUTHWARDS",
-    "SOUTHWEST",
-    "SOW",
-    "SOWED",
-    "SOWING",
-    "SOWS",
-    "SP",
-    "SPA",
-    "SPACE",
-    "SPACED",
-    "SPACES",
-    "SPACING",
-    "SPADE",
-    "SPADES",
-    "SPAIN",
-    "SPAM",
-    "SPANISH",
-    "SPANKING",
-    "SPARE",
-    "SPARED",
-    "SPARES",
-    "SPARING",
-    "SPAT",
-    "SPEAK",
-    "SPEAKER",
-    "SPEAKERS",
-    "SPEAKING",
-    "SPEAKS",
-    "SPECIAL",
-    "SPECIALIST",
-    "SPECIALISTS",
-    "SPECIALITIES",
-    "SPECIALITY",
-    "SPECIALIZATION",
-    "SPECIALIZATIONS",
-    "SPECIALIZE",
-    "SPECIALIZED",
-    "SPECIALLY",
-    "SPECIALS",
-    "SPECIALTY",
-    "SPECIES",
-    "SPECIFIC",
-    "SPECIFICATION",
-    "SPECIFICATIONS",
-    "SPECS",
-    "SPECTRUM",
-    "SPED",
-    "SPEECH",
-    "SPEECHES",
-    "SPEED",
-    "SPEEDING",
-    "SPEEDS",
-    "SPEEDY",
-    "SPELL",
-    "SPELLED",
-    "SPELLING",
-    "SPELLS",
-    "SPELT",
-    "SPEND",
-    "SPENDING",
-    "SPENDS",
-    "SPENT",
-    "SPILL",
-    "SPILLED",
-    "SPILLING",
-    "SPILLS",
-    "SPIN",
-    "SPINNING",
-    "SPINS",
-    "SPIRIT",
-    "SPIRITS",
-    "SPIRITUAL",
-    "SPIT",
-    "SPITE",
-    "SPITS",
-    "SPITTING",
-    "SPLENDID",
-    "SPLENDIDLY",
-    "SPLIT",
-    "SPLITS",
-    "SPLITTING",
-    "SPOIL",
-    "SPOILED",
-    "SPOILING",
-    "SPOILS",
-    "SPOKE",
-    "SPOKEN",
-    "SPONSOR",
-    "SPONSORED",
-    "SPONSORS",
-    "SPOON",
-    "SPOONFUL",
-    "SPOONS",
-    "SPORT",
-    "SPORTING",
-    "SPORTS",
-    "SPOT",
-    "SPOTS",
-    "SPOTTED",
-    "SPOTTING",
-    "SPRANG",
-    "SPRAY",
-    "SPREAD",
-    "SPREADING",
-    "SPREADS",
-    "SPRING",
-    "SPRINGING",
-    "SPRINGS",
-    "SPRUNG",
-    "SPUN",
-    "SPY",
-    "SPYWARE",
-    "SQL",
-    "SQUARE",
-    "SQUARELY",
-    "SQUARENESS",
-    "SQUARER",
-    "SQUARES",
-    "SQUAREST",
-    "SR",
-    "SRC",
-    "SRI",
-    "SS",
-    "ST",
-    "STABILITY",
-    "STABLE",
-    "STAFF",
-    "STAFFS",
-    "STAGE",
-    "STAGED",
-    "STAGES",
-    "STAGING",
-    "STAIN",
-    "STAINED",
-    "STAINING",
-    "STAINLESS",
-    "STAINS",
-    "STAIRS",
-    "STAMP",
-    "STAMPED",
-    "STAMPING",
-    "STAMPS",
-    "STAND",
-    "STANDARD",
-    "STANDARDS",
-    "STANDING",
-    "STANDS",
-    "STAR",
-    "STARRED",
-    "STARRING",
-    "STARS",
-    "START",
-    "STARTED",
-    "STARTING",
-    "STARTS",
-    "STATE",
-    "STATED",
-    "STATEMENT",
-    "STATEMENTS",
-    "STATES",
-    "STATIC",
-    "STATING",
-    "STATION",
-    "STATIONS",
-    "STATISTICAL",
-    "STATISTICS",
-    "STATS",
-    "STATUS",
-    "STAY",
-    "STAYED",
-    "STAYING",
-    "STAYS",
-    "STEADIED",
-    "STEADIES",
-    "STEADILY",
-    "STEADY",
-    "STEADYING",
-    "STEAL",
-    "STEALING",
-    "STEALS",
-    "STEAM",
-    "STEAMED",
-    "STEAMING",
-    "STEAMS",
-    "STEEL",
-    "STEEP",
-    "STEEPER",
-    "STEEPEST",
-    "STEEPNESS",
-    "STEER",
-    "STEERED",
-    "STEERING",
-    "STEERS",
-    "STEM",
-    "STEMMED",
-    "STEMS",
-    "STEP",
-    "STEPHEN",
-    "STEPPED",
-    "STEPPING",
-    "STEPS",
-    "STEREO",
-    "STERLING",
-    "STEVE",
-    "STEVEN",
-    "STEWART",
-    "STICK",
-    "STICKING",
-    "STICKS",
-    "STIFF",
-    "STIFFEN",
-    "STIFFENED",
-    "STIFFENING",
-    "STIFFENS",
-    "STIFFER",
-    "STIFFEST",
-    "STIFFNESS",
-    "STILLER",
-    "STILLEST",
-    "STILLNESS",
-    "STING",
-    "STINGING",
-    "STINGS",
-    "STIR",
-    "STIRRED",
-    "STIRRING",
-    "STIRS",
-    "STOCK",
-    "STOCKED",
-    "STOCKING",
-    "STOCKINGS",
-    "STOCKS",
-    "STOLE",
-    "STOLEN",
-    "STOMACH",
-    "STOMACHS",
-    "STONE",
-    "STONED",
-    "STONES",
-    "STONING",
-    "STONY",
-    "STOOD",
-    "STOPPED",
-    "STOPPING",
-    "STOPS",
-    "STORAGE",
-    "STORE",
-    "STORED",
-    "STORES",
-    "STORIES",
-    "STORING",
-    "STORM",
-    "STORMED",
-    "STORMING",
-    "STORMS",
-    "STORY",
-    "STOVE",
-    "STOVES",
-    "STRAIGHT",
-    "STRAIGHTENED",
-    "STRAIGHTENING",
-    "STRAIGHTENS",
-    "STRAIGHTER",
-    "STRAIGHTEST",
-    "STRANGE",
-    "STRANGELY",
-    "STRANGENESS",
-    "STRANGER",
-    "STRANGERS",
-    "STRANGEST",
-    "STRAP",
-    "STRAPPED",
-    "STRAPPING",
-    "STRAPS",
-    "STRATEGIC",
-    "STRATEGIES",
-    "STRATEGY",
-    "STRAW",
-    "STRAWS",
-    "STREAM",
-    "STREAMED",
-    "STREAMING",
-    "STREAMS",
-    "STREET",
-    "STREETS",
-    "STRENGTH",
-    "STRENGTHEN",
-    "STRENGTHENED",
-    "STRENGTHENING",
-    "STRENGTHENS",
-    "STRESS",
-    "STRETCH",
-    "STRETCHED",
-    "STRETCHES",
-    "STRETCHING",
-    "STRICT",
-    "STRICTER",
-    "STRICTEST",
-    "STRICTLY",
-    "STRICTNESS",
-    "STRIKE",
-    "STRIKES",
-    "STRIKING",
-    "STRING",
-    "STRINGED",
-    "STRINGING",
-    "STRINGS",
-    "STRIP",
-    "STRIPE",
-    "STRIPED",
-    "STRIPES",
-    "STRIPING",
-    "STRIPPED",
-    "STRIPPING",
-    "STRIPS",
-    "STROKE",
-    "STRONG",
-    "STRONGER",
-    "STRONGEST",
-    "STRUCK",
-    "STRUCT",
-    "STRUCTURAL",
-    "STRUCTURE",
-    "STRUCTURES",
-    "STRUGGLE",
-    "STRUGGLED",
-    "STRUGGLES",
-    "STRUGGLING",
-    "STUCK",
-    "STUDENT",
-    "STUDENTS",
-    "STUDIED",
-    "STUDIES",
-    "STUDIO",
-    "STUDIOS",
-    "STUDY",
-    "STUDYING",
-    "STUFF",
-    "STUFFED",
-    "STUFFING",
-    "STUFFS",
-    "STUNG",
-    "STUPID",
-    "STUPIDER",
-    "STUPIDEST",
-    "STUPIDITY",
-    "STUPIDLY",
-    "STYLE",
-    "STYLES",
-    "SU",
-    "SUBJECT",
-    "SUBJECTED",
-    "SUBJECTING",
-    "SUBJECTS",
-    "SUBLIME",
-    "SUBMISSION",
-    "SUBMIT",
-    "SUBMITTED",
-    "SUBSCRIBE",
-    "SUBSCRIPTION",
-    "SUBSCRIPTIONS",
-    "SUBSECTION",
-    "SUBSEQUENT",
-    "SUBSTANCE",
-    "SUBSTANCES",
-    "SUBSTANTIAL",
-    "SUBSTANTIVE",
-    "SUCCEED",
-    "SUCCEEDED",
-    "SUCCEEDING",
-    "SUCCEEDS",
-    "SUCCESS",
-    "SUCCESSFUL",
-    "SUCK",
-    "SUCKED",
-    "SUCKING",
-    "SUCKS",
-    "SUDDEN",
-    "SUDDENLY",
-    "SUDDENNESS",
-    "SUFFER",
-    "SUFFERED",
-    "SUFFERING",
-    "SUFFERS",
-    "SUFFICIENT",
-    "SUGAR",
-    "SUGARS",
-    "SUGARY",
-    "SUGGESTED",
-    "SUGGESTING",
-    "SUGGESTION",
-    "SUGGESTIONS",
-    "SUGGESTS",
-    "SUIT",
-    "SUITABILITY",
-    "SUITABLE",
-    "SUITE",
-    "SUITED",
-    "SUITES",
-    "SUITING",
-    "SUITS",
-    "SUM",
-    "SUMMARY",
-    "SUMMER",
-    "SUMMERS",
-    "SUMMIT",
-    "SUN",
-    "SUNDAY",
-    "SUNDAYS",
-    "SUNG",
-    "SUNK",
-    "SUNLIGHT",
-    "SUNNY",
-    "SUNS",
-    "SUNSET",
-    "SUNSHINE",
-    "SUPER",
-    "SUPERIOR",
-    "SUPERVISOR",
-    "SUPPER",
-    "SUPPERS",
-    "SUPPLEMENT",
-    "SUPPLEMENTS",
-    "SUPPLIED",
-    "SUPPLIER",
-    "SUPPLIERS",
-    "SUPPLIES",
-    "SUPPLY",
-    "SUPPLYING",
-    "SUPPORT",
-    "SUPPORTED",
-    "SUPPORTERS",
-    "SUPPORTING",
-    "SUPPORTIVE",
-    "SUPPORTS",
-    "SUPPOSE",
-    "SUPPOSED",
-    "SUPPOSES",
-    "SUPPOSING",
-    "SUPREME",
-    "SUR",
-    "SURELY",
-    "SURENESS",
-    "SURER",
-    "SUREST",
-    "SURFACE",
-    "SURFACED",
-    "SURFACES",
-    "SURFACING",
-    "SURGERY",
-    "SURPRISE",
-    "SURPRISED",
-    "SURPRISES",
-    "SURPRISING",
-    "SURPRISINGLY",
-    "SURROUND",
-    "SURROUNDED",
-    "SURROUNDING",
-    "SURROUNDS",
-    "SURVEY",
-    "SURVEYS",
-    "SURVIVAL",
-    "SUSAN",
-    "SUSPECT",
-    "SUSPECTED",
-    "SUSPECTING",
-    "SUSPECTS",
-    "SUSPENSION",
-    "SUSPICION",
-    "SUSPICIONS",
-    "SUSPICIOUS",
-    "SUSPICIOUSLY",
-    "SUSTAINABLE",
-    "SW",
-    "SWALLOW",
-    "SWALLOWED",
-    "SWALLOWING",
-    "SWALLOWS",
-    "SWAM",
-    "SWEAR",
-    "SWEARING",
-    "SWEARS",
-    "SWEAT",
-    "SWEATED",
-    "SWEATING",
-    "SWEATS",
-    "SWEDEN",
-    "SWEDISH",
-    "SWEEP",
-    "SWEEPING",
-    "SWEEPS",
-    "SWEET",
-    "SWEETLY",
-    "SWEETNESS",
-    "SWEETS",
-    "SWELL",
-    "SWELLED",
-    "SWELLING",
-    "SWELLS",
-    "SWEPT",
-    "SWIM",
-    "SWIMMING",
-    "SWIMS",
-    "SWING",
-    "SWINGING",
-    "SWINGS",
-    "SWISS",
-    "SWITCH",
-    "SWITCHES",
-    "SWITZERLAND",
-    "SWOLLEN",
-    "SWORD",
-    "SWORDS",
-    "SWORE",
-    "SWORN",
-    "SWUM",
-    "SWUNG",
-    "SYDNEY",
-    "SYMBOL",
-    "SYMBOLS",
-    "SYMPATHETIC",
-    "SYMPATHETICALLY",
-    "SYMPATHIES",
-    "SYMPATHY",
-    "SYMPTOMS",
-    "SYNDROME",
-    "SYNTAX",
-    "SYSTEM",
-    "SYSTEMATIC",
-    "SYSTEMATICALLY",
-    "SYSTEMS",
-    "TA",
-    "TAB",
-    "TABLE",
-    "TABLECLOTH",
-    "TABLES",
-    "TABS",
-    "TAG",
-    "TAGS",
-    "TAIL",
-    "TAILOR",
-    "TAILORED",
-    "TAILORING",
-    "TAILORS",
-    "TAILS",
-    "TAIWAN",
-    "TAKES",
-    "TALENT",
-    "TALK",
-    "TALKED",
-    "TALKING",
-    "TALKS",
-    "TALL",
-    "TALLER",
-    "TALLEST",
-    "TAME",
-    "TAMED",
-    "TAMES",
-    "TAMING",
-    "TAMPA",
-    "TANK",
-    "TAP",
-    "TAPE",
-    "TAPPED",
-    "TAPPING",
-    "TAPS",
-    "TARGET",
-    "TARGETS",
-    "TASK",
-    "TASKS",
-    "TASTE",
-    "TASTED",
-    "TASTES",
-    "TASTING",
-    "TAUGHT",
-    "TAX",
-    "TAXED",
-    "TAXES",
-    "TAXI",
-    "TAXING",
-    "TAXIS",
-    "TAXPAYER",
-    "TAXPAYERS",
-    "TAYLOR",
-    "TD",
-    "TE",
-    "TEA",
-    "TEACH",
-    "TEACHER",
-    "TEACHERS",
-    "TEACHES",
-    "TEACHING",
-    "TEACHINGS",
-    "TEAM",
-    "TEAMS",
-    "TEAR",
-    "TEARING",
-    "TEARS",
-    "TEAS",
-    "TECH",
-    "TECHNICAL",
-    "TECHNIQUE",
-    "TECHNIQUES",
-    "TECHNOLOGIES",
-    "TECHNOLOGY",
-    "TEE",
-    "TEEN",
-    "TEENAGE",
-    "TEENS",
-    "TEETH",
-    "TEL",
-    "TELECOM",
-    "TELECOMMUNICATIONS",
-    "TELEGRAPH",
-    "TELEGRAPHED",
-    "TELEGRAPHING",
-    "TELEGRAPHS",
-    "TELEPHONE",
-    "TELEPHONED",
-    "TELEPHONES",
-    "TELEPHONING",
-    "TELEVISION",
-    "TELLING",
-    "TELLS",
-    "TEMP",
-    "TEMPER",
-    "TEMPERATURE",
-    "TEMPERATURES",
-    "TEMPERS",
-    "TEMPLATE",
-    "TEMPLATES",
-    "TEMPLE",
-    "TEMPLES",
-    "TEMPORARY",
-    "TEMPT",
-    "TEMPTED",
-    "TEMPTING",
-    "TEMPTS",
-    "TEN",
-    "TEND",
-    "TENDED",
-    "TENDENCIES",
-    "TENDENCY",
-    "TENDER",
-    "TENDERLY",
-    "TENDERNESS",
-    "TENNESSEE",
-    "TENNIS",
-    "TENS",
-    "TENT",
-    "TENTH",
-    "TENTHS",
-    "TENTS",
-    "TERM",
-    "TERMINAL",
-    "TERMS",
-    "TERRIBLE",
-    "TERRIBLY",
-    "TERRITORY",
-    "TERROR",
-    "TERRORISM",
-    "TERRY",
-    "TEST",
-    "TESTED",
-    "TESTIMONIALS",
-    "TESTING",
-    "TESTS",
-    "TEXAS",
-    "TEXT",
-    "TEXTBOOKS",
-    "TEXTS",
-    "THAI",
-    "THAILAND",
-    "THANKED",
-    "THANKFUL",
-    "THANKFULLY",
-    "THANKING",
-    "THEATER",
-    "THEATRE",
-    "THEATRES",
-    "THEATRICAL",
-    "THEFT",
-    "THEME",
-    "THEMES",
-    "THEORY",
-    "THERAPY",
-    "THERMAL",
-    "THICK",
-    "THICKER",
-    "THICKEST",
-    "THICKLY",
-    "THICKNESS",
-    "THIEF",
-    "THIEVES",
-    "THIN",
-    "THING",
-    "THINGS",
-    "THINKING",
-    "THINKS",
-    "THINLY",
-    "THINNED",
-    "THINNER",
-    "THINNESS",
-    "THINNEST",
-    "THINNING",
-    "THINS",
-    "THIRDLY",
-    "THIRDS",
-    "THIRST",
-    "THIRSTS",
-    "THIRTEEN",
-    "THIRTEENTH",
-    "THIRTEENTHS",
-    "THIRTIES",
-    "THIRTIETH",
-    "THIRTIETHS",
-    "THIRTY",
-    "THOMAS",
-    "THOMPSON",
-    "THONGS",
-    "THORN",
-    "THORNS",
-    "THOROUGHNESS",
-    "THOUGHT",
-    "THOUGHTFUL",
-    "THOUGHTFULLY",
-    "THOUGHTFULNESS",
-    "THOUGHTS",
-    "THOUSANDS",
-    "THOUSANDTH",
-    "THOUSANDTHS",
-    "THREAD",
-    "THREADED",
-    "THREADING",
-    "THREADS",
-    "THREAT",
-    "THREATEN",
-    "THREATENED",
-    "THREATENING",
-    "THREATENS",
-    "THREATS",
-    "THREES",
-    "THREW",
-    "THROAT",
-    "THROATS",
-    "THROW",
-    "THROWING",
-    "THROWN",
-    "THROWS",
-    "THU",
-    "THUMB",
-    "THUMBNAIL",
-    "THUMBS",
-    "THUNDER",
-    "THUNDERED",
-    "THUNDERING",
-    "THUNDERS",
-    "THURS",
-    "THURSDAY",
-    "THURSDAYS",
-    "TICKET",
-    "TICKETS",
-    "TIDAL",
-    "TIDE",
-    "TIDES",
-    "TIDIED",
-    "TIDIES",
-    "TIDY",
-    "TIDYING",
-    "TIE",
-    "TIED",
-    "TIES",
-    "TIFFANY",
-    "TIGER",
-    "TIGHT",
-    "TIGHTEN",
-    "TIGHTENED",
-    "TIGHTENING",
-    "TIGHTENS",
-    "TIGHTER",
-    "TIGHTEST",
-    "TIGHTLY",
-    "TIGHTNESS",
-    "TIM",
-    "TIME",
-    "TIMELESS",
-    "TIMELY",
-    "TIMER",
-    "TIMES",
-    "TIN",
-    "TINS",
-    "TINY",
-    "TION",
-    "TIPPED",
-    "TIPPING",
-    "TIPS",
-    "TIRE",
-    "TIRED",
-    "TIRES",
-    "TIRING",
-    "TISSUE",
-    "TIT",
-    "TITANS",
-    "TITLE",
-    "TITLED",
-    "TITLES",
-    "TITS",
-    "TM",
-    "TN",
-    "TOBACCO",
-    "TOBACCOS",
-    "TODAY",
-    "TOE",
-    "TOES",
-    "TOKYO",
-    "TOLD",
-    "TOLL",
-    "TOM",
-    "TOMORROW",
-    "TON",
-    "TONE",
-    "TONES",
-    "TONGUE",
-    "TONGUES",
-    "TONIGHT",
-    "TONS",
-    "TONY",
-    "TOOL",
-    "TOOLBAR",
-    "TOOLS",
-    "TOOTH",
-    "TOOTHLESS",
-    "TOP",
-    "TOPIC",
-    "TOPICS",
-    "TOPPED",
-    "TOPPING",
-    "TOPS",
-    "TORE",
-    "TORN",
-    "TORONTO",
-    "TORTURE",
-    "TOSHIBA",
-    "TOTAL",
-    "TOTALED",
-    "TOTALING",
-    "TOTALITY",
-    "TOTALLED",
-    "TOTALLING",
-    "TOTALLY",
-    "TOTALS",
-    "TOUCH",
-    "TOUCHED",
-    "TOUCHES",
-    "TOUCHING",
-    "TOUGH",
-    "TOUGHER",
-    "TOUGHEST",
-    "TOUGHNESS",
-    "TOUR",
-    "TOURED",
-    "TOURING",
-    "TOURISM",
-    "TOURIST",
-    "TOURISTS",
-    "TOURNAMENT",
-    "TOURS",
-    "TOWEL",
-    "TOWELS",
-    "TOWER",
-    "TOWERING",
-    "TOWERS",
-    "TOWN",
-    "TOWNS",
-    "TOY",
-    "TOYOTA",
-    "TOYS",
-    "TR",
-    "TRACE",
-    "TRACK",
-    "TRACKBACK",
-    "TRACKED",
-    "TRACKING",
-    "TRACKS",
-    "TRADE",
-    "TRADED",
-    "TRADEMARK",
-    "TRADEMARKS",
-    "TRADER",
-    "TRADERS",
-    "TRADES",
-    "TRADING",
-    "TRADITION",
-    "TRADITIONAL",
-    "TRAFFIC",
-    "TRAIL",
-    "TRAILER",
-    "TRAILERS",
-    "TRAIN",
-    "TRAINED",
-    "TRAINERS",
-    "TRAINING",
-    "TRAINS",
-    "TRAMADOL",
-    "TRANNY",
-    "TRANS",
-    "TRANSACTION",
-    "TRANSACTIONS",
-    "TRANSFER",
-    "TRANSIT",
-    "TRANSITION",
-    "TRANSLATE",
-    "TRANSLATED",
-    "TRANSLATES",
-    "TRANSLATING",
-    "TRANSLATION",
-    "TRANSLATIONS",
-    "TRANSMISSION",
-    "TRANSPORT",
-    "TRANSPORTATION",
-    "TRAP",
-    "TRAPPED",
-    "TRAPPING",
-    "TRAPS",
-    "TRAVEL",
-    "TRAVELED",
-    "TRAVELER",
-    "TRAVELING",
-    "TRAVELLED",
-    "TRAVELLERS",
-    "TRAVELLING",
-    "TRAVELS",
-    "TRAY",
-    "TRAYS",
-    "TREASURE",
-    "TREASURED",
-    "TREASURER",
-    "TREASURES",
-    "TREASURING",
-    "TREASURY",
-    "TREAT",
-    "TREATED",
-    "TREATING",
-    "TREATMENT",
-    "TREATMENTS",
-    "TREATS",
-    "TREE",
-    "TREES",
-    "TREMBL",
-    "TREMBLE",
-    "TREMBLED",
-    "TREMBLES",
-    "TREMBLING",
-    "TREND",
-    "TRENDS",
-    "TRIAL",
-    "TRIALED",
-    "TRIALING",
-    "TRIALS",
-    "TRIBE",
-    "TRIBES",
-    "TRICK",
-    "TRICKED",
-    "TRICKING",
-    "TRICKS",
-    "TRICKSTER",
-    "TRIP",
-    "TRIPADVISOR",
-    "TRIPLE",
-    "TRIPPED",
-    "TRIPPING",
-    "TRIPS",
-    "TROOPS",
-    "TROPICAL",
-    "TROUBLE",
-    "TROUBLED",
-    "TROUBLES",
-    "TROUBLESOME",
-    "TROUBLING",
-    "TRUCK",
-    "TRUCKS",
-    "TRUE",
-    "TRUER",
-    "TRUEST",
-    "TRUNK",
-    "TRUNKS",
-    "TRUST",
-    "TRUSTED",
-    "TRUSTING",
-    "TRUSTS",
-    "TRUTH",
-    "TRUTHFUL",
-    "TRUTHFULNESS",
-    "TRUTHS",
-    "TT",
-    "TUBE",
-    "TUBES",
-    "TUE",
-    "TUES",
-    "TUESDAY",
-    "TUESDAYS",
-    "TUNE",
-    "TUNED",
-    "TUNES",
-    "TUNING",
-    "TURKEY",
-    "TURKISH",
-    "TURN",
-    "TURNED",
-    "TURNING",
-    "TURNS",
-    "TUTORIAL",
-    "TUTORIALS",
-    "TV",
-    "TVS",
-    "TWELFTH",
-    "TWELFTHS",
-    "TWELVE",
-    "TWELVES",
-    "TWENTIES",
-    "TWENTIETH",
-    "TWENTY",
-    "TWIKI",
-    "TWIN",
-    "TWIST",
-    "TWISTED",
-    "TWISTING",
-    "TWISTS",
-    "TX",
-    "TYING",
-    "TYPE",
-    "TYPED",
-    "TYPES",
-    "TYPICAL",
-    "TYPICALLY",
-    "TYPING",
-    "TYPIST",
-    "TYPISTS",
-    "UGLIER",
-    "UGLIEST",
-    "UGLINESS",
-    "UGLY",
-    "UK",
-    "UKRAINE",
-    "ULTIMATE",
-    "ULTRA",
-    "UMBRELLA",
-    "UMBRELLAS",
-    "UNABLE",
-    "UNACCEPTABLE",
-    "UNARMED",
-    "UNAVOIDABLE",
-    "UNBALANCED",
-    "UNBREAKABLE",
-    "UNBROKEN",
-    "UNBUSINESSLIKE",
-    "UNBUTTONED",
-    "UNCERTAIN",
-    "UNCERTAINTIES",
-    "UNCERTAINTY",
-    "UNCHANGEABLE",
-    "UNCHANGED",
-    "UNCHANGING",
-    "UNCLAIMED",
-    "UNCLE",
-    "UNCLES",
-    "UNCOMFORTABLE",
-    "UNCOMMON",
-    "UNCOMMONLY",
-    "UNCONCERNED",
-    "UNCONDITIONAL",
-    "UNCONSCIOUS",
-    "UNCONSCIOUSLY",
-    "UNCONTROLLABLE",
-    "UNCONTROLLABLY",
-    "UNCONTROLLED",
-    "UNCOUNTABLE",
-    "UNCOVER",
-    "UNCOVERED",
-    "UNCOVERS",
-    "UNCROWNED",
-    "UNCUT",
-    "UND",
-    "UNDAMAGED",
-    "UNDECIDED",
-    "UNDEFEATED",
-    "UNDELIVERED",
-    "UNDERDEVELOPED",
-    "UNDERGRADUATE",
-    "UNDERGROUND",
-    "UNDERNEATH",
-    "UNDERSTAND",
-    "UNDERSTANDING",
-    "UNDERSTANDS",
-    "UNDERSTOOD",
-    "UNDESIRABLE",
-    "UNDEVELOPED",
-    "UNDIVIDED",
-    "UNDOUBTEDLY",
-    "UNDRESSED",
-    "UNDYING",
-    "UNEASE",
-    "UNEASY",
-    "UNEDUCATED",
-    "UNEMPLOYED",
-    "UNEMPLOYMENT",
-    "UNEQUAL",
-    "UNFAIR",
-    "UNFAIRLY",
-    "UNFAMILIAR",
-    "UNFAMILIARITY",
-    "UNFINISHED",
-    "UNFORGETTABLE",
-    "UNFORTUNATE",
-    "UNHAPPY",
-    "UNIFORM",
-    "UNIMPORTANCE",
-    "UNIMPORTANT",
-    "UNION",
-    "UNIONS",
-    "UNIPROTKB",
-    "UNIQUE",
-    "UNIT",
-    "UNITE",
-    "UNITED",
-    "UNITES",
-    "UNITING",
-    "UNITS",
-    "UNITY",
-    "UNIVERSAL",
-    "UNIVERSE",
-    "UNIVERSITIES",
-    "UNIVERSITY",
-    "UNIX",
-    "UNJUST",
-    "UNJUSTLY",
-    "UNKNOWN",
-    "UNLAWFUL",
-    "UNLIMITED",
-    "UNLISTED",
-    "UNLOADED",
-    "UNLOADING",
-    "UNLOADS",
-    "UNLOCK",
-    "UNLOCKED",
-    "UNLOCKING",
-    "UNLOCKS",
-    "UNLUCKILY",
-    "UNLUCKY",
-    "UNMENTIONED",
-    "UNMISTAKABLE",
-    "UNMISTAKABLY",
-    "UNNECESSARILY",
-    "UNNECESSARY",
-    "UNPAID",
-    "UNPARDONABLE",
-    "UNPLEASANT",
-    "UNPLEASANTLY",
-    "UNPREJUDICED",
-    "UNPREPARED",
-    "UNPREVENTABLE",
-    "UNPROVEN",
-    "UNSEEN",
-    "UNSTEADILY",
-    "UNSTEADY",
-    "UNSUBSCRIBE",
-    "UNSUCCESSFUL",
-    "UNSUITABLE",
-    "UNSURE",
-    "UNSUSPECTING",
-    "UNTIE",
-    "UNTIED",
-    "UNTOUCHED",
-    "UNUSUAL",
-    "UNUSUALLY",
-    "UNWAGED",
-    "UNWANTED",
-    "UNWELCOME",
-    "UNWILLING",
-    "UNWILLINGLY",
-    "UNWISE",
-    "UPCOMING",
-    "UPDATE",
-    "UPDATED",
-    "UPDATES",
-    "UPGRADE",
-    "UPLOAD",
-    "UPPER",
-    "UPRIGHT",
-    "UPSET",
-    "UPSETS",
-    "UPSETTING",
-    "UPSIDE",
-    "UPSKIRT",
-    "UPSTAIRS",
-    "UPWARD",
-    "UPWARDS",
-    "URBAN",
-    "URGE",
-    "URGED",
-    "URGES",
-    "URGING",
-    "URL",
-    "URW",
-    "USA",
-    "USAGE",
-    "USB",
-    "USC",
-    "USD",
-    "USELESS",
-    "USER",
-    "USERNAME",
-    "USERS",
-    "USR",
-    "USUAL",
-    "UT",
-    "UTAH",
-    "UTC",
-    "UTILITIES",
-    "UTILITY",
-    "VA",
-    "VACATION",
-    "VACATIONS",
-    "VACUUM",
-    "VAIN",
-    "VAINER",
-    "VAINEST",
-    "VAINLY",
-    "VALENTINE",
-    "VALID",
-    "VALLEY",
-    "VALLEYS",
-    "VALUABLE",
-    "VALUABLES",
-    "VALUATION",
-    "VALUED",
-    "VALUELESS",
-    "VALUER",
-    "VALUES",
-    "VALUING",
-    "VAN",
-    "VANCOUVER",
-    "VAR",
-    "VARIABLE",
-    "VARIABLES",
-    "VARIETIES",
-    "VARIETY",
-    "VARIOUSLY",
-    "VARY",
-    "VAST",
-    "VAT",
-    "VBULLETIN",
-    "VECTOR",
-    "VEGAS",
-    "VEHICLE",
-    "VEHICLES",
-    "VEIL",
-    "VEILED",
-    "VEILING",
-    "VEILS",
-    "VENDOR",
-    "VENDORS",
-    "VENTURE",
-    "VENUE",
-    "VERB",
-    "VERBS",
-    "VERIFICATION",
-    "VERIFY",
-    "VERMONT",
-    "VERSE",
-    "VERSES",
-    "VERSION",
-    "VERSIONS",
-    "VERSUS",
-    "VERTICAL",
-    "VERZEICHNIS",
-    "VESSEL",
-    "VESSELS",
-    "VETERANS",
-    "VHS",
-    "VI",
-    "VIAGRA",
-    "VICE",
-    "VICTIM",
-    "VICTIMS",
-    "VICTORIA",
-    "VICTORIES",
-    "VICTORIOUS",
-    "VICTORY",
-    "VIDEO",
-    "VIDEOS",
-    "VIETNAM",
-    "VIEW",
-    "VIEWED",
-    "VIEWING",
-    "VIEWS",
-    "VILLA",
-    "VILLAGE",
-    "VILLAGER",
-    "VILLAGERS",
-    "VILLAGES",
-    "VINCENT",
-    "VINTAGE",
-    "VINYL",
-    "VIOLATION",
-    "VIOLENCE",
-    "VIOLENT",
-    "VIOLENTLY",
-    "VIRGIN",
-    "VIRGINIA",
-    "VIRTUAL",
-    "VIRTUE",
-    "VIRTUES",
-    "VIRTUOUS",
-    "VIRUS",
-    "VISA",
-    "VISIBLE",
-    "VISION",
-    "VISIT",
-    "VISITATION",
-    "VISITED",
-    "VISITING",
-    "VISITOR",
-    "VISITORS",
-    "VISITS",
-    "VISTA",
-    "VISUAL",
-    "VITAL",
-    "VITAMIN",
-    "VOICE",
-    "VOICED",
-    "VOICELESS",
-    "VOICES",
-    "VOICING",
-    "VOID",
-    "VOIP",
-    "VOLTAGE",
-    "VOLUME",
-    "VOLUNTARY",
-    "VOLUNTEER",
-    "VOLUNTEERS",
-    "VON",
-    "VOTE",
-    "VOTED",
-    "VOTER",
-    "VOTERS",
-    "VOTES",
-    "VOTING",
-    "VOWEL",
-    "VOWELS",
-    "VOYAGE",
-    "VOYAGED",
-    "VOYAGES",
-    "VOYAGING",
-    "VOYEUR",
-    "VT",
-    "WA",
-    "WAGE",
-    "WAGES",
-    "WAIST",
-    "WAISTS",
-    "WAIT",
-    "WAITED",
-    "WAITER",
-    "WAITERS",
-    "WAITING",
-    "WAITRESS",
-    "WAITRESSES",
-    "WAITS",
-    "WAKE",
-    "WAKEN",
-    "WAKES",
-    "WAKING",
-    "WALES",
-    "WALK",
-    "WALKED",
-    "WALKER",
-    "WALKING",
-    "WALKS",
-    "WALL",
-    "WALLED",
-    "WALLPAPER",
-    "WALLPAPERS",
-    "WALLS",
-    "WALTER",
-    "WANDER",
-    "WANDERED",
-    "WANDERING",
-    "WANDERS",
-    "WANTED",
-    "WANTING",
-    "WAR",
-    "WARD",
-    "WAREHOUSE",
-    "WARM",
-    "WARMED",
-    "WARMING",
-    "WARMLY",
-    "WARMS",
-    "WARMTH",
-    "WARN",
-    "WARNED",
-    "WARNER",
-    "WARNING",
-    "WARNS",
-    "WARRANTY",
-    "WARRED",
-    "WARREN",
-    "WARRING",
-    "WARS",
-    "WASH",
-    "WASHED",
-    "WASHES",
-    "WASHING",
-    "WASHINGTON",
-    "WASTE",
-    "WASTED",
-    "WASTEFUL",
-    "WASTEFULLY",
-    "WASTES",
-    "WASTING",
-    "WATCH",
-    "WATCHED",
-    "WATCHES",
-    "WATCHING",
-    "WATER",
-    "WATERED",
-    "WATERING",
-    "WATERS",
-    "WAVE",
-    "WAVED",
-    "WAVES",
-    "WAVING",
-    "WAX",
-    "WAXED",
-    "WAXES",
-    "WAXING",
-    "WAYNE",
-    "WAYS",
-    "WEAK",
-    "WEAKEN",
-    "WEAKLY",
-    "WEAKNESS",
-    "WEALTH",
-    "WEALTHY",
-    "WEAPON",
-    "WEAPONS",
-    "WEAR",
-    "WEARING",
-    "WEARS",
-    "WEATHER",
-    "WEATHERED",
-    "WEATHERING",
-    "WEATHERS",
-    "WEAVE",
-    "WEAVED",
-    "WEAVES",
-    "WEAVING",
-    "WEB",
-    "WEBCAM",
-    "WEBLOG",
-    "WEBMASTER",
-    "WEBSITE",
-    "WEBSITES",
-    "WEDDING",
-    "WEDDINGS",
-    "WEDNESDAY",
-    "WEDNESDAYS",
-    "WEED",
-    "WEEDED",
-    "WEEDING",
-    "WEEDS",
-    "WEEK",
-    "WEEKEND",
-    "WEEKENDS",
-    "WEEKLY",
-    "WEEKS",
-    "WEIGH",
-    "WEIGHED",
-    "WEIGHING",
-    "WEIGHS",
-    "WEIGHT",
-    "WEIGHTS",
-    "WEIRD",
-    "WELCOMED",
-    "WELCOMES",
-    "WELCOMING",
-    "WELFARE",
-    "WELLS",
-    "WEST",
-    "WESTERN",
-    "WESTERNS",
-    "WESTWARD",
-    "WESTWARDS",
-    "WET",
-    "WETS",
-    "WETTING",
-    "WHEAT",
-    "WHEATS",
-    "WHEEL",
-    "WHEELED",
-    "WHEELER",
-    "WHEELS",
-    "WHICHEVER",
-    "WHILST",
-    "WHIP",
-    "WHIPPED",
-    "WHIPPING",
-    "WHIPS",
-    "WHISPER",
-    "WHISPERED",
-    "WHISPERING",
-    "WHISPERS",
-    "WHISTLE",
-    "WHISTLED",
-    "WHISTLES",
-    "WHISTLING",
-    "WHITE",
-    "WHITENESS",
-    "WHITER",
-    "WHITEST",
-    "WHITISH",
-    "WHOLENESS",
-    "WHOLESALE",
-    "WHOLLY",
-    "WI",
-    "WICKED",
-    "WICKEDER",
-    "WICKEDEST",
-    "WICKEDLY",
-    "WICKEDNESS",
-    "WIDE",
-    "WIDENED",
-    "WIDENESS",
-    "WIDENING",
-    "WIDER",
-    "WIDEST",
-    "WIDOW",
-    "WIDOWED",
-    "WIDOWER",
-    "WIDOWS",
-    "WIDTH",
-    "WIFE",
-    "WIKI",
-    "WIKIPEDIA",
-    "WILD",
-    "WILDER",
-    "WILDEST",
-    "WILDLIFE",
-    "WILDLY",
-    "WILDNESS",
-    "WILLIAM",
-    "WILLIAMS",
-    "WILLINGLY",
-    "WILLINGNESS",
-    "WILSON",
-    "WIN",
-    "WIND",
-    "WINDED",
-    "WINDING",
-    "WINDOW",
-    "WINDOWS",
-    "WINDS",
-    "WINDY",
-    "WINE",
-    "WINED",
-    "WINES",
-    "WING",
-    "WINGED",
-    "WINGING",
-    "WINGS",
-    "WINING",
-    "WINNER",
-    "WINNERS",
-    "WINNING",
-    "WINS",
-    "WINTER",
-    "WINTERS",
-    "WINTRY",
-    "WIPE",
-    "WIPED",
-    "WIPER",
-    "WIPERS",
-    "WIPES",
-    "WIPING",
-    "WIRE",
-    "WIRED",
-    "WIRELESS",
-    "WIRES",
-    "WIRING",
-    "WISCONSIN",
-    "WISDOM",
-    "WISE",
-    "WISELY",
-    "WISENESS",
-    "WISER",
-    "WISEST",
-    "WISHED",
-    "WISHES",
-    "WISHING",
-    "WISHLIST",
-    "WITNESS",
-    "WITNESSED",
-    "WITNESSES",
-    "WITNESSING",
-    "WIVES",
-    "WIZARD",
-    "WOKE",
-    "WOKEN",
-    "WOLF",
-    "WOMAN",
-    "WOMEN",
-    "WOMENS",
-    "WONDERED",
-    "WONDERFUL",
-    "WONDERFULLY",
-    "WONDERING",
-    "WONDERS",
-    "WOOD",
-    "WOODEN",
-    "WOODLAND",
-    "WOODS",
-    "WOODY",
-    "WOOL",
-    "WOOLLEN",
-    "WOOLLY",
-    "WOOLS",
-    "WORD",
-    "WORDING",
-    "WORE",
-    "WORK",
-    "WORKED",
-    "WORKER",
-    "WORKERS",
-    "WORKING",
-    "WORKMAN",
-    "WORKMEN",
-    "WORKPLACE",
-    "WORKS",
-    "WORKSHOP",
-    "WORKSHOPS",
-    "WORLDS",
-    "WORLDWIDE",
-    "WORM",
-    "WORMED",
-    "WORMING",
-    "WORMS",
-    "WORN",
-    "WORRIED",
-    "WORRIES",
-    "WORRY",
-    "WORRYING",
-    "WORSE",
-    "WORSEN",
-    "WORSHIP",
-    "WORSHIPPED",
-    "WORSHIPPING",
-    "WORSHIPS",
-    "WORST",
-    "WORTH",
-    "WORTHLESS",
-    "WORTHY",
-    "WOUND",
-    "WOUNDED",
-    "WOUNDING",
-    "WOUNDS",
-    "WOVE",
-    "WOW",
-    "WRAP",
-    "WRAPPED",
-    "WRAPPER",
-    "WRAPPERS",
-    "WRAPPING",
-    "WRAPS",
-    "WRECK",
-    "WRECKED",
-    "WRECKING",
-    "WRECKS",
-    "WRIGHT",
-    "WRIST",
-    "WRISTS",
-    "WRITE",
-    "WRITER",
-    "WRITERS",
-    "WRITES",
-    "WRITING",
-    "WRITINGS",
-    "WRITTEN",
-    "WRONG",
-    "WRONGED",
-    "WRONGING",
-    "WRONGLY",
-    "WRONGS",
-    "WROTE",
-    "WV",
-    "WYOMING",
-    "XBOX",
-    "XHTML",
-    "XML",
-    "XP",
-    "XX",
-    "XXX",
-    "YA",
-    "YAHOO",
-    "YARD",
-    "YARDS",
-    "YEAH",
-    "YEAR",
-    "YEARLY",
-    "YEARS",
-    "YELLOW",
-    "YELLOWISH",
-    "YESTERDAY",
-    "YIELD",
-    "YIELDED",
-    "YIELDING",
-    "YIELDS",
-    "YOGA",
-    "YORK",
-    "YOUNG",
-    "YOUNGER",
-    "YOUNGEST",
-    "YOUNGSTER",
-    "YOUNGSTERS",
-    "YOUTH",
-    "YOUTHFUL",
-    "YOUTHS",
-    "ZEALAND",
-    "ZEROS",
-    "ZIP",
-    "ZONE",
-    "ZOO",
-    "ZOOM",
-    "AFFECTIONATE",
-    "AGGRESSIVE",
-    "AGGRESSOR",
-    "ANTHROPOLOGICAL",
-    "ANTHROPOLOGISTS",
-    "APPROACHED",
-    "ARCHEOLOGICAL",
-    "ARISTOTLE",
-    "BEES",
-    "BENITO",
-    "BERNSTEIN",
-    "BETS",
-    "BIOLOGISTS",
-    "BOTHERING",
-    "BRUTAL",
-    "BULLY",
-    "BULLYING",
-    "CHIMPANZEE",
-    "CHIMPANZEES",
-    "CHIMPS",
-    "CIRCUMFERENCE",
-    "COMEY",
-    "COMMENTED",
-    "CONCENTRATED",
-    "CONCLUDED",
-    "CONFRONTATION",
-    "CONSTANTLY",
-    "CYCLES",
-    "DARLING",
-    "DEARLY",
-    "DEBATING",
-    "DEMONIC",
-    "DESCENT",
-    "DETHRONED",
-    "DEVASTATION",
-    "DISTRACT",
-    "DRAMATICALLY",
-    "EMOTION",
-    "EMOTIONS",
-    "ENORMOUS",
-    "EVALUATIONS",
-    "EVOLUTIONARY",
-    "EXCEPTIONALLY",
-    "EXTRACT",
-    "FATAL",
-    "FBI",
-    "FIGURED",
-    "FREUD",
-    "FREUDIAN",
-    "FRUSTRATED",
-    "GRANTA",
-    "GUARANTEES",
-    "HARMONIOUS",
-    "HILLARY",
-    "HYPERMASCULINE",
-    "IMPATIENTLY",
-    "IMPLICATION",
-    "IMPLICIT",
-    "IMPRESSIVE",
-    "IMPRESSIVELY",
-    "INCIDENTS",
-    "INCREDIBLY",
-    "INDIGENOUS",
-    "INDUCE",
-    "INEVITABLE",
-    "INFANTILE",
-    "INHABITANTS",
-    "INNOCENT",
-    "INSTANCES",
-    "INSTINCTS",
-    "INSUBORDINATION",
-    "INTENSELY",
-    "INTIMIDATE",
-    "INTIMIDATION",
-    "JOURNALIST",
-    "KISSINGER",
-    "KONRAD",
-    "LETHAL",
-    "LITERALLY",
-    "LOVERS",
-    "MAMMALS",
-    "MANIFESTATIONS",
-    "MARVEL",
-    "MASSACRE",
-    "MYTH",
-    "NEGOTIATE",
-    "NICKNAMES",
-    "NIGEL",
-    "NIXON",
-    "OBLIVIOUS",
-    "OBSESSION",
-    "OPPONENT",
-    "OPTIMAL",
-    "PHENOMENON",
-    "PHEROMONAL",
-    "PHINEAS",
-    "PRECEDED",
-    "PRELITERATE",
-    "PRESIDENCY",
-    "PRIMATE",
-    "PRIMATES",
-    "PROMINENTLY",
-    "PROMOTES",
-    "PROSECUTOR",
-    "PUBERTY",
-    "RAGE",
-    "RATIONALITY",
-    "REACTIONS",
-    "RECITING",
-    "RECONCILIATION",
-    "RELAXED",
-    "RESTORING",
-    "RESURRECTION",
-    "RITUAL",
-    "SADDAM",
-    "SCREAM",
-    "SCREAMING",
-    "SEQUENTIAL",
-    "SIBLINGS",
-    "SOCIALITY",
-    "SPECTACLE",
-    "STABILISING",
-    "STARING",
-    "STORYLINE",
-    "STRESSED",
-    "STRESSFUL",
-    "STRUCTURED",
-    "SURVIVORS",
-    "TACTIC",
-    "TELEVISED",
-    "TERRORISING",
-    "TESTICLES",
-    "THEORIES",
-    "THRONE",
-    "TORMENTED",
-    "TRANQUILISED",
-    "TRUMP",
-    "TYRANTS",
-    "UNDERSTANDABLE",
-    "UNIQUELY",
-    "UNNOTICED",
-    "UNRECOGNISABLE",
-    "VETERINARIAN",
-    "VIEWERS",
-    "WARNINGS",
-    "ADIDAS",
-    "ADJUSTED",
-    "AIRPORTS",
-    "ANALYSTS",
-    "ARMANI",
-    "BORIS",
-    "BRUNCH",
-    "CAFÉ",
-    "CHELSEA",
-    "CHIC",
-    "CITED",
-    "COMMUNICATING",
-    "COSMOPOLITAN",
-    "DANDIES",
-    "DECADE",
-    "DECENT",
-    "DISTINCTION",
-    "DUDES",
-    "ECCENTRIC",
-    "EMULATE",
-    "ENTROPIC",
-    "EXQUISITE",
-    "FACEBOOK",
-    "FACETIME",
-    "FLEA",
-    "FLORENCE",
-    "FOUNDER",
-    "FREELANCE",
-    "FREELANCERS",
-    "FREELANCING",
-    "GOLDMAN",
-    "GUCCI",
-    "INFLUENCERS",
-    "INPUTS",
-    "JOGGING",
-    "JUSTIFYING",
-    "LAMINATE",
-    "LITERAL",
-    "LUMINOUS",
-    "MARGINALLY",
-    "MAYONNAISE",
-    "MEMO",
-    "MENSWEAR",
-    "MESS",
-    "MOTIVATE",
-    "NAP",
-    "NECKWEAR",
-    "OUTFIT",
-    "PEACOCK",
-    "PERMANENCE",
-    "PLEASURES",
-    "PRAGUE",
-    "PYJAMAS",
-    "READJUSTING",
-    "REUNION",
-    "ROMAIN",
-    "SACHS",
-    "SILICON",
-    "SPARTA",
-    "SPENCER",
-    "TESTIFY",
-    "TOILET",
-    "TRAINER",
-    "TROUSERS",
-    "UNIQLO",
-    "URINAL",
-    "VOX",
-    "WARDROBE",
-    "WEIRDLY",
-    "WORKPLACES",
-    "ZUCKERBERG",
-    "ABRUPT",
-    "ABRUPTLY",
-    "ABRUPTNESS",
-    "ABSURD",
-    "ABSURDITIES",
-    "ABSURDITY",
-    "ABUNDANT",
-    "ABUNDANTLY",
-    "ABUSED",
-    "ABUSIVE",
-    "ACCENT",
-    "ACCENTS",
-    "ACCOMPANIED",
-    "ACCOMPANY",
-    "ACCOMPANYING",
-    "ACCUSATIONS",
-    "ACHIEVING",
-    "ACKNOWLEDGE",
-    "ACKNOWLEDGED",
-    "ACKNOWLEDGMENT",
-    "ACKNOWLEDGMENTS",
-    "ADAPTED",
-    "ADHERED",
-    "ADHERING",
-    "ADIEU",
-    "ADJUSTING",
-    "ADMIRER",
-    "ADORATION",
-    "ADORNED",
-    "ADVANTAGEOUS",
-    "ADVANTAGEOUSLY",
-    "ADVISABLE",
-    "AFFECTION",
-    "AFFECTIONATELY",
-    "AFFECTIONS",
-    "AFFINITY",
-    "AFFLICTION",
-    "AFFRONT",
-    "AGITATED",
-    "AGITATION",
-    "AGITATIONS",
-    "AGONY",
-    "AIRING",
-    "ALARMED",
-    "ALARMING",
-    "ALARMS",
-    "ALIENATED",
-    "ALLUSION",
-    "ALLUSIONS",
-    "ALTAR",
-    "ALTER",
-    "ALTERATION",
-    "ALTERATIONS",
-    "ALTERED",
-    "AMAZE",
-    "AMAZED",
-    "AMAZEMENT",
-    "AMAZES",
-    "AMENDS",
-    "ANECDOTE",
-    "ANECDOTES",
-    "ANKLE",
-    "ANKLES",
-    "ANSWERABLE",
-    "ANTAGONIST",
-    "ANTICIPATE",
-    "ANTICIPATED",
-    "ANTICIPATING",
-    "APPETITE",
-    "APPROACHING",
-    "ASSISTED",
-    "ASSISTING",
-    "ASSURE",
-    "ASSURED",
-    "ASSURING",
-    "ATTACH",
-    "ATTACHMENTS",
-    "ATTENDANTS",
-    "ATTENTIONS",
-    "ATTENTIVE",
-    "ATTENTIVELY",
-    "ATTICS",
-    "ATTRIBUTED",
-    "ATTRIBUTING",
-    "AUTHORISE",
-    "AUTHORISED",
-    "AUTHORISING",
-    "AUTHORITATIVE",
-    "AVARICE",
-    "AWAITED",
-    "AWFUL",
-    "AWKWARDNESS",
-    "AWOKE",
-    "BARBAROUS",
-    "BARBAROUSLY",
-    "BELOVED",
-    "BENCHES",
-    "BENEFICENCE",
-    "BENEFICIAL",
-    "BENEFITED",
-    "BENEFITING",
-    "BENEVOLENCE",
-    "BENEVOLENT",
-    "BETRAY",
-    "BETRAYED",
-    "BLAMELESSNESS",
-    "BRACELETS",
-    "BRIDE",
-    "BRIDEGROOM",
-    "BRIGHTON",
-    "BRILLIANCY",
-    "CAPRICE",
-    "CAPTIVATE",
-    "CAPTIVATED",
-    "CAPTIVATING",
-    "CARELESSNESS",
-    "CAROLINE",
-    "CARPETS",
-    "CATHERINE",
-    "CELEBRATED",
-    "CHEEKS",
-    "CHEERFULNESS",
-    "CHESTNUTS",
-    "CHIN",
-    "CIRCULATED",
-    "CIRCULATING",
-    "CIRCULATION",
-    "CIRCUMSTANCE",
-    "CIVILITY",
-    "CIVILLY",
-    "CLAMOROUS",
-    "CLOSET",
-    "CLUE",
-    "COINCIDED",
-    "COINCIDENCE",
-    "COLONEL",
-    "COMBATED",
-    "COMFORTLESS",
-    "COMMUNICATED",
-    "COMMUNICATIVENESS",
-    "COMPASS",
-    "COMPASSION",
-    "COMPASSIONATE",
-    "COMPLEXION",
-    "COMPREHEND",
-    "COMPREHENDED",
-    "COMPREHENDS",
-    "CONCEIVE",
-    "CONCEPTION",
-    "CONCILIATE",
-    "CONCILIATORY",
-    "CONCLUDE",
-    "CONCLUDING",
-    "CONDEMN",
-    "CONDEMNED",
-    "CONDESCEND",
-    "CONDESCENDED",
-    "CONDESCENDINGLY",
-    "CONDESCENDS",
-    "CONDITIONALLY",
-    "CONDOLENCE",
-    "CONFEDERACY",
-    "CONFIDENTIAL",
-    "CONFIRMING",
-    "CONFIRMS",
-    "CONGRATULATORY",
-    "CONJECTURE",
-    "CONJECTURED",
-    "CONJECTURES",
-    "CONJECTURING",
-    "CONJUGAL",
-    "CONJUNCTION",
-    "CONSEQUENCE",
-    "CONSEQUENT",
-    "CONSIDERABLE",
-    "CONSIDERABLY",
-    "CONSISTED",
-    "CONSISTENCY",
-    "CONSOLATION",
-    "CONSOLATORY",
-    "CONSOLED",
-    "CONSOLING",
-    "CONSTITUTE",
-    "CONSULTED",
-    "CONTEMPLATION",
-    "CONTINUAL",
-    "CONTINUALLY",
-    "CONTRACTED",
-    "CONTRADICT",
-    "CONTRADICTIONS",
-    "CONTRARY",
-    "CONTRASTED",
-    "CONVERSE",
-    "CONVERSED",
-    "CONVERSING",
-    "CONVERTING",
-    "CONVINCE",
-    "CONVINCED",
-    "CORDIAL",
-    "CORDIALITY",
-    "CORDIALLY",
-    "CORRESPOND",
-    "CORRESPONDENCE",
-    "CORROBORATED",
-    "COURTESY",
-    "CRITICISMS",
-    "CUSTODY",
-    "DEAREST",
-    "DECENCY",
-    "DECENT",
-    "DEDUCED",
-    "DEFECT",
-    "DEFECTS",
-    "DEFERENCE",
-    "DEFICIENCY",
-    "DEFICIENT",
-    "DEGENERATE",
-    "DELIBERATELY",
-    "DELIBERATION",
-    "DELICIOUS",
-    "DENIED",
-    "DENOMINATED",
-    "DENOTED",
-    "DENY",
-    "DENYING",
-    "DEPART",
-    "DEPENDENCE",
-    "DEPRECIATE",
-    "DEPRESSED",
-    "DERIVE",
-    "DERIVES",
-    "DESPERATE",
-    "DESPERATION",
-    "DESTINED",
-    "DETECTED",
-    "DETESTABLE",
-    "DEVOTED",
-    "DEVOTING",
-    "DICTATED",
-    "DICTATES",
-    "DICTATING",
-    "DICTATORIAL",
-    "DIGNIFIED",
-    "DIGNITY",
-    "DISCOURAGE",
-    "DISCOURAGED",
-    "DISCOURSE",
-    "DISCOURSES",
-    "DISCRETION",
-    "DISGUISE",
-    "DISHONESTY",
-    "DISHONORABLE",
-    "DISPOSITION",
-    "DISPOSITIONS",
-    "DISTRACTEDLY",
-    "DISTRACTION",
-    "DISTRIBUTE",
-    "DISTRUST",
-    "DISTRUSTED",
-    "DISTURBERS",
-    "DIVERSIFIED",
-    "DRAWINGS",
-    "DREADFUL",
-    "DREADFULLY",
-    "DUETS",
-    "EASTER",
-    "ECLIPSED",
-    "EFFICACY",
-    "ELDEST",
-    "ELEGANCE",
-    "ELEGANT",
-    "ELEVATE",
-    "ELEVATED",
-    "ELEVATING",
-    "ELEVATION",
-    "ELOQUENCE",
-    "ELOQUENT",
-    "EMBARGO",
-    "EMBARRASSED",
-    "EMBARRASSMENT",
-    "EMBRACED",
-    "EMBRACING",
-    "EMERGENCE",
-    "EMINENT",
-    "EMPHATIC",
-    "EMPHATICALLY",
-    "EMPTINESS",
-    "ENABLING",
-    "ENUMERATING",
-    "ENUMERATION",
-    "ESTEEM",
-    "ESTEEMED",
-    "ESTIMABLE",
-    "ESTIMATION",
-    "ETIQUETTE",
-    "EVIDENT",
-    "EVIDENTLY",
-    "EXAGGERATE",
-    "EXASPERATE",
-    "EXCEEDED",
-    "EXCEEDING",
-    "EXCEEDINGLY",
-    "EXCELLENCY",
-    "EXCLAIM",
-    "EXCLAIMED",
-    "EXCLAIMING",
-    "EXCLAMATION",
-    "EXCLAMATIONS",
-    "EXCLUDE",
-    "EXCLUSION",
-    "EXECUTORS",
-    "EXHAUSTED",
-    "EXHIBITING",
-    "EXPRESSIVELY",
-    "EXPRESSLY",
-    "EXTINGUISHED",
-    "EXTRACTS",
-    "EXTRAVAGANCE",
-    "EXTRAVAGANT",
-    "EXUBERANT",
-    "FAME",
-    "FARE",
-    "FAREWELL",
-    "FATIGUE",
-    "FATIGUED",
-    "FELICITATIONS",
-    "FELICITY",
-    "FLUCTUATING",
-    "FORBADE",
-    "FORESEE",
-    "FORESEEN",
-    "FORMIDABLE",
-    "FORWARDED",
-    "FORWARDER",
-    "FORWARDING",
-    "FRANKLY",
-    "FRANKNESS",
-    "FRIENDLIER",
-    "FRIVOLOUS",
-    "FRONTED",
-    "GENIUS",
-    "GENTLEWOMAN",
-    "GOSSIPING",
-    "GRACIOUS",
-    "GRACIOUSLY",
-    "GRATIFIED",
-    "GRATIFY",
-    "GRATIFYING",
-    "GRATITUDE",
-    "GUARDIANS",
-    "HAM",
-    "HANDSOME",
-    "HANDSOMER",
-    "HANDSOMEST",
-    "HARMONY",
-    "HEIRESS",
-    "HEIRS",
-    "HONOURED",
-    "HONOURS",
-    "HORRID",
-    "HOSPITALITY",
-    "HOUSEKEEPER",
-    "HOUSEMAID",
-    "HUG",
-    "HUMILIATING",
-    "HUMILITY",
-    "HUMOUR",
-    "HUMOURED",
-    "IGNORANCE",
-    "IGNORANT",
-    "ILLUSTRATION",
-    "ILLUSTRIOUS",
-    "IMAGINABLE",
-    "IMMORAL",
-    "IMPARTIAL",
-    "IMPATIENCE",
-    "IMPATIENT",
-    "IMPERFECTION",
-    "IMPERFECTLY",
-    "IMPERTINENCE",
-    "IMPERTINENT",
-    "IMPLIED",
-    "IMPLY",
-    "IMPOSE",
-    "IMPOSED",
-    "IMPOSING",
-    "IMPRESSED",
-    "IMPRESSING",
-    "IMPRESSION",
-    "IMPROPRIETIES",
-    "IMPROPRIETY",
-    "IMPRUDENCE",
-    "IMPRUDENT",
-    "IMPULSE",
-    "IMPULSES",
-    "INADEQUATE",
-    "INATTENTION",
-    "INATTENTIVE",
-    "INCAPABLE",
-    "INCESSANT",
-    "INCESSANTLY",
-    "INCIVILITY",
-    "INCLINATION",
-    "INCLINATIONS",
-    "INCLINED",
-    "INCONCEIVABLE",
-    "INCONVENIENCE",
-    "INCONVENIENCES",
-    "INCONVENIENT",
-    "INCREDIBLE",
-    "INCREDULITY",
-    "INCREDULOUS",
-    "INDECISION",
-    "INDIFFERENCE",
-    "INDIFFERENT",
-    "INDIGNATION",
-    "INDIVIDUALLY",
-    "INDOLENCE",
-    "INDOLENT",
-    "INEVITABLY",
-    "INFERIOR",
-    "INFERIORITY",
-    "INFINITE",
-    "INFINITELY",
-    "INFLEXIBLY",
-    "INFORMALITY",
-    "INGRATITUDE",
-    "INHERIT",
-    "INHERITED",
-    "INHERITING",
-    "INHUMANITY",
-    "INJURE",
-    "INJURED",
-    "INJURING",
-    "INJUSTICE",
-    "INNOCENTLY",
-    "INSENSIBILITY",
-    "INSENSIBLE",
-    "INSIST",
-    "INSISTED",
-    "INSISTS",
-    "INSPIRES",
-    "INSPIRING",
-    "INSTANTANEOUS",
-    "INSTINCTIVELY",
-    "INSTRUCTED",
-    "INSTRUCTING",
-    "INSUFFICIENT",
-    "INTERRUPTION",
-    "INTERRUPTIONS",
-    "INTERVAL",
-    "INTERVALS",
-    "INTERVENE",
-    "INTIMATE",
-    "INTIMATELY",
-    "INTIMATES",
-    "INTIMIDATED",
-    "INVOLUNTARILY",
-    "INVOLUNTARY",
-    "IRRELIGIOUS",
-    "IRRITATED",
-    "IRRITATION",
-    "JUSTIFICATION",
-    "JUSTIFIED",
-    "JUSTIFY",
-    "JUSTIFYING",
-    "KEENER",
-    "KEENEST",
-    "KINDER",
-    "KINDEST",
-    "KITTY",
-    "LACONIC",
-    "LAMENT",
-    "LAMENTATIONS",
-    "LAMENTING",
-    "LANES",
-    "LAUREL",
-    "LEGALLY",
-    "LEISURELY",
-    "LOVELIEST",
-    "LOVELINESS",
-    "LUCAS",
-    "MAGISTRATE",
-    "MALICE",
-    "MALICIOUS",
-    "MAMMA",
-    "MATERNAL",
-    "MATLOCK",
-    "MATRIMONIAL",
-    "MATRIMONY",
-    "MEDIOCRITY",
-    "MEDITATE",
-    "MEDITATED",
-    "MEDITATING",
-    "MEDITATIONS",
-    "MELANCHOLY",
-    "MERCENARY",
-    "MERIT",
-    "MERITED",
-    "MERITS",
-    "MILITIA",
-    "MINIATURES",
-    "MIRACULOUS",
-    "MISTRESS",
-    "MISUNDERSTAND",
-    "MISUNDERSTOOD",
-    "MONOTONOUS",
-    "MORALIZE",
-    "MORTAL",
-    "MULTITUDE",
-    "MUTUALLY",
-    "NARRATIVE",
-    "NASTY",
-    "NEGLIGENT",
-    "NEIGHBOURING",
-    "NERVOUS",
-    "NEWCASTLE",
-    "NOTHINGS",
-    "NOTION",
-    "NOTIONS",
-    "NOVELTY",
-    "OAKS",
-    "OBSTACLES",
-    "OBSTINATE",
-    "OCCUPIED",
-    "OCCUPIES",
-    "OCCUPY",
-    "ODIOUS",
-    "OPPRESSED",
-    "OPPRESSIVELY",
-    "OSTENTATION",
-    "OSTENTATIOUS",
-    "PAPA",
-    "PASSIONS",
-    "PAVEMENT",
-    "PEACHES",
-    "PECUNIARY",
-    "PEDANTIC",
-    "PENETRATION",
-    "PERCEIVE",
-    "PERCEIVED",
-    "PERCEIVING",
-    "PERPETUAL",
-    "PERPETUALLY",
-    "PERPLEXITY",
-    "PERSEVERANCE",
-    "PERSEVERED",
-    "PERSEVERINGLY",
-    "PERVERSE",
-    "PETRIFIED",
-    "PHILOSOPHER",
-    "PHILOSOPHIC",
-    "PICTURESQUE",
-    "PLEASURES",
-    "POLITELY",
-    "POMPOUS",
-    "PONIES",
-    "POPE",
-    "PORTRAIT",
-    "PORTRAITS",
-    "POSITIVELY",
-    "POSTERITY",
-    "PRECEDING",
-    "PRECISELY",
-    "PREDICT",
-    "PREDOMINANCE",
-    "PREMEDITATED",
-    "PRESERVATIVE",
-    "PRESIDE",
-    "PRESIDED",
-    "PRESUME",
-    "PRESUMING",
-    "PRINCIPALLY",
-    "PRIVILEGE",
-    "PRIVILEGED",
-    "PRODIGIOUS",
-    "PRODIGIOUSLY",
-    "PROJECTED",
-    "PROMOTED",
-    "PROPORTION",
-    "PROPORTIONS",
-    "PROSPERITY",
-    "PROSPEROUS",
-    "PROTEST",
-    "PROTESTED",
-    "PROTESTING",
-    "PROVOKE",
-    "PROVOKED",
-    "PROVOKING",
-    "PRUDENCE",
-    "PRUDENT",
-    "PRUDENTIAL",
-    "PURSE",
-    "PYRAMIDS",
-    "QUIETED",
-    "QUIT",
-    "QUITTED",
-    "QUITTING",
-    "RATIONAL",
-    "RATIONALLY",
-    "REALITIES",
-    "REAPPEAR",
-    "RECITAL",
-    "RECKON",
-    "RECKONED",
-    "RECOVER",
-    "RECOVERED",
-    "RECOVERING",
-    "RECTITUDE",
-    "RECTOR",
-    "REFUGE",
-    "REGIMENT",
-    "REGULATE",
-    "REGULATED",
-    "REJECT",
-    "REJECTED",
-    "REJECTING",
-    "REJECTION",
-    "RELIED",
-    "RENEWAL",
-    "REPETITION",
-    "REPLETE",
-    "REPUGNANT",
-    "REPULSIVE",
-    "RESOLVE",
-    "RESOLVED",
-    "RESOLVING",
-    "RESPECTABILITY",
-    "RESTORED",
-    "RETROSPECTIVE",
-    "REVEALING",
-    "REVIVAL",
-    "REVIVED",
-    "RIDICULE",
-    "RIDICULING",
-    "RIDICULOUS",
-    "SALAD",
-    "SALLY",
-    "SANCTION",
-    "SANCTIONED",
-    "SARCASTIC",
-    "SATIN",
-    "SATIRICAL",
-    "SATISFACTIONS",
-    "SAVAGE",
-    "SCANDALOUS",
-    "SCARLET",
-    "ABANDONED",
-    "ABANDONING",
-    "ACHIEVEMENTS",
-    "ADHESIVE",
-    "ALRIGHT",
-    "ANTENNAE",
-    "APPRECIATED",
-    "APPRECIATION",
-    "ARMCHAIR",
-    "BARRICADE",
-    "BLANKET",
-    "BLOUSE",
-    "BOA",
-    "BOMBARD",
-    "BROOM",
-    "CASHIER",
-    "CEILING",
-    "CHEEK",
-    "CHEWING",
-    "CHILLY",
-    "CIGARETTES",
-    "CONCLUSIONS",
-    "CONSERVATORY",
-    "CONSIDERATE",
-    "CONSISTING",
-    "CONSUMED",
-    "CORPSE",
-    "COUCH",
-    "DEFINITE",
-    "DETERIORATION",
-    "DILIGENCE",
-    "DILIGENTLY",
-    "DOMINATED",
-    "ENTHUSIASM",
-    "ENTHUSIASTIC",
-    "EXAGGERATED",
-    "FINANCES",
-    "FOG",
-    "FOOTSTEPS",
-    "FROZE",
-    "GASLIGHT",
-    "HALLWAY",
-    "HOMEWORK",
-    "HORRIBLE",
-    "HUGGED",
-    "HUMANLY",
-    "HUNGRIER",
-    "IGNORING",
-    "IMAGININGS",
-    "IMMACULATE",
-    "IMMOBILE",
-    "IMPEDING",
-    "IMPLORING",
-    "INCOMPREHENSIBLE",
-    "INDICATING",
-    "INSISTENT",
-    "INVALID",
-    "INVESTIGATE",
-    "INVISIBLE",
-    "JUNK",
-    "LETHARGIC",
-    "LIEUTENANT",
-    "MEALTIME",
-    "METERS",
-    "MIDDAY",
-    "MIRACLE",
-    "MOBILITY",
-    "MONOGRAM",
-    "NECKLACE",
-    "OBSERVANT",
-    "OBSESSED",
-    "OSTRICH",
-    "PANIC",
-    "PERSECUTING",
-    "PILLOWS",
-    "POSTURE",
-    "PRECAUTION",
-    "PREOCCUPIED",
-    "PROHIBITION",
-    "PROVINCIAL",
-    "RAISINS",
-    "RELAXATION",
-    "REMOVING",
-    "RESPONDED",
-    "SACKED",
-    "SADDENED",
-    "SALLIED",
-    "SCREAMED",
-    "SHY",
-    "SLEEPINESS",
-    "SOFA",
-    "SPYING",
-    "STARE",
-    "STARED",
-    "STUBBORN",
-    "STUBBORNNESS",
-    "SUBORDINATES",
-    "SUPERNATURAL",
-    "SYMPTOM",
-    "TEMPORARILY",
-    "TEXTILE",
-    "TORTURED",
-    "TRAM",
-    "TRANSFERRING",
-    "TRANSFORM",
-    "TRANSFORMATION",
-    "TRANSFORMED",
-    "TRAVELLER",
-    "TREMENDOUS",
-    "TROUSER",
-    "UNCERTAINLY",
-    "UNDERWEAR",
-    "UNEXPECTED",
-    "UNSATISFACTORY",
-    "UNSUCCESSFULLY",
-    "UNUSED",
-    "VAGUE",
-    "VEGETABLES",
-    "VIGOROUSLY",
-    "VIGOUR",
-    "VIOLIN",
-    "WEAKER",
-    "ABSORB",
-    "ABSORBED",
-    "ABSORBS",
-    "ARISTOCRATIC",
-    "ASSIMILATED",
-    "BIOGRAPHICAL",
-    "CHILEAN",
-    "COLOSSAL",
-    "CONTINENT",
-    "CONTROVERSY",
-    "COSMOPOLITANS",
-    "CUBISM",
-    "DRAMAS",
-    "EMPATHY",
-    "ENERGIES",
-    "ENIGMATIC",
-    "EXECUTED",
-    "EXHIBITED",
-    "EXPRESSIONIST",
-    "FEROCIOUSLY",
-    "FOCUSING",
-    "FUSION",
-    "HETEROSEXUAL",
-    "HUMANISES",
-    "IMPRESSIONIST",
-    "INSPIRE",
-    "INSTINCT",
-    "INSTINCTIVE",
-    "MADAME",
-    "MODERNITY",
-    "NUDES",
-    "NUN",
-    "PERCEPTION",
-    "PORTRAYED",
-    "PREOCCUPATION",
-    "REALISM",
-    "REDEFINED",
-    "RETREAT",
-    "REVEAL",
-    "REVIEWERS",
-    "SHYNESS",
-    "SKETCHES",
-    "SPECTACULAR",
-    "SPECTATOR",
-    "SPECULATED",
-    "STYLISHLY",
-    "SUBORDINATION",
-    "SUCCES",
-    "SUPERB",
-    "TACT",
-    "TEXTURE",
-    "THEATRICALITY",
-    "ACADEMICS",
-    "ACCELERATED",
-    "ACCOMMODATE",
-    "ACCUMULATE",
-    "AFFILIATED",
-    "AGGRESSION",
-    "ALIENATE",
-    "AMPLIFYING",
-    "ANALOGY",
-    "ANALYSING",
-    "ANCIEN",
-    "ANDES",
-    "ANTHROPOLOGIST",
-    "ARCHAEOLOGICAL",
-    "ARCHAEOLOGIST",
-    "ARCHAEOLOGISTS",
-    "BOMBINGS",
-    "BOOM",
-    "BOOMS",
-    "CAMBODIAN",
-    "CAPTURED",
-    "CAUSAL",
-    "CHALLENGED",
-    "CHERNOBYL",
-    "CODIFY",
-    "COMPLEXITY",
-    "CONFLICTS",
-    "CONSTRUCTING",
-    "CONTROVERSIAL",
-    "CORRUPT",
-    "CRISES",
-    "CRITICISM",
-    "CRUCIAL",
-    "CULMINATE",
-    "CYCLIC",
-    "CYCLICAL",
-    "DECADES",
-    "DECODES",
-    "DEDUCE",
-    "DEPENDENCY",
-    "DEPRESSING",
-    "DESPERATELY",
-    "DESTABILISING",
-    "DISASTERS",
-    "ECOLOGICAL",
-    "ECOLOGY",
-    "ECONOMIST",
-    "ECONOMISTS",
-    "EGYPTIAN",
-    "ELITES",
-    "EUREKA",
-    "EVOLVED",
-    "EXECUTIVES",
-    "EXISTENTIAL",
-    "FLUCTUATIONS",
-    "FRAGILE",
-    "FRAGMENTED",
-    "FUNDAMENTALS",
-    "GREENLAND",
-    "HISTORIANS",
-    "HUMANITY",
-    "ICELAND",
-    "IDEOLOGICAL",
-    "IDIOSYNCRATIC",
-    "IMMINENT",
-    "INCORPORATES",
-    "INDICATOR",
-    "INDUSTRIALISED",
-    "INEVITABILITY",
-    "INFLEXIBLE",
-    "INFORMATIONAL",
-    "INITIALLY",
-    "INJECTING",
-    "INSTABILITY",
-    "INTENSIFIED",
-    "INTERACT",
-    "INTERACTED",
-    "INTERACTING",
-    "INTERPRETATIVE",
-    "INTERVENTIONS",
-    "KEEN",
-    "MAFIOSI",
-    "MAGNUM",
-    "MALTHUS",
-    "MANAGEABLE",
-    "MARGINALISED",
-    "MATHEMATICAL",
-    "MATHEMATICIANS",
-    "MATHS",
-    "MAXIMISE",
-    "MIKHAIL",
-    "MILLENNIUM",
-    "MOBILISATION",
-    "MONARCHIES",
-    "MOSCOW",
-    "NARRATIVES",
-    "OTTOMAN",
-    "PACTS",
-    "PERIODIC",
-    "PESTICIDE",
-    "PHYSICIST",
-    "PHYSICISTS",
-    "PRECISE",
-    "PREDICTABLE",
-    "PREDICTED",
-    "PREDICTING",
-    "PREDICTION",
-    "PREDICTIONS",
-    "PRINCETON",
-    "PROPHECIES",
-    "PROTESTS",
-    "QUANTITATIVE",
-    "RACISM",
-    "RADICAL",
-    "REBELLION",
-    "RECONSTRUCTING",
-    "RECONSTRUCTION",
-    "REGISTERS",
-    "REVOLUTIONARY",
-    "REVOLUTIONS",
-    "RISEN",
-    "SCEPTICAL",
-    "SCHOLAR",
-    "SCHOLARS",
-    "SECULAR",
-    "SEISMIC",
-    "SEXISM",
-    "SHRANK",
-    "SIMULATED",
-    "SKELETAL",
-    "SOCIETAL",
-    "SOPHISTICATED",
-    "SOVIET",
-    "SPECIALISATION",
-    "SUPPLEMENTARY",
-    "SURVIVE",
-    "TENSIONS",
-    "TERRIFIED",
-    "TERRIFYINGLY",
-    "TERRORISTS",
-    "TOXIC",
-    "TURBULENCE",
-    "VERBAL",
-    "VILLAS",
-    "VISCERAL",
-    "WALT",
-    "WIDESPREAD",
-])
+def __getattr__(name):
+    # Called only until the list is loaded and stored as a module global
+    if name in _FILES:
+        words = globals()[name] = load(name)
+        return words
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
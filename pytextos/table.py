@@ -0,0 +1,159 @@
+"""
+Columnar table of the metrics of the members of a Collection: one array of
+floats per metric, so that sorting, filtering, grouping and exporting read
+compact columns instead of going through every Text object.
+"""
+
+from array import array
+from itertools import compress
+from math import fsum, isnan
+from .index import NUMERIC, _value
+
+# Metrics stored as floats but returned as int
+INTEGER = ("token_count", "type_count", "reading_time")
+
+# Metrics that a Text returns as int or float, stored as floats and returned
+# as they were given
+MIXED = ("avg_word_len",)
+
+
+def _mean(values):
+    # As statistics.fmean(), which is new in Python 3.8
+    return fsum(values) / len(values)
+
+
+# statistics is imported on first use, it pulls in random, fractions and decimal
+def _median(values):
+    from statistics import median
+    return median(values)
+
+
+AGGREGATES = {"count": len, "sum": fsum, "mean": _mean, "median": _median, "min": min, "max": max}
+
+
+class MetricsTable:
+    """
+    Struct of arrays of metric values by text ID: `ids` holds the ID of each
+    row and `columns` an array('d') per metric, with NaN for metrics that are
+    not defined for a text. Values are read when a text is added, so the
+    table doesn't need the texts' bodies afterwards; texts edited later must
+    be added again.
+    """
+
+    def __init__(self, fields=NUMERIC):
+        self.fields = tuple(fields)
+        self.ids = array("I")
+        self.columns = {field: array("d") for field in self.fields}
+        self._rows = {}  # text ID -> row
+        self._ints = set()  # (text ID, field) of MIXED metrics given as int
+
+    def __repr__(self):
+        return f"<MetricsTable: {len(self)} rows, {len(self.fields)} columns>"
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, text_id):
+        return text_id in self._rows
+
+    @property
+    def nbytes(self):
+        """Memory used by the columns in bytes (int)"""
+        return sum(a.itemsize * len(a) for a in (self.ids, *self.columns.values()))
+
+    def add(self, text_id, text):
+        """Adds the metrics of a text, or updates them if it is already in the table"""
+        values = [_value(text, field) for field in self.fields]
+        row = self._rows.get(text_id)
+        if row is None:
+            row = self._rows[text_id] = len(self.ids)
+            self.ids.append(text_id)
+            for field in self.fields:
+                self.columns[field].append(0.0)
+        for field, value in zip(self.fields, values):
+            self.columns[field][row] = float("nan") if value is None else value
+            if field in MIXED:
+                if isinstance(value, int):
+                    self._ints.add((text_id, field))
+                else:
+                    self._ints.discard((text_id, field))
+
+    def remove(self, text_id):
+        """Removes a text, moving the last row in its place"""
+        row = self._rows.pop(text_id)
+        self._ints.difference_update((text_id, field) for field in MIXED)
+        last = len(self.ids) - 1
+        if row != last:
+            moved = self.ids[row] = self.ids[last]
+            self._rows[moved] = row
+            for column in self.columns.values():
+                column[row] = column[last]
+        del self.ids[last]
+        for column in self.columns.values():
+            del column[last]
+
+    def _out(self, field, value, text_id):
+        if isnan(value):
+            return None
+        if field in INTEGER or (text_id, field) in self._ints:
+            return int(value)
+        return value
+
+    def value(self, field, text_id):
+        """Returns the value of a metric for a text, or None if it is not defined"""
+        return self._out(field, self.columns[field][self._rows[text_id]], text_id)
+
+    def row(self, text_id):
+        """Returns a dict of the metrics of a text"""
+        row = self._rows[text_id]
+        return {f: self._out(f, self.columns[f][row], text_id) for f in self.fields}
+
+    def sort(self, field, descending=False):
+        """
+        Returns the text IDs sorted by a metric (array), ties by ID and texts
+        without a value last
+        """
+        column = self.columns[field]
+        defined = [(v, i) for v, i in zip(column, self.ids) if v == v]
+        if descending:
+            defined = [(-v, i) for v, i in defined]
+        defined.sort()
+        missing = sorted(compress(self.ids, map(isnan, column)))
+        return array("I", [i for _, i in defined] + missing)
+
+    def select(self, field, low=None, high=None):
+        """
+        Returns the IDs of the texts whose metric is between `low` and `high`,
+        both included (None for no bound), in ID order (array)
+        """
+        column = self.columns[field]
+        if low is None and high is None:
+            mask = (v == v for v in column)
+        elif low is None:
+            mask = (v <= high for v in column)
+        elif high is None:
+            mask = (v >= low for v in column)
+        else:
+            mask = (low <= v <= high for v in column)
+        return array("I", sorted(compress(self.ids, mask)))
+
+    def group_by(self, keys, field, aggregate="mean"):
+        """
+        Aggregates a metric by group: `keys` maps each text ID to its group
+        and `aggregate` is one of count, sum, mean, median, min and max, or a
+        function of a list of values. Texts without a value are left out.
+        Returns a dict of group -> result, groups in order of first row.
+        """
+        func = AGGREGATES.get(aggregate, aggregate)
+        groups = {}
+        for text_id, value in zip(self.ids, self.columns[field]):
+            if value == value:
+                key = keys[text_id]
+                try:
+                    groups[key].append(value)
+                except KeyError:
+                    groups[key] = [value]
+        results = {key: func(values) for key, values in groups.items()}
+        if field in INTEGER and aggregate in ("sum", "min", "max"):
+            results = {key: int(result) for key, result in results.items()}
+        return results
@@ -6,13 +6,45 @@ Issues: tokenization not perfect, how to implement vocabulary, required formatti
 """
 
 # Standard library imports to be used in methods
-import string
-from statistics import mean  # to calculate avg word length
-from collections import Counter  # for frequency distributions
+from collections import Counter, namedtuple
+from functools import wraps
 from math import sqrt, log
-import re
-from secrets import choice
-from .stopwords import ENGLISH_STOPS, KNOWN_VOCABULARY
+from . import stopwords
+from .analysis import Analysis
+from .tokenizer import TOKENIZER, SENTENCE_END
+from .spans import SpanIndex
+from .readers import read_lines, read_header, read_footer, decode_lines, map_lines, MappedBody
+
+
+# Fields of a TextRecord: metadata first, then computed metrics
+METADATA = ("filename", "title", "by", "date", "subtitle", "text_type", "genre", "source")
+METRICS = (
+    "token_count",
+    "type_count",
+    "lex_div_maas",
+    "hapax_richness",
+    "avg_word_len",
+    "avg_sentence_len",
+    "reading_time",
+    "keywords",
+)
+
+# Compact, picklable summary of a Text: metadata, metric values and the
+# frequency distribution as a dict
+TextRecord = namedtuple("TextRecord", METADATA + METRICS + ("freq",))
+
+
+def recorded(method):
+    """Metric property served from the Text's record when it has one"""
+    name = method.__name__
+
+    @wraps(method)
+    def metric(self):
+        if self._record is not None:
+            return getattr(self._record, name)
+        return method(self)
+
+    return property(metric)
 
 
 # Definition of Text class
@@ -22,141 +54,323 @@ class Text:
     checks for keywords and vocabulary against a list of stopwords
     """
 
-    def __init__(self, filename):
+    # Worker processes analyzing the body, see Text.__init__
+    jobs = None
+
+    # True once the body is changed in memory, see Text.edited
+    _edited = False
+
+    def __init__(self, filename, lazy=False, mmap=False, jobs=None):
         """
         Initializes Text object by providing a .txt filename which is then parsed.
         `text_type` and `genre` are optional parameters which can be updated later.
+        `lazy` reads the body on first access, `mmap` decodes paragraphs from
+        the mapped file when used and `jobs` analyzes the body in worker
+        processes (see Text._analyze).
         """
         self.filename = filename
+        self.jobs = jobs
 
         # Validating filename argument and raising exceptions.
         if filename.endswith(".txt"):
             try:
-                with open(filename, "r", encoding="utf-8", errors="ignore") as f:
-                    lines = [line.strip() for line in f.readlines() if not line.startswith("\n")]
-
-                self.title = lines[0]
-                self.by = lines[1]
-                self.date = lines[2]
-                self.subtitle = lines[3][1:-2] if lines[3].startswith("*") else None
-                self.body = lines[3:-3]
-                self.raw_body = " ".join(self.body)
-                self.text_type = (
-                    lines[-3][1:] if lines[-3].startswith("+") else None
-                )
-                self.genre = (
-                    lines[-2][1:] if lines[-2].startswith("-") else None
-                )
-                self.source = lines[-1]
+                if mmap:
+                    header, footer, body = map_lines(filename)
+                    self._parse(header, footer)
+                    self._set_body(body)
+                elif lazy:
+                    self._parse(read_header(filename), read_footer(filename))
+                    self._body = None
+                    self._cache = {}
+                    self._record = None
+                else:
+                    lines = read_lines(filename)
+                    self._parse(lines[:4], lines[-3:])
+                    self._set_body(lines[3:-3])
             except FileNotFoundError:
                 print("File not found in this directory.")
         else:
             print("The filename doesn't have a txt extension.")
 
+    def _parse(self, header, footer):
+        """Sets metadata attributes from the header and footer lines"""
+        self.title = header[0]
+        self.by = header[1]
+        self.date = header[2]
+        self.subtitle = header[3][1:-2] if header[3].startswith("*") else None
+        self.text_type = (
+            footer[-3][1:] if footer[-3].startswith("+") else None
+        )
+        self.genre = (
+            footer[-2][1:] if footer[-2].startswith("-") else None
+        )
+        self.source = footer[-1]
+
+    @classmethod
+    def from_bytes(cls, filename, data):
+        """
+        Creates a Text from the UTF-8 encoded content of a file already read
+        into memory, parsed as if it was read from `filename`
+        """
+        lines = decode_lines(data)
+        text = cls.__new__(cls)
+        text.filename = filename
+        text._parse(lines[:4], lines[-3:])
+        text._set_body(lines[3:-3])
+        return text
+
+    @classmethod
+    def from_record(cls, record):
+        """
+        Creates a Text from a TextRecord without reading the file: metrics are
+        served from the record and the body is read from `record.filename`
+        on first access. Changing the body discards the record.
+        """
+        text = cls.__new__(cls)
+        for field in METADATA:
+            setattr(text, field, getattr(record, field))
+        text._body = None
+        text._cache = {}
+        text._record = record
+        return text
+
+    @classmethod
+    def from_partial(cls, filename, header, footer, partial):
+        """
+        Creates a Text from its header and footer lines and the merged Partial
+        analysis of its body (see pytextos.scheduler), without reading the
+        body: metrics are computed from the partial counts and kept in a
+        record, as for Text.from_record().
+        """
+        text = cls.__new__(cls)
+        text.filename = filename
+        text._parse(header, footer)
+        text._body = None
+        text._record = None
+        text._cache = {
+            "analysis": Analysis.from_counts(partial.counts),
+            "sentence_stats": partial.sentence_stats(),
+        }
+        text.unload()
+        return text
+
+    def record(self):
+        """
+        Returns a TextRecord with metadata and metrics. Metrics that are not
+        defined for this text (e.g. for an empty body) are None.
+        """
+        if self._record is not None:
+            return self._record
+        values = [getattr(self, field, None) for field in METADATA]
+        for field in METRICS:
+            try:
+                values.append(getattr(self, field))
+            except (ZeroDivisionError, ValueError):
+                values.append(None)
+        values.append(dict(self.freq_dist()))
+        return TextRecord(*values)
+
+    def unload(self, keep_freq=True):
+        """
+        Drops the body and every cached result, keeping the metadata and a
+        TextRecord that serves the metrics, so that the Text no longer takes
+        memory in proportion to its length. The body is read again from the
+        file when needed; changes to it that were not saved are lost.
+        With `keep_freq=False` the frequency distribution is dropped from the
+        record too, and computed again from the file when used.
+        """
+        record = self.record()
+        if not keep_freq:
+            record = record._replace(freq=None)
+        self._record = record
+        self._body = None
+        self._cache = {}
+
+    @property
+    def edited(self):
+        """True if the body was changed since it was read from the file (bool)"""
+        return self._edited
+
+    @property
+    def loaded(self):
+        """True if the body or results computed from it are in memory (bool)"""
+        return self._body is not None or bool(self._cache)
+
     def __repr__(self):
         return f"<Text '{self.title} by {self.by}>"
 
+    @property
+    def body(self):
+        """List of paragraphs. Assigning a new body discards cached results."""
+        if self._body is None:
+            self._body = read_lines(self.filename)[3:-3]
+            self._cache = {}
+        return self._body
+
+    @body.setter
+    def body(self, paragraphs):
+        self._set_body(paragraphs)
+        self._edited = True
+
+    def _set_body(self, paragraphs):
+        self._body = paragraphs
+        self._cache = {}
+        self._record = None
+
+    def _cached(self, key, compute):
+        """Returns cached result for `key`, computing it on first use"""
+        try:
+            return self._cache[key]
+        except KeyError:
+            # Computed first, as loading the body replaces the cache. If two
+            # threads compute the same result, both use the first stored.
+            value = compute()
+            return self._cache.setdefault(key, value)
+
+    @property
+    def raw_body(self):
+        """Body as a single string, paragraphs joined by spaces (str)"""
+        return self._cached("raw_body", lambda: " ".join(self.body))
+
+    @property
+    def _analysis(self):
+        """Single-pass Analysis of the body, shared by all metrics"""
+        return self._cached("analysis", self._analyze)
+
+    def _analyze(self):
+        """
+        Analysis of the body: with `jobs=N` in N worker processes, a slice
+        of paragraphs each, which read the slices of a memory-mapped body
+        from the file (worth it for long texts only); a memory-mapped body is
+        otherwise tokenized a chunk at a time
+        """
+        body = self.body
+        if self.jobs and self.jobs > 1:
+            from .scheduler import analyze_text  # imports Text
+            analysis, sentence_stats = analyze_text(body, self.jobs, self.filename)
+            # Measured in the same pass, kept unless the body changes meanwhile
+            self._cache.setdefault("sentence_stats", sentence_stats)
+            return analysis
+        if isinstance(body, MappedBody):
+            # Tokenize straight from the mapped file, a chunk at a time
+            return Analysis.from_chunks(TOKENIZER.tokenize(c) for c in body.chunks())
+        return Analysis(TOKENIZER.tokenize(self.raw_body))
+
+    @property
+    def spans(self):
+        """SpanIndex with token and sentence offsets into raw_body, built on first use"""
+        return self._cached("spans", lambda: SpanIndex(self.raw_body))
+
     def __getitem__(self, i):
         return self.body[i]
 
     def __len__(self):
         return len(self.body)
 
+    def append_paragraph(self, paragraph):
+        """Adds a paragraph at the end of the body"""
+        self._edit(len(self.body), 0, paragraph)
+
+    def insert_paragraph(self, i, paragraph):
+        """Inserts a paragraph before paragraph i"""
+        self._edit(i, 0, paragraph)
+
+    def replace_paragraph(self, i, paragraph):
+        """Replaces paragraph i with a new one"""
+        self._edit(i, 1, paragraph)
+
+    def remove_paragraph(self, i):
+        """Removes paragraph i from the body"""
+        self._edit(i, 1, None)
+
+    def _edit(self, i, removed, paragraph):
+        """
+        Removes `removed` paragraphs at position i and inserts `paragraph`
+        there if given. An existing analysis is updated with the edited
+        paragraph only; results derived from raw_body are discarded.
+        """
+        body = self.body
+        if not isinstance(body, list):
+            body = list(body)
+        if removed:
+            i = range(len(body))[i]
+        else:
+            i = min(max(i + len(body) if i < 0 else i, 0), len(body))
+        analysis = self._cache.get("analysis")
+        if analysis is not None:
+            analysis.split_paragraphs(body, TOKENIZER)
+            if removed:
+                analysis.remove(i)
+        if removed:
+            del body[i]
+        if paragraph is not None:
+            paragraph = paragraph.strip()
+            body.insert(i, paragraph)
+            if analysis is not None:
+                analysis.insert(i, TOKENIZER.tokenize(paragraph))
+        self._body = body
+        self._cache = {} if analysis is None else {"analysis": analysis}
+        self._record = None
+        self._edited = True
+
     def sent_tokenize(self):
         """
         Returns list of sentences from raw_body or the text
         """
-        pattern=r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s"
-        return [s for s in re.split(pattern, self.raw_body) if len(s)>3]
+        return list(self._sentences)
+
+    @property
+    def _sentences(self):
+        return self._cached(
+            "sentences", lambda: [s for s in SENTENCE_END.split(self.raw_body) if len(s)>3]
+        )
 
     def tokenize(self):
         """
         Returns a list of word tokens from the body of the text
         """
-        # Remove curly quotes with a maketrans() translation table
-        words = []
-        mapping = {
-            '"': None,
-            "\u201c": None,
-            "\u201d": None,
-            "\u2018": None,
-            "\u2019": "'",
-            "\u2012": " ",
-            "\u2013": " ",
-            "\u2014": " ",
-            "\u2015": " ",
-            "!": None,
-            "?": None,
-            "#": None,
-            "$": None,
-            "%": None,
-            "&": None,
-            "\\": None,
-            "(": None,
-            ")": None,
-            "*": None,
-            "+": None,
-            ",": None,
-            "-": " ",
-            ".": None,
-            "/": None,
-            ":": None,
-            ";": None,
-            "<": None,
-            "=": None,
-            ">": None,
-            "@": None,
-            "[": None,
-            "]": None,
-            "~": None,
-            "_": None,
-            "`": None,
-            "{": None,
-            "}": None,
-            "0": None,
-            "1": None,
-            "2": None,
-            "3": None,
-            "4": None,
-            "5": None,
-            "6": None,
-            "7": None,
-            "8": None,
-            "9": None,
-        }
-        trans_table = str.maketrans(mapping)
-        for sent in self.body:
-            clean_sent = sent.translate(trans_table)
-            words.extend(
-                [w.strip("' ").upper() for w in clean_sent.split()]
-            )  # remove single quotes but not apostrophe
-        return words
+        return self._analysis.tokens()
 
-    @property
+    @recorded
     def token_count(self):
         """Total number of words, i.e. tokens (int)"""
-        return len(self.tokenize())
+        return self._analysis.token_count
 
-    @property
+    @recorded
     def type_count(self):
         """Number of unique types, i.e. set of tokens (int)"""
-        return len(set(self.tokenize()))
+        return self._analysis.type_count
 
-    @property
+    @recorded
     def reading_time(self):
         """Reading time in rounded number of minutes (int) """
         return round(self.token_count / 265)
 
-    @property
+    @recorded
     def avg_word_len(self):
         """Average word length in number of characters (int)"""
-        return round(mean([len(w) for w in self.tokenize()]), 2)
+        analysis = self._analysis
+        if not analysis.token_count:
+            from statistics import StatisticsError
+            raise StatisticsError("mean requires at least one data point")
+        # An int when the mean is exact, as statistics.mean() returned it
+        words, rest = divmod(analysis.char_count, analysis.token_count)
+        return round(analysis.char_count / analysis.token_count, 2) if rest else words
 
     @property
+    def _sentence_stats(self):
+        # Number of sentences and their total length in characters
+        if self.jobs and self.jobs > 1 and "analysis" not in self._cache:
+            self._analysis  # measures sentences in the worker processes too
+        return self._cached(
+            "sentence_stats", lambda: (len(self._sentences), sum(map(len, self._sentences)))
+        )
+
+    @recorded
     def avg_sentence_len(self):
         """Average sentence length in number of characers (int)"""
-        sentences=self.sent_tokenize()
-        return round(sum(map(len, sentences)) / len(sentences), 2)
+        count, chars = self._sentence_stats
+        return round(chars / count, 2)
 
 
     def lex_div(self, variant="maas"):
@@ -171,43 +385,38 @@ class Text:
                 log(self.token_count) ** 2
             )
 
-    @property
+    @recorded
     def lex_div_maas(self):
         """ Maas lexical diversity (float)"""
         return self.lex_div()
 
-    @property
+    @recorded
     def hapax_richness(self):
         """ Number of hapaxes divided by total number of tokens (float)"""
-        freq = self.freq_dist()
-        hapax = [w for w in freq if freq[w] == 1]
-        return len(hapax) / self.token_count * 100
+        return self._analysis.hapax_count / self.token_count * 100
 
-    @property
+    @recorded
     def keywords(self):
         """ Seven most common words separated by space (str)"""
-        words = [i[0] for i in self.freq_dist().most_common(10)]
+        words = [i[0] for i in self._analysis.most_common(10)]
         return " ".join(words)
 
     def freq_dist(self):
         """Returns a Counter object with word frequencies (Counter object)"""
-        cnt = Counter()
-        for word in self.tokenize():
-            if word.lower() not in ENGLISH_STOPS:
-                cnt[word.upper()] += 1
-        return cnt
+        if self._record is not None and self._record.freq is not None:
+            return Counter(self._record.freq)
+        return self._analysis.freq_dist()
 
     def word_freq(self, word):
         """Returns number of occurrences of a given word, excluding stopwords (int)"""
-        freq = self.freq_dist()
-        if word.upper() in freq:
-            return freq[word.uppwer()]
-        else:
-            return 0
+        if self._record is not None and self._record.freq is not None:
+            return self._record.freq.get(word.upper(), 0)
+        return self._analysis.count(word.upper())
 
     def random_sent(self):
         """Returns random senteces from body of text"""
-        return choice(self.sent_tokenize()).strip()
+        from secrets import choice  # imported here, it pulls in hashlib
+        return choice(self._sentences).strip()
 
 
 
@@ -218,15 +427,14 @@ class Text:
         full = set(
             [
                 word.upper()
-                for word in self.tokenize()
-                if word.lower() not in ENGLISH_STOPS
+                for word in self.freq_dist()
             ]
         )
         return sorted(
             [
                 word.upper()
                 for word in full
-                if word not in (KNOWN_VOCABULARY) and word.isalpha()
+                if word not in (stopwords.KNOWN_VOCABULARY) and word.isalpha()
             ]
         )
 
@@ -0,0 +1,191 @@
+"""
+Tokenizer shared by Text and Extract objects. Translation tables are built
+once at import time; plain ASCII input takes a fast path working on bytes.
+"""
+
+import re
+from array import array
+
+# Whitespace ending a sentence: after a full stop or question mark, except in
+# abbreviations such as "e.g." or "Mr."
+SENTENCE_END = re.compile(r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s")
+
+# Characters removed (None) or replaced before splitting on whitespace.
+# Curly quotes are removed, except the closing one, used as an apostrophe.
+MAPPING = {
+    '"': None,
+    "\u201c": None,
+    "\u201d": None,
+    "\u2018": None,
+    "\u2019": "'",
+    "\u2012": " ",
+    "\u2013": " ",
+    "\u2014": " ",
+    "\u2015": " ",
+    "!": None,
+    "?": None,
+    "#": None,
+    "$": None,
+    "%": None,
+    "&": None,
+    "\\": None,
+    "(": None,
+    ")": None,
+    "*": None,
+    "+": None,
+    ",": None,
+    "-": " ",
+    ".": None,
+    "/": None,
+    ":": None,
+    ";": None,
+    "<": None,
+    "=": None,
+    ">": None,
+    "@": None,
+    "[": None,
+    "]": None,
+    "~": None,
+    "_": None,
+    "`": None,
+    "{": None,
+    "}": None,
+    "0": None,
+    "1": None,
+    "2": None,
+    "3": None,
+    "4": None,
+    "5": None,
+    "6": None,
+    "7": None,
+    "8": None,
+    "9": None,
+}
+
+
+class Tokenizer:
+    """
+    Splits text into upper-cased word tokens. Characters in `mapping` are
+    removed (None) or replaced, text is split on whitespace and single quotes
+    around each word are stripped, keeping apostrophes inside words.
+
+    Text is processed as UTF-8 bytes: ASCII characters never occur inside
+    multibyte sequences, so a single bytes.translate() handles the ASCII part
+    of the mapping and bytes.replace() the few non-ASCII characters. Pure ASCII
+    input is also upper-cased as bytes.
+    """
+
+    def __init__(self, mapping=MAPPING):
+        self.mapping = dict(mapping)
+        sources, targets, deleted = [], [], []
+        self._replace = []
+        for c, v in self.mapping.items():
+            if c.isascii() and v is None:
+                deleted.append(c)
+            elif c.isascii() and len(v) == 1 and v.isascii():
+                sources.append(c)
+                targets.append(v)
+            else:
+                self._replace.append((c.encode("utf-8"), (v or "").encode("utf-8")))
+        self._table = bytes.maketrans("".join(sources).encode(), "".join(targets).encode())
+        self._delete = "".join(deleted).encode()
+        # Offsets of tokens: runs between whitespace and characters mapped to
+        # spaces, trimmed of removed characters and quotes
+        spaced = "".join(c for c, v in self.mapping.items() if v == " ")
+        self._run = re.compile(f"[^\\s{re.escape(spaced)}]+")
+        self._removed = "".join(c for c, v in self.mapping.items() if v is None)
+        self._trimmed = self._removed + "'" + "".join(
+            c for c, v in self.mapping.items() if v == "'"
+        )
+        # Sequential replacements only match str.translate() when no
+        # replacement produces a character that is mapped itself
+        self._translate = None
+        if any(ch in self.mapping for v in self.mapping.values() if v for ch in v):
+            self._translate = str.maketrans(self.mapping)
+
+    def __repr__(self):
+        return f"<Tokenizer: {len(self.mapping)} mapped characters>"
+
+    def __call__(self, text):
+        return self.tokenize(text)
+
+    def tokenize(self, text):
+        """
+        Returns a list of upper-cased word tokens from a string, or from
+        bytes of UTF-8 encoded text
+        """
+        if not isinstance(text, str):
+            data = bytes(text)
+            if data.isascii() and self._translate is None:
+                return self._split(self._clean(data).upper().decode("ascii"))
+            # Undecodable bytes are dropped before mapping, as when reading files
+            text = data.decode("utf-8", errors="ignore")
+        if self._translate is not None:
+            clean = text.translate(self._translate).upper()
+        elif text.isascii():
+            clean = self._clean(text.encode("ascii")).upper().decode("ascii")
+        else:
+            data = self._clean(text.encode("utf-8", errors="surrogatepass"))
+            clean = data.decode("utf-8", errors="surrogatepass").upper()
+        return self._split(clean)
+
+    def spans(self, text):
+        """
+        Returns two arrays with the start and end offsets in `text` of every
+        token produced by tokenize(text)
+        """
+        starts, ends = offset_arrays(len(text))
+        trimmed, removed = self._trimmed, self._removed
+        for m in self._run.finditer(text):
+            run = m.group()
+            word = run.strip(trimmed)
+            if word:
+                start = m.start() + len(run) - len(run.lstrip(trimmed))
+                starts.append(start)
+                ends.append(start + len(word))
+            elif run.strip(removed):
+                # Only quotes left: tokenize() yields an empty token
+                starts.append(m.start())
+                ends.append(m.start())
+        return starts, ends
+
+    def _split(self, clean):
+        if "'" not in clean:
+            return clean.split()
+        # remove single quotes but not apostrophe
+        return [w.strip("' ") for w in clean.split()]
+
+    def _clean(self, data):
+        data = data.translate(self._table, self._delete)
+        if not data.isascii():
+            for old, new in self._replace:
+                data = data.replace(old, new)
+        return data
+
+
+def offset_arrays(size):
+    """Returns two empty arrays able to hold offsets up to `size`"""
+    typecode = "I" if size < 2**32 else "Q"
+    return array(typecode), array(typecode)
+
+
+def sentence_spans(text):
+    """
+    Returns two arrays with the start and end offsets in `text` of the
+    sentences found by Text.sent_tokenize()
+    """
+    starts, ends = offset_arrays(len(text))
+    start = 0
+    for m in SENTENCE_END.finditer(text):
+        if m.start() - start > 3:
+            starts.append(start)
+            ends.append(m.start())
+        start = m.end()
+    if len(text) - start > 3:
+        starts.append(start)
+        ends.append(len(text))
+    return starts, ends
+
+
+# Module-level tokenizer, built once at import time
+TOKENIZER = Tokenizer()
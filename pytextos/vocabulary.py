@@ -0,0 +1,69 @@
+"""
+Shared vocabulary table: every distinct token type gets an integer ID, so
+texts are stored as compact arrays of IDs and counted with integer keys.
+"""
+
+import threading
+from array import array
+from . import stopwords
+
+
+class Vocabulary:
+    """
+    Maps token types (upper-case str) to consecutive integer IDs and back,
+    flagging the types that are stopwords. Safe to use from several threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()  # new types can be added from several threads
+        self._ids = {}
+        self.types = []
+        self.stops = bytearray()
+
+    def __repr__(self):
+        return f"<Vocabulary: {len(self)} types>"
+
+    def __len__(self):
+        return len(self.types)
+
+    def __contains__(self, word):
+        return word in self._ids
+
+    def __getitem__(self, i):
+        return self.types[i]
+
+    def get(self, word, default=None):
+        """Returns the ID of a type, or `default` if it isn't in the vocabulary"""
+        return self._ids.get(word, default)
+
+    def intern(self, word):
+        """Returns the ID of a type, adding it to the vocabulary if needed (int)"""
+        i = self._ids.get(word)
+        if i is None:
+            with self._lock:
+                i = self._ids.get(word)
+                if i is None:
+                    i = len(self.types)
+                    self.types.append(word)
+                    self.stops.append(word.lower() in stopwords.ENGLISH_STOPS)
+                    # Published last, so that an ID is never seen before its type
+                    self._ids[word] = i
+        return i
+
+    def encode(self, tokens, types=None):
+        """
+        Returns an array('I') of IDs for a list of tokens. `types` is an
+        optional iterable of the distinct tokens, if already known.
+        """
+        if types is None:
+            types = set(tokens)
+        local = {w: self.intern(w) for w in types}
+        return array("I", map(local.__getitem__, tokens))
+
+    def decode(self, ids):
+        """Returns the list of tokens for a sequence of IDs"""
+        return list(map(self.types.__getitem__, ids))
+
+
+# Vocabulary shared by all Text objects
+VOCABULARY = Vocabulary()
@@ -0,0 +1,113 @@
+"""
+Change notifications for the folders of a live Collection: inotify through
+ctypes where the C library provides it (Linux), polling otherwise.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+
+# inotify(7) constants
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_DELETE = 0x200
+IN_Q_OVERFLOW = 0x4000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCHED = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE
+
+# struct inotify_event: wd, mask, cookie, len, then the name
+_EVENT = struct.Struct("iIII")
+
+
+def _libc():
+    """Returns the C library if it has inotify, or None"""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class Watcher:
+    """
+    Waits for files to change in a set of directories. `directories` maps a
+    prefix to a directory to watch: changed files are reported as
+    os.path.join(prefix, name), to match the file names used by a
+    Collection. With inotify, wait() returns the paths that changed;
+    otherwise, or when the kernel dropped events, it sleeps `interval`
+    seconds and returns None, meaning that every file must be checked.
+    """
+
+    def __init__(self, directories, interval=1.0):
+        self.interval = interval
+        self._fd = None
+        self._prefixes = {}  # watch descriptor -> prefix
+        libc = _libc() if directories else None
+        if libc is None:
+            return
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return
+        for prefix, directory in directories.items():
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), WATCHED)
+            if wd < 0:
+                os.close(fd)
+                self._prefixes.clear()
+                return
+            self._prefixes[wd] = prefix
+        self._fd = fd
+
+    def __repr__(self):
+        mode = "inotify" if self.inotify else f"polling every {self.interval} s"
+        return f"<Watcher: {mode}>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def inotify(self):
+        """True if changes are notified by inotify rather than polled (bool)"""
+        return self._fd is not None
+
+    def wait(self, timeout=None):
+        """
+        Waits for changes and returns the set of changed paths (empty after
+        `timeout` seconds without changes), or None if they are not known
+        """
+        if self._fd is None:
+            time.sleep(self.interval if timeout is None else min(self.interval, timeout))
+            return None
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return set()
+        paths = set()
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return paths
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                if mask & IN_Q_OVERFLOW:
+                    return None
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if wd in self._prefixes and name:
+                    paths.add(os.path.join(self._prefixes[wd], os.fsdecode(name)))
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
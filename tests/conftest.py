@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+def write_text(path, paragraphs, title="Title", by="By Some One", genre="news"):
+    """Writes a text in Text's file format: header, body and footer lines"""
+    lines = [title, by, "2024-01-01", "*A subtitle*", *paragraphs, "+article", f"-{genre}", "source"]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n\n".join(lines) + "\n")
+    return str(path)
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Folder of five texts, t0.txt to t4.txt, of 2 to 10 paragraphs"""
+    folder = tmp_path / "corpus"
+    folder.mkdir()
+    for n in range(5):
+        paragraphs = [f"Paragraph {i} of text {n} about climate change." for i in range(2 * n + 2)]
+        write_text(folder / f"t{n}.txt", paragraphs, title=f"Text {n}", genre=("news", "essay")[n % 2])
+    return folder
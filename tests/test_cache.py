@@ -0,0 +1,32 @@
+from conftest import write_text
+from pytextos.cache import AnalysisCache
+from pytextos.text import Text
+
+
+def put(cache, path):
+    with open(path, "rb") as f:
+        cache.put(Text(path).record(), f.read())
+
+
+def test_evicts_least_recently_used(tmp_path):
+    paths = [write_text(tmp_path / f"t{n}.txt", [f"Text number {n}."]) for n in range(5)]
+    cache = AnalysisCache(str(tmp_path / "cache.sqlite"), max_entries=3)
+    for path in paths:
+        put(cache, path)
+    assert len(cache) == 3
+    assert sorted(cache.get_many(paths)) == paths[2:]
+    # Writing a cached file again doesn't evict
+    put(cache, paths[3])
+    assert sorted(cache.get_many(paths)) == paths[2:]
+
+
+def test_evict_counts_entries_of_other_connections(tmp_path):
+    paths = [write_text(tmp_path / f"t{n}.txt", [f"Text number {n}."]) for n in range(4)]
+    cache = AnalysisCache(str(tmp_path / "cache.sqlite"), max_entries=None)
+    other = AnalysisCache(str(tmp_path / "cache.sqlite"), max_entries=None)
+    for path in paths[:2]:
+        put(cache, path)
+    for path in paths[2:]:
+        put(other, path)
+    assert cache.evict(3) == 1
+    assert sorted(cache.get_many(paths)) == paths[1:]
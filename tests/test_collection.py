@@ -0,0 +1,143 @@
+import asyncio
+import os
+
+from conftest import write_text
+from pytextos import Collection, Text
+from pytextos.text import Extract
+
+
+def filenames(collection):
+    return sorted(os.path.basename(t.filename) for t in collection)
+
+
+def test_refresh_drops_deleted_files(corpus):
+    c = Collection(corpus)
+    os.remove(corpus / "t1.txt")
+    changes = c.refresh()
+    assert changes.removed == [str(corpus / "t1.txt")]
+    assert filenames(c) == ["t0.txt", "t2.txt", "t3.txt", "t4.txt"]
+    assert len(c.containing("climate")) == 4
+
+
+def test_refresh_adds_and_reanalyzes(corpus):
+    c = Collection(corpus)
+    write_text(corpus / "t5.txt", ["A new text about climate."])
+    write_text(corpus / "t0.txt", ["Rewritten with zebras.", "And more zebras."])
+    changes = c.refresh()
+    assert changes.added == [str(corpus / "t5.txt")]
+    assert changes.changed == [str(corpus / "t0.txt")]
+    assert len(c) == 6
+    assert [os.path.basename(t.filename) for t in c.containing("zebras")] == ["t0.txt"]
+    assert c.refresh() == ([], [], [])
+
+
+def test_refresh_keeps_members_added_from_elsewhere(corpus, tmp_path):
+    c = Collection(corpus)
+    c.add(write_text(tmp_path / "other.txt", ["Outside the folder."]))
+    assert c.refresh() == ([], [], [])
+    assert len(c) == 6
+
+
+def test_refresh_reports_unparsed_files_once_readable(corpus):
+    c = Collection(corpus)
+    (corpus / "bad.txt").write_bytes(b"\xff\xfe")
+    assert c.refresh() == ([], [], [])
+    assert c.refresh() == ([], [], [])
+    write_text(corpus / "bad.txt", ["Readable now."])
+    assert c.refresh().added == [str(corpus / "bad.txt")]
+
+
+def test_refresh_skips_files_deleted_after_scan(corpus):
+    c = Collection(corpus)
+    scan = c._scan
+    c._scan = lambda paths=None: dict(scan(paths), **{str(corpus / "gone.txt"): (1, 1)})
+    assert c.refresh() == ([], [], [])
+    assert len(c) == 5
+
+
+def test_add_replaces_member_of_the_same_file(corpus):
+    c = Collection(corpus)
+    c.add(str(corpus / "t1.txt"))
+    c.extend([str(corpus / "t2.txt"), str(corpus / "t2.txt")])
+    assert len(c) == 5
+    os.remove(corpus / "t1.txt")
+    assert c.refresh().removed == [str(corpus / "t1.txt")]
+    assert len(c) == 4
+    assert len(c.containing("climate")) == 4
+
+
+def test_add_missing_file(corpus):
+    c = Collection(corpus)
+    c.add(str(corpus / "missing.txt"))
+    assert len(c) == 5
+
+
+def test_extract_members(corpus):
+    c = Collection(corpus, resident=1)
+    extract = Extract(c[0], 0, 1)
+    c.add(extract)
+    for text in c:
+        text.freq_dist()
+    assert extract.loaded
+    assert c.refresh() == ([], [], [])
+    c.remove(extract)
+    assert len(c) == 5
+
+
+def test_eviction_keeps_edited_members(corpus):
+    c = Collection(corpus, resident=2)
+    text = c[0]
+    count = text.token_count
+    text.append_paragraph("zebra zebra zebra")
+    c[1], c[2], c[3]
+    assert text.loaded
+    assert text.token_count == len(text.tokenize()) == count + 3
+    assert text.freq_dist()["ZEBRA"] == 3
+
+
+def test_eviction_rereads_unedited_members(corpus):
+    c = Collection(corpus, resident=2)
+    loaded = Collection(corpus)
+    c[0], c[1], c[2], c[3]
+    assert sum(t.loaded for t in c._members) <= 2
+    # Evicted members drop their word counts and read them again when used
+    for text, expected in zip(c._members, loaded):
+        assert text.record()._replace(freq=None) == expected.record()._replace(freq=None)
+        assert text.freq_dist() == expected.freq_dist()
+
+
+def test_astream_left_early(corpus, tmp_path):
+    async def load():
+        c = Collection()
+        stream = c.astream(corpus, concurrency=2)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        return c
+
+    c = asyncio.run(load())
+    assert len(c) == len(c._ids) == 1
+    c.to_csv(tmp_path / "out.csv")
+
+
+def test_loading_modes_agree(corpus, tmp_path):
+    expected = [t.record() for t in Collection(corpus)]
+    for options in ({"threads": 2}, {"jobs": 2}, {"cache": tmp_path / "c.sqlite", "jobs": 2}):
+        assert [t.record() for t in Collection(corpus, **options)] == expected, options
+    cached = Collection(corpus, cache=tmp_path / "c.sqlite")
+    assert [t.record() for t in cached] == expected
+    assert [t.record() for t in Collection(corpus, lazy=True)] == sorted(
+        expected, key=lambda r: r.filename
+    )
+
+
+def test_avg_word_len_is_int_when_exact(tmp_path):
+    # The subtitle line "A subtitle" is part of the body
+    exact = write_text(tmp_path / "exact.txt", ["abcd efg"])
+    rounded = write_text(tmp_path / "rounded.txt", ["abcd efgh"])
+    assert repr(Text(exact).avg_word_len) == "4"
+    assert repr(Text(rounded).avg_word_len) == "4.25"
+    c = Collection([exact, rounded])
+    rows = {t.filename: c.table.row(c._ids[t]) for t in c}
+    assert repr(rows[exact]["avg_word_len"]) == "4"
+    assert repr(rows[rounded]["avg_word_len"]) == "4.25"
@@ -0,0 +1,157 @@
+"""
+Randomized checks, with fixed seeds, that the fast analysis paths give
+exactly the results of the plain ones: the tokenizer, the Partials of chunks
+merged by pytextos.scheduler and Text(jobs=N).
+"""
+
+import os
+import random
+
+import pytest
+
+from pytextos import Text, scheduler
+from pytextos.analysis import Analysis
+from pytextos.cache import content_hash
+from pytextos.tokenizer import MAPPING, SENTENCE_END, TOKENIZER
+
+# Pieces of paragraphs around sentence ends, abbreviations, quotes and
+# characters the tokenizer maps or strips
+PIECES = [
+    "e.g.", "Mr.", "Dr.", "U.S.", "I.", "end.", "abc.", "42.", "x?", "yes!", ".", "?",
+    "a", "ab", "it's", "don't", "'quote'", '"q"', "(again)", "well-known", "--", "1984,",
+    "word", "THE", "the", "“quoted”", "it’s", "café", "dash—here", "tab\there", "", " ",
+]
+
+
+def legacy_tokenize(paragraphs):
+    # The original per-paragraph str.translate() implementation of Text.tokenize()
+    trans_table = str.maketrans(dict(MAPPING))
+    words = []
+    for sent in paragraphs:
+        clean_sent = sent.translate(trans_table)
+        words.extend([w.strip("' ").upper() for w in clean_sent.split()])
+    return words
+
+
+def paragraph(rng, words=6):
+    return " ".join(rng.choice(PIECES) for _ in range(rng.randint(0, words))).strip()
+
+
+def body(rng, paragraphs=12):
+    return [paragraph(rng) for _ in range(rng.randint(0, paragraphs))]
+
+
+def sentence_stats(paragraphs):
+    sentences = [s for s in SENTENCE_END.split(" ".join(paragraphs)) if len(s) > 3]
+    return len(sentences), sum(map(len, sentences))
+
+
+def write_file(path, rng, paragraphs=300):
+    """Writes a text in Text's file format with random line ends"""
+    nl = rng.choice(["\n", "\r\n", "\n\n"])
+    lines = ["Title", "By Some One", "2024", "*Sub*", *body(rng, paragraphs),
+             "+article", "-news", "src"]
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(nl.join(lines) + rng.choice(["", nl]))
+    return str(path)
+
+
+def same_record(a, b):
+    # Dicts compare equal whatever their order, which decides ties in most_common()
+    assert a == b
+    assert list(a.freq) == list(b.freq)
+
+
+def same_text(a, b):
+    assert a.tokenize() == b.tokenize()
+    assert list(a.freq_dist().items()) == list(b.freq_dist().items())
+    assert a.sent_tokenize() == b.sent_tokenize()
+    same_record(a.record(), b.record())
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_tokenizer(seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        paragraphs = body(rng)
+        assert TOKENIZER.tokenize(" ".join(paragraphs)) == legacy_tokenize(paragraphs), paragraphs
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_merge(seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        paragraphs = body(rng)
+        whole = scheduler.analyze_body(paragraphs)
+        cuts = sorted(rng.sample(range(len(paragraphs) + 1), rng.randint(0, min(4, len(paragraphs) + 1))))
+        parts = [paragraphs[a:b] for a, b in zip([0] + cuts, cuts + [len(paragraphs)])]
+        merged = scheduler.merge(scheduler.analyze_body(p) for p in parts)
+        assert list(merged.counts.items()) == list(whole.counts.items()), parts
+        assert merged[1:] == whole[1:], parts
+        assert whole.sentence_stats() == sentence_stats(paragraphs), paragraphs
+
+
+def test_file_chunks(tmp_path):
+    rng = random.Random(0)
+    for n in range(5):
+        path = write_file(tmp_path / f"f{n}.txt", rng)
+        serial = Text(path).record()
+        for parts in (2, 3, 7, 20):
+            offsets = scheduler._offsets(path, os.path.getsize(path), parts)
+            chunks = [
+                scheduler._analyze_chunk(path, start, end)
+                for start, end in zip(offsets, offsets[1:] + [None])
+            ]
+            header, footer = chunks[0][0], chunks[-1][1]
+            if len(offsets) < 2 or len(header) < 4 or len(footer) < 3:
+                continue
+            partial = scheduler.merge(c[2] for c in chunks)
+            same_record(Text.from_partial(path, header, footer, partial).record(), serial)
+
+
+def test_scheduled_analysis(tmp_path, monkeypatch):
+    rng = random.Random(1)
+    files = []
+    for n in range(6):
+        path = write_file(tmp_path / f"f{n}.txt", rng, rng.choice([5, 300]))
+        files.append((path, os.path.getsize(path)))
+    # Tasks small enough that the larger files are split into chunks
+    monkeypatch.setattr(scheduler, "MIN_TASK", 2000)
+    assert any(task.start is not None for task in scheduler.schedule(files, 2))
+    records = scheduler.analyze(files, 2)
+    hashed = scheduler.analyze(files, 2, hashes=True)
+    for path, _ in files:
+        same_record(records[path], Text(path).record())
+        same_record(hashed[path][0], records[path])
+        with open(path, "rb") as f:
+            assert hashed[path][1] == content_hash(f.read())
+
+
+def test_analyze_text():
+    rng = random.Random(2)
+    for _ in range(40):
+        paragraphs = body(rng, 30)
+        analysis, stats = scheduler.analyze_text(paragraphs, rng.randint(2, 3))
+        expected = Analysis(TOKENIZER.tokenize(" ".join(paragraphs)))
+        assert analysis.tokens() == expected.tokens(), paragraphs
+        assert list(analysis.counts.items()) == list(expected.counts.items()), paragraphs
+        assert stats == sentence_stats(paragraphs), paragraphs
+
+
+@pytest.mark.parametrize("options", [{}, {"lazy": True}, {"mmap": True}])
+def test_text_jobs(tmp_path, options):
+    rng = random.Random(3)
+    path = write_file(tmp_path / "long.txt", rng, 3000)
+    serial, parallel = Text(path, **options), Text(path, jobs=2, **options)
+    parallel.avg_sentence_len  # measured with the counts, without splitting sentences
+    assert "sentences" not in parallel._cache
+    serial.token_count
+    same_text(parallel, serial)
+    # Edits update both analyses in place, where types first seen in an
+    # edited paragraph become the most recent ones
+    replaced, inserted = paragraph(rng, 20), paragraph(rng, 20)
+    for text in (serial, parallel):
+        text.replace_paragraph(5, replaced)
+        text.remove_paragraph(0)
+        text.insert_paragraph(3, inserted)
+    same_text(parallel, serial)
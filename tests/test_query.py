@@ -0,0 +1,40 @@
+import pytest
+
+from pytextos import Collection
+from pytextos.query import Clause, parse
+
+
+def test_parse():
+    query = parse('genre:news,essay AND words:10.. NOT "climate change" SORT lexdiv DESC LIMIT 3')
+    assert query.clauses == (
+        Clause("genre", frozenset({"news", "essay"}), False),
+        Clause("token_count", (10, None), False),
+        Clause("contains", ("CLIMATE", "CHANGE"), True),
+    )
+    assert (query.sort, query.descending, query.limit) == ("lex_div_maas", True, 3)
+
+
+@pytest.mark.parametrize("query, message", [
+    ("colour:red", "Unknown field"),
+    ("words:many", "Not a number"),
+    ("words:1..x", "Not a number"),
+    ('contains:"..."', "No words"),
+    ("climate SORT", "SORT needs a field"),
+    ("climate SORT colour", "Unknown field"),
+    ("climate LIMIT ten", "LIMIT needs a number"),
+    ("genre:news OR genre:essay", "OR is not supported"),
+    ("climate NOT", "NOT at the end"),
+    ('climate "change', "Not a valid query"),
+])
+def test_parse_errors(query, message):
+    with pytest.raises(ValueError, match=message):
+        parse(query)
+
+
+def test_query(corpus):
+    c = Collection(corpus)
+    found = c.query("genre:essay AND words:20.. SORT words DESC")
+    assert [t.title for t in found] == ["Text 3", "Text 1"]
+    assert [t.title for t in c.query("NOT genre:essay LIMIT 2")] == ["Text 4", "Text 2"]
+    with pytest.raises(ValueError, match="Unknown field"):
+        c.query("colour:red")